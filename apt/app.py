@@ -17,6 +17,8 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from apt.utils.paths import user_data_path
+
 
 # ---------------------------------------------------------------------------
 # Logging — write WARN+ to ``error.log`` next to the app, INFO+ to stderr.
@@ -28,29 +30,8 @@ LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
 
 def _log_file_path() -> str:
-    """Pick a writable location for ``error.log``.
-
-    Dev mode (running from source) keeps the historical project-root
-    ``error.log`` so existing tooling/docs stay valid. Installed builds
-    cannot write there — ``Program Files\\AIVEX\\APT\\`` is admin-only —
-    so we redirect to ``%LOCALAPPDATA%\\AIVEX\\APT\\error.log``
-    (writable by every Windows user, persists across upgrades).
-    """
-    if getattr(sys, "frozen", False):
-        base = (
-            os.environ.get("LOCALAPPDATA")
-            or os.environ.get("APPDATA")
-            or os.path.expanduser("~")
-        )
-        log_dir = os.path.join(base, "AIVEX", "APT")
-        try:
-            os.makedirs(log_dir, exist_ok=True)
-            return os.path.join(log_dir, "error.log")
-        except OSError:
-            # Last-resort: a temp file we know we can open.
-            import tempfile
-            return os.path.join(tempfile.gettempdir(), "aivex_apt_error.log")
-    return "error.log"
+    """``error.log`` — project root from source, ``%LOCALAPPDATA%`` when frozen."""
+    return user_data_path("error.log")
 
 
 def _setup_logging() -> None:
@@ -105,10 +86,12 @@ from apt.dialogs import (
     CropPanel,
     DateBasedCopyPanel,
     ImageFormatCopyPanel,
+    JobQueuePanel,
     MIMtoBMPPanel,
     NGCountPanel,
     NGSortingPanel,
     PreprocessingPanel,
+    RenderOverlaysPanel,
     SimulationFolderingPanel,
 )
 from apt.theme import QSS, apply_palette
@@ -156,10 +139,12 @@ class MainWindow(QMainWindow):
             ("Copy",          "Image Format Copy",    ImageFormatCopyPanel),
             ("Copy",          "Simulation Foldering", SimulationFolderingPanel),
             ("Image Ops",     "Crop",                 CropPanel),
+            ("Image Ops",     "Render Overlays",      RenderOverlaysPanel),
             ("Image Ops",     "Attach FOV",           AttachFOVPanel),
             ("Image Ops",     "BMP to JPG (BTJ)",     BMPtoJPGPanel),
             ("Image Ops",     "Preprocessing",        PreprocessingPanel),
             ("Conversion",    "MIM to BMP",           MIMtoBMPPanel),
+            ("Queue",         "Job Queue",            JobQueuePanel),
         ]
         sections: dict[str, list[tuple[str, int]]] = {}
         for idx, (section, label, panel_cls) in enumerate(self.pages):
@@ -197,6 +182,10 @@ class MainWindow(QMainWindow):
             if worker is not None and worker.isRunning():
                 worker.stop()
                 worker.wait(500)
+            queue = getattr(panel, "queue", None)
+            if queue is not None:
+                # Interrupted jobs stay queued and resume on the next start.
+                queue.shutdown(timeout=2.0)
         QThreadPool.globalInstance().clear()
         super().closeEvent(event)
 
@@ -0,0 +1,161 @@
+"""Headless runner: ``python -m apt.cli <operation> --task task.json``.
+
+Runs any registered worker operation without PyQt — for batch jobs on
+ingestion servers. The task runs on a ``LocalTaskContext`` (see
+``apt.workers.context``), the same Qt-free core ``WorkerThread`` wraps.
+Every event is printed to stdout as one JSON line::
+
+    {"event": "progress", "value": 42}
+    {"event": "log", "message": "Copied ..."}
+    {"event": "result", "value": [...]}
+    {"event": "plan", "value": {"actions": [...], "total_bytes": ..., ...}}
+    {"event": "finished", "message": "... 완료.", "exit_code": 0, "metrics": {...}}
+
+Exit codes: 0 completed, 1 failed, 2 bad arguments / task file, 3 stopped
+or aborted by the handler (e.g. missing source), 130 interrupted (Ctrl+C
+asks the handler to stop cooperatively first).
+
+``--task -`` reads the task JSON from stdin. The operation argument fills in
+(and overrides) ``task["operation"]``. ``--dry-run`` sets ``dry_run`` in the
+task: the handler scans as usual, prints its plan (``apt.workers.plan``) and
+leaves the target untouched. ``--timings`` sets ``instrument``: the
+finished event then carries the per-stage timing table and the path of the
+saved JSON report (``apt.workers.instrument``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import sys
+import threading
+from typing import IO, Any, Callable, Sequence
+
+from apt.workers.context import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_STOPPED,
+    LocalTaskContext,
+    finished_status,
+)
+from apt.workers.plan import ThroughputHistory, shared_throughput_history
+from apt.workers.registry import load_handlers
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_STOPPED = 3
+EXIT_INTERRUPTED = 130
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+
+def exit_code_for(message: str | None, stopped: bool = False) -> int:
+    """Map a handler's terminal ``finished`` message onto an exit code."""
+    if stopped:
+        return EXIT_INTERRUPTED
+    return {
+        STATUS_DONE: EXIT_OK,
+        STATUS_FAILED: EXIT_FAILED,
+        STATUS_STOPPED: EXIT_STOPPED,
+    }[finished_status(message)]
+
+
+class JsonLinePrinter:
+    """Writes one JSON object per line; safe to call from pool threads."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def __call__(self, event: str, **fields: Any) -> None:
+        line = json.dumps({"event": event, **fields}, ensure_ascii=False, default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+def _load_task(path: str) -> dict:
+    if path == "-":
+        task = json.load(sys.stdin)
+    else:
+        with open(path, encoding="utf-8") as f:
+            task = json.load(f)
+    if not isinstance(task, dict):
+        raise ValueError("task JSON must be an object")
+    return task
+
+
+def run_task(
+    task: dict,
+    out: Callable[..., None],
+    throughput: ThroughputHistory | None = None,
+) -> int:
+    """Run ``task`` on a ``LocalTaskContext``, streaming events to ``out``."""
+    worker = LocalTaskContext(task, throughput=throughput)
+    worker.progress.connect(lambda value: out("progress", value=value))
+    worker.log.connect(lambda message: out("log", message=message))
+    worker.ng_count_result.connect(lambda value: out("result", value=value))
+    worker.plan_ready.connect(lambda plan: out("plan", value=plan.to_dict()))
+
+    # The handler runs on its own thread so Ctrl+C in the main thread can
+    # request a cooperative stop instead of tearing through the pools.
+    runner = threading.Thread(target=worker.run, name="apt-cli-task", daemon=True)
+    runner.start()
+    interrupted = False
+    while runner.is_alive():
+        try:
+            runner.join(0.2)
+        except KeyboardInterrupt:
+            interrupted = True
+            worker.stop()
+            out("log", message="중지 요청됨 — 진행 중인 작업을 마무리합니다.")
+    code = exit_code_for(worker.finished_message, stopped=interrupted)
+    fields: dict[str, Any] = {"metrics": worker.metrics.snapshot()}
+    if worker.timing_report:
+        fields["timings"] = worker.timings.summary()
+        fields["timing_report"] = worker.timing_report
+    out("finished", message=worker.finished_message, exit_code=code, **fields)
+    return code
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    handlers = load_handlers()
+    parser = argparse.ArgumentParser(
+        prog="python -m apt.cli",
+        description="Run an APT worker operation without the GUI.",
+    )
+    parser.add_argument("operation", choices=sorted(handlers))
+    parser.add_argument(
+        "--task", required=True, help="Task JSON file ('-' reads stdin)."
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Print the plan and ETA without touching the target.",
+    )
+    parser.add_argument(
+        "--timings", action="store_true",
+        help="Record per-stage timings and save the report next to error.log.",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format=LOG_FORMAT, stream=sys.stderr)
+    out = JsonLinePrinter(sys.stdout)
+    try:
+        task = _load_task(args.task)
+    except (OSError, ValueError) as exc:
+        out("error", message=f"Task 파일 오류: {exc}", exit_code=EXIT_USAGE)
+        return EXIT_USAGE
+    task["operation"] = args.operation
+    if args.dry_run:
+        task["dry_run"] = True
+    if args.timings:
+        task["instrument"] = True
+    return run_task(task, out, shared_throughput_history())
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
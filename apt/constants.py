@@ -24,6 +24,61 @@ IGNORED_DIRS: frozenset[str] = frozenset(
     {"ok", "ng", "ng_info", "crop", "thumbnail"}
 )
 
+# Execution backends for CPU-bound handlers (``backend`` task key). See
+# apt/workers/executor.bounded_map.
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+BACKEND_CHOICES: list[tuple[str, str]] = [
+    ("Threads", BACKEND_THREAD),
+    ("Processes (CPU-bound)", BACKEND_PROCESS),
+]
+
+# How sorting handlers place each file (``transfer`` task key). ``link``
+# tries a reflink, then a hard link, then copies (apt/utils/fs.link_file).
+TRANSFER_COPY = "copy"
+TRANSFER_LINK = "link"
+TRANSFER_MODES: tuple[str, ...] = (TRANSFER_COPY, TRANSFER_LINK)
+
+# Duplicate handling for copy targets (``dedup`` task key). See
+# apt/utils/dedup.ContentIndex.
+DEDUP_OFF = "off"
+DEDUP_SKIP = "skip"
+DEDUP_LINK = "link"
+DEDUP_MODES: tuple[str, ...] = (DEDUP_OFF, DEDUP_SKIP, DEDUP_LINK)
+DEDUP_CHOICES: list[tuple[str, str]] = [
+    ("Off", DEDUP_OFF),
+    ("Skip duplicates", DEDUP_SKIP),
+    ("Hard-link duplicates", DEDUP_LINK),
+]
+
+# BMP -> JPG encoder (``encoder`` task key). ``opencv`` decodes straight from
+# a memory-mapped file and encodes with libjpeg-turbo (cv2.imencode). See
+# apt/workers/btj.JpegOptions for the remaining JPEG task keys.
+BTJ_ENCODER_PILLOW = "pillow"
+BTJ_ENCODER_OPENCV = "opencv"
+BTJ_ENCODER_CHOICES: list[tuple[str, str]] = [
+    ("Pillow", BTJ_ENCODER_PILLOW),
+    ("OpenCV (libjpeg-turbo)", BTJ_ENCODER_OPENCV),
+]
+JPEG_SUBSAMPLINGS: tuple[str, ...] = ("4:4:4", "4:2:2", "4:2:0")
+JPEG_QUALITY_DEFAULT = 75  # Pillow's default, so untouched tasks encode as before
+
+# Crop debug overlays (``debug_overlay`` task key): ``<name>_draw.<ext>`` next
+# to each labelled crop, drawn from the crop in memory. ``off`` leaves them to
+# the ``render_overlays`` operation (``overlay_format`` task key), run later
+# for just the files someone wants to look at.
+OVERLAY_OFF = "off"
+OVERLAY_BMP = "bmp"
+OVERLAY_PNG = "png"
+OVERLAY_JPG = "jpg"
+OVERLAY_FORMATS: tuple[str, ...] = (OVERLAY_BMP, OVERLAY_PNG, OVERLAY_JPG)
+OVERLAY_CHOICES: list[tuple[str, str]] = [
+    ("BMP", OVERLAY_BMP),
+    ("PNG", OVERLAY_PNG),
+    ("JPG", OVERLAY_JPG),
+    ("Off (render later)", OVERLAY_OFF),
+]
+
 # ---------------------------------------------------------------------------
 # Operation identifiers (the ``operation`` field in worker task dicts).
 # Keep these in lock-step with apt/workers/base.OPERATION_REGISTRY.
@@ -39,3 +94,4 @@ OP_CROP = "crop"
 OP_ATTACH_FOV = "attach_fov"
 OP_MIM_TO_BMP = "mim_to_bmp"
 OP_BTJ = "btj"
+OP_RENDER_OVERLAYS = "render_overlays"
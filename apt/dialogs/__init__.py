@@ -14,10 +14,12 @@ from apt.dialogs.date_copy import DateBasedCopyPanel
 from apt.dialogs.image_copy import ImageFormatCopyPanel
 from apt.dialogs.simulation import SimulationFolderingPanel
 from apt.dialogs.crop import CropPanel
+from apt.dialogs.render_overlays import RenderOverlaysPanel
 from apt.dialogs.mim_to_bmp import MIMtoBMPPanel
 from apt.dialogs.attach_fov import AttachFOVPanel
 from apt.dialogs.btj import BMPtoJPGPanel
 from apt.dialogs.preprocessing import PreprocessingPanel
+from apt.dialogs.job_queue import JobQueuePanel
 
 __all__ = [
     "BaseTaskPanel",
@@ -28,8 +30,10 @@ __all__ = [
     "ImageFormatCopyPanel",
     "SimulationFolderingPanel",
     "CropPanel",
+    "RenderOverlaysPanel",
     "MIMtoBMPPanel",
     "AttachFOVPanel",
     "BMPtoJPGPanel",
     "PreprocessingPanel",
+    "JobQueuePanel",
 ]
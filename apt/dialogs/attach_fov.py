@@ -6,7 +6,7 @@ from PyQt5.QtWidgets import QFormLayout, QLabel
 
 from apt.constants import OP_ATTACH_FOV
 from apt.dialogs.base import BaseTaskPanel
-from apt.widgets import FOVInput, PathPicker
+from apt.widgets import BackendSelector, FOVInput, PathPicker
 
 
 class AttachFOVPanel(BaseTaskPanel):
@@ -24,6 +24,8 @@ class AttachFOVPanel(BaseTaskPanel):
         form.addRow(QLabel("<b>Target Path</b>"), self.target_picker)
         self.fov_input = FOVInput()
         form.addRow(QLabel("<b>FOV Number(s)</b>"), self.fov_input)
+        self.backend_selector = BackendSelector()
+        form.addRow(QLabel("<b>Execution Backend</b>"), self.backend_selector)
 
     def get_parameters(self) -> dict:
         return {
@@ -32,6 +34,7 @@ class AttachFOVPanel(BaseTaskPanel):
             "search2": self.search2_picker.text(),
             "target": self.target_picker.text(),
             "fov_number": self.fov_input.value(),
+            "backend": self.backend_selector.value(),
         }
 
     def validate_parameters(self, params: dict) -> bool:
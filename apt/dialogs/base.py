@@ -5,11 +5,14 @@ Layout (top to bottom):
     [configuration area  — subclass-provided ``build_form(form_layout)``]
     [Logs (LogConsole)]
     [Progress bar]
-    [Start / Stop buttons]
+    [Stage Timing toggle · Add to Queue / Dry Run / Start / Stop buttons]
 
 Subclasses provide ``TITLE`` / ``SUBTITLE`` class attributes, implement
 ``build_form()`` to populate the form, and override ``get_parameters()`` /
-``validate_parameters()`` to produce the worker task dict.
+``validate_parameters()`` to produce the worker task dict. "Dry Run" runs
+the same task with ``dry_run`` set, which logs the plan and its ETA
+(``apt.workers.plan``) without touching the target; "Stage Timing" adds
+``instrument`` for a per-stage timing report (``apt.workers.instrument``).
 """
 
 from __future__ import annotations
@@ -20,6 +23,7 @@ from typing import Iterable
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
+    QCheckBox,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
@@ -33,11 +37,18 @@ from PyQt5.QtWidgets import (
 
 from apt.widgets import LogConsole
 from apt.workers import WorkerThread
+from apt.workers.jobs import shared_job_queue
+from apt.workers.logsink import task_log_path
+from apt.workers.plan import shared_throughput_history
 
 
 class BaseTaskPanel(QWidget):
     TITLE: str = "Task"
     SUBTITLE: str = ""
+    # Panels whose result is shown in the panel itself (NG Count) opt out.
+    QUEUEABLE: bool = True
+    # Read-only tasks have nothing to plan.
+    PLANNABLE: bool = True
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -82,7 +93,21 @@ class BaseTaskPanel(QWidget):
         layout.addWidget(self.progress_bar)
 
         button_row = QHBoxLayout()
+        self.timing_checkbox = QCheckBox("Stage Timing")
+        self.timing_checkbox.setToolTip(
+            "단계별(scan/read/decode/encode/write) 소요 시간을 기록하고 보고서를 저장합니다."
+        )
+        button_row.addWidget(self.timing_checkbox)
         button_row.addStretch(1)
+        if self.QUEUEABLE:
+            self.queue_button = QPushButton("Add to Queue")
+            self.queue_button.clicked.connect(self.queue_task)
+            button_row.addWidget(self.queue_button)
+        if self.PLANNABLE:
+            self.dry_run_button = QPushButton("Dry Run")
+            self.dry_run_button.setToolTip("복사/변환 없이 작업 계획과 예상 시간을 확인합니다.")
+            self.dry_run_button.clicked.connect(self.dry_run_task)
+            button_row.addWidget(self.dry_run_button)
         self.start_button = QPushButton("Start")
         self.start_button.setObjectName("PrimaryButton")
         self.start_button.clicked.connect(self.start_task)
@@ -112,31 +137,68 @@ class BaseTaskPanel(QWidget):
     def append_log(self, message: str) -> None:
         self.log_console.append(message)
 
+    def append_logs(self, messages: list[str]) -> None:
+        self.log_console.append_many(messages)
+
     def start_task(self) -> None:
+        self._launch(dry_run=False)
+
+    def dry_run_task(self) -> None:
+        """Plan the task (files, bytes, conflicts, ETA) without running it."""
+        self._launch(dry_run=True)
+
+    def _launch(self, dry_run: bool) -> None:
         if self.worker is not None and self.worker.isRunning():
             QMessageBox.warning(self, "작업 중", "이미 작업이 진행 중입니다.")
             return
-        self.append_log("------ 작업 시작 ------")
+        self.append_log("------ Dry Run 시작 ------" if dry_run else "------ 작업 시작 ------")
         self.progress_bar.setValue(0)
         params = self.get_parameters()
         if not self.validate_parameters(params):
             self.append_log("------ 작업 중지 ------")
             return
+        if dry_run:
+            params["dry_run"] = True
+        self._apply_common_options(params)
         try:
-            self.worker = WorkerThread(params)
+            log_path = task_log_path(params.get("operation", ""))
+            self.worker = WorkerThread(
+                params, log_path=log_path, throughput=shared_throughput_history()
+            )
         except Exception as exc:  # pragma: no cover
             logging.error("WorkerThread 생성 실패", exc_info=True)
             self.append_log(f"WorkerThread 생성 실패: {exc}")
             return
+        self.append_log(f"상세 로그 파일: {os.path.abspath(log_path)}")
         self.worker.progress.connect(self.update_progress)
-        self.worker.log.connect(self.append_log)
+        self.worker.log_batch.connect(self.append_logs)
         if params.get("operation") == "ng_count":
             self.worker.ng_count_result.connect(self.update_ng_count_table)
         self.worker.finished.connect(self.task_finished)
         self.worker.start()
         self.start_button.setEnabled(False)
+        if self.PLANNABLE:
+            self.dry_run_button.setEnabled(False)
         self.stop_button.setEnabled(True)
 
+    def queue_task(self) -> None:
+        """Validate the form and hand the task to the shared job queue."""
+        params = self.get_parameters()
+        if not self.validate_parameters(params):
+            return
+        self._apply_common_options(params)
+        try:
+            job = shared_job_queue().add(params)
+        except ValueError as exc:
+            self.append_log(f"작업 큐 추가 실패: {exc}")
+            return
+        self.append_log(f"작업 큐에 추가됨: {job.id} ({job.operation})")
+
+    def _apply_common_options(self, params: dict) -> None:
+        """Options every panel shares (the button-row toggles)."""
+        if self.timing_checkbox.isChecked():
+            params["instrument"] = True
+
     def stop_task(self) -> None:
         if self.worker is not None and self.worker.isRunning():
             self.worker.stop()
@@ -149,6 +211,8 @@ class BaseTaskPanel(QWidget):
     def task_finished(self, message: str) -> None:
         self.append_log(message)
         self.start_button.setEnabled(True)
+        if self.PLANNABLE:
+            self.dry_run_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         if any(token in message for token in ("완료", "오류", "중지")):
             self.append_log("------ 작업 종료 ------")
@@ -5,7 +5,7 @@ import os
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QCheckBox, QFormLayout, QHBoxLayout, QLabel, QLineEdit
 
-from apt.constants import OP_BASIC_SORTING
+from apt.constants import OP_BASIC_SORTING, TRANSFER_COPY, TRANSFER_LINK
 from apt.dialogs.base import BaseTaskPanel
 from apt.widgets import FormatSelector, FOVInput, PathPicker
 
@@ -51,6 +51,20 @@ class BasicSortingPanel(BaseTaskPanel):
         self.format_selector = FormatSelector()
         form.addRow(QLabel("<b>Image Formats</b>"), self.format_selector)
 
+        self.resume_checkbox = QCheckBox("Resume — 저널(.apt_journal.jsonl)로 완료가 확인된 파일은 건너뜀")
+        form.addRow(QLabel("<b>Resume</b>"), self.resume_checkbox)
+
+        self.link_checkbox = QCheckBox(
+            "Link — 같은 볼륨이면 복사 대신 reflink/하드링크 (하드링크는 원본과 내용을 공유)"
+        )
+        form.addRow(QLabel("<b>Transfer</b>"), self.link_checkbox)
+
+        self.listing_cache_checkbox = QCheckBox(
+            "Listing Cache — 이전 실행 이후 바뀌지 않은 폴더는 목록을 다시 읽지 않음"
+        )
+        self.listing_cache_checkbox.setChecked(True)
+        form.addRow(QLabel("<b>Listing Cache</b>"), self.listing_cache_checkbox)
+
     # -- option toggles -------------------------------------------------
     def _toggle_only_defect(self, state: int) -> None:
         if state == Qt.Checked:
@@ -85,6 +99,9 @@ class BasicSortingPanel(BaseTaskPanel):
             "formats": self.format_selector.selected(),
             "double_path_folder": self.double_path_checkbox.isChecked(),
             "only_defect_sorting": self.only_defect_checkbox.isChecked(),
+            "resume": self.resume_checkbox.isChecked(),
+            "transfer": TRANSFER_LINK if self.link_checkbox.isChecked() else TRANSFER_COPY,
+            "listing_cache": self.listing_cache_checkbox.isChecked(),
         }
 
     def validate_parameters(self, params: dict) -> bool:
@@ -6,7 +6,7 @@ from PyQt5.QtWidgets import QFormLayout, QLabel
 
 from apt.constants import OP_BTJ
 from apt.dialogs.base import BaseTaskPanel
-from apt.widgets import PathPicker
+from apt.widgets import BackendSelector, JpegOptionsEditor, PathPicker
 
 
 class BMPtoJPGPanel(BaseTaskPanel):
@@ -25,6 +25,10 @@ class BMPtoJPGPanel(BaseTaskPanel):
             "Select Target Path (Optional)", "Select Target Folder (Optional)"
         )
         form.addRow(QLabel("<b>Target Path (optional)</b>"), self.target_picker)
+        self.backend_selector = BackendSelector()
+        form.addRow(QLabel("<b>Execution Backend</b>"), self.backend_selector)
+        self.jpeg_options = JpegOptionsEditor()
+        form.addRow(QLabel("<b>JPEG</b>"), self.jpeg_options)
 
         note = QLabel("※ Target 미입력 시, Source 뒤에 '_JPG' 폴더가 자동 생성됩니다.")
         note.setStyleSheet("color: #9A9CA3; font-size: 11px;")
@@ -35,6 +39,8 @@ class BMPtoJPGPanel(BaseTaskPanel):
             "operation": OP_BTJ,
             "source": self.source_picker.text(),
             "target": self.target_picker.text(),
+            "backend": self.backend_selector.value(),
+            **self.jpeg_options.values(),
         }
 
     def validate_parameters(self, params: dict) -> bool:
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
+import os
+
 from PyQt5.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QFormLayout,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QSpinBox,
 )
 
-from apt.constants import OP_CROP
+from apt.constants import OP_CROP, OVERLAY_CHOICES
 from apt.dialogs.base import BaseTaskPanel
-from apt.widgets import FormatSelector, FOVInput, PathPicker
+from apt.utils.roi import load_roi_file
+from apt.widgets import BackendSelector, FormatSelector, FOVInput, PathPicker
 
 
 class CropPanel(BaseTaskPanel):
     TITLE = "Crop"
     SUBTITLE = (
         "이미지 트리에서 FOV(선택)에 해당하는 파일을 크롭합니다. "
-        "BMP에 동명의 JSON이 있으면 라벨 좌표도 함께 보정됩니다."
+        "BMP에 동명의 JSON이 있으면 라벨 좌표도 함께 보정됩니다. "
+        "ROI 파일을 지정하면 영역마다 하위 폴더에 저장합니다 (이미지당 1회 디코딩). "
+        "Tile Mode는 이미지를 고정 크기 타일로 겹치게 잘라 학습용 데이터를 만듭니다."
     )
 
     def build_form(self, form: QFormLayout) -> None:
@@ -45,8 +52,51 @@ class CropPanel(BaseTaskPanel):
             crop_row.addWidget(edit)
         form.addRow(QLabel("<b>Crop Area (Pixels)</b>"), crop_row)
 
+        self.roi_picker = PathPicker(
+            "Select ROI File", "Select ROI File", pick_file=True,
+            file_filter="ROI / LabelMe JSON (*.json);;All files (*.*)",
+            placeholder="(선택) 이름 있는 영역 목록 — 지정하면 Crop Area 대신 사용",
+        )
+        form.addRow(QLabel("<b>ROI File</b>"), self.roi_picker)
+
+        tile_row = QHBoxLayout()
+        self.tile_check = QCheckBox("Tile Mode")
+        self.tile_check.setToolTip("Crop Area / ROI File 대신 전체 이미지를 타일 격자로 자릅니다.")
+        tile_row.addWidget(self.tile_check)
+        self.tile_w, self.tile_h, self.stride_x, self.stride_y = (QSpinBox() for _ in range(4))
+        for label, spin, value in (
+            ("W", self.tile_w, 512), ("H", self.tile_h, 512),
+            ("Stride X", self.stride_x, 256), ("Stride Y", self.stride_y, 256),
+        ):
+            spin.setRange(1, 65535)
+            spin.setValue(value)
+            tile_row.addWidget(QLabel(f"{label}:"))
+            tile_row.addWidget(spin)
+        self.labelled_only_check = QCheckBox("Labelled Only")
+        self.labelled_only_check.setToolTip("JSON 라벨(shapes / rois)이 없는 타일은 저장하지 않습니다.")
+        tile_row.addWidget(self.labelled_only_check)
+        tile_row.addStretch(1)
+        form.addRow(QLabel("<b>Tiling</b>"), tile_row)
+
+        self.compact_json_check = QCheckBox("Compact JSON")
+        self.compact_json_check.setToolTip(
+            "보정된 라벨 JSON을 들여쓰기 없이 저장합니다 (파일이 작고 저장이 빠름)."
+        )
+        form.addRow(QLabel("<b>Label JSON</b>"), self.compact_json_check)
+
+        self.overlay_combo = QComboBox()
+        for label, token in OVERLAY_CHOICES:
+            self.overlay_combo.addItem(label, token)
+        self.overlay_combo.setToolTip(
+            "라벨 있는 크롭마다 라벨을 그린 <이름>_draw 이미지를 함께 저장합니다. "
+            "Off면 저장하지 않고, 필요한 파일만 Render Overlays에서 나중에 그립니다."
+        )
+        form.addRow(QLabel("<b>Debug Overlay</b>"), self.overlay_combo)
+
         self.format_selector = FormatSelector()
         form.addRow(QLabel("<b>Image Formats</b>"), self.format_selector)
+        self.backend_selector = BackendSelector()
+        form.addRow(QLabel("<b>Execution Backend</b>"), self.backend_selector)
 
     def _on_coords_mode_changed(self, idx: int) -> None:
         if idx == 0:
@@ -72,6 +122,13 @@ class CropPanel(BaseTaskPanel):
             "right_bottom_x": self.rx.text().strip(),
             "right_bottom_y": self.ry.text().strip(),
             "coords_mode": "xywh" if self.coords_mode.currentIndex() == 1 else "ltrb",
+            "roi_file": self.roi_picker.text(),
+            "tile_size": [self.tile_w.value(), self.tile_h.value()] if self.tile_check.isChecked() else None,
+            "tile_stride": [self.stride_x.value(), self.stride_y.value()],
+            "labelled_tiles_only": self.labelled_only_check.isChecked(),
+            "compact_json": self.compact_json_check.isChecked(),
+            "debug_overlay": self.overlay_combo.currentData(),
+            "backend": self.backend_selector.value(),
         }
 
     def validate_parameters(self, params: dict) -> bool:
@@ -82,6 +139,20 @@ class CropPanel(BaseTaskPanel):
             missing.append("Target Path")
         if not params["formats"]:
             missing.append("Image Formats")
+        invalid = self.validate_paths(params, ("source", "target"))
+        if params["tile_size"]:
+            if params["roi_file"]:
+                invalid.append("Tile Mode와 ROI File은 함께 쓸 수 없습니다.")
+            return self.warn_missing(missing, invalid)
+        if params["roi_file"]:
+            if not os.path.isfile(params["roi_file"]):
+                invalid.append("ROI File이(가) 유효하지 않습니다.")
+            else:
+                try:
+                    load_roi_file(params["roi_file"], params["coords_mode"])
+                except ValueError as exc:
+                    invalid.append(f"ROI File: {exc}")
+            return self.warn_missing(missing, invalid)
         for key, desc in (
             ("left_top_x", "Left Top X"),
             ("left_top_y", "Left Top Y"),
@@ -96,5 +167,4 @@ class CropPanel(BaseTaskPanel):
                     int(val)
                 except ValueError:
                     missing.append(f"{desc} (정수 필요)")
-        invalid = self.validate_paths(params, ("source", "target"))
         return self.warn_missing(missing, invalid)
@@ -12,7 +12,7 @@ from PyQt5.QtWidgets import (
 
 from apt.constants import OP_DATE_COPY
 from apt.dialogs.base import BaseTaskPanel
-from apt.widgets import FormatSelector, FOVInput, PathPicker
+from apt.widgets import DedupSelector, FormatSelector, FOVInput, PathPicker
 
 
 class DateBasedCopyPanel(BaseTaskPanel):
@@ -70,6 +70,12 @@ class DateBasedCopyPanel(BaseTaskPanel):
         self.format_selector = FormatSelector()
         form.addRow(QLabel("<b>Image Formats</b>"), self.format_selector)
 
+        self.resume_checkbox = QCheckBox("Resume — 저널(.apt_journal.jsonl)로 완료가 확인된 파일은 건너뜀")
+        form.addRow(QLabel("<b>Resume</b>"), self.resume_checkbox)
+
+        self.dedup_selector = DedupSelector()
+        form.addRow(QLabel("<b>Duplicates</b>"), self.dedup_selector)
+
     # -- toggles --------------------------------------------------------
     def _toggle_mode(self, _state: int) -> None:
         sender = self.sender()
@@ -139,6 +145,8 @@ class DateBasedCopyPanel(BaseTaskPanel):
             "strong_random": self.strong_random.isChecked(),
             "conditional_random": self.conditional_random.isChecked(),
             "random_count": self.random_count.value() if self.conditional_random.isChecked() else 0,
+            "resume": self.resume_checkbox.isChecked(),
+            "dedup": self.dedup_selector.value(),
         }
 
     def validate_parameters(self, params: dict) -> bool:
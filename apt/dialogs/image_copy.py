@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PyQt5.QtWidgets import QFormLayout, QLabel
+from PyQt5.QtWidgets import QCheckBox, QFormLayout, QLabel
 
 from apt.constants import OP_IMAGE_COPY
 from apt.dialogs.base import BaseTaskPanel
@@ -19,12 +19,16 @@ class ImageFormatCopyPanel(BaseTaskPanel):
         self.format_selector = FormatSelector()
         form.addRow(QLabel("<b>Image Formats</b>"), self.format_selector)
 
+        self.resume_checkbox = QCheckBox("Resume — 저널(.apt_journal.jsonl)로 완료가 확인된 파일은 건너뜀")
+        form.addRow(QLabel("<b>Resume</b>"), self.resume_checkbox)
+
     def get_parameters(self) -> dict:
         return {
             "operation": OP_IMAGE_COPY,
             "sources": [self.source_picker.text()],
             "targets": [self.target_picker.text()],
             "formats": self.format_selector.selected(),
+            "resume": self.resume_checkbox.isChecked(),
         }
 
     def validate_parameters(self, params: dict) -> bool:
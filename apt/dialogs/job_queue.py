@@ -0,0 +1,181 @@
+"""Job Queue page — per-job progress for tasks queued from any panel."""
+
+from __future__ import annotations
+
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QProgressBar,
+    QPushButton,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from apt.widgets import LogConsole
+from apt.workers.jobs import Job, JobQueue, shared_job_queue
+
+_COLUMNS = ["ID", "Operation", "Stage", "State", "Progress", "Message"]
+_PROGRESS_COLUMN = 4
+
+
+class JobQueuePanel(QWidget):
+    TITLE = "Job Queue"
+    SUBTITLE = (
+        "각 패널의 'Add to Queue' 버튼으로 추가한 작업을 순서대로 실행합니다. "
+        "I/O 작업(복사/정렬)과 CPU 작업(Crop/BTJ/Attach FOV/MIM)은 각각의 동시 실행 수 안에서 병렬로 실행되며, "
+        "큐는 재시작 후에도 유지됩니다 (중단된 작업은 이어하기로 다시 실행)."
+    )
+
+    # Job-thread Channel → UI thread (queued connection).
+    _job_changed = pyqtSignal(object)
+    _job_log = pyqtSignal(object)
+
+    def __init__(self, queue: JobQueue | None = None, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.queue = queue if queue is not None else shared_job_queue()
+        self._rows: dict[str, int] = {}
+        self._build_layout()
+
+        self._job_changed.connect(self._update_job)
+        self._job_log.connect(self._append_job_log)
+        forward_changed = self._job_changed.emit
+
+        def forward_log(entry: tuple[str, str]) -> None:
+            # Per-file lines stay in the job's log file; only surface problems.
+            if entry[1].startswith("오류"):
+                self._job_log.emit(entry)
+
+        self.queue.changed.connect(forward_changed)
+        self.queue.log.connect(forward_log)
+        queue_ref = self.queue
+        # The queue outlives the page; stop emitting into a deleted widget.
+        self.destroyed.connect(
+            lambda *_: (queue_ref.changed.disconnect(forward_changed),
+                        queue_ref.log.disconnect(forward_log))
+        )
+        for job in self.queue.jobs():
+            self._update_job(job)
+        self._sync_pause_button()
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def _build_layout(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(28, 24, 28, 24)
+        layout.setSpacing(10)
+
+        title = QLabel(self.TITLE)
+        title.setObjectName("PageTitle")
+        layout.addWidget(title)
+        subtitle = QLabel(self.SUBTITLE)
+        subtitle.setObjectName("PageSubtitle")
+        subtitle.setWordWrap(True)
+        layout.addWidget(subtitle)
+
+        budget_row = QHBoxLayout()
+        budget_row.addWidget(QLabel("<b>I/O 동시 작업</b>"))
+        self.io_spin = QSpinBox()
+        self.io_spin.setRange(1, 16)
+        self.io_spin.setValue(self.queue.io_slots)
+        budget_row.addWidget(self.io_spin)
+        budget_row.addSpacing(16)
+        budget_row.addWidget(QLabel("<b>CPU 동시 작업</b>"))
+        self.cpu_spin = QSpinBox()
+        self.cpu_spin.setRange(1, 16)
+        self.cpu_spin.setValue(self.queue.cpu_slots)
+        budget_row.addWidget(self.cpu_spin)
+        self.apply_budget_button = QPushButton("Apply")
+        self.apply_budget_button.clicked.connect(self.apply_budget)
+        budget_row.addWidget(self.apply_budget_button)
+        budget_row.addStretch(1)
+        layout.addLayout(budget_row)
+
+        self.table = QTableWidget(0, len(_COLUMNS))
+        self.table.setHorizontalHeaderLabels(_COLUMNS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(len(_COLUMNS) - 1, QHeaderView.Stretch)
+        layout.addWidget(self.table, 2)
+
+        self.log_console = LogConsole()
+        layout.addWidget(self.log_console, 1)
+
+        button_row = QHBoxLayout()
+        button_row.addStretch(1)
+        self.pause_button = QPushButton("Pause")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.cancel_button = QPushButton("Cancel Selected")
+        self.cancel_button.setObjectName("DangerButton")
+        self.cancel_button.clicked.connect(self.cancel_selected)
+        self.clear_button = QPushButton("Clear Finished")
+        self.clear_button.clicked.connect(self.clear_finished)
+        button_row.addWidget(self.pause_button)
+        button_row.addWidget(self.cancel_button)
+        button_row.addWidget(self.clear_button)
+        layout.addLayout(button_row)
+
+    # ------------------------------------------------------------------
+    # Slots
+    # ------------------------------------------------------------------
+    def apply_budget(self) -> None:
+        self.queue.set_budget(self.io_spin.value(), self.cpu_spin.value())
+        self.log_console.append(
+            f"동시 실행 수 변경: I/O {self.queue.io_slots}, CPU {self.queue.cpu_slots}"
+        )
+
+    def toggle_pause(self) -> None:
+        if self.queue.paused:
+            self.queue.resume()
+            self.log_console.append("큐 실행 재개")
+        else:
+            self.queue.pause()
+            self.log_console.append("큐 일시 정지 — 실행 중인 작업은 계속됩니다.")
+        self._sync_pause_button()
+
+    def cancel_selected(self) -> None:
+        ids = {self.table.item(index.row(), 0).text() for index in self.table.selectionModel().selectedRows()}
+        for job_id in ids:
+            self.queue.cancel(job_id)
+            self.log_console.append(f"[{job_id}] 취소 요청")
+
+    def clear_finished(self) -> None:
+        self.queue.remove_finished()
+        self.table.setRowCount(0)
+        self._rows.clear()
+        for job in self.queue.jobs():
+            self._update_job(job)
+
+    # ------------------------------------------------------------------
+    # Queue → table
+    # ------------------------------------------------------------------
+    def _sync_pause_button(self) -> None:
+        self.pause_button.setText("Resume" if self.queue.paused else "Pause")
+
+    def _update_job(self, job: Job) -> None:
+        row = self._rows.get(job.id)
+        if row is None:
+            row = self._rows[job.id] = self.table.rowCount()
+            self.table.insertRow(row)
+            for column, text in enumerate((job.id, job.operation, job.stage)):
+                self.table.setItem(row, column, QTableWidgetItem(text))
+            bar = QProgressBar()
+            bar.setMaximum(100)
+            self.table.setCellWidget(row, _PROGRESS_COLUMN, bar)
+        previous = self.table.item(row, 3)
+        if previous is not None and previous.text() != job.state:
+            self.log_console.append(f"[{job.id}] {job.operation}: {job.state}")
+        self.table.setItem(row, 3, QTableWidgetItem(job.state))
+        self.table.cellWidget(row, _PROGRESS_COLUMN).setValue(job.progress)
+        self.table.setItem(row, 5, QTableWidgetItem(job.message))
+
+    def _append_job_log(self, entry: tuple[str, str]) -> None:
+        job_id, message = entry
+        self.log_console.append(f"[{job_id}] {message}")
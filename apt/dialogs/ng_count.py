@@ -25,6 +25,8 @@ from apt.widgets import PathPicker
 class NGCountPanel(BaseTaskPanel):
     TITLE = "NG Count"
     SUBTITLE = "NG 폴더의 Cam_*/Defect 통계를 계산하고 클립보드에 복사할 수 있습니다."
+    QUEUEABLE = False
+    PLANNABLE = False
 
     def build_form(self, form: QFormLayout) -> None:
         self.ng_picker = PathPicker("Select NG Folder", "Select NG Folder", read_only=True)
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
+    QCheckBox,
     QDialog,
     QFileDialog,
     QFormLayout,
@@ -20,9 +21,9 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
 )
 
-from apt.constants import OP_NG_SORTING
+from apt.constants import OP_NG_SORTING, TRANSFER_COPY, TRANSFER_LINK
 from apt.dialogs.base import BaseTaskPanel
-from apt.widgets import FormatSelector, PathPicker
+from apt.widgets import DedupSelector, FormatSelector, PathPicker
 
 
 class NGSortingPanel(BaseTaskPanel):
@@ -55,6 +56,23 @@ class NGSortingPanel(BaseTaskPanel):
         self.format_selector = FormatSelector()
         form.addRow(QLabel("<b>Image Formats</b>"), self.format_selector)
 
+        self.resume_checkbox = QCheckBox("Resume — 저널(.apt_journal.jsonl)로 완료가 확인된 파일은 건너뜀")
+        form.addRow(QLabel("<b>Resume</b>"), self.resume_checkbox)
+
+        self.link_checkbox = QCheckBox(
+            "Link — 같은 볼륨이면 복사 대신 reflink/하드링크 (하드링크는 원본과 내용을 공유)"
+        )
+        form.addRow(QLabel("<b>Transfer</b>"), self.link_checkbox)
+
+        self.listing_cache_checkbox = QCheckBox(
+            "Listing Cache — 이전 실행 이후 바뀌지 않은 폴더는 목록을 다시 읽지 않음"
+        )
+        self.listing_cache_checkbox.setChecked(True)
+        form.addRow(QLabel("<b>Listing Cache</b>"), self.listing_cache_checkbox)
+
+        self.dedup_selector = DedupSelector()
+        form.addRow(QLabel("<b>Duplicates</b>"), self.dedup_selector)
+
     # -- subfolder picker dialog (carried over from legacy) -----------
     def _open_subfolder_picker(self) -> None:
         parent_folder = QFileDialog.getExistingDirectory(
@@ -146,6 +164,10 @@ class NGSortingPanel(BaseTaskPanel):
             "source2": self.source2_picker.text(),
             "target": self.target_picker.text(),
             "formats": self.format_selector.selected(),
+            "resume": self.resume_checkbox.isChecked(),
+            "transfer": TRANSFER_LINK if self.link_checkbox.isChecked() else TRANSFER_COPY,
+            "listing_cache": self.listing_cache_checkbox.isChecked(),
+            "dedup": self.dedup_selector.value(),
         }
 
     def validate_parameters(self, params: dict) -> bool:
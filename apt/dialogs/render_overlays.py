@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from PyQt5.QtWidgets import (
+    QComboBox,
+    QFileDialog,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QPushButton,
+    QVBoxLayout,
+)
+
+from apt.constants import OP_RENDER_OVERLAYS, OVERLAY_CHOICES, OVERLAY_OFF, OVERLAY_PNG
+from apt.dialogs.base import BaseTaskPanel
+from apt.widgets import BackendSelector, PathPicker
+
+
+class RenderOverlaysPanel(BaseTaskPanel):
+    TITLE = "Render Overlays"
+    SUBTITLE = (
+        "Crop 결과 이미지와 JSON으로 라벨을 그린 <이름>_draw 이미지를 만듭니다. "
+        "파일을 고르면 그 파일만, 고르지 않으면 Source 폴더 전체를 그립니다."
+    )
+
+    def build_form(self, form: QFormLayout) -> None:
+        self.source_picker = PathPicker("Select Source Path", "Select Crop Output Folder")
+        form.addRow(QLabel("<b>Source Path</b>"), self.source_picker)
+
+        files_box = QVBoxLayout()
+        self.file_list = QListWidget()
+        self.file_list.setMinimumHeight(120)
+        files_box.addWidget(self.file_list)
+        buttons = QHBoxLayout()
+        self.add_files_button = QPushButton("Add Files")
+        self.add_files_button.clicked.connect(self._add_files)
+        self.clear_files_button = QPushButton("Clear")
+        self.clear_files_button.clicked.connect(self.file_list.clear)
+        buttons.addWidget(self.add_files_button)
+        buttons.addWidget(self.clear_files_button)
+        buttons.addStretch(1)
+        files_box.addLayout(buttons)
+        form.addRow(QLabel("<b>Files</b>"), files_box)
+
+        self.format_combo = QComboBox()
+        for label, token in OVERLAY_CHOICES:
+            if token != OVERLAY_OFF:
+                self.format_combo.addItem(label, token)
+        self.format_combo.setCurrentIndex(self.format_combo.findData(OVERLAY_PNG))
+        form.addRow(QLabel("<b>Overlay Format</b>"), self.format_combo)
+        self.backend_selector = BackendSelector()
+        form.addRow(QLabel("<b>Execution Backend</b>"), self.backend_selector)
+
+    def _add_files(self) -> None:
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select Cropped Images", self.source_picker.text(),
+            "Images (*.bmp *.png *.jpg *.jpeg);;All files (*.*)",
+        )
+        existing = {self.file_list.item(i).text() for i in range(self.file_list.count())}
+        self.file_list.addItems([p for p in paths if p not in existing])
+
+    def get_parameters(self) -> dict:
+        return {
+            "operation": OP_RENDER_OVERLAYS,
+            "source": self.source_picker.text(),
+            "files": [self.file_list.item(i).text() for i in range(self.file_list.count())],
+            "overlay_format": self.format_combo.currentData(),
+            "backend": self.backend_selector.value(),
+        }
+
+    def validate_parameters(self, params: dict) -> bool:
+        missing = [] if params["source"] or params["files"] else ["Source Path 또는 Files"]
+        return self.warn_missing(missing, self.validate_paths(params, ("source",)))
@@ -202,7 +202,7 @@ QProgressBar::chunk {{
     border-radius: 3px;
 }}
 
-QTextEdit#LogConsole {{
+QTextEdit#LogConsole, QTableView#LogConsole {{
     background-color: #08080A;
     color: #E0E0E0;
     font-family: Consolas, "Cascadia Mono", "D2Coding", monospace;
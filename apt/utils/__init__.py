@@ -1,8 +1,10 @@
 """Pure utility functions — Qt-free so they can be unit tested."""
 
 from apt.utils.fov import parse_fov_numbers, extract_fov_from_filename
-from apt.utils.formats import is_valid_file
+from apt.utils.formats import FileMatcher, is_valid_file
 from apt.utils.fs import (
+    COPY_STRATEGIES,
+    available_copy_strategies,
     ensure_target_folder,
     copy_file_chunked,
     copy_folder_filtered,
@@ -12,6 +14,9 @@ __all__ = [
     "parse_fov_numbers",
     "extract_fov_from_filename",
     "is_valid_file",
+    "FileMatcher",
+    "COPY_STRATEGIES",
+    "available_copy_strategies",
     "ensure_target_folder",
     "copy_file_chunked",
     "copy_folder_filtered",
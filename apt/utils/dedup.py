@@ -0,0 +1,289 @@
+"""Content-hash index of a copy target, used to skip or link duplicate files.
+
+The same inner ID often shows up in several source trees, so sorting and
+date-based copies end up writing identical images again. ``ContentIndex``
+keeps ``<target>/.apt_dedup.sqlite`` with one row per file under the target
+root — ``(path, size, mtime_ns, quick, full)`` — where ``quick`` is a
+BLAKE2b digest of the size plus the first and last 64 KiB. A source whose
+``(size, quick)`` matches an indexed file is compared by full-content hash
+(computed lazily and cached in the row) before it counts as a duplicate;
+the duplicate is then skipped or hard-linked instead of copied.
+
+Rows whose file was deleted or modified since it was indexed are dropped
+when a lookup runs into them, so the index never vouches for stale data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+
+from apt.constants import DEDUP_LINK, DEDUP_MODES, DEDUP_OFF, DEDUP_SKIP
+from apt.utils.fs import StoppedCallable, _never_stopped, copy_file_chunked
+from apt.utils.journal import CopyCallable
+
+INDEX_FILENAME = ".apt_dedup.sqlite"
+
+_EDGE = 64 * 1024  # bytes hashed at each end for the quick digest
+_CHUNK = 1024 * 1024
+_COMMIT_EVERY = 256
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS files ("
+    " path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+    " quick TEXT NOT NULL, full TEXT)",
+    "CREATE INDEX IF NOT EXISTS files_key ON files (size, quick)",
+)
+
+
+def quick_hash(path: str, size: int | None = None) -> str:
+    """BLAKE2b over the size and the first / last 64 KiB of ``path``."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        digest.update(size.to_bytes(8, "little"))
+        digest.update(f.read(_EDGE))
+        if size > 2 * _EDGE:
+            f.seek(-_EDGE, os.SEEK_END)
+            digest.update(f.read(_EDGE))
+        elif size > _EDGE:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def full_hash(path: str) -> str:
+    """BLAKE2b over the whole file."""
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ContentIndex:
+    """Thread-safe content index of one target root.
+
+    ``copy`` is a drop-in for ``copy_file_chunked`` (and can be passed to
+    ``CopyJournal.copy``): a source whose content already exists under the
+    root is skipped (``DEDUP_SKIP``) or hard-linked to the existing file
+    (``DEDUP_LINK``, falling back to a real copy when the filesystem refuses
+    the link); everything else is copied and indexed.
+    """
+
+    def __init__(self, target_root: str, mode: str = DEDUP_SKIP) -> None:
+        if mode not in (DEDUP_SKIP, DEDUP_LINK):
+            raise ValueError(f"알 수 없는 중복 처리 방식: {mode!r}")
+        self.root = target_root
+        self.mode = mode
+        self.path = os.path.join(target_root, INDEX_FILENAME)
+        self.skipped = 0
+        self.linked = 0
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._inflight: dict[tuple[int, str], threading.Event] = {}
+        os.makedirs(target_root, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._db.commit()
+
+    # ------------------------------------------------------------------
+    def __enter__(self) -> "ContentIndex":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    # ------------------------------------------------------------------
+    def _rel(self, path: str) -> str:
+        return os.path.relpath(path, self.root)
+
+    def _write(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            if self._db is None:
+                return
+            self._db.execute(sql, params)
+            self._pending += 1
+            if self._pending >= _COMMIT_EVERY:
+                self._db.commit()
+                self._pending = 0
+
+    def add(self, path: str, quick: str | None = None, full: str | None = None) -> None:
+        """Index ``path`` (hashes are computed unless the caller has them)."""
+        st = os.stat(path)
+        if quick is None:
+            quick = quick_hash(path, st.st_size)
+        self._write(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, quick, full) VALUES (?, ?, ?, ?, ?)",
+            (self._rel(path), st.st_size, st.st_mtime_ns, quick, full),
+        )
+
+    def sync(self, is_stopped: StoppedCallable = _never_stopped) -> int:
+        """Index files under the root that are new or changed; returns how many.
+
+        Needed once for targets filled before dedup was enabled — afterwards
+        every file written through ``copy`` is indexed as it lands.
+        """
+        with self._lock:
+            known = {
+                rel: (size, mtime)
+                for rel, size, mtime in self._db.execute("SELECT path, size, mtime_ns FROM files")
+            }
+        added = 0
+        for dirpath, _dirnames, filenames in os.walk(self.root):
+            for name in filenames:
+                if is_stopped():
+                    return added
+                if name.startswith(".apt_"):
+                    continue  # index / journal files
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                    if known.get(self._rel(path)) == (st.st_size, st.st_mtime_ns):
+                        continue
+                    self.add(path)
+                    added += 1
+                except OSError:
+                    logging.error(f"중복 인덱스 등록 실패: {path}", exc_info=True)
+        return added
+
+    def find(self, src: str) -> tuple[str | None, str, str | None]:
+        """Look ``src`` up; returns ``(existing_path | None, quick, full)``.
+
+        ``full`` is only computed when a quick-hash candidate forced it.
+        """
+        size = os.path.getsize(src)
+        quick = quick_hash(src, size)
+        existing, full = self._lookup(src, size, quick)
+        return existing, quick, full
+
+    def _lookup(self, src: str, size: int, quick: str) -> tuple[str | None, str | None]:
+        with self._lock:
+            if self._db is None:
+                return None, None
+            rows = self._db.execute(
+                "SELECT path, mtime_ns, full FROM files WHERE size = ? AND quick = ?",
+                (size, quick),
+            ).fetchall()
+        src_full: str | None = None
+        for rel, mtime, full in rows:
+            path = os.path.join(self.root, rel)
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is None or st.st_size != size or st.st_mtime_ns != mtime:
+                self._write("DELETE FROM files WHERE path = ?", (rel,))
+                continue
+            if full is None:
+                full = full_hash(path)
+                self._write("UPDATE files SET full = ? WHERE path = ?", (full, rel))
+            if src_full is None:
+                src_full = full_hash(src)
+            if full == src_full:
+                return path, src_full
+        return None, src_full
+
+    def _claim(self, key: tuple[int, str]) -> None:
+        """Wait until no other thread is copying a file with ``key``, then own it.
+
+        Two identical sources copied concurrently would otherwise both miss
+        the index and both be written.
+        """
+        while True:
+            with self._lock:
+                busy = self._inflight.get(key)
+                if busy is None:
+                    self._inflight[key] = threading.Event()
+                    return
+            busy.wait()
+
+    def _release(self, key: tuple[int, str]) -> None:
+        with self._lock:
+            self._inflight.pop(key).set()
+
+    def copy(
+        self,
+        src: str,
+        dst: str,
+        is_stopped: StoppedCallable = _never_stopped,
+        copy: CopyCallable = copy_file_chunked,
+    ) -> str:
+        """Deduplicating drop-in for ``copy_file_chunked``."""
+        if is_stopped():
+            return "오류 발생: 사용자 중지 요청"
+        try:
+            size = os.path.getsize(src)
+            quick = quick_hash(src, size)
+        except OSError as exc:
+            return f"오류 발생: {exc}"
+        key = (size, quick)
+        self._claim(key)
+        try:
+            return self._copy_claimed(src, dst, size, quick, is_stopped, copy)
+        finally:
+            self._release(key)
+
+    def _copy_claimed(
+        self,
+        src: str,
+        dst: str,
+        size: int,
+        quick: str,
+        is_stopped: StoppedCallable,
+        copy: CopyCallable,
+    ) -> str:
+        try:
+            existing, full = self._lookup(src, size, quick)
+        except OSError as exc:
+            return f"오류 발생: {exc}"
+        if existing is not None:
+            if os.path.abspath(existing) == os.path.abspath(dst) or self.mode == DEDUP_SKIP:
+                with self._lock:
+                    self.skipped += 1
+                return f"Skipped (duplicate of {existing}) {src} -> {dst}"
+            try:
+                if os.path.lexists(dst):
+                    os.remove(dst)
+                os.link(existing, dst)
+            except OSError:
+                pass  # cross-device or no hard-link support — copy instead
+            else:
+                with self._lock:
+                    self.linked += 1
+                self.add(dst, quick, full)
+                return f"Linked (duplicate of {existing}) {src} -> {dst}"
+        result = copy(src, dst, is_stopped)
+        if not result.startswith("오류 발생"):
+            try:
+                self.add(dst, quick, full)
+            except OSError:
+                logging.error(f"중복 인덱스 등록 실패: {dst}", exc_info=True)
+        return result
+
+
+def open_content_index(target_root: str, mode: str | None) -> ContentIndex | None:
+    """``ContentIndex`` for ``mode`` (a ``dedup`` task value), or None when off."""
+    mode = mode or DEDUP_OFF
+    if mode not in DEDUP_MODES:
+        raise ValueError(f"알 수 없는 중복 처리 방식: {mode!r}")
+    if mode == DEDUP_OFF:
+        return None
+    return ContentIndex(target_root, mode)
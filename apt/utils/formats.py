@@ -6,11 +6,19 @@
     matches ``*.jpg`` whose basename **does** contain ``fov``.
 
 All other tokens are treated as plain suffix checks (case-insensitive).
+
+``is_valid_file`` re-reads the token list for every file; workers filtering
+whole directory listings build one ``FileMatcher`` per task instead, which
+folds the tokens (and optionally a FOV-number set) into a single
+precompiled check.
 """
 
 from __future__ import annotations
 
 import os
+from typing import Callable, Collection, Iterable
+
+from apt.utils.fov import extract_fov_from_filename
 
 
 def is_valid_file(filename: str, formats: list[str] | None) -> bool:
@@ -32,3 +40,68 @@ def is_valid_file(filename: str, formats: list[str] | None) -> bool:
             if fname_lower.endswith(fmt_lower):
                 return True
     return False
+
+
+class FileMatcher:
+    """Precompiled ``is_valid_file`` + FOV-number filter.
+
+    ``formats=None`` accepts every format (only the FOV set applies); an
+    empty list accepts nothing, as ``is_valid_file`` does. With
+    ``fov_numbers`` a file must also carry one of them as its leading
+    number (``extract_fov_from_filename``). ``matcher(name)`` checks one
+    name; ``matcher.filter(names)`` filters a whole listing in one call.
+    """
+
+    def __init__(
+        self,
+        formats: Iterable[str] | None,
+        fov_numbers: Collection[str] | None = None,
+    ) -> None:
+        self.formats = None if formats is None else [fmt.lower() for fmt in formats]
+        self.fov_numbers = frozenset(fov_numbers) if fov_numbers else None
+        self._match_format = self._compile_formats(self.formats)
+        self.match = self._compile(self._match_format, self.fov_numbers)
+
+    @staticmethod
+    def _compile_formats(formats: list[str] | None) -> Callable[[str], bool] | None:
+        if formats is None:
+            return None
+        suffixes = tuple(fmt for fmt in formats if fmt not in ("org_jpg", "fov_jpg"))
+        org_jpg = "org_jpg" in formats
+        fov_jpg = "fov_jpg" in formats
+        if not org_jpg and not fov_jpg:
+            if not suffixes:
+                return lambda _name: False
+            return lambda name: name.lower().endswith(suffixes)
+
+        def match(name: str) -> bool:
+            lower = name.lower()
+            if suffixes and lower.endswith(suffixes):
+                return True
+            base, ext = os.path.splitext(lower)
+            if ext != ".jpg":
+                return False
+            return fov_jpg if "fov" in base else org_jpg
+
+        return match
+
+    @staticmethod
+    def _compile(
+        match_format: Callable[[str], bool] | None,
+        fov_numbers: frozenset[str] | None,
+    ) -> Callable[[str], bool]:
+        if fov_numbers is None:
+            return match_format or (lambda _name: True)
+        if match_format is None:
+            return lambda name: extract_fov_from_filename(name) in fov_numbers
+        return lambda name: match_format(name) and extract_fov_from_filename(name) in fov_numbers
+
+    def __call__(self, name: str) -> bool:
+        return self.match(name)
+
+    def matches_format(self, name: str) -> bool:
+        return self._match_format is None or self._match_format(name)
+
+    def filter(self, names: Iterable[str]) -> list[str]:
+        """The names in ``names`` that match, in order."""
+        return list(filter(self.match, names))
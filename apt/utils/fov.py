@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import re
 
+_NON_DIGIT = re.compile(r"[^0-9]")
+
 
 def parse_fov_numbers(text: str | None) -> set[str] | None:
     """Parse a comma-separated FOV expression to a set of digit strings.
@@ -49,6 +51,7 @@ def extract_fov_from_filename(filename: str) -> str | None:
     """
     if not filename:
         return None
-    prefix = filename.split("_", 1)[0]
-    digits = re.sub(r"[^0-9]", "", prefix)
-    return digits or None
+    prefix = filename.partition("_")[0]
+    if prefix.isascii() and prefix.isdigit():
+        return prefix  # the common "12_..." case needs no regex
+    return _NON_DIGIT.sub("", prefix) or None
@@ -8,18 +8,45 @@ flag and progress logging.
 
 from __future__ import annotations
 
+import errno
 import logging
 import os
 import shutil
-from typing import Callable, Iterable
+import sys
+import threading
+from typing import TYPE_CHECKING, Callable, Iterable
 
-from apt.utils.formats import is_valid_file
+from apt.constants import TRANSFER_COPY, TRANSFER_LINK, TRANSFER_MODES
+from apt.utils.formats import FileMatcher
+
+try:  # reflinks are Linux-only (FICLONE); elsewhere link_file starts at hard links
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+if TYPE_CHECKING:
+    from apt.utils.journal import CopyJournal
 
 LogCallable = Callable[[str], None]
 StoppedCallable = Callable[[], bool]
 
 _CHUNK = 1024 * 1024  # 1 MiB
 
+# Copy engines, fastest first. ``copy_file_range`` / ``sendfile`` keep the
+# bytes in the kernel; ``readinto`` is the portable user-space fallback.
+COPY_STRATEGIES: tuple[str, ...] = ("copy_file_range", "sendfile", "readinto")
+
+# errnos meaning "this engine is not supported here" rather than a real I/O
+# failure — on these we silently try the next strategy.
+_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSUP}
+)
+
+
+# ioctl(dst_fd, FICLONE, src_fd): share the source extents copy-on-write
+# (btrfs, XFS with reflink=1, bcachefs, ...).
+_FICLONE = 0x40049409
+
 
 def _noop_log(_: str) -> None: ...
 
@@ -44,26 +71,106 @@ def ensure_target_folder(
         return False
 
 
+def _copy_range(sfd: int, dfd: int, is_stopped: StoppedCallable) -> bool:
+    """``os.copy_file_range`` loop. Returns True when stopped mid-copy."""
+    while True:
+        if is_stopped():
+            return True
+        if os.copy_file_range(sfd, dfd, _CHUNK) == 0:
+            return False
+
+
+def _copy_sendfile(sfd: int, dfd: int, is_stopped: StoppedCallable) -> bool:
+    """``os.sendfile`` loop (Linux accepts a regular file as ``out_fd``)."""
+    offset = 0
+    while True:
+        if is_stopped():
+            return True
+        sent = os.sendfile(dfd, sfd, offset, _CHUNK)
+        if sent == 0:
+            return False
+        offset += sent
+
+
+_buffers = threading.local()
+
+
+def _copy_readinto(sf, df, is_stopped: StoppedCallable) -> bool:
+    """User-space loop reading into one reused per-thread buffer."""
+    view = getattr(_buffers, "view", None)
+    if view is None:
+        view = _buffers.view = memoryview(bytearray(_CHUNK))
+    while True:
+        if is_stopped():
+            return True
+        n = sf.readinto(view)
+        if not n:
+            return False
+        df.write(view[:n])
+
+
+def available_copy_strategies() -> list[str]:
+    """Copy strategies usable on this platform, fastest first."""
+    strategies = []
+    if hasattr(os, "copy_file_range"):
+        strategies.append("copy_file_range")
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        strategies.append("sendfile")
+    strategies.append("readinto")
+    return strategies
+
+
+def default_copy_strategy() -> str:
+    return available_copy_strategies()[0]
+
+
 def copy_file_chunked(
     src: str,
     dst: str,
     is_stopped: StoppedCallable = _never_stopped,
+    strategy: str | None = None,
 ) -> str:
-    """Copy ``src`` to ``dst`` in 1 MiB chunks honouring ``is_stopped``."""
+    """Copy ``src`` to ``dst`` in 1 MiB chunks honouring ``is_stopped``.
+
+    ``strategy`` picks the copy engine (see ``COPY_STRATEGIES``); ``None``
+    uses ``default_copy_strategy()``. Kernel-side engines fall back to the
+    next one when the filesystem refuses them (e.g. cross-device SMB
+    mounts), so callers never need to care which one actually ran.
+    """
     if is_stopped():
         return "오류 발생: 사용자 중지 요청"
+    if strategy is None:
+        strategy = default_copy_strategy()
+    elif strategy not in COPY_STRATEGIES:
+        return f"오류 발생: 알 수 없는 복사 방식 {strategy!r}"
+    available = available_copy_strategies()
+    candidates = [
+        name for name in COPY_STRATEGIES[COPY_STRATEGIES.index(strategy):]
+        if name in available
+    ]
     try:
+        _unshare(dst)
         with open(src, "rb") as sf, open(dst, "wb") as df:
-            while True:
-                if is_stopped():
-                    df.close()
-                    if os.path.exists(dst):
-                        os.remove(dst)
-                    return "오류 발생: 사용자 중지 요청"
-                data = sf.read(_CHUNK)
-                if not data:
+            stopped = False
+            for name in candidates:
+                try:
+                    if name == "copy_file_range":
+                        stopped = _copy_range(sf.fileno(), df.fileno(), is_stopped)
+                    elif name == "sendfile":
+                        stopped = _copy_sendfile(sf.fileno(), df.fileno(), is_stopped)
+                    else:
+                        stopped = _copy_readinto(sf, df, is_stopped)
                     break
-                df.write(data)
+                except OSError as exc:
+                    # Only fall back if nothing was written yet — a failure
+                    # half-way through is a real I/O error.
+                    if exc.errno not in _FALLBACK_ERRNOS or os.fstat(df.fileno()).st_size:
+                        raise
+                    sf.seek(0)
+        if stopped:
+            if os.path.exists(dst):
+                os.remove(dst)
+            return "오류 발생: 사용자 중지 요청"
         return f"Copied {src} to {dst}"
     except Exception as exc:
         logging.error("파일 복사 오류", exc_info=True)
@@ -75,6 +182,70 @@ def copy_file_chunked(
         return f"오류 발생: {exc}"
 
 
+def _unshare(dst: str) -> None:
+    """Remove ``dst`` if it is a hard link, so rewriting it can't alter the
+    other names of the same inode (e.g. the source a link run linked it to)."""
+    try:
+        if os.stat(dst).st_nlink > 1:
+            os.remove(dst)
+    except FileNotFoundError:
+        pass
+
+
+def _reflink(src: str, dst: str) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as sf, open(dst, "wb") as df:
+            fcntl.ioctl(df.fileno(), _FICLONE, sf.fileno())
+        return True
+    except OSError:
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        return False
+
+
+def link_file(
+    src: str,
+    dst: str,
+    is_stopped: StoppedCallable = _never_stopped,
+) -> str:
+    """Place ``src`` at ``dst`` without copying bytes when the volume allows.
+
+    Tries a reflink (copy-on-write clone, independent of the source
+    afterwards), then a hard link (shares the inode — editing one edits
+    both), then falls back to ``copy_file_chunked``. Drop-in for
+    ``copy_file_chunked``; the result says which one ran.
+    """
+    if is_stopped():
+        return "오류 발생: 사용자 중지 요청"
+    try:
+        if os.path.lexists(dst):
+            if os.path.samefile(src, dst):
+                return f"Linked {src} to {dst}"
+            os.remove(dst)
+    except OSError as exc:
+        return f"오류 발생: {exc}"
+    if _reflink(src, dst):
+        return f"Reflinked {src} to {dst}"
+    try:
+        os.link(src, dst)
+        return f"Linked {src} to {dst}"
+    except OSError:
+        pass  # cross-device, FAT/exFAT, SMB without link support, ...
+    return copy_file_chunked(src, dst, is_stopped)
+
+
+def transfer_function(mode: str | None) -> Callable[[str, str, StoppedCallable], str]:
+    """Per-file transfer for a ``transfer`` task value (``copy`` / ``link``)."""
+    mode = mode or TRANSFER_COPY
+    if mode not in TRANSFER_MODES:
+        raise ValueError(f"알 수 없는 전송 방식: {mode!r}")
+    return link_file if mode == TRANSFER_LINK else copy_file_chunked
+
+
 def copy_folder(src: str, dst: str, is_stopped: StoppedCallable = _never_stopped) -> str:
     if is_stopped():
         return "오류 발생: 사용자 중지 요청"
@@ -93,11 +264,20 @@ def copy_folder_filtered(
     dst: str,
     formats: Iterable[str],
     is_stopped: StoppedCallable = _never_stopped,
+    journal: "CopyJournal | None" = None,
+    copy: Callable[[str, str, StoppedCallable], str] | None = None,
 ) -> str:
-    """Copy the immediate files of ``src`` matching ``formats`` into ``dst``."""
+    """Copy the immediate files of ``src`` matching ``formats`` into ``dst``.
+
+    With a ``journal`` every file goes through ``journal.copy`` so resumed
+    runs skip files that are already proven done. ``copy`` replaces the
+    per-file copy (e.g. ``ContentIndex.copy``); default ``copy_file_chunked``.
+    """
+    if copy is None:
+        copy = copy_file_chunked
     if is_stopped():
         return "오류 발생: 사용자 중지 요청"
-    formats_list = list(formats)
+    matcher = FileMatcher(formats)
     try:
         if not os.path.exists(dst):
             os.makedirs(dst, exist_ok=True)
@@ -106,10 +286,13 @@ def copy_folder_filtered(
             for entry in it:
                 if is_stopped():
                     return "오류 발생: 사용자 중지 요청"
-                if entry.is_file() and is_valid_file(entry.name, formats_list):
+                if entry.is_file() and matcher(entry.name):
                     src_file = os.path.join(src, entry.name)
                     dst_file = os.path.join(dst, entry.name)
-                    result = copy_file_chunked(src_file, dst_file, is_stopped)
+                    if journal is not None:
+                        result = journal.copy(src_file, dst_file, is_stopped, copy=copy)
+                    else:
+                        result = copy(src_file, dst_file, is_stopped)
                     if not result.startswith("오류 발생"):
                         count += 1
         return f"Copied {count} file(s) from {src} to {dst} (filtered)"
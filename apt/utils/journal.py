@@ -0,0 +1,131 @@
+"""Append-only copy journal used to resume interrupted copy / sorting jobs.
+
+Every successfully copied file is recorded as one JSON line
+``{"src", "dst", "size", "mtime"}`` in ``<target>/.apt_journal.jsonl``. A
+later run with ``resume`` enabled skips any pair whose journal entry still
+matches the source (same size + mtime) and whose destination exists with the
+same size — i.e. work the journal *proves* is done. Anything else, including
+a half-written destination left behind by a crash, is copied again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Callable
+
+from apt.utils.fs import StoppedCallable, _never_stopped, copy_file_chunked
+
+JOURNAL_FILENAME = ".apt_journal.jsonl"
+
+CopyCallable = Callable[[str, str, StoppedCallable], str]
+
+
+class CopyJournal:
+    """Thread-safe journal of completed ``(src, dst, size, mtime)`` copies.
+
+    ``resume=False`` starts a fresh journal (the previous one is truncated,
+    since the run re-copies everything anyway). ``resume=True`` loads the
+    existing entries and keeps appending to the same file. ``read_only``
+    only loads — nothing under the target is created (dry runs). With
+    ``metrics`` (a ``TaskMetrics``) every recorded copy adds to its
+    ``files`` / ``bytes`` counters.
+    """
+
+    def __init__(
+        self,
+        target_root: str,
+        resume: bool = False,
+        read_only: bool = False,
+        metrics=None,
+    ) -> None:
+        self.path = os.path.join(target_root, JOURNAL_FILENAME)
+        self.resume = resume
+        self.metrics = metrics
+        self._done: dict[tuple[str, str], tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        if resume:
+            self._load()
+        self._fh = None
+        if not read_only:
+            os.makedirs(target_root, exist_ok=True)
+            self._fh = open(self.path, "a" if resume else "w", encoding="utf-8")
+
+    # ------------------------------------------------------------------
+    def __enter__(self) -> "CopyJournal":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None and not self._fh.closed:
+                self._fh.close()
+
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    key = (entry["src"], entry["dst"])
+                    self._done[key] = (int(entry["size"]), int(entry["mtime"]))
+                except (ValueError, KeyError, TypeError):
+                    # A crash mid-write leaves a truncated last line — ignore.
+                    continue
+
+    def is_done(self, src: str, dst: str) -> bool:
+        """True if ``src -> dst`` was journaled and neither side changed since."""
+        recorded = self._done.get((src, dst))
+        if recorded is None:
+            return False
+        size, mtime = recorded
+        try:
+            st = os.stat(src)
+            return (
+                st.st_size == size
+                and st.st_mtime_ns == mtime
+                and os.path.getsize(dst) == size
+            )
+        except OSError:
+            return False
+
+    def record(self, src: str, dst: str) -> None:
+        try:
+            st = os.stat(src)
+        except OSError:
+            logging.error(f"저널 기록 실패: {src}", exc_info=True)
+            return
+        entry = {"src": src, "dst": dst, "size": st.st_size, "mtime": st.st_mtime_ns}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._done[(src, dst)] = (st.st_size, st.st_mtime_ns)
+            if self._fh is not None and not self._fh.closed:
+                self._fh.write(line)
+                self._fh.flush()
+        if self.metrics is not None:
+            self.metrics.add("files")
+            self.metrics.add("bytes", st.st_size)
+
+    def copy(
+        self,
+        src: str,
+        dst: str,
+        is_stopped: StoppedCallable = _never_stopped,
+        copy: CopyCallable = copy_file_chunked,
+    ) -> str:
+        """Journaled drop-in for ``copy_file_chunked``."""
+        if self.resume and self.is_done(src, dst):
+            return f"Skipped (journal) {src} -> {dst}"
+        result = copy(src, dst, is_stopped)
+        if not result.startswith("오류 발생"):
+            self.record(src, dst)
+        return result
@@ -0,0 +1,181 @@
+"""Persistent directory listings, invalidated by the directory's mtime.
+
+Basic Sorting and NG Folder Sorting are rerun many times a day against the
+same inner-ID trees with different FOV numbers, and each run lists every
+inner-ID folder again — on a network share that listing is most of the
+run. ``ListingCache`` stores each listing in SQLite keyed by the absolute
+directory path together with the directory's ``st_mtime_ns``. Adding,
+removing or renaming an entry bumps the directory mtime, so a listing is
+reused only while the folder is unchanged; a listing taken within
+``_SETTLE_NS`` of the directory's last change is not stored, since more
+entries could still land in the same timestamp tick.
+
+Only names are cached — file *contents* changing never affects a listing.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+from apt.utils.paths import user_data_path
+
+LISTING_CACHE_FILENAME = "listing_cache.sqlite"
+
+_SETTLE_NS = 2_000_000_000  # FAT / SMB mtimes can be 2 s coarse
+_COMMIT_EVERY = 512
+_SEP = "\0"  # never valid in a file name
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS listings ("
+    " path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL,"
+    " files TEXT NOT NULL, dirs TEXT NOT NULL, dir_links TEXT NOT NULL)"
+)
+
+
+class DirListing(NamedTuple):
+    """Entry names of one directory.
+
+    ``dirs`` holds every entry that is a directory (following symlinks, as
+    ``DirEntry.is_dir()`` does); ``dir_links`` the subset that are
+    symlinks, which recursive scans do not enter.
+    """
+
+    files: tuple[str, ...]
+    dirs: tuple[str, ...]
+    dir_links: tuple[str, ...] = ()
+
+
+def scan_listing(path: str) -> DirListing:
+    """List ``path`` with ``os.scandir`` (uncached)."""
+    files: list[str] = []
+    dirs: list[str] = []
+    links: list[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                    if entry.is_symlink():
+                        links.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+            except OSError:
+                continue
+    return DirListing(tuple(files), tuple(dirs), tuple(links))
+
+
+def _split(joined: str) -> tuple[str, ...]:
+    return tuple(joined.split(_SEP)) if joined else ()
+
+
+class ListingCache:
+    """Thread-safe on-disk cache of ``DirListing`` s."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending = 0
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    def __enter__(self) -> "ListingCache":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+    def listdir(self, path: str) -> DirListing:
+        """Listing of ``path`` — from the cache while its mtime is unchanged.
+
+        Raises ``OSError`` like ``os.scandir`` when ``path`` can't be listed.
+        """
+        key = os.path.abspath(path)
+        mtime = os.stat(key).st_mtime_ns
+        with self._lock:
+            row = None
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT mtime_ns, files, dirs, dir_links FROM listings WHERE path = ?", (key,)
+                ).fetchone()
+        if row is not None and row[0] == mtime:
+            self.hits += 1
+            return DirListing(_split(row[1]), _split(row[2]), _split(row[3]))
+        self.misses += 1
+        listing = scan_listing(key)
+        if time.time_ns() - mtime > _SETTLE_NS:
+            self._store(key, mtime, listing)
+        return listing
+
+    def _store(self, key: str, mtime: int, listing: DirListing) -> None:
+        with self._lock:
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO listings (path, mtime_ns, files, dirs, dir_links)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, mtime, _SEP.join(listing.files), _SEP.join(listing.dirs),
+                 _SEP.join(listing.dir_links)),
+            )
+            self._pending += 1
+            if self._pending >= _COMMIT_EVERY:
+                self._db.commit()
+                self._pending = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._db is not None and self._pending:
+                self._db.commit()
+                self._pending = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM listings")
+                self._db.commit()
+                self._pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+
+def list_dir(path: str, cache: ListingCache | None = None) -> DirListing:
+    """``cache.listdir(path)``, or a plain scan when no cache is in use."""
+    return cache.listdir(path) if cache is not None else scan_listing(path)
+
+
+_shared_cache: ListingCache | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_listing_cache() -> ListingCache:
+    """The app-wide cache, kept next to ``error.log``."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ListingCache(user_data_path(LISTING_CACHE_FILENAME))
+        return _shared_cache
+
+
+def listing_cache_for(task: dict) -> ListingCache | None:
+    """The shared cache when the task asks for it (``listing_cache: true``)."""
+    return shared_listing_cache() if task.get("listing_cache", False) else None
@@ -0,0 +1,32 @@
+"""Where the app keeps its own files (error.log, the job queue, …)."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+
+def user_data_path(filename: str) -> str:
+    """Pick a writable location for an app-owned file.
+
+    Dev mode (running from source) keeps the historical project-root
+    location so existing tooling/docs stay valid. Installed builds cannot
+    write there — ``Program Files\\AIVEX\\APT\\`` is admin-only — so we
+    redirect to ``%LOCALAPPDATA%\\AIVEX\\APT\\<filename>`` (writable by
+    every Windows user, persists across upgrades).
+    """
+    if getattr(sys, "frozen", False):
+        base = (
+            os.environ.get("LOCALAPPDATA")
+            or os.environ.get("APPDATA")
+            or os.path.expanduser("~")
+        )
+        data_dir = os.path.join(base, "AIVEX", "APT")
+        try:
+            os.makedirs(data_dir, exist_ok=True)
+            return os.path.join(data_dir, filename)
+        except OSError:
+            # Last-resort: a temp file we know we can open.
+            import tempfile
+            return os.path.join(tempfile.gettempdir(), f"aivex_apt_{filename}")
+    return filename
@@ -0,0 +1,117 @@
+"""Named crop regions for the multi-region Crop mode.
+
+Regions come either from the task (``regions``) or from an ROI file
+(``roi_file``), both as ``[{"name": "pad_1", "box": [a, b, c, d]}, ...]``
+where the box is read in the task's ``coords_mode`` (``ltrb`` or ``xywh``).
+An ROI file may also hold that list under a ``"regions"`` key, or be a
+LabelMe file drawn on a sample image: its rectangle shapes become the
+regions, named after their labels (``pad``, ``pad_2``, … when a label
+repeats).
+
+Each name becomes a sub-folder of the Crop target, so names must be valid
+folder names and unique.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+_FORBIDDEN_CHARS = set('<>:"/\\|?*')
+
+
+@dataclass(frozen=True)
+class CropRegion:
+    name: str
+    box: tuple[int, int, int, int]  # LTRB
+
+
+def _check_name(name: object) -> str:
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError(f"영역 이름이 비어 있습니다: {name!r}")
+    name = name.strip()
+    if name in (".", "..") or _FORBIDDEN_CHARS & set(name) or any(ord(c) < 32 for c in name):
+        raise ValueError(f"폴더 이름으로 쓸 수 없는 영역 이름입니다: {name!r}")
+    return name
+
+
+def _to_ltrb(name: str, values: object, coords_mode: str) -> tuple[int, int, int, int]:
+    if not isinstance(values, (list, tuple)) or len(values) != 4:
+        raise ValueError(f"영역 '{name}'의 box는 정수 4개여야 합니다: {values!r}")
+    try:
+        a, b, c, d = (int(v) for v in values)
+    except (TypeError, ValueError):
+        raise ValueError(f"영역 '{name}'의 box는 정수 4개여야 합니다: {values!r}") from None
+    if coords_mode != "xywh":
+        return a, b, c, d
+    width, height = abs(c), abs(d)
+    if width == 0 or height == 0:
+        raise ValueError(f"영역 '{name}'의 width/height가 0입니다.")
+    return a, b, a + width, b + height
+
+
+def unique_regions(regions: list[CropRegion]) -> list[CropRegion]:
+    """``regions`` unchanged; raises ``ValueError`` if two share a folder name."""
+    seen: set[str] = set()
+    for region in regions:
+        key = region.name.casefold()  # folders collide case-insensitively on Windows
+        if key in seen:
+            raise ValueError(f"영역 이름이 중복됩니다: {region.name}")
+        seen.add(key)
+    return regions
+
+
+def parse_regions(items: object, coords_mode: str = "ltrb") -> list[CropRegion]:
+    """``CropRegion``s from a list of ``{"name", "box"}`` dicts.
+
+    Raises ``ValueError`` (with a message fit for the log) on bad input.
+    """
+    if not isinstance(items, list) or not items:
+        raise ValueError("영역 목록이 비어 있습니다.")
+    regions = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError(f"영역 항목은 name / box를 가진 객체여야 합니다: {item!r}")
+        name = _check_name(item.get("name"))
+        regions.append(CropRegion(name, _to_ltrb(name, item.get("box"), coords_mode)))
+    return unique_regions(regions)
+
+
+def _labelme_regions(shapes: list) -> list[CropRegion]:
+    regions = []
+    counts: dict[str, int] = {}
+    for shape in shapes:
+        if not isinstance(shape, dict) or (shape.get("shape_type") or "").lower() != "rectangle":
+            continue
+        points = shape.get("points") or []
+        if len(points) < 2:
+            continue
+        label = _check_name(shape.get("label") or "roi")
+        counts[label] = counts.get(label, 0) + 1
+        name = label if counts[label] == 1 else f"{label}_{counts[label]}"
+        try:
+            (x1, y1), (x2, y2) = (float(v) for v in points[0][:2]), (float(v) for v in points[1][:2])
+        except (TypeError, ValueError):
+            raise ValueError(f"영역 '{name}'의 좌표가 올바르지 않습니다: {points!r}") from None
+        regions.append(CropRegion(name, (
+            round(min(x1, x2)), round(min(y1, y2)), round(max(x1, x2)), round(max(y1, y2)),
+        )))
+    if not regions:
+        raise ValueError("LabelMe 파일에 rectangle 도형이 없습니다.")
+    return unique_regions(regions)
+
+
+def load_roi_file(path: str, coords_mode: str = "ltrb") -> list[CropRegion]:
+    """Regions from an ROI file (see the module docstring for the formats)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except OSError as exc:
+        raise ValueError(f"ROI 파일을 읽을 수 없습니다: {exc}") from None
+    except ValueError as exc:
+        raise ValueError(f"ROI 파일이 올바른 JSON이 아닙니다: {exc}") from None
+    if isinstance(data, dict) and isinstance(data.get("shapes"), list):
+        return _labelme_regions(data["shapes"])
+    if isinstance(data, dict):
+        data = data.get("regions")
+    return parse_regions(data, coords_mode)
@@ -0,0 +1,232 @@
+"""Parallel directory scanner shared by every worker.
+
+``scan_files`` fans ``os.scandir`` calls out over a thread pool — one task
+per directory — and yields matching files as soon as their directory has been
+listed, so callers can start working before the whole tree is enumerated.
+On network shares the per-directory round-trip dominates, which is exactly
+what the fan-out hides.
+
+Filtering happens while scanning:
+
+* directories whose lowercase name is in ``ignored_dirs`` are not entered
+  (mirrors the ``dirnames[:] = ...`` pruning the workers used with
+  ``os.walk``);
+* files must pass ``is_valid_file(name, formats)`` when ``formats`` is given
+  and carry one of ``fov_numbers`` (``extract_fov_from_filename``) when
+  that is given — both compiled once into a ``FileMatcher``;
+* an optional ``file_filter(name)`` callable handles anything else.
+
+Yield order is not deterministic — sort if you need a stable order.
+
+Handlers feed the scan straight into ``bounded_map`` through
+``StreamedScan``, so the first copy / crop / conversion starts as soon as
+the first directory is listed. The price is that the total is unknown
+until the scan ends: progress stays put while scanning and counts against
+the final total afterwards. Dry runs still list everything first (a plan
+needs the full picture), as does Attach FOV, whose pairing needs both
+complete listings, and Render Overlays, which is meant for a handful of
+picked files.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Collection, Generic, Iterable, Iterator, NamedTuple, TypeVar
+
+from apt.constants import IGNORED_DIRS
+from apt.utils.formats import FileMatcher
+from apt.utils.fs import StoppedCallable, _never_stopped
+
+if TYPE_CHECKING:
+    from apt.utils.listing_cache import ListingCache
+
+ErrorCallable = Callable[[str, Exception], None]
+
+DEFAULT_SCAN_WORKERS = 8
+
+T = TypeVar("T")
+
+
+class ScanEntry(NamedTuple):
+    """One matching file.
+
+    ``root`` is the scan root it was found under and ``rel_dir`` the
+    directory relative to that root (``"."`` for files directly in it).
+    """
+
+    path: str
+    name: str
+    dirpath: str
+    root: str
+    rel_dir: str
+
+    @property
+    def top_folder(self) -> str:
+        """First path component below ``root`` (the inner ID for most trees)."""
+        return self.rel_dir.split(os.sep, 1)[0]
+
+
+def _ignore_error(_path: str, _exc: Exception) -> None: ...
+
+
+def _list_dir(
+    dirpath: str,
+    root: str,
+    rel_dir: str,
+    accept: Callable[[str], bool],
+    ignored: Collection[str],
+    recursive: bool,
+    skip_files: bool,
+    cache: "ListingCache | None" = None,
+) -> tuple[list[ScanEntry], list[tuple[str, str, str]]]:
+    if cache is not None:
+        return _list_cached_dir(dirpath, root, rel_dir, accept, ignored, recursive, skip_files, cache)
+    files: list[ScanEntry] = []
+    subdirs: list[tuple[str, str, str]] = []
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    # Like os.walk(followlinks=False): symlinked dirs are not entered.
+                    if recursive and entry.name.lower() not in ignored and not entry.is_symlink():
+                        sub_rel = entry.name if rel_dir == "." else os.path.join(rel_dir, entry.name)
+                        subdirs.append((entry.path, root, sub_rel))
+                    continue
+                if skip_files or not entry.is_file() or not accept(entry.name):
+                    continue
+            except OSError:
+                continue
+            files.append(ScanEntry(os.path.join(dirpath, entry.name), entry.name, dirpath, root, rel_dir))
+    return files, subdirs
+
+
+def _list_cached_dir(
+    dirpath: str,
+    root: str,
+    rel_dir: str,
+    accept: Callable[[str], bool],
+    ignored: Collection[str],
+    recursive: bool,
+    skip_files: bool,
+    cache: "ListingCache",
+) -> tuple[list[ScanEntry], list[tuple[str, str, str]]]:
+    """``_list_dir`` over a cached listing of ``dirpath``."""
+    listing = cache.listdir(dirpath)
+    subdirs: list[tuple[str, str, str]] = []
+    if recursive:
+        links = set(listing.dir_links)
+        for name in listing.dirs:
+            if name.lower() not in ignored and name not in links:
+                sub_rel = name if rel_dir == "." else os.path.join(rel_dir, name)
+                subdirs.append((os.path.join(dirpath, name), root, sub_rel))
+    if skip_files:
+        return [], subdirs
+    files = [
+        ScanEntry(os.path.join(dirpath, name), name, dirpath, root, rel_dir)
+        for name in listing.files
+        if accept(name)
+    ]
+    return files, subdirs
+
+
+def make_file_filter(
+    formats: Iterable[str] | None = None,
+    fov_numbers: Collection[str] | None = None,
+    file_filter: Callable[[str], bool] | None = None,
+) -> Callable[[str], bool]:
+    """Combine the format / FOV / custom predicates into one callable."""
+    match = FileMatcher(formats, fov_numbers).match
+    if file_filter is None:
+        return match
+    return lambda name: match(name) and file_filter(name)
+
+
+def scan_files(
+    roots: str | Iterable[str],
+    *,
+    formats: Iterable[str] | None = None,
+    fov_numbers: Collection[str] | None = None,
+    file_filter: Callable[[str], bool] | None = None,
+    recursive: bool = True,
+    ignored_dirs: Collection[str] = IGNORED_DIRS,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    is_stopped: StoppedCallable = _never_stopped,
+    on_error: ErrorCallable = _ignore_error,
+    cache: "ListingCache | None" = None,
+) -> Iterator[ScanEntry]:
+    """Yield every file under ``roots`` that passes the filters.
+
+    ``roots`` may be one folder or many; with ``recursive=False`` each root
+    is listed once, which turns "scan 50k inner-ID folders" into 50k
+    parallel ``scandir`` calls. Unreadable directories are reported through
+    ``on_error`` and skipped. Stops early (without raising) once
+    ``is_stopped()`` turns true; closing the generator cancels pending
+    listings. With a ``cache`` (``ListingCache``), folders whose mtime
+    hasn't changed since an earlier scan are not listed again.
+    """
+    if isinstance(roots, str):
+        roots = [roots]
+    accept = make_file_filter(formats, fov_numbers, file_filter)
+    ignored = {d.lower() for d in ignored_dirs}
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    pending: dict[Future, str] = {}
+
+    def submit(dirpath: str, root: str, rel_dir: str) -> None:
+        # A root whose own name is ignored still gets descended into — only
+        # its direct files are skipped (same as the legacy os.walk loops).
+        skip_files = rel_dir == "." and os.path.basename(dirpath.rstrip("\\/")).lower() in ignored
+        fut = executor.submit(
+            _list_dir, dirpath, root, rel_dir, accept, ignored, recursive, skip_files, cache
+        )
+        pending[fut] = dirpath
+
+    try:
+        for root in roots:
+            submit(root, root, ".")
+        while pending:
+            if is_stopped():
+                return
+            done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for fut in done:
+                dirpath = pending.pop(fut)
+                try:
+                    files, subdirs = fut.result()
+                except Exception as exc:  # noqa: BLE001 — reported, not fatal
+                    on_error(dirpath, exc)
+                    continue
+                for sub in subdirs:
+                    submit(*sub)
+                yield from files
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class StreamedScan(Generic[T]):
+    """Counts the items of a streamed scan as a handler consumes them.
+
+    ``found`` is what has been yielded so far and ``done`` turns true once
+    the scan is exhausted, when ``on_done(found)`` runs (on the consuming
+    thread). ``percent(processed)`` is ``None`` until then — the total is not
+    known yet — and ``processed / found`` after.
+    """
+
+    def __init__(self, items: Iterable[T], on_done: Callable[[int], None] | None = None) -> None:
+        self._items = items
+        self._on_done = on_done
+        self.found = 0
+        self.done = False
+
+    def __iter__(self) -> Iterator[T]:
+        for item in self._items:
+            self.found += 1
+            yield item
+        self.done = True
+        if self._on_done is not None:
+            self._on_done(self.found)
+
+    def percent(self, processed: int) -> int | None:
+        if not self.done or not self.found:
+            return None
+        return min(int(processed / self.found * 100), 100)
@@ -2,5 +2,8 @@ from apt.widgets.path_picker import PathPicker
 from apt.widgets.format_selector import FormatSelector
 from apt.widgets.fov_input import FOVInput
 from apt.widgets.log_console import LogConsole
+from apt.widgets.backend_selector import BackendSelector
+from apt.widgets.dedup_selector import DedupSelector
+from apt.widgets.jpeg_options import JpegOptionsEditor
 
-__all__ = ["PathPicker", "FormatSelector", "FOVInput", "LogConsole"]
+__all__ = ["PathPicker", "FormatSelector", "FOVInput", "LogConsole", "BackendSelector", "DedupSelector", "JpegOptionsEditor"]
@@ -0,0 +1,19 @@
+"""Execution-backend picker (threads vs. processes) for CPU-bound panels."""
+
+from __future__ import annotations
+
+from PyQt5.QtWidgets import QComboBox, QWidget
+
+from apt.constants import BACKEND_CHOICES
+
+
+class BackendSelector(QComboBox):
+    """QComboBox over ``BACKEND_CHOICES``; ``.value()`` is the task token."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        for label, token in BACKEND_CHOICES:
+            self.addItem(label, token)
+
+    def value(self) -> str:
+        return self.currentData()
@@ -0,0 +1,23 @@
+"""Duplicate-handling picker (off / skip / hard-link) for copy panels."""
+
+from __future__ import annotations
+
+from PyQt5.QtWidgets import QComboBox, QWidget
+
+from apt.constants import DEDUP_CHOICES
+
+
+class DedupSelector(QComboBox):
+    """QComboBox over ``DEDUP_CHOICES``; ``.value()`` is the task token."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        for label, token in DEDUP_CHOICES:
+            self.addItem(label, token)
+        self.setToolTip(
+            "Target에 같은 내용의 파일이 이미 있으면 복사하지 않고 건너뛰거나 하드링크합니다 "
+            "(.apt_dedup.sqlite 인덱스)."
+        )
+
+    def value(self) -> str:
+        return self.currentData()
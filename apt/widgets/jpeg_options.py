@@ -0,0 +1,55 @@
+"""JPEG encoder / quality / subsampling row for the BTJ panel."""
+
+from __future__ import annotations
+
+from PyQt5.QtWidgets import QCheckBox, QComboBox, QHBoxLayout, QLabel, QSpinBox, QWidget
+
+from apt.constants import BTJ_ENCODER_CHOICES, JPEG_QUALITY_DEFAULT, JPEG_SUBSAMPLINGS
+
+
+class JpegOptionsEditor(QWidget):
+    """Compact editor whose ``.values()`` are the BTJ task's JPEG keys."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.encoder_combo = QComboBox()
+        for label, token in BTJ_ENCODER_CHOICES:
+            self.encoder_combo.addItem(label, token)
+        self.encoder_combo.setToolTip(
+            "OpenCV: 메모리 매핑된 BMP를 바로 디코딩하고 libjpeg-turbo로 인코딩합니다 "
+            "(흑백 BMP는 흑백 JPG로 저장)."
+        )
+        layout.addWidget(self.encoder_combo)
+
+        layout.addWidget(QLabel("Quality"))
+        self.quality_spin = QSpinBox()
+        self.quality_spin.setRange(1, 100)
+        self.quality_spin.setValue(JPEG_QUALITY_DEFAULT)
+        layout.addWidget(self.quality_spin)
+
+        self.subsampling_combo = QComboBox()
+        self.subsampling_combo.addItems(JPEG_SUBSAMPLINGS)
+        self.subsampling_combo.setCurrentText("4:2:0")
+        self.subsampling_combo.setToolTip("Chroma subsampling")
+        layout.addWidget(self.subsampling_combo)
+
+        self.optimize_check = QCheckBox("Optimize")
+        self.progressive_check = QCheckBox("Progressive")
+        self.metadata_check = QCheckBox("Keep Metadata")
+        self.metadata_check.setToolTip("해상도(DPI), ICC 프로파일, 원본 파일 시간을 유지합니다.")
+        for check in (self.optimize_check, self.progressive_check, self.metadata_check):
+            layout.addWidget(check)
+        layout.addStretch(1)
+
+    def values(self) -> dict:
+        return {
+            "encoder": self.encoder_combo.currentData(),
+            "quality": self.quality_spin.value(),
+            "subsampling": self.subsampling_combo.currentText(),
+            "optimize": self.optimize_check.isChecked(),
+            "progressive": self.progressive_check.isChecked(),
+            "keep_metadata": self.metadata_check.isChecked(),
+        }
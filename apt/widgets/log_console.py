@@ -1,47 +1,119 @@
-"""Read-only log console with timestamps and a Clear button."""
+"""Read-only log console with timestamps, filtering, export and Clear.
 
-from __future__ import annotations
+Backed by ``LogModel`` in a single-column ``QTableView`` with fixed row
+heights, so only the visible rows are ever rendered — the console stays
+responsive with a million records (``QListView`` re-lays out every row on
+each insert, even with uniform item sizes). Older records drop off once
+``max_records`` (``DEFAULT_MAX_RECORDS``, 50,000) is reached; the complete
+log of a task run lives in its file under ``logs/``.
+"""
 
-from datetime import datetime
+from __future__ import annotations
 
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QFileDialog,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
+    QLineEdit,
     QPushButton,
-    QTextEdit,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from apt.widgets.log_model import (
+    DEFAULT_MAX_RECORDS,
+    LEVEL_ERROR,
+    LEVEL_INFO,
+    LEVEL_WARNING,
+    LogModel,
+)
+
+_LEVEL_CHOICES = [("All", LEVEL_INFO), ("Warn+", LEVEL_WARNING), ("Error", LEVEL_ERROR)]
+
 
 class LogConsole(QWidget):
-    def __init__(self, parent: QWidget | None = None) -> None:
+    def __init__(self, parent: QWidget | None = None, max_records: int = DEFAULT_MAX_RECORDS) -> None:
         super().__init__(parent)
+        self.model = LogModel(max_records, self)
 
         header = QHBoxLayout()
         header.setContentsMargins(0, 0, 0, 0)
         header.addWidget(QLabel("<b>Logs</b>"))
         header.addStretch(1)
+        self.level_combo = QComboBox()
+        for label, level in _LEVEL_CHOICES:
+            self.level_combo.addItem(label, level)
+        self.level_combo.currentIndexChanged.connect(self._apply_filter)
+        header.addWidget(self.level_combo)
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter…")
+        self.filter_edit.setClearButtonEnabled(True)
+        header.addWidget(self.filter_edit)
+        self.export_button = QPushButton("Export")
+        self.export_button.clicked.connect(self.export_dialog)
+        header.addWidget(self.export_button)
         self.clear_button = QPushButton("Clear")
         self.clear_button.clicked.connect(self.clear)
         header.addWidget(self.clear_button)
 
-        self.text = QTextEdit()
-        self.text.setObjectName("LogConsole")
-        self.text.setReadOnly(True)
+        # Re-filter once typing pauses rather than on every keystroke.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.filter_edit.textChanged.connect(lambda _text: self._filter_timer.start())
+
+        self.view = QTableView()
+        self.view.setObjectName("LogConsole")
+        self.view.setModel(self.model)
+        self.view.setShowGrid(False)
+        self.view.setWordWrap(False)
+        self.view.horizontalHeader().hide()
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        rows = self.view.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.view.fontMetrics().height() + 4)
+        self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.view.setSelectionMode(QAbstractItemView.ExtendedSelection)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(6)
         layout.addLayout(header)
-        layout.addWidget(self.text, 1)
+        layout.addWidget(self.view, 1)
 
     # -- API ------------------------------------------------------------
     def append(self, message: str) -> None:
-        if not message:
-            return
-        stamp = datetime.now().strftime("%H:%M:%S")
-        self.text.append(f"[{stamp}] {message}")
+        self.append_many([message])
+
+    def append_many(self, messages: list[str]) -> None:
+        bar = self.view.verticalScrollBar()
+        follow = bar.value() >= bar.maximum()
+        self.model.append_many(messages)
+        if follow:
+            self.view.scrollToBottom()
 
     def clear(self) -> None:  # noqa: D401
-        self.text.clear()
+        self.model.clear()
+
+    def export(self, path: str) -> int:
+        """Write the currently visible (filtered) lines to ``path``."""
+        return self.model.export(path)
+
+    def export_dialog(self) -> None:
+        path, _ = QFileDialog.getSaveFileName(self, "Export Logs", "logs.txt", "Log files (*.txt *.log)")
+        if path:
+            self.export(path)
+
+    # -- internals --------------------------------------------------------
+    def _apply_filter(self) -> None:
+        self._filter_timer.stop()
+        self.model.set_filter(self.level_combo.currentData(), self.filter_edit.text())
+        self.view.scrollToBottom()
@@ -0,0 +1,180 @@
+"""Array-backed list model behind ``LogConsole``.
+
+A ``QTextEdit`` lays out every line it holds; after tens of thousands of
+lines each append costs milliseconds. ``LogModel`` keeps records in flat
+columns — ``array('d')`` timestamps, a ``bytearray`` of levels and a list of
+message strings — and a single-column ``QTableView`` with fixed row heights
+only asks for the rows on screen, so even a million records (with a raised
+``max_records``) stay cheap to append and scroll.
+
+Filtering (minimum level and/or case-insensitive text) keeps an
+``array('l')`` of matching record indices; with no filter active the
+index is skipped entirely and rows map 1:1 to records.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Any, Iterable
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt5.QtGui import QColor
+
+from apt.theme import DANGER, ORANGE
+
+LEVEL_INFO = 0
+LEVEL_WARNING = 1
+LEVEL_ERROR = 2
+LEVEL_NAMES = ("INFO", "WARN", "ERROR")
+
+# Handlers log plain text; the level is inferred from the wording they use.
+_ERROR_TOKENS = ("오류", "실패", "Error", "error")
+_WARNING_TOKENS = ("건너뜀", "Skipped", "경고", "없음", "중지", "중단")
+
+# Per console. Each record keeps its message string alive, so the default
+# stays modest; the full log of a run is on disk anyway.
+DEFAULT_MAX_RECORDS = 50_000
+
+LevelRole = Qt.UserRole + 1
+
+
+def classify_level(message: str) -> int:
+    if any(token in message for token in _ERROR_TOKENS):
+        return LEVEL_ERROR
+    if any(token in message for token in _WARNING_TOKENS):
+        return LEVEL_WARNING
+    return LEVEL_INFO
+
+
+class LogModel(QAbstractListModel):
+    """Append-only log records with level / text filtering."""
+
+    def __init__(self, max_records: int = DEFAULT_MAX_RECORDS, parent=None) -> None:
+        super().__init__(parent)
+        self.max_records = max(1, max_records)
+        self._times = array("d")
+        self._levels = bytearray()
+        self._messages: list[str] = []
+        self._min_level = LEVEL_INFO
+        self._needle = ""
+        self._visible: array | None = None  # None → every record is visible
+        self._colors = {LEVEL_WARNING: QColor(ORANGE), LEVEL_ERROR: QColor(DANGER)}
+
+    # ------------------------------------------------------------------
+    # Qt model API
+    # ------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return len(self._messages) if self._visible is None else len(self._visible)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        record = self._record(index.row())
+        if role == Qt.DisplayRole:
+            return self.format_record(record)
+        if role == Qt.ForegroundRole:
+            return self._colors.get(self._levels[record])
+        if role == LevelRole:
+            return self._levels[record]
+        return None
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+    @property
+    def total_records(self) -> int:
+        return len(self._messages)
+
+    def _record(self, row: int) -> int:
+        return row if self._visible is None else self._visible[row]
+
+    def format_record(self, record: int) -> str:
+        stamp = time.strftime("%H:%M:%S", time.localtime(self._times[record]))
+        return f"[{stamp}] {self._messages[record]}"
+
+    def _accepts(self, record: int) -> bool:
+        if self._levels[record] < self._min_level:
+            return False
+        return not self._needle or self._needle in self._messages[record].lower()
+
+    def append_many(self, messages: Iterable[str]) -> None:
+        messages = [m for m in messages if m]
+        if not messages:
+            return
+        messages = messages[-self.max_records:]
+        self._trim(len(messages))
+        now = time.time()
+        start = len(self._messages)
+        self._messages.extend(messages)
+        self._times.extend([now] * len(messages))
+        self._levels.extend(classify_level(m) for m in messages)
+        end = len(self._messages)
+        if self._visible is None:
+            self.beginInsertRows(QModelIndex(), start, end - 1)
+            self.endInsertRows()
+            return
+        matches = [i for i in range(start, end) if self._accepts(i)]
+        if matches:
+            first = len(self._visible)
+            self.beginInsertRows(QModelIndex(), first, first + len(matches) - 1)
+            self._visible.extend(matches)
+            self.endInsertRows()
+
+    def _trim(self, incoming: int) -> None:
+        overflow = len(self._messages) + incoming - self.max_records
+        if overflow <= 0:
+            return
+        # Drop a tenth at a time so trimming (a model reset) stays rare.
+        drop = min(len(self._messages), max(overflow, self.max_records // 10))
+        self.beginResetModel()
+        del self._messages[:drop]
+        del self._times[:drop]
+        del self._levels[:drop]
+        self._rebuild_visible()
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._messages.clear()
+        self._times = array("d")
+        self._levels = bytearray()
+        self._rebuild_visible()
+        self.endResetModel()
+
+    # ------------------------------------------------------------------
+    # Filtering / export
+    # ------------------------------------------------------------------
+    def set_filter(self, min_level: int = LEVEL_INFO, text: str = "") -> None:
+        self.beginResetModel()
+        self._min_level = min_level
+        self._needle = text.strip().lower()
+        self._rebuild_visible()
+        self.endResetModel()
+
+    def _rebuild_visible(self) -> None:
+        if self._min_level == LEVEL_INFO and not self._needle:
+            self._visible = None
+            return
+        levels, min_level, needle = self._levels, self._min_level, self._needle
+        if needle:
+            self._visible = array("l", (
+                i for i, message in enumerate(self._messages)
+                if levels[i] >= min_level and needle in message.lower()
+            ))
+        else:
+            self._visible = array("l", (i for i, level in enumerate(levels) if level >= min_level))
+
+    def export(self, path: str, visible_only: bool = True) -> int:
+        """Write records (the filtered rows by default) to ``path``; returns the count."""
+        records = range(len(self._messages))
+        if visible_only and self._visible is not None:
+            records = self._visible
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(self.format_record(record) + "\n")
+                count += 1
+        return count
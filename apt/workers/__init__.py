@@ -1,3 +1,23 @@
-from apt.workers.base import WorkerThread, set_worker_priority
+"""Task workers.
 
-__all__ = ["WorkerThread", "set_worker_priority"]
+``WorkerThread`` pulls in PyQt5, so it is resolved lazily — the handler
+modules, ``apt.workers.registry`` and the headless ``apt.cli`` runner import
+this package without a Qt install. Handlers run against the Qt-free
+``TaskContext`` from ``apt.workers.context``.
+"""
+
+from apt.workers.context import LocalTaskContext, TaskContext, TaskMetrics
+
+__all__ = ["LocalTaskContext", "TaskContext", "TaskMetrics", "WorkerThread", "set_worker_priority"]
+
+
+def __getattr__(name: str):
+    if name == "WorkerThread":
+        from apt.workers.base import WorkerThread
+
+        return WorkerThread
+    if name == "set_worker_priority":
+        from apt.workers.executor import set_worker_priority
+
+        return set_worker_priority
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
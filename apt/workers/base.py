@@ -1,4 +1,4 @@
-"""QThread worker + operation dispatch table.
+"""QThread adapter over ``apt.workers.context`` + operation dispatch table.
 
 The dispatch is data-driven so that adding a new task does not require
 touching the if/elif chain that the legacy ``WorkerThread.run`` carried.
@@ -6,62 +6,43 @@ touching the if/elif chain that the legacy ``WorkerThread.run`` carried.
 
 from __future__ import annotations
 
-import logging
-import multiprocessing
-import os
-from typing import Callable
-
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from apt.constants import (
-    OP_ATTACH_FOV,
-    OP_BASIC_SORTING,
-    OP_BTJ,
-    OP_CROP,
-    OP_DATE_COPY,
-    OP_IMAGE_COPY,
-    OP_MIM_TO_BMP,
-    OP_NG_COUNT,
-    OP_NG_SORTING,
-    OP_SIMULATION,
+from apt.workers.context import LocalTaskContext
+from apt.workers.executor import set_worker_priority  # noqa: F401  (re-export)
+from apt.workers.logsink import LogBatcher
+from apt.workers.plan import ThroughputHistory
+from apt.workers.registry import (  # noqa: F401  (re-export)
+    _EXPECTED,
+    _HANDLERS,
+    TaskHandler,
+    dispatch,
+    load_handlers,
+    register,
 )
-from apt.utils.fs import ensure_target_folder as _ensure_target_folder
-
-TaskHandler = Callable[["WorkerThread", dict], None]
-
-
-def set_worker_priority() -> None:
-    """Lower the OS scheduling priority of the calling worker thread.
-
-    The legacy code shelled out to ``win32process`` on Windows and ``os.nice``
-    elsewhere; we keep the same behavior so heavy I/O loops do not starve the
-    UI thread.
-    """
-    try:
-        import win32api  # type: ignore[import-untyped]
-        import win32process  # type: ignore[import-untyped]
-
-        thread_handle = win32api.GetCurrentThread()
-        win32process.SetThreadPriority(thread_handle, win32process.THREAD_PRIORITY_BELOW_NORMAL)
-    except ImportError:
-        try:
-            os.nice(10)
-        except (AttributeError, OSError):
-            pass
 
 
 class WorkerThread(QThread):
-    """The single QThread that owns one task at a time.
+    """Qt adapter that runs one ``LocalTaskContext`` on a ``QThread``.
+
+    Handlers receive the context, not this thread; its channels are
+    forwarded to the signals below, which Qt delivers on the UI thread.
 
     Signals
     -------
     progress(int)
-        0–100 percent progress.
+        0–100 percent progress; only emitted when the value changes.
     log(str)
-        Free-form log line — UI appends to its log console.
+        Free-form log line, one emit per line.
+    log_batch(list)
+        The same lines coalesced every ``LOG_BATCH_INTERVAL_MS`` — what the
+        UI console listens to, so 100k-file tasks do not flood the UI thread.
     ng_count_result(object)
         NG-count result tuple ``(rows, total_top_folders, total_cams,
         total_defects)``.
+    plan_ready(object)
+        The ``Plan`` of a ``dry_run`` task (``apt.workers.plan``), emitted
+        just before ``finished``.
     finished(str)
         Terminal status message — always emitted exactly once when the task
         completes (success, cancel, or exception).
@@ -69,84 +50,64 @@ class WorkerThread(QThread):
 
     progress = pyqtSignal(int)
     log = pyqtSignal(str)
+    log_batch = pyqtSignal(list)
     ng_count_result = pyqtSignal(object)
+    plan_ready = pyqtSignal(object)
     finished = pyqtSignal(str)
 
-    def __init__(self, task: dict) -> None:
+    def __init__(
+        self,
+        task: dict,
+        log_path: str | None = None,
+        throughput: ThroughputHistory | None = None,
+    ) -> None:
         super().__init__()
         self.task: dict = task
-        self._is_stopped = False
-        self.max_workers = min(12, (multiprocessing.cpu_count() or 1) * 2)
+        self.context = LocalTaskContext(task, log_path=log_path, throughput=throughput)
+        self._batcher = LogBatcher(self.log_batch.emit)
+        self.context.progress.connect(self.progress.emit)
+        self.context.log.connect(self.log.emit)
+        self.context.log.connect(self._batcher.add)
+        self.context.ng_count_result.connect(self.ng_count_result.emit)
+        self.context.plan_ready.connect(self.plan_ready.emit)
+        self.context.finished.connect(self._forward_finished)
+
+    @property
+    def log_path(self) -> str | None:
+        return self.context.log_path
+
+    def _forward_finished(self, message: str) -> None:
+        # Deliver pending lines first so the console keeps the order.
+        self._batcher.flush()
+        self.finished.emit(message)
+
+    @property
+    def max_workers(self) -> int:
+        return self.context.max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        self.context.max_workers = value
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def stop(self) -> None:
-        self._is_stopped = True
+        self.context.stop()
 
     def is_stopped(self) -> bool:
-        return self._is_stopped
+        return self.context.is_stopped()
 
     def run(self) -> None:  # noqa: D401
-        operation = self.task.get("operation", "")
-        handler = _HANDLERS.get(operation)
-        if handler is None:
-            self.log.emit(f"알 수 없는 작업 유형입니다: {operation!r}")
-            self.finished.emit("알 수 없는 작업 유형입니다.")
-            return
         try:
-            handler(self, self.task)
-        except Exception as exc:  # noqa: BLE001
-            logging.error("작업 중 오류 발생", exc_info=True)
-            self.log.emit(f"오류 발생: {exc}")
-            self.finished.emit("작업 중 오류 발생했습니다.")
+            self.context.run()
+        finally:
+            self._batcher.close()
 
-    # ------------------------------------------------------------------
-    # Shared helpers — workers call these instead of redefining their own.
-    # ------------------------------------------------------------------
     def ensure_target_folder(self, target_path: str) -> bool:
-        return _ensure_target_folder(target_path, log=self.log.emit)
-
-
-# ---------------------------------------------------------------------------
-# Operation registry — populated below by importing the task modules.
-# Each handler signature: handler(worker: WorkerThread, task: dict) -> None
-# ---------------------------------------------------------------------------
-
-_HANDLERS: dict[str, TaskHandler] = {}
+        return self.context.ensure_target_folder(target_path)
 
 
-def register(operation: str, handler: TaskHandler) -> TaskHandler:
-    """Register a worker task. Returns the handler so it can decorate."""
-    _HANDLERS[operation] = handler
-    return handler
-
-
-# Import task modules so they self-register. The imports are at module bottom
-# to avoid circular imports with workers.base.
-from apt.workers import (  # noqa: E402,F401  (registration side-effects)
-    btj,
-    copying,
-    counting,
-    cropping,
-    fov,
-    mim,
-    sorting,
-)
-
-# Sanity check — every operation key declared in constants must have a handler.
-_EXPECTED = {
-    OP_NG_SORTING,
-    OP_DATE_COPY,
-    OP_IMAGE_COPY,
-    OP_SIMULATION,
-    OP_BASIC_SORTING,
-    OP_NG_COUNT,
-    OP_CROP,
-    OP_ATTACH_FOV,
-    OP_MIM_TO_BMP,
-    OP_BTJ,
-}
-_missing = _EXPECTED - _HANDLERS.keys()
-if _missing:  # pragma: no cover — would break import
-    raise RuntimeError(f"Worker handlers missing for: {sorted(_missing)}")
+# Populate the operation registry (``apt.workers.registry``) by importing the
+# task modules; they self-register.
+load_handlers()
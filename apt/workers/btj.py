@@ -1,32 +1,282 @@
-"""BMP -> JPG conversion handler (BTJ)."""
+"""BMP -> JPG conversion handler (BTJ).
+
+Two encoders (``encoder`` task key):
+
+* ``pillow`` (default) — decode with Pillow, convert to RGB, save as JPEG.
+* ``opencv`` — decode straight from a memory-mapped BMP with
+  ``cv2.imdecode`` and encode with ``cv2.imencode`` (libjpeg-turbo).
+  8-bit grayscale BMPs stay single-channel JPEGs instead of being expanded
+  to RGB, which is most of the gain on line-scan images.
+
+Both honour ``quality`` / ``subsampling`` / ``optimize`` / ``progressive``
+and ``keep_metadata`` (resolution written into the JFIF header, the ICC
+profile embedded in a V5 BMP header as APP2 segments, and the source file's
+timestamps). Pillow does not read BMP profiles itself, so both encoders take
+it from ``_bmp_icc_profile``.
+"""
 
 from __future__ import annotations
 
+import io
 import logging
+import mmap
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import struct
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import cv2
+import numpy as np
 from PIL import Image
 
-from apt.constants import OP_BTJ
+from apt.constants import (
+    BACKEND_PROCESS,
+    BACKEND_THREAD,
+    BTJ_ENCODER_OPENCV,
+    BTJ_ENCODER_PILLOW,
+    JPEG_QUALITY_DEFAULT,
+    JPEG_SUBSAMPLINGS,
+    OP_BTJ,
+)
+from apt.utils.scan import StreamedScan, scan_files
+from apt.workers.executor import bounded_map, stop_check
+from apt.workers.instrument import (
+    STAGE_DECODE,
+    STAGE_ENCODE,
+    STAGE_READ,
+    STAGE_SCAN,
+    STAGE_TRANSFORM,
+    current_timings,
+    read_file,
+    timings_for,
+    write_file,
+)
+from apt.workers.plan import finish_plan, plan_for, prepare_target
+from apt.workers.tuning import STAGE_CPU, tuner_for
 
 if TYPE_CHECKING:
     from apt.workers.base import WorkerThread
 
+_INCHES_PER_METER = 0.0254
+_BMP_V5_HEADER_SIZE = 124
+_PROFILE_EMBEDDED = b"MBED"  # bV5CSType, stored as the little-endian 'MBED' constant
+_ICC_MARKER = b"ICC_PROFILE\x00"
+_ICC_CHUNK = 0xFFFF - 2 - len(_ICC_MARKER) - 2  # payload per APP2 segment
 
-def _convert_bmp_to_jpg(src: str, dst: str, is_stopped) -> str:
-    if is_stopped():
-        return "오류 발생: 사용자 중지 요청"
-    try:
-        with Image.open(src) as img:
+
+@dataclass(frozen=True)
+class JpegOptions:
+    """JPEG settings of a BTJ task (picklable for the process backend)."""
+
+    encoder: str = BTJ_ENCODER_PILLOW
+    quality: int = JPEG_QUALITY_DEFAULT
+    subsampling: str = "4:2:0"
+    optimize: bool = False
+    progressive: bool = False
+    keep_metadata: bool = False
+
+    @classmethod
+    def from_task(cls, task: dict) -> "JpegOptions":
+        """Read the options from ``task``; ``ValueError`` for invalid values."""
+        encoder = task.get("encoder", BTJ_ENCODER_PILLOW)
+        if encoder not in (BTJ_ENCODER_PILLOW, BTJ_ENCODER_OPENCV):
+            raise ValueError(f"알 수 없는 인코더: {encoder}")
+        quality = int(task.get("quality", JPEG_QUALITY_DEFAULT))
+        if not 1 <= quality <= 100:
+            raise ValueError(f"JPEG 품질은 1~100 사이여야 합니다: {quality}")
+        subsampling = task.get("subsampling", "4:2:0")
+        if subsampling not in JPEG_SUBSAMPLINGS:
+            raise ValueError(f"지원하지 않는 서브샘플링: {subsampling}")
+        return cls(
+            encoder=encoder,
+            quality=quality,
+            subsampling=subsampling,
+            optimize=bool(task.get("optimize", False)),
+            progressive=bool(task.get("progressive", False)),
+            keep_metadata=bool(task.get("keep_metadata", False)),
+        )
+
+    def describe(self) -> str:
+        flags = [name for name, on in (
+            ("optimize", self.optimize), ("progressive", self.progressive), ("metadata", self.keep_metadata),
+        ) if on]
+        return (
+            f"인코더: {self.encoder}, 품질 {self.quality}, 서브샘플링 {self.subsampling}"
+            + (f", {' / '.join(flags)}" if flags else "")
+        )
+
+
+DEFAULT_JPEG_OPTIONS = JpegOptions()
+
+
+def _is_bmp(filename: str) -> bool:
+    return filename.lower().endswith(".bmp")
+
+
+# ---------------------------------------------------------------------------
+# Pillow encoder
+# ---------------------------------------------------------------------------
+
+def _encode_pillow(src: str, options: JpegOptions) -> bytes:
+    timings = current_timings()
+    data = read_file(src)
+    with Image.open(io.BytesIO(data)) as img:
+        with timings.stage(STAGE_DECODE):
+            img.load()
+        info = img.info
+        with timings.stage(STAGE_TRANSFORM):
             if img.mode == "RGBA":
                 background = Image.new("RGB", img.size, (255, 255, 255))
                 background.paste(img, mask=img.split()[3])
                 img = background
             elif img.mode != "RGB":
                 img = img.convert("RGB")
-            img.save(dst, "JPEG")
+        save_args: dict = {
+            "quality": options.quality,
+            "subsampling": options.subsampling,
+            "optimize": options.optimize,
+            "progressive": options.progressive,
+        }
+        if options.keep_metadata:
+            dpi = info.get("dpi")
+            if dpi:
+                save_args["dpi"] = tuple(int(round(d)) for d in dpi)
+            icc_profile = info.get("icc_profile") or _bmp_icc_profile(data)
+            if icc_profile:
+                save_args["icc_profile"] = icc_profile
+        buffer = io.BytesIO()
+        with timings.stage(STAGE_ENCODE):
+            img.save(buffer, "JPEG", **save_args)
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# OpenCV encoder
+# ---------------------------------------------------------------------------
+
+def _bmp_dpi(header: bytes) -> tuple[int, int] | None:
+    """Resolution stored in a BMP header (pixels per meter), in DPI."""
+    if len(header) < 46 or header[:2] != b"BM":
+        return None
+    (info_size,) = struct.unpack_from("<I", header, 14)
+    if info_size < 40:
+        return None  # BITMAPCOREHEADER carries no resolution
+    x_ppm, y_ppm = struct.unpack_from("<ii", header, 38)
+    if x_ppm <= 0 or y_ppm <= 0:
+        return None
+    return round(x_ppm * _INCHES_PER_METER), round(y_ppm * _INCHES_PER_METER)
+
+
+def _bmp_icc_profile(data: bytes | mmap.mmap) -> bytes | None:
+    """ICC profile embedded in a BITMAPV5HEADER, if any.
+
+    Linked profiles (a file name instead of the data) are not followed.
+    """
+    if len(data) < 14 + _BMP_V5_HEADER_SIZE or data[:2] != b"BM":
+        return None
+    (info_size,) = struct.unpack_from("<I", data, 14)
+    if info_size < _BMP_V5_HEADER_SIZE or data[70:74][::-1] != _PROFILE_EMBEDDED:
+        return None
+    offset, size = struct.unpack_from("<II", data, 126)
+    start = 14 + offset
+    if not size or start + size > len(data):
+        return None
+    return bytes(data[start:start + size])
+
+
+def _with_icc_profile(jpeg: bytes, profile: bytes) -> bytes:
+    """Insert ``profile`` as APP2 ICC_PROFILE segments after SOI / JFIF APP0."""
+    pos = 2
+    if jpeg[2:4] == b"\xff\xe0":
+        pos = 4 + struct.unpack_from(">H", jpeg, 4)[0]
+    chunks = [profile[i:i + _ICC_CHUNK] for i in range(0, len(profile), _ICC_CHUNK)]
+    if len(chunks) > 255:
+        return jpeg
+    segments = b"".join(
+        b"\xff\xe2" + struct.pack(">H", 2 + len(_ICC_MARKER) + 2 + len(chunk))
+        + _ICC_MARKER + bytes((seq, len(chunks))) + chunk
+        for seq, chunk in enumerate(chunks, 1)
+    )
+    return jpeg[:pos] + segments + jpeg[pos:]
+
+
+def _set_jfif_dpi(jpeg: np.ndarray, dpi: tuple[int, int]) -> None:
+    """Write ``dpi`` into the JFIF APP0 segment libjpeg emits (in place)."""
+    if jpeg[2:4].tobytes() != b"\xff\xe0" or jpeg[6:11].tobytes() != b"JFIF\x00":
+        return
+    jpeg[13] = 1  # density unit: dots per inch
+    jpeg[14:18] = np.frombuffer(struct.pack(">HH", *(min(d, 0xFFFF) for d in dpi)), np.uint8)
+
+
+def _flatten_alpha(img: np.ndarray) -> np.ndarray:
+    """BGRA -> BGR over a white background (what the Pillow path does)."""
+    alpha = img[:, :, 3:4].astype(np.uint16)
+    bgr = img[:, :, :3].astype(np.uint16)
+    return ((bgr * alpha + 255 * (255 - alpha) + 127) // 255).astype(np.uint8)
+
+
+def _opencv_params(options: JpegOptions) -> list[int]:
+    params = [
+        cv2.IMWRITE_JPEG_QUALITY, options.quality,
+        cv2.IMWRITE_JPEG_OPTIMIZE, int(options.optimize),
+        cv2.IMWRITE_JPEG_PROGRESSIVE, int(options.progressive),
+    ]
+    factor = getattr(cv2, f"IMWRITE_JPEG_SAMPLING_FACTOR_{options.subsampling.replace(':', '')}", None)
+    if factor is not None and hasattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR"):
+        params += [cv2.IMWRITE_JPEG_SAMPLING_FACTOR, factor]
+    return params
+
+
+def _encode_opencv(src: str, options: JpegOptions) -> bytes:
+    timings = current_timings()
+    dpi = icc_profile = None
+    with open(src, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        with timings.stage(STAGE_READ, size):
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            buf = np.frombuffer(mapped, dtype=np.uint8)
+            with timings.stage(STAGE_DECODE):
+                img = cv2.imdecode(buf, cv2.IMREAD_UNCHANGED)
+            if options.keep_metadata:
+                dpi = _bmp_dpi(mapped[:46])
+                icc_profile = _bmp_icc_profile(mapped)
+            del buf  # the mmap can't close while a view is exported
+        finally:
+            mapped.close()
+    if img is None:
+        raise ValueError("BMP 디코딩 실패")
+    with timings.stage(STAGE_TRANSFORM):
+        if img.ndim == 3 and img.shape[2] == 4:
+            img = _flatten_alpha(img)
+        if img.dtype != np.uint8:
+            img = cv2.convertScaleAbs(img, alpha=255.0 / max(1.0, float(img.max())))
+    with timings.stage(STAGE_ENCODE):
+        ok, encoded = cv2.imencode(".jpg", img, _opencv_params(options))
+    if not ok:
+        raise ValueError("JPEG 인코딩 실패")
+    if dpi is not None:
+        _set_jfif_dpi(encoded.reshape(-1), dpi)
+    if icc_profile:
+        return _with_icc_profile(encoded.tobytes(), icc_profile)
+    return encoded.tobytes()
+
+
+_ENCODERS = {
+    BTJ_ENCODER_PILLOW: _encode_pillow,
+    BTJ_ENCODER_OPENCV: _encode_opencv,
+}
+
+
+def _convert_bmp_to_jpg(src: str, dst: str, is_stopped, options: JpegOptions = DEFAULT_JPEG_OPTIONS) -> str:
+    if is_stopped():
+        return "오류 발생: 사용자 중지 요청"
+    try:
+        write_file(dst, _ENCODERS[options.encoder](src, options))
+        if options.keep_metadata:
+            st = os.stat(src)
+            os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
         return f"Converted BMP -> JPG: {src} -> {dst}"
     except Exception as exc:
         logging.error(f"BMP->JPG 변환 오류 ({src})", exc_info=True)
@@ -38,15 +288,30 @@ def _convert_bmp_to_jpg(src: str, dst: str, is_stopped) -> str:
         return f"오류 발생: {exc}"
 
 
+def _jpg_path(bmp_path: str, source: str, target: str) -> str:
+    rel = os.path.relpath(bmp_path, source)
+    return os.path.join(target, os.path.splitext(rel)[0] + ".jpg")
+
+
 def btj_operation(worker: "WorkerThread", task: dict) -> None:
     worker.log.emit("------ BMP TO JPG 작업: BMP -> JPG 변환 시작 ------")
+    plan = plan_for(task)
     try:
         source = task.get("source", "").strip()
         target = task.get("target", "").strip()
+        backend = task.get("backend", BACKEND_THREAD)
         if not target:
             target = f"{source}_JPG"
+        try:
+            options = JpegOptions.from_task(task)
+        except ValueError as exc:
+            worker.log.emit(f"JPEG 옵션 오류: {exc}")
+            worker.finished.emit("BMP->JPG 변환 중지됨.")
+            return
 
-        if not worker.ensure_target_folder(target):
+        if plan is not None:
+            plan.target = target
+        if not prepare_target(worker, target, plan):
             worker.finished.emit("BMP->JPG 변환 중지됨 (Target 생성 실패).")
             return
         if not os.path.isdir(source):
@@ -55,52 +320,83 @@ def btj_operation(worker: "WorkerThread", task: dict) -> None:
             return
 
         is_stopped = worker.is_stopped
-        bmp_files: list[str] = []
-        for dirpath, _dirnames, filenames in os.walk(source):
+        timings = timings_for(worker)
+        scan_started = time.perf_counter_ns()
+        bmp_paths = (
+            entry.path
+            for entry in scan_files(
+                source,
+                file_filter=_is_bmp,
+                ignored_dirs=(),
+                max_workers=worker.max_workers,
+                is_stopped=is_stopped,
+            )
+        )
+
+        if plan is not None:
+            bmp_files = sorted(bmp_paths)
+            timings.add_since(STAGE_SCAN, scan_started)
             if is_stopped():
                 worker.log.emit("사용자에 의해 중지됨.")
                 worker.finished.emit("BMP->JPG 변환 중지됨.")
                 return
-            for fname in filenames:
-                if fname.lower().endswith(".bmp"):
-                    bmp_files.append(os.path.join(dirpath, fname))
-
-        total = len(bmp_files)
-        if total == 0:
-            worker.log.emit("변환할 .bmp 파일이 없습니다.")
-            worker.finished.emit("BMP->JPG 변환 완료 (처리 대상 0).")
+            if not bmp_files:
+                worker.log.emit("변환할 .bmp 파일이 없습니다.")
+                worker.finished.emit("BMP->JPG 변환 완료 (처리 대상 0).")
+                return
+            worker.log.emit(f"총 변환 대상 BMP 파일: {len(bmp_files)}개")
+            for bmp_path in bmp_files:
+                plan.add(bmp_path, _jpg_path(bmp_path, source, target), kind="convert")
+            finish_plan(worker, plan, "BMP->JPG 변환")
             return
 
-        worker.log.emit(f"총 변환 대상 BMP 파일: {total}개")
         worker.log.emit(f"Target 폴더: {target}")
+        worker.log.emit(options.describe())
+        if backend == BACKEND_PROCESS:
+            worker.log.emit("프로세스 풀 백엔드로 실행합니다.")
+
+        def scan_done(found: int) -> None:
+            timings.add_since(STAGE_SCAN, scan_started)
+            worker.log.emit(f"총 변환 대상 BMP 파일: {found}개")
 
+        # Conversion starts with the first listed folder; see apt.utils.scan.
+        scan = StreamedScan(bmp_paths, on_done=scan_done)
         processed = 0
-        with ThreadPoolExecutor(max_workers=worker.max_workers) as executor:
-            futures = []
-            for bmp_path in bmp_files:
-                if is_stopped():
-                    break
-                rel = os.path.relpath(bmp_path, source)
-                out_path = os.path.join(target, os.path.splitext(rel)[0] + ".jpg")
+        job_stopped = stop_check(worker, backend)
+
+        def convert_jobs():
+            for bmp_path in scan:
+                out_path = _jpg_path(bmp_path, source, target)
                 out_dir = os.path.dirname(out_path)
                 if out_dir and not os.path.exists(out_dir):
                     os.makedirs(out_dir, exist_ok=True)
-                futures.append(executor.submit(_convert_bmp_to_jpg, bmp_path, out_path, is_stopped))
-
-            for future in as_completed(futures):
-                if is_stopped():
-                    worker.log.emit(
-                        f"사용자 중지 요청으로 작업 중단. 현재까지 {processed}개 변환 완료."
-                    )
-                    worker.finished.emit("BMP->JPG 변환 중단됨.")
-                    return
-                result = future.result()
-                if result.startswith("오류 발생"):
-                    worker.log.emit(result)
-                else:
-                    processed += 1
-                    worker.log.emit(result)
-                    worker.progress.emit(min(int(processed / total * 100), 100))
+                yield bmp_path, out_path, job_stopped, options
+
+        for _job, result in bounded_map(
+            worker, _convert_bmp_to_jpg, convert_jobs(), backend=backend,
+            tuner=tuner_for(worker, task, STAGE_CPU, backend),
+        ):
+            if is_stopped():
+                break
+            if result.startswith("오류 발생"):
+                worker.log.emit(result)
+            else:
+                processed += 1
+                worker.log.emit(result)
+                percent = scan.percent(processed)
+                if percent is not None:
+                    worker.progress.emit(percent)
+        if is_stopped():
+            worker.log.emit(
+                f"사용자 중지 요청으로 작업 중단. 현재까지 {processed}개 변환 완료."
+            )
+            worker.finished.emit("BMP->JPG 변환 중단됨.")
+            return
+        if scan.found == 0:
+            worker.log.emit("변환할 .bmp 파일이 없습니다.")
+            worker.finished.emit("BMP->JPG 변환 완료 (처리 대상 0).")
+            return
+        worker.progress.emit(scan.percent(processed))
 
         worker.log.emit("BMP->JPG 변환 작업 완료")
         worker.finished.emit(f"BMP->JPG 변환 완료 (총 {processed}개).")
@@ -110,6 +406,6 @@ def btj_operation(worker: "WorkerThread", task: dict) -> None:
         worker.finished.emit("BMP->JPG 변환 중 오류 발생.")
 
 
-from apt.workers.base import register  # noqa: E402
+from apt.workers.registry import register  # noqa: E402
 
 register(OP_BTJ, btj_operation)
@@ -0,0 +1,254 @@
+"""Qt-free task execution context.
+
+Handlers are written against ``TaskContext`` — the ``log`` / ``progress`` /
+``ng_count_result`` / ``finished`` / ``plan_ready`` channels plus
+cancellation, the shared helpers, executor access and metrics — not against
+``QThread``.
+``LocalTaskContext`` is the plain implementation: it runs a task on the
+calling thread, so tests, the CLI, services and benchmarks need no
+``QApplication``, and several contexts can run side by side on their own
+threads. ``WorkerThread`` is just an adapter that owns a ``LocalTaskContext``
+and forwards its channels to Qt signals.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Protocol
+
+from apt.utils.fs import ensure_target_folder as _ensure_target_folder
+from apt.workers.executor import bounded_map
+from apt.workers.instrument import save_timing_report, timing_report_path, timings_for_task
+from apt.workers.logsink import TaskLogFile
+from apt.workers.registry import dispatch
+
+if TYPE_CHECKING:
+    from apt.workers.plan import Plan, ThroughputHistory
+
+
+class Channel:
+    """Qt-free stand-in for a ``pyqtSignal`` — ``emit`` calls every slot.
+
+    Slots run on the emitting thread; connect a Qt signal's ``emit`` to get
+    queued delivery on the UI thread.
+    """
+
+    def __init__(self) -> None:
+        self._slots: list[Callable[[Any], None]] = []
+
+    def connect(self, slot: Callable[[Any], None]) -> None:
+        self._slots.append(slot)
+
+    def disconnect(self, slot: Callable[[Any], None]) -> None:
+        if slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, value: Any) -> None:
+        for slot in list(self._slots):
+            slot(value)
+
+
+class ProgressChannel(Channel):
+    """``Channel`` for 0–100 progress that drops repeats of the last value.
+
+    Handlers emit progress once per file; only integer changes reach the
+    slots (at most ~101 deliveries per task).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._last: int | None = None
+
+    def emit(self, value: int) -> None:
+        value = int(value)
+        if value == self._last:
+            return
+        self._last = value
+        super().emit(value)
+
+
+# Outcome of a finished task, derived from its terminal ``finished`` message.
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_STOPPED = "stopped"
+
+
+def finished_status(message: str | None) -> str:
+    """Classify a handler's ``finished`` message (handlers only emit text)."""
+    if message is None or "오류" in message or "알 수 없는" in message:
+        return STATUS_FAILED
+    if "중지" in message or "중단" in message:
+        return STATUS_STOPPED
+    return STATUS_DONE
+
+
+class TaskMetrics:
+    """Thread-safe named counters and wall-clock timing for one task."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def start(self) -> None:
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    def stop(self) -> None:
+        self.finished_at = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            data: dict[str, Any] = dict(self._counters)
+        data["elapsed_s"] = round(self.elapsed, 3)
+        return data
+
+
+class TaskContext(Protocol):
+    """What a handler may use from the ``worker`` argument it receives."""
+
+    task: dict
+    max_workers: int
+    metrics: TaskMetrics
+    timings: Any  # StageTimings, or NULL_TIMINGS when instrumentation is off
+    progress: Any  # .emit(int)
+    log: Any  # .emit(str)
+    ng_count_result: Any  # .emit(object)
+    finished: Any  # .emit(str)
+    plan_ready: Any  # .emit(Plan) — dry runs only
+
+    def stop(self) -> None: ...
+
+    def is_stopped(self) -> bool: ...
+
+    def ensure_target_folder(self, target_path: str) -> bool: ...
+
+    def map(self, fn: Callable[..., Any], jobs: Iterable[tuple], **kwargs: Any) -> Iterator[tuple[tuple, Any]]: ...
+
+
+class LocalTaskContext:
+    """``TaskContext`` that runs its task synchronously on the calling thread.
+
+    With ``log_path`` every log line of the run is also appended to that file
+    (see ``apt.workers.logsink.task_log_path``). With ``throughput`` (a
+    ``ThroughputHistory``) a successful run records its files / bytes /
+    seconds there, which is what dry-run ETAs are estimated from.
+
+    ``instrument: true`` in the task turns on per-stage timings
+    (``apt.workers.instrument``): the summary table is logged just before
+    the handler's ``finished`` message and saved as JSON in ``timing_dir``
+    (default ``timings/`` next to ``error.log``).
+    """
+
+    def __init__(
+        self,
+        task: dict,
+        log_path: str | None = None,
+        throughput: "ThroughputHistory | None" = None,
+        timing_dir: str | None = None,
+    ) -> None:
+        self.task: dict = task
+        self.log_path = log_path
+        self.throughput = throughput
+        self.timing_dir = timing_dir
+        self.timings = timings_for_task(task)
+        self.timing_report: str | None = None
+        self._is_stopped = False
+        self.max_workers = min(12, (multiprocessing.cpu_count() or 1) * 2)
+        self.metrics = TaskMetrics()
+        self.progress = ProgressChannel()
+        self.log = Channel()
+        self.ng_count_result = Channel()
+        self.finished = Channel()
+        self.plan_ready = Channel()  # emits the ``Plan`` of a dry run
+        self.finished_message: str | None = None
+        self.plan: "Plan | None" = None
+        self.finished.connect(self._remember_finished)
+        self.plan_ready.connect(self._remember_plan)
+
+    def _remember_finished(self, message: str) -> None:
+        # Connected first, so the timing table lands before the message.
+        self.finished_message = message
+        if self.timings.enabled:
+            self._report_timings()
+
+    def _report_timings(self) -> None:
+        self.log.emit("------ 단계별 소요 시간 ------")
+        for line in self.timings.table_lines():
+            self.log.emit(line)
+        try:
+            path = timing_report_path(self.task.get("operation", ""), self.timing_dir)
+            save_timing_report(
+                path, self.timings, self.task, self.metrics.snapshot(), self.finished_message
+            )
+        except OSError as exc:
+            logging.error("단계별 시간 보고서 저장 실패", exc_info=True)
+            self.log.emit(f"단계별 시간 보고서 저장 실패: {exc}")
+            return
+        self.timing_report = path
+        self.log.emit(f"단계별 시간 보고서: {os.path.abspath(path)}")
+
+    def _remember_plan(self, plan: "Plan") -> None:
+        self.plan = plan
+
+    # ------------------------------------------------------------------
+    def stop(self) -> None:
+        self._is_stopped = True
+
+    def is_stopped(self) -> bool:
+        return self._is_stopped
+
+    def run(self) -> None:
+        """Dispatch the task to its handler; returns when it has finished."""
+        log_file = TaskLogFile(self.log_path) if self.log_path else None
+        if log_file is not None:
+            self.log.connect(log_file.write)
+        self.metrics.start()
+        try:
+            dispatch(self, self.task)
+        finally:
+            self.metrics.stop()
+            if log_file is not None:
+                self.log.disconnect(log_file.write)
+                log_file.close()
+        self._record_throughput()
+
+    def _record_throughput(self) -> None:
+        if self.throughput is None or self.task.get("dry_run", False):
+            return
+        if finished_status(self.finished_message) != STATUS_DONE:
+            return
+        files = self.metrics.get("files") or self.metrics.get("jobs")
+        self.throughput.record(
+            self.task.get("operation", ""), files, self.metrics.get("bytes"), self.metrics.elapsed
+        )
+
+    # ------------------------------------------------------------------
+    # Shared helpers — handlers call these instead of redefining their own.
+    # ------------------------------------------------------------------
+    def ensure_target_folder(self, target_path: str) -> bool:
+        return _ensure_target_folder(target_path, log=self.log.emit)
+
+    def map(self, fn: Callable[..., Any], jobs: Iterable[tuple], **kwargs: Any) -> Iterator[tuple[tuple, Any]]:
+        """``bounded_map`` over this context (see ``apt.workers.executor``)."""
+        return bounded_map(self, fn, jobs, **kwargs)
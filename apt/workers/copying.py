@@ -5,14 +5,21 @@ from __future__ import annotations
 import logging
 import os
 import random
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING
 
 from apt.constants import OP_DATE_COPY, OP_IMAGE_COPY, OP_SIMULATION
-from apt.utils.formats import is_valid_file
+from apt.utils.dedup import ContentIndex, open_content_index
+from apt.utils.formats import FileMatcher
+from apt.utils.fov import extract_fov_from_filename
 from apt.utils.fs import copy_file_chunked, copy_folder_filtered
+from apt.utils.journal import CopyJournal
+from apt.workers.executor import bounded_map
+from apt.workers.instrument import STAGE_SCAN, timed_copy, timings_for
+from apt.workers.plan import finish_plan, plan_for, plan_journal, prepare_target
+from apt.workers.tuning import STAGE_IO, tuner_for
 
 if TYPE_CHECKING:
     from apt.workers.base import WorkerThread
@@ -23,9 +30,10 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 def date_based_copy(worker: "WorkerThread", task: dict) -> None:
-    from apt.workers.base import set_worker_priority
-
     worker.log.emit("------ Date-Based Copy 작업 시작 ------")
+    journal: CopyJournal | None = None
+    content_index: ContentIndex | None = None
+    plan = plan_for(task)
     try:
         mode = task.get("mode", "folder")
         source = task["source"]
@@ -45,10 +53,27 @@ def date_based_copy(worker: "WorkerThread", task: dict) -> None:
             worker.log.emit(f"Source 경로 없음: {source}")
             worker.finished.emit("Date-Based Copy 중지됨.")
             return
-        if not worker.ensure_target_folder(target):
+        if not prepare_target(worker, target, plan):
             worker.finished.emit("Date-Based Copy 중지됨.")
             return
+        if plan is not None:
+            journal = plan_journal(target, task)
+        else:
+            journal = CopyJournal(
+                target, resume=task.get("resume", False), metrics=getattr(worker, "metrics", None)
+            )
+            content_index = open_content_index(target, task.get("dedup"))
+        if journal is not None and journal.resume:
+            worker.log.emit(f"이어하기 모드: 저널 항목 {len(journal)}개")
+        if content_index is not None:
+            added = content_index.sync(worker.is_stopped)
+            worker.log.emit(f"중복 인덱스: {len(content_index)}개 파일 (신규 등록 {added}개)")
+        copy_file = timed_copy(copy_file_chunked)
+        if content_index is not None:
+            copy_file = partial(content_index.copy, copy=copy_file)
 
+        timings = timings_for(worker)
+        scan_started = time.perf_counter_ns()
         all_folders = [
             os.path.join(source, f)
             for f in os.listdir(source)
@@ -67,7 +92,9 @@ def date_based_copy(worker: "WorkerThread", task: dict) -> None:
             return
 
         sorted_folders = sorted(eligible, key=lambda x: os.path.getmtime(x))
+        timings.add_since(STAGE_SCAN, scan_started)
         is_stopped = worker.is_stopped
+        tuner = tuner_for(worker, task, STAGE_IO)
 
         if mode == "folder":
             if strong_random:
@@ -86,30 +113,46 @@ def date_based_copy(worker: "WorkerThread", task: dict) -> None:
             worker.log.emit(
                 f"날짜: {specified_dt.strftime('%Y-%m-%d %H:%M:%S')}, 폴더 수: {total}"
             )
+            if plan is not None:
+                matcher = FileMatcher(formats)
+                for folder_path in selected:
+                    dst_folder = os.path.join(target, os.path.basename(folder_path))
+                    try:
+                        with os.scandir(folder_path) as it:
+                            names = matcher.filter(entry.name for entry in it if entry.is_file())
+                    except OSError as exc:
+                        worker.log.emit(f"폴더 {folder_path} 파일 목록 오류: {exc}")
+                        continue
+                    for name in names:
+                        plan.add_copy(
+                            os.path.join(folder_path, name), os.path.join(dst_folder, name), journal
+                        )
+                finish_plan(worker, plan, "Date-Based Copy (Folder Mode)")
+                return
             processed = 0
-            with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as executor:
-                futures = []
+
+            def folder_jobs():
                 for folder_path in selected:
-                    if is_stopped():
-                        worker.log.emit(f"작업 중지: 폴더 처리 {processed}")
-                        worker.finished.emit(f"작업 중지됨. 폴더 처리: {processed}")
-                        return
                     folder_name = os.path.basename(folder_path)
                     dst_folder = os.path.join(target, folder_name)
                     if not worker.ensure_target_folder(dst_folder):
                         continue
                     worker.log.emit(f"Source: {folder_path}, Destination: {dst_folder}")
-                    futures.append(
-                        executor.submit(copy_folder_filtered, folder_path, dst_folder, formats, is_stopped)
-                    )
-                for future in as_completed(futures):
-                    if is_stopped():
-                        worker.log.emit(f"작업 중지: 폴더 처리 {processed}")
-                        worker.finished.emit(f"작업 중지됨. 폴더 처리: {processed}")
-                        return
-                    worker.log.emit(future.result())
-                    processed += 1
-                    worker.progress.emit(min(int(processed / total * 100), 100))
+                    yield folder_path, dst_folder, formats, is_stopped, journal, copy_file
+
+            for _job, result in bounded_map(
+                worker, copy_folder_filtered, folder_jobs(), tuner=tuner
+            ):
+                if is_stopped():
+                    break
+                worker.log.emit(result)
+                processed += 1
+                worker.progress.emit(min(int(processed / total * 100), 100))
+            _log_dedup(worker, content_index)
+            if is_stopped():
+                worker.log.emit(f"작업 중지: 폴더 처리 {processed}")
+                worker.finished.emit(f"작업 중지됨. 폴더 처리: {processed}")
+                return
             worker.finished.emit(f"Date-Based Copy (Folder Mode) 완료. 폴더 처리: {processed}")
             worker.log.emit("------ Date-Based Copy (Folder Mode) 완료 ------")
             return
@@ -133,6 +176,8 @@ def date_based_copy(worker: "WorkerThread", task: dict) -> None:
                 selected = sorted_folders[:count]
             total = len(selected)
             worker.log.emit(f"Image Mode: 선택된 폴더 수 {total}")
+            matcher = FileMatcher(formats)
+            fov_set = set(fov_numbers)
             processed_folders = 0
             processed_images = 0
             for folder_path in selected:
@@ -143,51 +188,55 @@ def date_based_copy(worker: "WorkerThread", task: dict) -> None:
                 inner_id = os.path.basename(folder_path)
                 try:
                     with os.scandir(folder_path) as it:
-                        image_files = [
-                            entry.name for entry in it
-                            if entry.is_file() and is_valid_file(entry.name, formats)
-                        ]
+                        image_files = matcher.filter(entry.name for entry in it if entry.is_file())
                 except Exception as exc:
                     worker.log.emit(f"폴더 {folder_path} 파일 목록 오류: {exc}")
                     continue
                 matching = []
                 for image in image_files:
-                    parts = image.split("_", 1)
-                    if len(parts) < 2:
+                    if "_" not in image:
                         worker.log.emit(f"파일 이름 오류: {image}")
                         continue
-                    prefix = parts[0].lower()
-                    digits = re.sub(r"[^0-9]", "", prefix)
-                    if digits in fov_numbers:
+                    if (extract_fov_from_filename(image) or "") in fov_set:
                         matching.append(image)
                 if not matching:
                     worker.log.emit(f"폴더 {folder_path} FOV 미일치")
+                elif plan is not None:
+                    for image in matching:
+                        src_file = os.path.join(folder_path, image)
+                        dst_file = os.path.join(target, f"{inner_id}_{image}")
+                        if journal is None and os.path.exists(dst_file):
+                            plan.skip(src_file, "대상 파일이 이미 있음", dst_file)
+                        else:
+                            plan.add_copy(src_file, dst_file, journal)
                 else:
                     worker.log.emit(f"폴더 {folder_path}에서 {len(matching)} 이미지 복사 시작")
-                    with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as executor:
-                        futures = []
+
+                    def image_jobs(folder_path: str, inner_id: str, matching: list[str]):
                         for image in matching:
-                            if is_stopped():
-                                break
                             src_file = os.path.join(folder_path, image)
                             file_base, file_ext = os.path.splitext(image)
                             new_name = f"{inner_id}_{file_base}{file_ext}"
                             dst_file = os.path.join(target, new_name)
-                            if os.path.exists(dst_file):
+                            if not journal.resume and os.path.exists(dst_file):
                                 worker.log.emit(f"파일 건너뜀: {dst_file}")
                                 continue
-                            futures.append(executor.submit(copy_file_chunked, src_file, dst_file, is_stopped))
-                        for future in as_completed(futures):
-                            if is_stopped():
-                                break
-                            result = future.result()
-                            if result.startswith("오류 발생"):
-                                worker.log.emit(result)
-                            else:
-                                processed_images += 1
-                                worker.log.emit(result)
+                            yield src_file, dst_file, is_stopped
+
+                    jobs = image_jobs(folder_path, inner_id, matching)
+                    copy = partial(journal.copy, copy=copy_file)
+                    for _job, result in bounded_map(worker, copy, jobs, tuner=tuner):
+                        if is_stopped():
+                            break
+                        if not result.startswith("오류 발생"):
+                            processed_images += 1
+                        worker.log.emit(result)
                 processed_folders += 1
                 worker.progress.emit(min(int(processed_folders / total * 100), 100))
+            if plan is not None:
+                finish_plan(worker, plan, "Date-Based Copy (Image Mode)")
+                return
+            _log_dedup(worker, content_index)
             worker.finished.emit(
                 f"Date-Based Copy (Image Mode) 완료. 폴더: {processed_folders}, 이미지: {processed_images}"
             )
@@ -200,6 +249,16 @@ def date_based_copy(worker: "WorkerThread", task: dict) -> None:
         logging.error("Date-Based Copy 중 오류 발생", exc_info=True)
         worker.log.emit(f"오류 발생: {exc}")
         worker.finished.emit("Date-Based Copy 중 오류 발생.")
+    finally:
+        if journal is not None:
+            journal.close()
+        if content_index is not None:
+            content_index.close()
+
+
+def _log_dedup(worker: "WorkerThread", index: ContentIndex | None) -> None:
+    if index is not None:
+        worker.log.emit(f"중복 처리: 건너뜀 {index.skipped}, 하드링크 {index.linked}")
 
 
 # ---------------------------------------------------------------------------
@@ -207,97 +266,122 @@ def date_based_copy(worker: "WorkerThread", task: dict) -> None:
 # ---------------------------------------------------------------------------
 
 def image_format_copy(worker: "WorkerThread", task: dict) -> None:
-    from apt.workers.base import set_worker_priority
-
     worker.log.emit("------ Image Format Copy 작업 시작 ------")
+    journals: dict[str, CopyJournal] = {}
+    plan = plan_for(task)
     try:
         sources = task["sources"]
         targets = task["targets"]
         formats = task["formats"]
+        resume = task.get("resume", False)
 
         if targets and not os.path.exists(targets[0]):
-            os.makedirs(targets[0], exist_ok=True)
+            if plan is not None:
+                plan.check_target(targets[0])
+            else:
+                os.makedirs(targets[0], exist_ok=True)
 
+        timings = timings_for(worker)
+        scan_started = time.perf_counter_ns()
         total = 0
+        matcher = FileMatcher(formats)
         pairs = list(zip(sources, targets))
         for source, _target in pairs:
             if os.path.exists(source):
                 try:
                     with os.scandir(source) as it:
-                        total += sum(
-                            1 for entry in it
-                            if entry.is_file() and is_valid_file(entry.name, formats)
-                        )
+                        total += len(matcher.filter(entry.name for entry in it if entry.is_file()))
                 except Exception as exc:
                     worker.log.emit(f"Source {source} 파일 목록 오류: {exc}")
+        timings.add_since(STAGE_SCAN, scan_started)
         if total == 0:
             worker.log.emit("선택한 이미지 포맷 없음")
             worker.finished.emit("Image Format Copy 완료.")
             return
         worker.log.emit(f"총 복사할 이미지 수: {total}")
+        if plan is not None:
+            for source, target in pairs:
+                if not os.path.exists(source):
+                    continue
+                journal = plan_journal(target, task)
+                try:
+                    with os.scandir(source) as it:
+                        names = matcher.filter(entry.name for entry in it if entry.is_file())
+                except OSError:
+                    continue
+                for name in names:
+                    plan.add_copy(os.path.join(source, name), os.path.join(target, name), journal)
+            finish_plan(worker, plan, "Image Format Copy")
+            return
 
         is_stopped = worker.is_stopped
+        tuner = tuner_for(worker, task, STAGE_IO)
         processed = 0
-        with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as executor:
-            futures = []
+
+        def copy_jobs():
             for source, target in pairs:
-                if is_stopped():
-                    worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
-                    worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
-                    return
                 if not os.path.exists(source):
                     worker.log.emit(f"Source 경로 없음: {source}")
                     continue
                 if not worker.ensure_target_folder(target):
                     continue
+                journal = journals.get(target)
+                if journal is None:
+                    journal = journals[target] = CopyJournal(
+                        target, resume=resume, metrics=getattr(worker, "metrics", None)
+                    )
                 try:
                     with os.scandir(source) as it:
-                        image_files = [
-                            entry.name for entry in it
-                            if entry.is_file() and is_valid_file(entry.name, formats)
-                        ]
+                        image_files = matcher.filter(entry.name for entry in it if entry.is_file())
                 except Exception as exc:
                     worker.log.emit(f"Source {source} 파일 목록 오류: {exc}")
                     continue
                 for name in image_files:
-                    if is_stopped():
-                        worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
-                        worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
-                        return
-                    src_file = os.path.join(source, name)
-                    dst_file = os.path.join(target, name)
-                    futures.append(executor.submit(copy_file_chunked, src_file, dst_file, is_stopped))
-
-            for future in as_completed(futures):
-                if is_stopped():
-                    worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
-                    worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
-                    return
-                result = future.result()
-                if result.startswith("오류 발생"):
-                    worker.log.emit(result)
-                else:
-                    processed += 1
-                    worker.log.emit(result)
-                    worker.progress.emit(min(int(processed / total * 100), 100))
+                    yield journal, os.path.join(source, name), os.path.join(target, name)
+
+        copy_file = timed_copy(copy_file_chunked)
+
+        def journaled_copy(journal: CopyJournal, src_file: str, dst_file: str) -> str:
+            return journal.copy(src_file, dst_file, is_stopped, copy=copy_file)
+
+        for _job, result in bounded_map(worker, journaled_copy, copy_jobs(), tuner=tuner):
+            if is_stopped():
+                break
+            if result.startswith("오류 발생"):
+                worker.log.emit(result)
+            else:
+                processed += 1
+                worker.log.emit(result)
+                worker.progress.emit(min(int(processed / total * 100), 100))
+        if is_stopped():
+            worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
+            worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
+            return
         worker.finished.emit(f"Image Format Copy 완료. 처리 이미지: {processed}")
         worker.log.emit("------ Image Format Copy 작업 완료 ------")
     except Exception as exc:
         logging.error("Image Format Copy 오류", exc_info=True)
         worker.log.emit(f"오류 발생: {exc}")
         worker.finished.emit("Image Format Copy 중 오류 발생.")
+    finally:
+        for journal in journals.values():
+            journal.close()
 
 
 # ---------------------------------------------------------------------------
 # 3) Simulation Foldering (legacy stub — kept as-is)
 # ---------------------------------------------------------------------------
 
-def simulation_foldering(worker: "WorkerThread", _task: dict) -> None:
+def simulation_foldering(worker: "WorkerThread", task: dict) -> None:
     worker.log.emit("------ Simulation Foldering 작업 시작 ------")
+    plan = plan_for(task)
+    if plan is not None:
+        finish_plan(worker, plan, "Simulation Foldering")
+        return
     worker.finished.emit("Simulation Foldering 작업 완료.")
 
 
-from apt.workers.base import register  # noqa: E402
+from apt.workers.registry import register  # noqa: E402
 
 register(OP_DATE_COPY, date_based_copy)
 register(OP_IMAGE_COPY, image_format_copy)
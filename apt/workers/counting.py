@@ -12,6 +12,7 @@ import os
 from typing import TYPE_CHECKING
 
 from apt.constants import OP_NG_COUNT
+from apt.workers.plan import finish_plan, plan_for
 
 if TYPE_CHECKING:
     from apt.workers.base import WorkerThread
@@ -25,6 +26,11 @@ def ng_count(worker: "WorkerThread", task: dict) -> None:
             worker.log.emit(f"NG 폴더 없음: {ng_folder}")
             worker.finished.emit("NG Count 중지됨.")
             return
+        plan = plan_for(task)
+        if plan is not None:
+            plan.note("NG Count는 읽기 전용 작업이라 기록할 대상이 없습니다.")
+            finish_plan(worker, plan, "NG Count")
+            return
 
         try:
             with os.scandir(ng_folder) as it:
@@ -96,6 +102,6 @@ def ng_count(worker: "WorkerThread", task: dict) -> None:
         worker.finished.emit("NG Count 중 오류 발생.")
 
 
-from apt.workers.base import register  # noqa: E402
+from apt.workers.registry import register  # noqa: E402
 
 register(OP_NG_COUNT, ng_count)
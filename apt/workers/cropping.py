@@ -2,18 +2,44 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING
-
-from PIL import Image, ImageDraw, ImageFile, ImageOps
-
-from apt.constants import IGNORED_DIRS, OP_CROP
-from apt.utils.formats import is_valid_file
+import struct
+import time
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFile
+
+from apt.constants import (
+    BACKEND_PROCESS,
+    BACKEND_THREAD,
+    OP_CROP,
+    OP_RENDER_OVERLAYS,
+    OVERLAY_BMP,
+    OVERLAY_FORMATS,
+    OVERLAY_OFF,
+    OVERLAY_PNG,
+)
 from apt.utils.fov import parse_fov_numbers
+from apt.utils.fs import _never_stopped
+from apt.utils.roi import CropRegion, load_roi_file, parse_regions, unique_regions
+from apt.utils.scan import DEFAULT_SCAN_WORKERS, StreamedScan, scan_files
+from apt.workers.executor import bounded_map, stop_check
+from apt.workers.instrument import (
+    STAGE_ENCODE,
+    STAGE_SCAN,
+    STAGE_TRANSFORM,
+    current_timings,
+    read_file,
+    timings_for,
+    write_file,
+)
+from apt.workers.plan import finish_plan, plan_for, prepare_target
+from apt.workers.regions import RegionReader, clamp_box
+from apt.workers.tuning import STAGE_CPU, tuner_for
 
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 
@@ -25,62 +51,158 @@ if TYPE_CHECKING:
 # Crop primitives
 # ---------------------------------------------------------------------------
 
+def _read_region(src: str, crop_coords: tuple[int, int, int, int]):
+    """``(patch, clamped box, full display size)`` — only the box is decoded.
+
+    ``patch`` and the box are ``None`` when the box misses the image.
+    """
+    with RegionReader(src) as reader:
+        box = clamp_box(crop_coords, reader.size)
+        if box is None:
+            return None, None, reader.size
+        return reader.crop(box), box, reader.size
+
+
+def _save(img: Image.Image, dst: str) -> Image.Image:
+    """Encode ``img`` in the format of ``dst``'s extension and write it.
+
+    Modes the format can't store are converted to RGB; returns the image
+    that was actually written.
+    """
+    fmt = Image.registered_extensions().get(os.path.splitext(dst)[1].lower())
+    with current_timings().stage(STAGE_ENCODE):
+        buffer = io.BytesIO()
+        try:
+            img.save(buffer, format=fmt)
+        except OSError:
+            img = img.convert("RGB")
+            buffer = io.BytesIO()
+            img.save(buffer, format=fmt)
+    write_file(dst, buffer.getvalue())
+    return img
+
+
 def _crop_image(src: str, dst: str, crop_coords: tuple[int, int, int, int], is_stopped) -> str:
     if is_stopped():
         return "오류 발생: 사용자 중지 요청"
     try:
-        with Image.open(src) as img:
-            img = ImageOps.exif_transpose(img)
-            img.load()
-            w, h = img.size
-            x1, y1, x2, y2 = crop_coords
-            if x1 > x2:
-                x1, x2 = x2, x1
-            if y1 > y2:
-                y1, y2 = y2, y1
-            x1 = max(0, min(x1, w))
-            y1 = max(0, min(y1, h))
-            x2 = max(0, min(x2, w))
-            y2 = max(0, min(y2, h))
-            if x2 <= x1 or y2 <= y1:
-                return f"SKIP: 크롭 영역이 유효하지 않음 (img={w}x{h}, box={crop_coords})"
-            cropped = img.crop((x1, y1, x2, y2))
-            try:
-                cropped.save(dst)
-            except OSError:
-                cropped = cropped.convert("RGB")
-                cropped.save(dst)
-            return f"Cropped {src} -> {dst} (img={w}x{h}, box=({x1},{y1},{x2},{y2}))"
+        cropped, box, (w, h) = _read_region(src, crop_coords)
+        if box is None:
+            return f"SKIP: 크롭 영역이 유효하지 않음 (img={w}x{h}, box={crop_coords})"
+        x1, y1, x2, y2 = box
+        _save(cropped, dst)
+        return f"Cropped {src} -> {dst} (img={w}x{h}, box=({x1},{y1},{x2},{y2}))"
     except Exception as exc:
         logging.error(f"이미지 크롭 오류: {src}", exc_info=True)
         return f"오류 발생: {exc}"
 
 
+def _shape_points(shapes: list) -> tuple[np.ndarray, np.ndarray]:
+    """Every usable ``[x, y]`` of ``shapes`` as one (N, 2) float array, plus each shape's count.
+
+    Points that are not ``[x, y, ...]`` lists are dropped, as are the extra
+    coordinates of longer ones.
+    """
+    chunks = []
+    counts = np.zeros(len(shapes), dtype=np.intp)
+    for i, shp in enumerate(shapes):
+        pts = (shp.get("points") or []) if isinstance(shp, dict) else []
+        try:
+            arr = np.asarray(pts, dtype=float)
+        except (TypeError, ValueError):
+            arr = None
+        if arr is None or arr.ndim != 2 or arr.shape[1] < 2:
+            arr = np.array(
+                [p[:2] for p in pts if isinstance(p, (list, tuple)) and len(p) >= 2], dtype=float
+            ).reshape(-1, 2)
+        chunks.append(arr[:, :2])
+        counts[i] = len(arr)
+    if not chunks:
+        return np.empty((0, 2)), counts
+    return np.concatenate(chunks), counts
+
+
+def _copy_labels(data: dict) -> dict:
+    """Copy of ``data`` that ``_adjust_and_save_json`` may edit.
+
+    Only the shape dicts and their bboxes are copied: points and rois are
+    replaced with new lists, never edited, so they can stay shared.
+    """
+    copied = dict(data)
+    if isinstance(data.get("shapes"), list):
+        copied["shapes"] = shapes = []
+        for shp in data["shapes"]:
+            if isinstance(shp, dict):
+                shp = dict(shp)
+                if isinstance(shp.get("bbox"), dict):
+                    shp["bbox"] = dict(shp["bbox"])
+            shapes.append(shp)
+    return copied
+
+
+def _adjust_rois(rois: list, crop_box: tuple[int, int, int, int], new_size: tuple[int, int]) -> list:
+    """``rois`` ``[x1, y1, x2, y2]`` boxes moved into the crop, clamped and ordered."""
+    picked = [i for i, item in enumerate(rois) if isinstance(item, (list, tuple)) and len(item) >= 4]
+    new_rois = list(rois)
+    if not picked:
+        return new_rois
+    x1, y1 = int(crop_box[0]), int(crop_box[1])
+    new_w, new_h = new_size
+    boxes = np.array([[int(v) for v in rois[i][:4]] for i in picked], dtype=np.int64)
+    boxes -= (x1, y1, x1, y1)
+    np.clip(boxes, 0, (new_w, new_h, new_w, new_h), out=boxes)
+    xs = np.sort(boxes[:, 0::2], axis=1)
+    ys = np.sort(boxes[:, 1::2], axis=1)
+    for i, box in zip(picked, np.stack([xs[:, 0], ys[:, 0], xs[:, 1], ys[:, 1]], axis=1).tolist()):
+        new_rois[i] = box
+    return new_rois
+
+
 def _adjust_and_save_json(
     src_json_path: str,
     dst_json_path: str,
     crop_box: tuple[int, int, int, int],
     new_size: tuple[int, int],
     new_image_filename: str,
-    debug_draw_path: str | None = None,
-    debug_base_image_path: str | None = None,
-) -> None:
-    with open(src_json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    src_data: dict | None = None,
+    compact: bool = False,
+) -> dict:
+    """Write ``src_json_path``'s labels re-projected into ``crop_box``.
+
+    ``src_data`` is the already-parsed source (left untouched), for callers
+    that cut several patches from one labelled image. ``compact`` writes the
+    JSON without indentation (smaller, and encoded by the C encoder).
+    Returns the labels as written.
+    """
+    if src_data is not None:
+        data = _copy_labels(src_data)
+    else:
+        with open(src_json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
     x1, y1, _x2, _y2 = crop_box
     new_w, new_h = new_size
 
-    for shp in data.get("shapes", []):
-        pts = shp.get("points", [])
+    shapes = data.get("shapes", [])
+    # Every point of every shape is moved and clamped in one go; "+ 0.0"
+    # turns the -0.0 a clamp can leave into 0.0.
+    points, counts = _shape_points(shapes)
+    points = np.clip(points - (float(x1), float(y1)), 0.0, (float(new_w), float(new_h))) + 0.0
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    lows = highs = points[:0]
+    if len(points):
+        filled = starts[counts > 0]
+        lows = np.minimum.reduceat(points, filled).tolist()
+        highs = np.maximum.reduceat(points, filled).tolist()
+    adjusted = points.tolist()
+
+    extent = 0
+    for shp, start, end in zip(shapes, starts.tolist(), ends.tolist()):
+        if not isinstance(shp, dict):
+            continue
         shape_type = (shp.get("shape_type") or "").lower()
-        adj_pts = []
-        for p in pts:
-            if not isinstance(p, (list, tuple)) or len(p) < 2:
-                continue
-            nx = max(0.0, min(float(p[0]) - float(x1), float(new_w)))
-            ny = max(0.0, min(float(p[1]) - float(y1), float(new_h)))
-            adj_pts.append([nx, ny])
+        adj_pts = adjusted[start:end]
         if adj_pts:
             shp["points"] = adj_pts
 
@@ -109,52 +231,48 @@ def _adjust_and_save_json(
             bbox["y"] = float(adj_pts[0][1])
             bbox["width"] = 0.0
             bbox["height"] = 0.0
-        else:
-            xs = [p[0] for p in adj_pts]
-            ys = [p[1] for p in adj_pts]
-            if xs and ys:
-                minx, maxx = max(0.0, min(xs)), min(float(new_w), max(xs))
-                miny, maxy = max(0.0, min(ys)), min(float(new_h), max(ys))
-                if bbox is not None:
-                    bbox["x"] = float(minx)
-                    bbox["y"] = float(miny)
-                    bbox["width"] = float(max(0.0, maxx - minx))
-                    bbox["height"] = float(max(0.0, maxy - miny))
+        elif adj_pts and bbox is not None:
+            (minx, miny), (maxx, maxy) = lows[extent], highs[extent]
+            bbox["x"] = minx
+            bbox["y"] = miny
+            bbox["width"] = maxx - minx
+            bbox["height"] = maxy - miny
+        extent += bool(adj_pts)
 
     rois = data.get("rois", None)
     if isinstance(rois, list):
-        new_rois = []
-        for item in rois:
-            if isinstance(item, (list, tuple)) and len(item) >= 4:
-                rx1 = max(0, min(int(item[0]) - int(x1), new_w))
-                ry1 = max(0, min(int(item[1]) - int(y1), new_h))
-                rx2 = max(0, min(int(item[2]) - int(x1), new_w))
-                ry2 = max(0, min(int(item[3]) - int(y1), new_h))
-                if rx2 < rx1:
-                    rx1, rx2 = rx2, rx1
-                if ry2 < ry1:
-                    ry1, ry2 = ry2, ry1
-                new_rois.append([rx1, ry1, rx2, ry2])
-            else:
-                new_rois.append(item)
-        data["rois"] = new_rois
+        data["rois"] = _adjust_rois(rois, crop_box, new_size)
 
     data["imagePath"] = new_image_filename
     data["imageWidth"] = int(new_w)
     data["imageHeight"] = int(new_h)
 
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=4)
     with open(dst_json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+        f.write(text)
+    return data
 
-    if debug_draw_path and debug_base_image_path:
-        try:
-            _draw_debug_labels(debug_base_image_path, data, debug_draw_path)
-        except Exception:
-            logging.error("디버그 드로잉 오류", exc_info=True)
+
+def _overlay_path(folder: str, base: str, overlay: str) -> str | None:
+    """``<folder>/<base>_draw.<overlay>``, or ``None`` when overlays are off."""
+    return None if overlay == OVERLAY_OFF else os.path.join(folder, f"{base}_draw.{overlay}")
 
 
-def _draw_debug_labels(image_path: str, data: dict, save_path: str) -> None:
-    with Image.open(image_path) as im:
+def _write_overlay(image: Image.Image, data: dict, save_path: str) -> None:
+    """Save ``data``'s labels drawn over ``image``; a failure is only logged."""
+    try:
+        _save(_draw_debug_labels(image, data), save_path)
+    except Exception:
+        logging.error("디버그 드로잉 오류", exc_info=True)
+
+
+def _draw_debug_labels(image: Image.Image, data: dict) -> Image.Image:
+    """A copy of ``image`` with ``data``'s shapes and bboxes drawn on it."""
+    with current_timings().stage(STAGE_TRANSFORM):
+        im = image.copy()
         draw = ImageDraw.Draw(im)
         for shp in data.get("shapes", []):
             pts = shp.get("points", [])
@@ -186,10 +304,7 @@ def _draw_debug_labels(image_path: str, data: dict, save_path: str) -> None:
                         draw.rectangle([x, y, x2, y2], width=2)
                 except Exception:
                     pass
-        try:
-            im.save(save_path)
-        except OSError:
-            im.convert("RGB").save(save_path)
+    return im
 
 
 def _crop_image_and_json_pair(
@@ -198,115 +313,432 @@ def _crop_image_and_json_pair(
     src_json: str,
     dst_json: str,
     crop_coords: tuple[int, int, int, int],
-    debug_draw_path: str,
+    debug_draw_path: str | None,
+    compact_json: bool = False,
 ) -> str:
+    timings = current_timings()
     try:
-        with Image.open(src_img) as img:
-            img = ImageOps.exif_transpose(img)
-            img.load()
-            x1, y1, x2, y2 = crop_coords
-            if x1 > x2:
-                x1, x2 = x2, x1
-            if y1 > y2:
-                y1, y2 = y2, y1
-            w, h = img.size
-            x1 = max(0, min(x1, w))
-            y1 = max(0, min(y1, h))
-            x2 = max(0, min(x2, w))
-            y2 = max(0, min(y2, h))
-            if x2 <= x1 or y2 <= y1:
-                return f"SKIP: 크롭 영역이 유효하지 않음 (img={w}x{h}, box=({x1},{y1},{x2},{y2}))"
-            cropped = img.crop((x1, y1, x2, y2))
-            try:
-                cropped.save(dst_img)
-            except OSError:
-                cropped = cropped.convert("RGB")
-                cropped.save(dst_img)
-            new_w, new_h = cropped.size
-
-        _adjust_and_save_json(
-            src_json_path=src_json,
-            dst_json_path=dst_json,
-            crop_box=(x1, y1, x2, y2),
-            new_size=(new_w, new_h),
-            new_image_filename=os.path.basename(dst_img),
-            debug_draw_path=debug_draw_path,
-            debug_base_image_path=dst_img,
-        )
+        cropped, box, (w, h) = _read_region(src_img, crop_coords)
+        if box is None:
+            return f"SKIP: 크롭 영역이 유효하지 않음 (img={w}x{h}, box={crop_coords})"
+        x1, y1, x2, y2 = box
+        cropped = _save(cropped, dst_img)
+        new_w, new_h = cropped.size
+
+        with timings.stage(STAGE_TRANSFORM):
+            data = _adjust_and_save_json(
+                src_json_path=src_json,
+                dst_json_path=dst_json,
+                crop_box=(x1, y1, x2, y2),
+                new_size=(new_w, new_h),
+                new_image_filename=os.path.basename(dst_img),
+                compact=compact_json,
+            )
+        if debug_draw_path:
+            _write_overlay(cropped, data, debug_draw_path)
         return f"Cropped+JSON {src_img} -> {dst_img}, JSON -> {dst_json}"
     except Exception as exc:
         logging.error("crop_image_and_json_pair 오류", exc_info=True)
         for p in (dst_img, dst_json, debug_draw_path):
             try:
-                if os.path.exists(p):
+                if p and os.path.exists(p):
                     os.remove(p)
             except OSError:
                 pass
         return f"오류 발생: {exc}"
 
 
-def _collect_crop_candidates(
+def _remove_written(paths: list[str]) -> None:
+    for p in paths:
+        try:
+            if os.path.exists(p):
+                os.remove(p)
+        except OSError:
+            pass
+
+
+def _crop_regions(
+    src_img: str,
+    src_json: str | None,
+    outputs: list[tuple[str, tuple[int, int, int, int], str, str | None, str | None]],
+    is_stopped,
+    compact_json: bool = False,
+) -> str:
+    """Cut every ``(name, box, dst_img, dst_json, debug_path)`` from one decode.
+
+    ``dst_json`` / ``debug_path`` are ``None`` when the image has no labels
+    (``debug_path`` also when overlays are off).
+    A failure removes everything this call wrote for the image.
+    """
+    if is_stopped():
+        return "오류 발생: 사용자 중지 요청"
+    timings = current_timings()
+    written: list[str] = []
+    try:
+        with RegionReader(src_img) as reader:
+            w, h = reader.size
+            boxes = {name: clamp_box(box, (w, h)) for name, box, *_rest in outputs}
+            valid = [item for item in outputs if boxes[item[0]] is not None]
+            patches = reader.crops([boxes[item[0]] for item in valid]) if valid else []
+
+        src_data = None
+        if src_json is not None and valid:
+            with open(src_json, "r", encoding="utf-8") as f:
+                src_data = json.load(f)
+        for (name, _box, dst_img, dst_json, debug_path), patch in zip(valid, patches):
+            written.append(dst_img)
+            patch = _save(patch, dst_img)
+            if src_data is None:
+                continue
+            written.append(dst_json)
+            with timings.stage(STAGE_TRANSFORM):
+                data = _adjust_and_save_json(
+                    src_json_path=src_json,
+                    dst_json_path=dst_json,
+                    crop_box=boxes[name],
+                    new_size=patch.size,
+                    new_image_filename=os.path.basename(dst_img),
+                    src_data=src_data,
+                    compact=compact_json,
+                )
+            if debug_path:
+                written.append(debug_path)
+                _write_overlay(patch, data, debug_path)
+
+        skipped = [name for name, box in boxes.items() if box is None]
+        result = f"Cropped {src_img} -> {len(valid)}개 영역 (img={w}x{h})"
+        if skipped:
+            result += f", SKIP: 이미지 밖의 영역 {', '.join(skipped)}"
+        return result
+    except Exception as exc:
+        logging.error(f"다중 영역 크롭 오류: {src_img}", exc_info=True)
+        _remove_written(written)
+        return f"오류 발생: {exc}"
+
+
+_BMP_FAST_MODES = ("L", "P", "RGB")
+_BMP_PPM = 3780  # 96 dpi, what Pillow writes by default
+_GREY_BGRX = np.repeat(np.arange(256, dtype=np.uint8), 4).reshape(256, 4)
+_GREY_BGRX[:, 3] = 0
+
+
+def _encode_bmp(pixels: np.ndarray, palette: bytes | None = None) -> bytes:
+    """An HxW (``L`` / ``P``) or HxWx3 BGR array as a bottom-up BMP.
+
+    The same file Pillow writes for those modes, minus the Image round
+    trip — tiles are small enough that per-call overhead dominates.
+    """
+    height, width = pixels.shape[:2]
+    channels = 1 if pixels.ndim == 2 else 3
+    if channels == 1:
+        if palette is None:
+            table = _GREY_BGRX
+        else:
+            rgb = np.frombuffer(palette, np.uint8).reshape(-1, 3)
+            table = np.zeros((len(rgb), 4), np.uint8)
+            table[:, :3] = rgb[:, ::-1]
+    else:
+        table = np.empty((0, 4), np.uint8)
+    stride = (width * channels + 3) & ~3
+    offset = 14 + 40 + table.size
+    size = offset + stride * height
+    out = bytearray(size)
+    struct.pack_into("<2sIHHI", out, 0, b"BM", size, 0, 0, offset)
+    struct.pack_into(
+        "<IiiHHIIiiII", out, 14, 40, width, height, 1, channels * 8, 0,
+        stride * height, _BMP_PPM, _BMP_PPM, len(table), 0,
+    )
+    out[54:offset] = table.tobytes()
+    rows = np.frombuffer(out, np.uint8, offset=offset).reshape(height, stride)
+    if channels == 1:
+        rows[:, :width] = pixels[::-1]
+    else:
+        rows[:, :width * 3].reshape(height, width, 3)[:] = pixels[::-1]
+    return bytes(out)
+
+
+def _tile_origins(length: int, tile: int, stride: int) -> list[int]:
+    """Tile starts along one axis; the last tile is flush with the far edge."""
+    if length < tile:
+        return []
+    starts = list(range(0, length - tile + 1, stride))
+    if starts[-1] + tile < length:
+        starts.append(length - tile)
+    return starts
+
+
+def _label_extents(items: list, roi: bool = False) -> np.ndarray:
+    """``[x1, y1, x2, y2]`` per LabelMe shape (or ``rois`` entry); NaN when unusable."""
+    extents = np.full((len(items), 4), np.nan)
+    for i, item in enumerate(items):
+        if roi:
+            if isinstance(item, (list, tuple)) and len(item) >= 4:
+                try:
+                    x1, y1, x2, y2 = (float(v) for v in item[:4])
+                except (TypeError, ValueError):
+                    continue
+                extents[i] = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+            continue
+        points = [p for p in (item.get("points") or []) if isinstance(p, (list, tuple)) and len(p) >= 2]
+        if points:
+            try:
+                pts = np.array([p[:2] for p in points], dtype=float)
+            except (TypeError, ValueError):
+                continue
+            extents[i, :2] = pts.min(axis=0)
+            extents[i, 2:] = pts.max(axis=0)
+    return extents
+
+
+def _overlapping(extents: np.ndarray, box: tuple[int, int, int, int]) -> np.ndarray:
+    """Indices of the extents that fall inside ``box``.
+
+    Areas must overlap it; single points must lie in ``[x1, x2) x [y1, y2)``
+    so a point on a tile seam belongs to exactly one tile.
+    """
+    x1, y1, x2, y2 = box
+    left, top, right, bottom = extents.T
+    point = (left == right) & (top == bottom)
+    inside = (left >= x1) & (left < x2) & (top >= y1) & (top < y2)
+    overlap = (right > x1) & (left < x2) & (bottom > y1) & (top < y2)
+    return np.flatnonzero(np.where(point, inside, overlap))
+
+
+def _crop_tiles(
+    src_img: str,
+    src_json: str | None,
+    dst_base: str,
+    ext: str,
+    tile_size: tuple[int, int],
+    stride: tuple[int, int],
+    labelled_only: bool,
+    is_stopped,
+    compact_json: bool = False,
+) -> str:
+    """Cut a ``tile_size`` grid every ``stride`` pixels out of one decoded frame.
+
+    Tiles are numpy views of the frame, written as ``<dst_base>_x<x>_y<y><ext>``
+    with their labels (only the shapes / rois that fall in the tile) next to
+    them. ``labelled_only`` drops tiles without labels — and so every tile
+    of an image that has no JSON. A failure or a stop partway through
+    removes the tiles already written for the image.
+    """
+    if is_stopped():
+        return "오류 발생: 사용자 중지 요청"
+    timings = current_timings()
+    written: list[str] = []
+    try:
+        tile_w, tile_h = tile_size
+        with RegionReader(src_img) as reader:
+            w, h = reader.size
+            xs = _tile_origins(w, tile_w, stride[0])
+            ys = _tile_origins(h, tile_h, stride[1])
+            if not xs or not ys:
+                return f"SKIP: 이미지가 타일보다 작음 (img={w}x{h}, tile={tile_w}x{tile_h}) {src_img}"
+            if labelled_only and src_json is None:
+                return f"SKIP: 라벨 없는 이미지 {src_img}"
+            fast_bmp = ext.lower() == ".bmp" and reader.mode in _BMP_FAST_MODES
+            pixels, mode, palette = reader.frame(bgr=fast_bmp)
+
+        data = shapes = rois = None
+        if src_json is not None:
+            with open(src_json, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            shapes = data.get("shapes") if isinstance(data.get("shapes"), list) else []
+            rois = data.get("rois") if isinstance(data.get("rois"), list) else None
+            shape_extents = _label_extents(shapes)
+            roi_extents = _label_extents(rois or [], roi=True)
+
+        kept = dropped = 0
+        for y in ys:
+            if is_stopped():
+                _remove_written(written)
+                return "오류 발생: 사용자 중지 요청"
+            for x in xs:
+                box = (x, y, x + tile_w, y + tile_h)
+                if data is not None:
+                    in_shapes = _overlapping(shape_extents, box)
+                    in_rois = _overlapping(roi_extents, box)
+                    if labelled_only and not len(in_shapes) and not len(in_rois):
+                        dropped += 1
+                        continue
+                tile = pixels[y:y + tile_h, x:x + tile_w]  # a view, nothing copied yet
+                dst_img = f"{dst_base}_x{x}_y{y}{ext}"
+                written.append(dst_img)
+                if fast_bmp:
+                    with timings.stage(STAGE_ENCODE):
+                        encoded = _encode_bmp(tile, palette if mode == "P" else None)
+                    write_file(dst_img, encoded)
+                else:
+                    image = Image.fromarray(tile, "L" if mode == "P" else mode)
+                    if palette is not None:
+                        image.putpalette(palette)
+                    _save(image, dst_img)
+                kept += 1
+                if data is None:
+                    continue
+                # imageData (if embedded) is the whole frame's, not the tile's.
+                tile_data = dict(data, shapes=[shapes[i] for i in in_shapes], imageData=None)
+                if rois is not None:
+                    tile_data["rois"] = [rois[i] for i in in_rois]
+                dst_json = f"{dst_base}_x{x}_y{y}.json"
+                written.append(dst_json)
+                with timings.stage(STAGE_TRANSFORM):
+                    _adjust_and_save_json(
+                        src_json_path=src_json,
+                        dst_json_path=dst_json,
+                        crop_box=box,
+                        new_size=(tile_w, tile_h),
+                        new_image_filename=os.path.basename(dst_img),
+                        src_data=tile_data,
+                        compact=compact_json,
+                    )
+        result = f"Tiled {src_img} -> {kept}개 타일 (img={w}x{h})"
+        if dropped:
+            result += f", 라벨 없는 타일 {dropped}개 제외"
+        return result
+    except Exception as exc:
+        logging.error(f"타일 크롭 오류: {src_img}", exc_info=True)
+        _remove_written(written)
+        return f"오류 발생: {exc}"
+
+
+def _crop_candidates(
     root_folder: str,
     formats: list[str],
     fov_numbers: set[str] | None = None,
-) -> list[tuple[str, str]]:
-    collected: list[tuple[str, str]] = []
-    for dirpath, dirnames, filenames in os.walk(root_folder):
-        dirnames[:] = [d for d in dirnames if d.lower() not in IGNORED_DIRS]
-        folder_name = os.path.basename(dirpath)
-        if folder_name.lower() in IGNORED_DIRS:
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    is_stopped=_never_stopped,
+    target: str | None = None,
+) -> Iterator[tuple[str, str]]:
+    """``(path, inner_id)`` of every image to crop, as the scan finds them.
+
+    Files under ``target`` are left out: the scan runs while crops are being
+    written, and a target inside the source must not feed itself.
+    """
+    inside_target = os.path.join(os.path.abspath(target), "") if target else None
+    for entry in scan_files(
+        root_folder,
+        formats=formats,
+        fov_numbers=fov_numbers,
+        max_workers=max_workers,
+        is_stopped=is_stopped,
+    ):
+        if inside_target and os.path.abspath(entry.path).startswith(inside_target):
             continue
-        rel_path = os.path.relpath(dirpath, root_folder)
-        parts = rel_path.split(os.sep)
-        inner_id = parts[0] if parts else folder_name
-        for fname in filenames:
-            if not is_valid_file(fname, formats):
-                continue
-            if fov_numbers:
-                prefix = fname.split("_", 1)[0].lower()
-                digits = re.sub(r"[^0-9]", "", prefix)
-                if digits not in fov_numbers:
-                    continue
-            collected.append((os.path.join(dirpath, fname), inner_id))
-    return collected
+        yield entry.path, entry.top_folder
 
 
 # ---------------------------------------------------------------------------
 # Public handler
 # ---------------------------------------------------------------------------
 
-def crop_images(worker: "WorkerThread", task: dict) -> None:
-    from apt.workers.base import set_worker_priority
+def _pixel_pair(value) -> tuple[int, int]:
+    """``256`` / ``"256"`` / ``[256, 128]`` -> ``(w, h)``, both positive."""
+    if isinstance(value, (int, str)):
+        value = (value, value)
+    width, height = (int(v) for v in value)
+    if width <= 0 or height <= 0:
+        raise ValueError(f"양의 정수여야 합니다: {value!r}")
+    return width, height
+
+
+def _task_regions(task: dict) -> list[CropRegion]:
+    """Named boxes of a multi-region task: ``roi_file`` first, then ``regions``."""
+    coords_mode = task.get("coords_mode", "ltrb")
+    regions = []
+    if task.get("roi_file"):
+        regions += load_roi_file(task["roi_file"], coords_mode)
+    if task.get("regions"):
+        regions += parse_regions(task["regions"], coords_mode)
+    return unique_regions(regions)
+
+
+def _plan_tiles(plan, src_img: str, src_json: str | None, dst_base: str, ext: str,
+                tile_size: tuple[int, int], stride: tuple[int, int]) -> None:
+    """Dry-run every tile of ``src_img`` (only its header is read)."""
+    try:
+        with RegionReader(src_img) as reader:
+            w, h = reader.size
+    except Exception as exc:
+        plan.skip(src_img, f"이미지를 열 수 없음: {exc}")
+        return
+    tile_w, tile_h = tile_size
+    xs = _tile_origins(w, tile_w, stride[0])
+    ys = _tile_origins(h, tile_h, stride[1])
+    if not xs or not ys:
+        plan.skip(src_img, f"이미지가 타일보다 작음 ({w}x{h})")
+        return
+    tile_bytes = os.path.getsize(src_img) * tile_w * tile_h // (w * h)
+    for y in ys:
+        for x in xs:
+            plan.add(src_img, f"{dst_base}_x{x}_y{y}{ext}", kind="tile", size=tile_bytes)
+            if src_json is not None:
+                plan.add(src_json, f"{dst_base}_x{x}_y{y}.json", kind="label", size=0)
+
+
+def _call(fn, args: tuple) -> str:
+    return fn(*args)
+
 
+def crop_images(worker: "WorkerThread", task: dict) -> None:
     worker.log.emit("------ Crop 작업 시작 ------")
+    plan = plan_for(task)
     try:
         source = task["source"]
         target = task["target"]
         formats = task["formats"]
         fov_text = task.get("fov_number", "").strip()
-
-        try:
-            x1 = int(task["left_top_x"])
-            y1 = int(task["left_top_y"])
-            x2 = int(task["right_bottom_x"])
-            y2 = int(task["right_bottom_y"])
-            if task.get("coords_mode", "ltrb") == "xywh":
-                start_x, start_y, width, height = x1, y1, x2, y2
-                if width < 0 or height < 0:
-                    worker.log.emit(
-                        f"경고: width/height가 음수입니다. 절대값으로 보정합니다 (w={width}, h={height})"
-                    )
-                    width, height = abs(width), abs(height)
-                if width == 0 or height == 0:
-                    worker.log.emit("경고: width/height가 0입니다. 크롭을 중지합니다.")
-                    worker.finished.emit("Crop 중지됨.")
-                    return
-                x1, y1 = start_x, start_y
-                x2, y2 = start_x + width, start_y + height
-        except Exception as exc:
-            worker.log.emit(f"Crop 좌표 오류: {exc}")
+        backend = task.get("backend", BACKEND_THREAD)
+
+        regions = tiles = None
+        labelled_only = bool(task.get("labelled_tiles_only", False))
+        compact_json = bool(task.get("compact_json", False))
+        overlay = task.get("debug_overlay", OVERLAY_BMP)
+        if overlay != OVERLAY_OFF and overlay not in OVERLAY_FORMATS:
+            worker.log.emit(f"Crop 오버레이 설정 오류: {overlay!r}")
             worker.finished.emit("Crop 중지됨.")
             return
+        if task.get("tile_size"):
+            try:
+                if task.get("regions") or task.get("roi_file"):
+                    raise ValueError("타일 모드와 영역(ROI) 모드는 함께 쓸 수 없습니다.")
+                tile_size = _pixel_pair(task["tile_size"])
+                tiles = (tile_size, _pixel_pair(task.get("tile_stride") or tile_size))
+            except (TypeError, ValueError) as exc:
+                worker.log.emit(f"Crop 타일 설정 오류: {exc}")
+                worker.finished.emit("Crop 중지됨.")
+                return
+        elif task.get("regions") or task.get("roi_file"):
+            try:
+                regions = _task_regions(task)
+            except ValueError as exc:
+                worker.log.emit(f"Crop 영역 오류: {exc}")
+                worker.finished.emit("Crop 중지됨.")
+                return
+        else:
+            try:
+                x1 = int(task["left_top_x"])
+                y1 = int(task["left_top_y"])
+                x2 = int(task["right_bottom_x"])
+                y2 = int(task["right_bottom_y"])
+                if task.get("coords_mode", "ltrb") == "xywh":
+                    start_x, start_y, width, height = x1, y1, x2, y2
+                    if width < 0 or height < 0:
+                        worker.log.emit(
+                            f"경고: width/height가 음수입니다. 절대값으로 보정합니다 (w={width}, h={height})"
+                        )
+                        width, height = abs(width), abs(height)
+                    if width == 0 or height == 0:
+                        worker.log.emit("경고: width/height가 0입니다. 크롭을 중지합니다.")
+                        worker.finished.emit("Crop 중지됨.")
+                        return
+                    x1, y1 = start_x, start_y
+                    x2, y2 = start_x + width, start_y + height
+            except Exception as exc:
+                worker.log.emit(f"Crop 좌표 오류: {exc}")
+                worker.finished.emit("Crop 중지됨.")
+                return
 
         fov_numbers = parse_fov_numbers(fov_text) if fov_text else None
 
@@ -314,31 +746,46 @@ def crop_images(worker: "WorkerThread", task: dict) -> None:
             worker.log.emit(f"Source 경로 없음: {source}")
             worker.finished.emit("Crop 중지됨.")
             return
-        if not worker.ensure_target_folder(target):
+        if not prepare_target(worker, target, plan):
             worker.finished.emit("Crop 중지됨.")
             return
 
-        all_files = _collect_crop_candidates(source, formats, fov_numbers)
-        total = len(all_files)
-        if total == 0:
-            worker.log.emit("조건에 맞는 이미지 없음")
-            worker.finished.emit("Crop 완료.")
-            return
-
-        worker.log.emit(f"총 Crop 대상 이미지 수: {total}")
-        crop_coords = (x1, y1, x2, y2)
-        worker.log.emit(f"Crop 영역(LTRB): {crop_coords}")
+        timings = timings_for(worker)
+        scan_started = time.perf_counter_ns()
+        candidates = _crop_candidates(
+            source, formats, fov_numbers, worker.max_workers, worker.is_stopped, target
+        )
+        if plan is not None:
+            candidates = sorted(candidates)
+            timings.add_since(STAGE_SCAN, scan_started)
+            if not candidates:
+                worker.log.emit("조건에 맞는 이미지 없음")
+                worker.finished.emit("Crop 완료.")
+                return
+            worker.log.emit(f"총 Crop 대상 이미지 수: {len(candidates)}")
+
+        if tiles is not None:
+            (tile_w, tile_h), (stride_x, stride_y) = tiles
+            worker.log.emit(
+                f"타일 {tile_w}x{tile_h}, stride {stride_x}x{stride_y}"
+                + (", 라벨 있는 타일만 저장" if labelled_only else "")
+            )
+        elif regions is None:
+            crop_coords = (x1, y1, x2, y2)
+            worker.log.emit(f"Crop 영역(LTRB): {crop_coords}")
+        else:
+            worker.log.emit(f"Crop 영역 {len(regions)}개 (이미지당 1회 디코딩):")
+            for region in regions:
+                worker.log.emit(f"  {region.name}: {region.box}")
+        if backend == BACKEND_PROCESS:
+            worker.log.emit("프로세스 풀 백엔드로 실행합니다.")
 
         is_stopped = worker.is_stopped
+        job_stopped = stop_check(worker, backend)
         processed = 0
-        with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as executor:
-            futures = []
-            for file_path, inner_id in all_files:
-                if is_stopped():
-                    worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
-                    worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
-                    return
 
+        def crop_jobs(files):
+            for file_path, inner_id in files:
                 orig_filename = os.path.basename(file_path)
                 file_base, file_ext = os.path.splitext(orig_filename)
                 use_prefix = os.path.dirname(file_path) != source
@@ -347,31 +794,106 @@ def crop_images(worker: "WorkerThread", task: dict) -> None:
 
                 src_dir = os.path.dirname(file_path)
                 json_path = os.path.join(src_dir, f"{file_base}.json")
-                if file_ext.lower() == ".bmp" and os.path.isfile(json_path):
+                has_json = file_ext.lower() == ".bmp" and os.path.isfile(json_path)
+                if tiles is not None:
+                    yield _crop_tiles, (
+                        file_path,
+                        json_path if has_json else None,
+                        os.path.join(target, os.path.splitext(new_filename)[0]),
+                        file_ext,
+                        tiles[0],
+                        tiles[1],
+                        labelled_only,
+                        job_stopped,
+                        compact_json,
+                    )
+                elif regions is not None:
+                    new_base = os.path.splitext(new_filename)[0]
+                    outputs = []
+                    for region in regions:
+                        region_dir = os.path.join(target, region.name)
+                        outputs.append((
+                            region.name,
+                            region.box,
+                            os.path.join(region_dir, new_filename),
+                            os.path.join(region_dir, f"{new_base}.json") if has_json else None,
+                            _overlay_path(region_dir, new_base, overlay) if has_json else None,
+                        ))
+                    yield _crop_regions, (
+                        file_path, json_path if has_json else None, outputs, job_stopped, compact_json,
+                    )
+                elif has_json:
                     new_base = os.path.splitext(new_filename)[0]
                     dst_json = os.path.join(target, f"{new_base}.json")
-                    debug_path = os.path.join(target, f"{new_base}_draw.bmp")
-                    futures.append(
-                        executor.submit(
-                            _crop_image_and_json_pair,
-                            file_path, dst_file, json_path, dst_json, crop_coords, debug_path,
-                        )
+                    debug_path = _overlay_path(target, new_base, overlay)
+                    yield (
+                        _crop_image_and_json_pair,
+                        (file_path, dst_file, json_path, dst_json, crop_coords, debug_path, compact_json),
                     )
                 else:
-                    futures.append(
-                        executor.submit(_crop_image, file_path, dst_file, crop_coords, is_stopped)
-                    )
+                    yield _crop_image, (file_path, dst_file, crop_coords, job_stopped)
+
+        if plan is not None:
+            for fn, args in crop_jobs(candidates):
+                if fn is _crop_tiles:
+                    _plan_tiles(plan, *args[:6])
+                    continue
+                if fn is _crop_regions:
+                    src_img, src_json, outputs = args[:3]
+                    for _name, _box, dst_img, dst_json, debug_path in outputs:
+                        plan.add(src_img, dst_img, kind="crop")
+                        if dst_json is not None:
+                            plan.add(src_json, dst_json, kind="label")
+                        if debug_path is not None:
+                            plan.add(dst_img, debug_path, kind="overlay", size=0)
+                    continue
+                plan.add(args[0], args[1], kind="crop")
+                if fn is _crop_image_and_json_pair:
+                    plan.add(args[2], args[3], kind="label")
+                    if args[5] is not None:
+                        plan.add(args[1], args[5], kind="overlay", size=0)
+            if tiles is not None and labelled_only:
+                plan.note("라벨 없는 타일은 실제 실행 시 제외되므로 실제 기록 수는 더 적을 수 있습니다.")
+            finish_plan(worker, plan, "Crop")
+            return
 
-            for future in as_completed(futures):
-                if is_stopped():
-                    worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
-                    worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
-                    return
-                result = future.result()
-                if result:
-                    processed += 1
-                    worker.log.emit(result)
-                    worker.progress.emit(min(int(processed / total * 100), 100))
+        def scan_done(found: int) -> None:
+            timings.add_since(STAGE_SCAN, scan_started)
+            worker.log.emit(f"총 Crop 대상 이미지 수: {found}")
+
+        # Cropping starts with the first listed folder; see apt.utils.scan.
+        scan = StreamedScan(candidates, on_done=scan_done)
+
+        def streamed_jobs():
+            for i, job in enumerate(crop_jobs(scan)):
+                if i == 0:
+                    for region in regions or ():
+                        os.makedirs(os.path.join(target, region.name), exist_ok=True)
+                yield job
+
+        for _job, result in bounded_map(
+            worker, _call, streamed_jobs(), backend=backend,
+            tuner=tuner_for(worker, task, STAGE_CPU, backend),
+        ):
+            if is_stopped():
+                worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
+                worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
+                return
+            if result:
+                processed += 1
+                worker.log.emit(result)
+                percent = scan.percent(processed)
+                if percent is not None:
+                    worker.progress.emit(percent)
+        if is_stopped():
+            worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
+            worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
+            return
+        if scan.found == 0:
+            worker.log.emit("조건에 맞는 이미지 없음")
+            worker.finished.emit("Crop 완료.")
+            return
+        worker.progress.emit(scan.percent(processed))
 
         worker.finished.emit(f"Crop 완료. 처리 이미지: {processed}")
         worker.log.emit("------ Crop 작업 완료 ------")
@@ -381,6 +903,119 @@ def crop_images(worker: "WorkerThread", task: dict) -> None:
         worker.finished.emit("Crop 중 오류 발생.")
 
 
-from apt.workers.base import register  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Overlays on demand
+# ---------------------------------------------------------------------------
+
+_OVERLAY_SOURCES = (".bmp", ".png", ".jpg", ".jpeg")
+
+
+def _is_overlay_source(name: str) -> bool:
+    return not os.path.splitext(name)[0].endswith("_draw")
+
+
+def _render_overlay(image_path: str, json_path: str, save_path: str) -> str:
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        with Image.open(io.BytesIO(read_file(image_path))) as im:
+            _save(_draw_debug_labels(im, data), save_path)
+        return f"Overlay {image_path} -> {save_path}"
+    except Exception as exc:
+        logging.error(f"오버레이 렌더링 오류: {image_path}", exc_info=True)
+        return f"오류 발생: {exc}"
+
+
+def _overlay_candidates(worker, task: dict) -> list[str]:
+    """``files`` (relative to ``source`` unless absolute), else every image under ``source``."""
+    source = task.get("source", "")
+    files = task.get("files") or []
+    if files:
+        return [path if os.path.isabs(path) else os.path.join(source, path) for path in files]
+    with timings_for(worker).stage(STAGE_SCAN):
+        return sorted(
+            entry.path
+            for entry in scan_files(
+                source,
+                formats=_OVERLAY_SOURCES,
+                file_filter=_is_overlay_source,
+                ignored_dirs=(),
+                max_workers=worker.max_workers,
+                is_stopped=worker.is_stopped,
+            )
+        )
+
+
+def render_overlays(worker: "WorkerThread", task: dict) -> None:
+    """Draw the labels of already-cropped images (``<name>_draw.<ext>``).
+
+    For Crop runs with ``debug_overlay`` off: overlays are made afterwards,
+    only for the images someone wants to look at.
+    """
+    worker.log.emit("------ Render Overlays 작업 시작 ------")
+    plan = plan_for(task)
+    try:
+        source = task.get("source", "")
+        overlay = task.get("overlay_format", OVERLAY_PNG)
+        backend = task.get("backend", BACKEND_THREAD)
+        if overlay not in OVERLAY_FORMATS:
+            worker.log.emit(f"오버레이 형식 오류: {overlay!r}")
+            worker.finished.emit("Render Overlays 중지됨.")
+            return
+        if not task.get("files") and not os.path.isdir(source):
+            worker.log.emit(f"Source 경로 없음: {source}")
+            worker.finished.emit("Render Overlays 중지됨.")
+            return
+
+        jobs = []
+        for image_path in _overlay_candidates(worker, task):
+            base, _ext = os.path.splitext(image_path)
+            json_path = f"{base}.json"
+            if not os.path.isfile(image_path) or not os.path.isfile(json_path):
+                if task.get("files"):  # asked for by name, so say why it was left out
+                    worker.log.emit(f"SKIP: 이미지 또는 JSON 없음 {image_path}")
+                    if plan is not None:
+                        plan.skip(image_path, "이미지 또는 JSON 없음")
+                continue
+            jobs.append((_render_overlay, (image_path, json_path, f"{base}_draw.{overlay}")))
+        total = len(jobs)
+        if total == 0:
+            worker.log.emit("오버레이를 그릴 라벨 이미지 없음")
+            worker.finished.emit("Render Overlays 완료.")
+            return
+
+        if plan is not None:
+            for _fn, (image_path, _json_path, save_path) in jobs:
+                plan.add(image_path, save_path, kind="overlay", size=0)
+            finish_plan(worker, plan, "Render Overlays")
+            return
+
+        worker.log.emit(f"총 오버레이 대상 이미지 수: {total}")
+        processed = 0
+        for _job, result in bounded_map(
+            worker, _call, jobs, backend=backend,
+            tuner=tuner_for(worker, task, STAGE_CPU, backend),
+        ):
+            if worker.is_stopped():
+                break
+            processed += 1
+            worker.log.emit(result)
+            worker.progress.emit(min(int(processed / total * 100), 100))
+        if worker.is_stopped():
+            worker.log.emit(f"작업 중지: 처리 이미지 {processed}")
+            worker.finished.emit(f"작업 중지됨. 처리 이미지: {processed}")
+            return
+
+        worker.finished.emit(f"Render Overlays 완료. 처리 이미지: {processed}")
+        worker.log.emit("------ Render Overlays 작업 완료 ------")
+    except Exception as exc:
+        logging.error("Render Overlays 중 오류 발생", exc_info=True)
+        worker.log.emit(f"오류 발생: {exc}")
+        worker.finished.emit("Render Overlays 중 오류 발생.")
+
+
+from apt.workers.registry import register  # noqa: E402
 
 register(OP_CROP, crop_images)
+register(OP_RENDER_OVERLAYS, render_overlays)
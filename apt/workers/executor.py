@@ -0,0 +1,291 @@
+"""Bounded producer/consumer execution for worker tasks.
+
+The handlers used to ``submit`` every job up-front and only then iterate
+``as_completed`` — with 500k files that is 500k live ``Future`` objects and a
+progress bar stuck at 0% until submission ends. ``bounded_map`` instead pulls
+jobs lazily from an iterable, keeps at most ``max_in_flight`` of them
+submitted, and yields each ``(job, result)`` as soon as it completes, so
+memory stays flat and progress starts with the first finished file.
+
+CPU-bound handlers (BTJ, Crop, Attach FOV) can opt into a process pool with
+``backend="process"`` to sidestep the GIL; see ``bounded_map``.
+
+This module is Qt-free; it only needs an object exposing ``is_stopped()`` and
+``max_workers`` (a ``TaskContext`` or any test double). Completed jobs are
+counted into ``worker.metrics`` when the object has one, and with enabled
+``worker.timings`` each job runs with them as its current timings
+(``apt.workers.instrument``).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from apt.constants import BACKEND_PROCESS, BACKEND_THREAD
+from apt.workers.instrument import STAGE_QUEUE, StageTimings, run_with_timings, timings_for
+
+if TYPE_CHECKING:
+    from apt.workers.tuning import ConcurrencyTuner
+
+BACKENDS: tuple[str, ...] = (BACKEND_THREAD, BACKEND_PROCESS)
+
+# Jobs (chunks, for the process backend) kept queued per pool worker —
+# enough slack that a worker never idles while the consumer is busy logging
+# the previous result.
+IN_FLIGHT_PER_WORKER = 4
+
+# Jobs per process-pool submission; amortises pickling / IPC per file.
+PROCESS_CHUNK_SIZE = 16
+
+# How often a blocked consumer re-checks ``is_stopped``.
+_POLL_INTERVAL = 0.2
+
+# Set in each pool process by ``_init_process``.
+_process_stop_event = None
+_process_gate: "_ConcurrencyGate | None" = None
+
+
+def set_worker_priority() -> None:
+    """Lower the OS scheduling priority of the calling worker thread.
+
+    The legacy code shelled out to ``win32process`` on Windows and ``os.nice``
+    elsewhere; we keep the same behavior so heavy I/O loops do not starve the
+    UI thread.
+    """
+    try:
+        import win32api  # type: ignore[import-untyped]
+        import win32process  # type: ignore[import-untyped]
+
+        thread_handle = win32api.GetCurrentThread()
+        win32process.SetThreadPriority(thread_handle, win32process.THREAD_PRIORITY_BELOW_NORMAL)
+    except ImportError:
+        try:
+            os.nice(10)
+        except (AttributeError, OSError):
+            pass
+
+
+def _init_process(stop_event, gate: "_ConcurrencyGate | None" = None) -> None:
+    global _process_stop_event, _process_gate
+    _process_stop_event = stop_event
+    _process_gate = gate
+    set_worker_priority()
+
+
+class _ConcurrencyGate:
+    """Lets at most ``limit`` jobs run while more wait submitted behind it.
+
+    A tuned pool is sized at ``tuner.maximum``, so the number of *running*
+    jobs is capped here and ``bounded_map`` can keep the usual
+    ``IN_FLIGHT_PER_WORKER`` slack queued. ``counters`` holds
+    ``[limit, running]`` — a list for threads, a shared array under a
+    process ``Condition`` for pool processes (``for_processes``).
+    """
+
+    def __init__(self, limit: int, condition=None, counters=None) -> None:
+        self._cond = condition if condition is not None else threading.Condition()
+        self._counters = counters if counters is not None else [limit, 0]
+
+    @classmethod
+    def for_processes(cls, ctx, limit: int) -> "_ConcurrencyGate":
+        return cls(limit, ctx.Condition(), ctx.Array("i", [limit, 0], lock=False))
+
+    def set_limit(self, limit: int) -> None:
+        with self._cond:
+            if self._counters[0] != limit:
+                self._counters[0] = limit
+                self._cond.notify_all()
+
+    def __enter__(self) -> "_ConcurrencyGate":
+        with self._cond:
+            while self._counters[1] >= self._counters[0]:
+                self._cond.wait()
+            self._counters[1] += 1
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        with self._cond:
+            self._counters[1] -= 1
+            self._cond.notify()
+
+
+def _gated(gate: _ConcurrencyGate, fn: Callable[..., Any], *args: Any) -> Any:
+    with gate:
+        return fn(*args)
+
+
+def _process_slot():
+    return _process_gate if _process_gate is not None else nullcontext()
+
+
+def process_is_stopped() -> bool:
+    """Picklable ``is_stopped`` for jobs that run in the process pool.
+
+    The parent sets a shared event once the worker is stopped, so long jobs
+    in child processes can still bail out between chunks of work.
+    """
+    return _process_stop_event is not None and _process_stop_event.is_set()
+
+
+def stop_check(worker: Any, backend: str) -> Callable[[], bool]:
+    """The ``is_stopped`` callable to put into job tuples for ``backend``."""
+    return process_is_stopped if backend == BACKEND_PROCESS else worker.is_stopped
+
+
+def _run_chunk(fn: Callable[..., Any], chunk: list[tuple]) -> list[Any]:
+    with _process_slot():
+        return [fn(*job) for job in chunk]
+
+
+def _run_timed_chunk(
+    fn: Callable[..., Any], chunk: list[tuple], submitted_ns: int
+) -> tuple[list[Any], dict[str, list[int]]]:
+    """``_run_chunk`` recording into child-side timings shipped back raw.
+
+    The queue wait is recorded once, when the chunk starts; a job's wait
+    behind the earlier jobs of its chunk is their run time, not queueing.
+    """
+    timings = StageTimings()
+    with _process_slot():
+        timings.add(STAGE_QUEUE, max(0, time.time_ns() - submitted_ns))
+        results = [run_with_timings(timings, fn, None, *job) for job in chunk]
+    return results, timings.raw()
+
+
+def bounded_map(
+    worker: Any,
+    fn: Callable[..., Any],
+    jobs: Iterable[tuple],
+    *,
+    backend: str = BACKEND_THREAD,
+    max_workers: int | None = None,
+    max_in_flight: int | None = None,
+    chunk_size: int = PROCESS_CHUNK_SIZE,
+    executor: Executor | None = None,
+    tuner: ConcurrencyTuner | None = None,
+) -> Iterator[tuple[tuple, Any]]:
+    """Run ``fn(*job)`` for every job and yield ``(job, result)`` on completion.
+
+    ``jobs`` is consumed lazily (a generator is fine — its side effects such
+    as logging or creating folders run on the calling thread as jobs are
+    pulled). Submission stops once ``worker.is_stopped()`` turns true; the
+    jobs already in flight still complete and are yielded. Breaking out of
+    the loop cancels whatever has not started yet.
+
+    ``backend="process"`` runs jobs on a ``ProcessPoolExecutor`` (one
+    process per core by default) in chunks of ``chunk_size`` so the pickling
+    round-trip is amortised. ``fn`` must then be a module-level function and
+    every job tuple picklable — use ``stop_check(worker, backend)`` instead
+    of ``worker.is_stopped`` inside the tuple.
+
+    A pool is created and torn down here unless an ``executor`` is passed
+    in. Exceptions raised by ``fn`` propagate from the iteration, as
+    ``future.result()`` did.
+
+    With a ``tuner`` (see ``apt.workers.tuning``) the pool is sized at
+    ``tuner.maximum`` and a ``_ConcurrencyGate`` lets ``tuner.limit`` jobs
+    run at once — a limit that adapts to the measured throughput — with
+    ``tuner.limit * IN_FLIGHT_PER_WORKER`` in flight; ``max_workers`` and
+    ``max_in_flight`` are then ignored. A tuner may be reused across several
+    calls so what it learned carries over. A process ``executor`` passed in
+    has no gate, so there only ``tuner.limit`` chunks are kept in flight.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend!r}")
+    use_processes = backend == BACKEND_PROCESS
+    if tuner is not None:
+        workers = tuner.maximum
+    elif use_processes:
+        workers = max_workers or os.cpu_count() or 1
+    else:
+        workers = max_workers or worker.max_workers
+    if not use_processes:
+        chunk_size = 1
+    fixed_limit = max_in_flight or workers * IN_FLIGHT_PER_WORKER
+
+    stop_event = None
+    gate = None
+    own_executor = executor is None
+    if executor is None:
+        if use_processes:
+            ctx = multiprocessing.get_context("spawn")
+            stop_event = ctx.Event()
+            if tuner is not None:
+                gate = _ConcurrencyGate.for_processes(ctx, tuner.limit)
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=ctx,
+                initializer=_init_process, initargs=(stop_event, gate),
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers, initializer=set_worker_priority)
+    if tuner is not None and not use_processes:
+        gate = _ConcurrencyGate(tuner.limit)
+
+    is_stopped = worker.is_stopped
+    metrics = getattr(worker, "metrics", None)
+    timings = timings_for(worker)
+    job_iter = iter(jobs)
+    pending: dict[Future, list[tuple]] = {}
+    exhausted = False
+    try:
+        while True:
+            if gate is not None:
+                gate.set_limit(tuner.limit)
+                limit = tuner.limit * IN_FLIGHT_PER_WORKER
+            else:
+                limit = tuner.limit if tuner is not None else fixed_limit
+            while not exhausted and len(pending) < limit and not is_stopped():
+                chunk = list(islice(job_iter, chunk_size))
+                if not chunk:
+                    exhausted = True
+                    break
+                if use_processes:
+                    if timings.enabled:
+                        future = executor.submit(_run_timed_chunk, fn, chunk, time.time_ns())
+                    else:
+                        future = executor.submit(_run_chunk, fn, chunk)
+                else:
+                    call: tuple = (fn, *chunk[0])
+                    if timings.enabled:
+                        call = (run_with_timings, timings, fn, time.time_ns(), *chunk[0])
+                    if gate is not None:
+                        call = (_gated, gate, *call)
+                    future = executor.submit(*call)
+                pending[future] = chunk
+            if not pending:
+                return
+            done, _ = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            if stop_event is not None and is_stopped():
+                stop_event.set()
+            for future in done:
+                chunk = pending.pop(future)
+                results = future.result() if use_processes else [future.result()]
+                if use_processes and timings.enabled:
+                    results, raw = results
+                    timings.merge(raw)
+                if tuner is not None:
+                    tuner.record(len(chunk))
+                if metrics is not None:
+                    metrics.add("jobs", len(chunk))
+                yield from zip(chunk, results)
+    finally:
+        for future in pending:
+            future.cancel()
+        if stop_event is not None and is_stopped():
+            stop_event.set()
+        if own_executor:
+            executor.shutdown(wait=True)
@@ -2,61 +2,98 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING
 
 from PIL import Image, ImageDraw, ImageFont
 
-from apt.constants import IGNORED_DIRS, OP_ATTACH_FOV
+from apt.constants import BACKEND_PROCESS, BACKEND_THREAD, OP_ATTACH_FOV
 from apt.utils.fov import parse_fov_numbers
+from apt.utils.fs import _never_stopped
+from apt.utils.scan import DEFAULT_SCAN_WORKERS, scan_files
+from apt.workers.executor import bounded_map, stop_check
+from apt.workers.instrument import (
+    STAGE_DECODE,
+    STAGE_ENCODE,
+    STAGE_SCAN,
+    STAGE_TRANSFORM,
+    current_timings,
+    read_file,
+    timings_for,
+    write_file,
+)
+from apt.workers.plan import finish_plan, plan_for, prepare_target
+from apt.workers.tuning import STAGE_CPU, tuner_for
 
 if TYPE_CHECKING:
     from apt.workers.base import WorkerThread
 
 
-def _recursive_find_fov_images(root_folder: str) -> dict[tuple[str, str], list[str]]:
+def _is_fov_jpg(filename: str) -> bool:
+    lname = filename.lower()
+    return lname.startswith("fov") and lname.endswith(".jpg") and any(
+        c.isdigit() for c in lname.replace("fov", "")
+    )
+
+
+def _recursive_find_fov_images(
+    root_folder: str,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    is_stopped=_never_stopped,
+) -> dict[tuple[str, str], list[str]]:
     result: dict[tuple[str, str], list[str]] = {}
-    for dirpath, dirnames, filenames in os.walk(root_folder):
-        dirnames[:] = [d for d in dirnames if d.lower() not in IGNORED_DIRS]
-        folder_name = os.path.basename(dirpath)
-        if folder_name.lower() in IGNORED_DIRS:
-            continue
+    for entry in scan_files(
+        root_folder, file_filter=_is_fov_jpg, max_workers=max_workers, is_stopped=is_stopped
+    ):
+        folder_name = os.path.basename(entry.dirpath)
         last15 = folder_name[-15:] if len(folder_name) >= 15 else folder_name
-        for filename in filenames:
-            lname = filename.lower()
-            if lname.startswith("fov") and lname.endswith(".jpg"):
-                digits = "".join(filter(str.isdigit, lname.replace("fov", "")))
-                if not digits:
-                    continue
-                key = (last15, digits)
-                result.setdefault(key, []).append(os.path.join(dirpath, filename))
+        digits = "".join(filter(str.isdigit, entry.name.lower().replace("fov", "")))
+        result.setdefault((last15, digits), []).append(entry.path)
+    # Pairs are matched by index, so keep each list in a stable order.
+    for paths in result.values():
+        paths.sort()
     return result
 
 
+def _attached_path(target: str, key: tuple[str, str]) -> str:
+    last15, fovnum = key
+    return os.path.join(target, f"attached_{last15}_{fovnum}.jpg")
+
+
 def _attach_two_images(
     src1: str, src2: str, key: tuple[str, str], target: str, is_stopped
 ) -> str:
     if is_stopped():
         return "오류 발생: 사용자 중지 요청"
+    timings = current_timings()
     try:
-        last15, fovnum = key
-        im1 = Image.open(src1)
-        im2 = Image.open(src2)
-        width = im1.width + im2.width
-        height = max(im1.height, im2.height)
-        new_img = Image.new("RGB", (width, height), (255, 255, 255))
-        new_img.paste(im1, (0, 0))
-        new_img.paste(im2, (im1.width, 0))
-        draw = ImageDraw.Draw(new_img)
-        font = ImageFont.load_default()
-        draw.text((10, 10), f"{os.path.basename(src1)}\nfov:{fovnum}", fill=(0, 0, 0), font=font)
-        draw.text(
-            (im1.width + 10, 10), f"{os.path.basename(src2)}\nfov:{fovnum}", fill=(0, 0, 0), font=font
-        )
-        out_path = os.path.join(target, f"attached_{last15}_{fovnum}.jpg")
-        new_img.save(out_path)
+        _last15, fovnum = key
+        data1 = read_file(src1)
+        data2 = read_file(src2)
+        with timings.stage(STAGE_DECODE):
+            im1 = Image.open(io.BytesIO(data1))
+            im2 = Image.open(io.BytesIO(data2))
+            im1.load()
+            im2.load()
+        with timings.stage(STAGE_TRANSFORM):
+            width = im1.width + im2.width
+            height = max(im1.height, im2.height)
+            new_img = Image.new("RGB", (width, height), (255, 255, 255))
+            new_img.paste(im1, (0, 0))
+            new_img.paste(im2, (im1.width, 0))
+            draw = ImageDraw.Draw(new_img)
+            font = ImageFont.load_default()
+            draw.text((10, 10), f"{os.path.basename(src1)}\nfov:{fovnum}", fill=(0, 0, 0), font=font)
+            draw.text(
+                (im1.width + 10, 10), f"{os.path.basename(src2)}\nfov:{fovnum}", fill=(0, 0, 0), font=font
+            )
+        out_path = _attached_path(target, key)
+        buffer = io.BytesIO()
+        with timings.stage(STAGE_ENCODE):
+            new_img.save(buffer, "JPEG")
+        write_file(out_path, buffer.getvalue())
         return f"Attached: {src1} + {src2} => {out_path}"
     except Exception as exc:
         logging.error("attach_two_images 오류", exc_info=True)
@@ -64,27 +101,28 @@ def _attach_two_images(
 
 
 def attach_fov(worker: "WorkerThread", task: dict) -> None:
-    from apt.workers.base import set_worker_priority
-
     worker.log.emit("------ Attach FOV 작업 시작 ------")
+    plan = plan_for(task)
     try:
         search1 = task.get("search1", "")
         search2 = task.get("search2", "")
         target = task.get("target", "")
         fov_text = task.get("fov_number", "").strip()
+        backend = task.get("backend", BACKEND_THREAD)
 
         if not os.path.isdir(search1) or not os.path.isdir(search2):
             worker.log.emit("Search Folder Path 오류")
             worker.finished.emit("Attach FOV 중지됨.")
             return
-        if not worker.ensure_target_folder(target):
+        if not prepare_target(worker, target, plan):
             worker.finished.emit("Attach FOV 중지됨.")
             return
 
         fov_numbers = parse_fov_numbers(fov_text) if fov_text else None
 
-        dict1 = _recursive_find_fov_images(search1)
-        dict2 = _recursive_find_fov_images(search2)
+        with timings_for(worker).stage(STAGE_SCAN):
+            dict1 = _recursive_find_fov_images(search1, worker.max_workers, worker.is_stopped)
+            dict2 = _recursive_find_fov_images(search2, worker.max_workers, worker.is_stopped)
         intersection_keys = set(dict1.keys()) & set(dict2.keys())
         if fov_numbers is not None:
             intersection_keys = {k for k in intersection_keys if k[1] in fov_numbers}
@@ -95,27 +133,42 @@ def attach_fov(worker: "WorkerThread", task: dict) -> None:
 
         total = sum(min(len(dict1[k]), len(dict2[k])) for k in intersection_keys)
         worker.log.emit(f"총 attach 건수: {total}")
+        if backend == BACKEND_PROCESS:
+            worker.log.emit("프로세스 풀 백엔드로 실행합니다.")
         is_stopped = worker.is_stopped
         processed = 0
 
-        with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as executor:
-            futures = []
+        job_stopped = stop_check(worker, backend)
+
+        def attach_jobs():
             for key in intersection_keys:
                 a, b = dict1[key], dict2[key]
                 for i in range(min(len(a), len(b))):
-                    futures.append(executor.submit(_attach_two_images, a[i], b[i], key, target, is_stopped))
-            for future in as_completed(futures):
-                if is_stopped():
-                    worker.log.emit(f"작업 중지: 처리 이미지 쌍 {processed}")
-                    worker.finished.emit(f"Attach FOV 중지됨. 처리 이미지 쌍: {processed}")
-                    return
-                result = future.result()
-                if result.startswith("오류 발생"):
-                    worker.log.emit(result)
-                else:
-                    processed += 1
-                    worker.log.emit(result)
-                    worker.progress.emit(min(int(processed / total * 100), 100))
+                    yield a[i], b[i], key, target, job_stopped
+
+        if plan is not None:
+            for a, b, key, _target, _stopped in attach_jobs():
+                size = sum(os.path.getsize(p) for p in (a, b) if os.path.exists(p))
+                plan.add(f"{a} + {b}", _attached_path(target, key), kind="attach", size=size)
+            finish_plan(worker, plan, "Attach FOV")
+            return
+
+        for _job, result in bounded_map(
+            worker, _attach_two_images, attach_jobs(), backend=backend,
+            tuner=tuner_for(worker, task, STAGE_CPU, backend),
+        ):
+            if is_stopped():
+                break
+            if result.startswith("오류 발생"):
+                worker.log.emit(result)
+            else:
+                processed += 1
+                worker.log.emit(result)
+                worker.progress.emit(min(int(processed / total * 100), 100))
+        if is_stopped():
+            worker.log.emit(f"작업 중지: 처리 이미지 쌍 {processed}")
+            worker.finished.emit(f"Attach FOV 중지됨. 처리 이미지 쌍: {processed}")
+            return
 
         worker.finished.emit(f"Attach FOV 완료. 처리 이미지 쌍: {processed}")
         worker.log.emit("------ Attach FOV 작업 완료 ------")
@@ -125,6 +178,6 @@ def attach_fov(worker: "WorkerThread", task: dict) -> None:
         worker.finished.emit("Attach FOV 중 오류 발생.")
 
 
-from apt.workers.base import register  # noqa: E402
+from apt.workers.registry import register  # noqa: E402
 
 register(OP_ATTACH_FOV, attach_fov)
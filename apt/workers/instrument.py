@@ -0,0 +1,255 @@
+"""Per-stage timing of worker hot paths.
+
+With ``instrument: true`` in the task, the context carries a ``StageTimings``
+that the hot paths report into: the scan in each handler, ``read`` /
+``decode`` / ``transform`` / ``encode`` / ``write`` inside the per-file
+primitives, and ``queue`` — how long each job (each chunk, on the process
+backend) waited in ``bounded_map`` between submission and the moment a pool
+worker picked it up. Every stage
+keeps a call count, total and max wall time and the bytes it moved; at the
+end of the task the context logs a summary table and saves it as JSON under
+``timings/`` next to ``error.log``.
+
+Primitives don't take the timings as an argument: ``bounded_map`` installs
+the task's timings as the *current* timings of the pool thread for the
+duration of each job (``current_timings()``). Process-pool jobs record into
+a fresh ``StageTimings`` in the child, which is shipped back with the chunk
+results and merged. Without instrumentation ``current_timings()`` is
+``NULL_TIMINGS``, whose ``stage()`` is a shared no-op context manager — the
+cost on the hot path is one thread-local lookup per stage.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Any, Callable, Iterator
+
+from apt.utils.paths import user_data_path
+
+TIMINGS_DIRNAME = "timings"
+
+STAGE_SCAN = "scan"
+STAGE_QUEUE = "queue"
+STAGE_READ = "read"
+STAGE_DECODE = "decode"
+STAGE_TRANSFORM = "transform"
+STAGE_ENCODE = "encode"
+STAGE_WRITE = "write"
+
+# Report order; stages outside this list follow alphabetically.
+STAGE_ORDER = (
+    STAGE_SCAN, STAGE_QUEUE, STAGE_READ, STAGE_DECODE, STAGE_TRANSFORM, STAGE_ENCODE, STAGE_WRITE,
+)
+
+_CALLS, _TOTAL_NS, _MAX_NS, _BYTES = range(4)
+
+
+class StageTimings:
+    """Thread-safe ``stage -> [calls, total_ns, max_ns, bytes]`` counters."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, list[int]] = {}
+
+    def add(self, stage: str, elapsed_ns: int, nbytes: int = 0, calls: int = 1) -> None:
+        with self._lock:
+            stats = self._stats.get(stage)
+            if stats is None:
+                stats = self._stats[stage] = [0, 0, 0, 0]
+            stats[_CALLS] += calls
+            stats[_TOTAL_NS] += elapsed_ns
+            stats[_BYTES] += nbytes
+            if elapsed_ns > stats[_MAX_NS]:
+                stats[_MAX_NS] = elapsed_ns
+
+    def add_since(self, stage: str, start_ns: int, nbytes: int = 0) -> None:
+        """``add`` the time since ``start_ns`` (a ``time.perf_counter_ns()`` stamp)."""
+        self.add(stage, time.perf_counter_ns() - start_ns, nbytes)
+
+    @contextmanager
+    def stage(self, name: str, nbytes: int = 0) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - start, nbytes)
+
+    def raw(self) -> dict[str, list[int]]:
+        """Picklable copy of the counters (see ``merge``)."""
+        with self._lock:
+            return {stage: list(stats) for stage, stats in self._stats.items()}
+
+    def merge(self, raw: dict[str, list[int]]) -> None:
+        with self._lock:
+            for stage, (calls, total, peak, nbytes) in raw.items():
+                stats = self._stats.setdefault(stage, [0, 0, 0, 0])
+                stats[_CALLS] += calls
+                stats[_TOTAL_NS] += total
+                stats[_BYTES] += nbytes
+                stats[_MAX_NS] = max(stats[_MAX_NS], peak)
+
+    # ------------------------------------------------------------------
+    def summary(self) -> list[dict[str, Any]]:
+        """One row per stage, in ``STAGE_ORDER``."""
+        raw = self.raw()
+        order = {stage: i for i, stage in enumerate(STAGE_ORDER)}
+        rows = []
+        for stage in sorted(raw, key=lambda s: (order.get(s, len(order)), s)):
+            calls, total, peak, nbytes = raw[stage]
+            seconds = total / 1e9
+            rows.append({
+                "stage": stage,
+                "calls": calls,
+                "total_s": round(seconds, 4),
+                "mean_ms": round(total / calls / 1e6, 3) if calls else 0.0,
+                "max_ms": round(peak / 1e6, 3),
+                "bytes": nbytes,
+                "mb_per_s": round(nbytes / 1e6 / seconds, 2) if nbytes and seconds else None,
+            })
+        return rows
+
+    def table_lines(self) -> list[str]:
+        lines = [
+            f"{'stage':<10} {'calls':>8} {'total s':>9} {'mean ms':>9} {'max ms':>9} {'MB':>9} {'MB/s':>8}"
+        ]
+        for row in self.summary():
+            mb_s = f"{row['mb_per_s']:.1f}" if row["mb_per_s"] is not None else "-"
+            lines.append(
+                f"{row['stage']:<10} {row['calls']:>8} {row['total_s']:>9.3f} {row['mean_ms']:>9.3f} "
+                f"{row['max_ms']:>9.3f} {row['bytes'] / 1e6:>9.1f} {mb_s:>8}"
+            )
+        return lines
+
+
+class _NullTimings:
+    """Instrumentation off — every call is a no-op."""
+
+    enabled = False
+    _null = nullcontext()
+
+    def add(self, stage: str, elapsed_ns: int, nbytes: int = 0, calls: int = 1) -> None: ...
+
+    def add_since(self, stage: str, start_ns: int, nbytes: int = 0) -> None: ...
+
+    def stage(self, name: str, nbytes: int = 0):
+        return self._null
+
+    def raw(self) -> dict[str, list[int]]:
+        return {}
+
+    def merge(self, raw: dict[str, list[int]]) -> None: ...
+
+
+NULL_TIMINGS = _NullTimings()
+
+_local = threading.local()
+
+
+def current_timings() -> StageTimings | _NullTimings:
+    """Timings of the task whose job runs on this thread, or ``NULL_TIMINGS``."""
+    return getattr(_local, "timings", NULL_TIMINGS)
+
+
+def timings_for(worker: Any) -> StageTimings | _NullTimings:
+    """``worker.timings`` when the worker has enabled instrumentation."""
+    timings = getattr(worker, "timings", None)
+    return NULL_TIMINGS if timings is None else timings
+
+
+def timings_for_task(task: dict) -> StageTimings | _NullTimings:
+    """Fresh ``StageTimings`` when the task asks for them (``instrument: true``)."""
+    return StageTimings() if task.get("instrument", False) else NULL_TIMINGS
+
+
+def run_with_timings(
+    timings: StageTimings, fn: Callable[..., Any], submitted_ns: int | None, *args: Any
+) -> Any:
+    """Call ``fn(*args)`` with ``timings`` current, recording its queue wait.
+
+    ``submitted_ns`` is a ``time.time_ns()`` stamp, which — unlike
+    ``perf_counter`` — is comparable between the parent and pool processes.
+    ``None`` skips the queue stage (the caller has recorded it already).
+    """
+    if submitted_ns is not None:
+        timings.add(STAGE_QUEUE, max(0, time.time_ns() - submitted_ns))
+    previous = getattr(_local, "timings", None)
+    _local.timings = timings
+    try:
+        return fn(*args)
+    finally:
+        if previous is None:
+            del _local.timings
+        else:
+            _local.timings = previous
+
+
+def timed_copy(copy: Callable[..., str]) -> Callable[..., str]:
+    """Wrap a ``copy_file_chunked``-style function into the ``write`` stage."""
+
+    def copy_timed(src: str, dst: str, *args: Any, **kwargs: Any) -> str:
+        timings = current_timings()
+        if not timings.enabled:
+            return copy(src, dst, *args, **kwargs)
+        start = time.perf_counter_ns()
+        result = copy(src, dst, *args, **kwargs)
+        nbytes = 0
+        if not result.startswith("오류 발생"):
+            try:
+                nbytes = os.path.getsize(src)
+            except OSError:
+                pass
+        timings.add(STAGE_WRITE, time.perf_counter_ns() - start, nbytes)
+        return result
+
+    return copy_timed
+
+
+def read_file(path: str) -> bytes:
+    """Whole file as bytes, counted into the ``read`` stage."""
+    start = time.perf_counter_ns()
+    with open(path, "rb") as f:
+        data = f.read()
+    current_timings().add(STAGE_READ, time.perf_counter_ns() - start, len(data))
+    return data
+
+
+def write_file(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path``, counted into the ``write`` stage."""
+    with current_timings().stage(STAGE_WRITE, len(data)):
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+def timing_report_path(operation: str, report_dir: str | None = None) -> str:
+    """``<report_dir>/<operation>_<YYYYmmdd_HHMMSS_ffffff>.json`` (dir is created).
+
+    ``report_dir`` defaults to ``timings/`` next to ``error.log``.
+    """
+    report_dir = report_dir or user_data_path(TIMINGS_DIRNAME)
+    os.makedirs(report_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return os.path.join(report_dir, f"{operation or 'task'}_{stamp}.json")
+
+
+def save_timing_report(
+    path: str,
+    timings: StageTimings,
+    task: dict,
+    metrics: dict[str, Any],
+    finished_message: str | None,
+) -> None:
+    report = {
+        "operation": task.get("operation", ""),
+        "finished": finished_message,
+        "metrics": metrics,
+        "stages": timings.summary(),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
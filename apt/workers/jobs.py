@@ -0,0 +1,315 @@
+"""Persistent multi-job queue.
+
+Panels run one task at a time; the queue lets any panel enqueue its task
+dict and runs several at once on ``LocalTaskContext`` threads, dispatched
+through the same ``_HANDLERS`` table. Concurrency is bounded by two global
+budgets — ``io_slots`` for copy / sorting jobs and ``cpu_slots`` for image
+jobs (``OPERATION_STAGES``) — and jobs of the same stage start in FIFO
+order. Each running job's thread pool gets its share of the default
+``max_workers`` so a full queue does not oversubscribe the machine.
+
+The queue is saved as JSON after every state change. Jobs that were still
+running when the app exited come back as queued with ``resume`` set, so
+journaled copies (``apt.utils.journal``) pick up where they stopped; a
+restored queue starts paused until the user resumes it.
+
+Qt-free: ``changed`` / ``log`` are ``Channel``s emitted from job threads.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from apt.constants import OP_ATTACH_FOV, OP_BTJ, OP_CROP, OP_MIM_TO_BMP, OP_RENDER_OVERLAYS
+from apt.utils.paths import user_data_path
+from apt.workers.context import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_STOPPED,
+    Channel,
+    LocalTaskContext,
+    finished_status,
+)
+from apt.workers.logsink import TASK_LOG_DIRNAME, task_log_path
+from apt.workers.plan import ThroughputHistory, shared_throughput_history
+from apt.workers.registry import load_handlers
+from apt.workers.tuning import STAGE_CPU, STAGE_IO
+
+QUEUE_FILENAME = "job_queue.json"
+QUEUE_VERSION = 1
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATES = {STATUS_DONE, STATUS_FAILED, STATUS_STOPPED, JOB_CANCELLED}
+
+# Operations not listed here are I/O bound.
+OPERATION_STAGES: dict[str, str] = {
+    OP_CROP: STAGE_CPU,
+    OP_ATTACH_FOV: STAGE_CPU,
+    OP_BTJ: STAGE_CPU,
+    OP_MIM_TO_BMP: STAGE_CPU,
+    OP_RENDER_OVERLAYS: STAGE_CPU,
+}
+
+DEFAULT_IO_SLOTS = 2
+DEFAULT_CPU_SLOTS = 1
+
+
+@dataclass
+class Job:
+    """One queued task and its last known state."""
+
+    task: dict
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    state: str = JOB_QUEUED
+    progress: int = 0
+    message: str = ""
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+
+    @property
+    def operation(self) -> str:
+        return self.task.get("operation", "")
+
+    @property
+    def stage(self) -> str:
+        return OPERATION_STAGES.get(self.operation, STAGE_IO)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+
+class JobQueue:
+    """FIFO job queue with per-stage concurrency budgets.
+
+    ``path=None`` keeps the queue in memory only. With ``log_dir`` each job
+    run writes its full log to a file there (``task_log_path``); with
+    ``throughput`` successful runs feed the dry-run ETA history.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        *,
+        io_slots: int = DEFAULT_IO_SLOTS,
+        cpu_slots: int = DEFAULT_CPU_SLOTS,
+        log_dir: str | None = None,
+        throughput: ThroughputHistory | None = None,
+    ) -> None:
+        self.path = path
+        self.log_dir = log_dir
+        self.throughput = throughput
+        self.io_slots = io_slots
+        self.cpu_slots = cpu_slots
+        self.changed = Channel()  # emits the Job whose state / progress changed
+        self.log = Channel()  # emits (job_id, message)
+        self.paused = False
+        self._shutting_down = False
+        self._lock = threading.RLock()
+        self._idle = threading.Condition(self._lock)
+        self._jobs: list[Job] = []
+        self._contexts: dict[str, LocalTaskContext] = {}
+        if path and os.path.exists(path):
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def jobs(self) -> list[Job]:
+        with self._lock:
+            return list(self._jobs)
+
+    def add(self, task: dict) -> Job:
+        """Enqueue a copy of ``task``; raises ValueError for unknown operations."""
+        operation = task.get("operation", "")
+        if operation not in load_handlers():
+            raise ValueError(f"Unknown operation: {operation!r}")
+        job = Job(task=dict(task))
+        with self._lock:
+            self._jobs.append(job)
+            self._save()
+        self.changed.emit(job)
+        self._schedule()
+        return job
+
+    def cancel(self, job_id: str) -> None:
+        """Drop a queued job, or ask a running one to stop."""
+        with self._lock:
+            job = self._find(job_id)
+            if job is None or job.finished:
+                return
+            if job.state == JOB_QUEUED:
+                job.state = JOB_CANCELLED
+                self._save()
+            else:
+                self._contexts[job_id].stop()
+                return
+        self.changed.emit(job)
+
+    def remove_finished(self) -> None:
+        with self._lock:
+            self._jobs = [job for job in self._jobs if not job.finished]
+            self._save()
+
+    def set_budget(self, io_slots: int, cpu_slots: int) -> None:
+        with self._lock:
+            self.io_slots = max(1, io_slots)
+            self.cpu_slots = max(1, cpu_slots)
+            self._save()
+        self._schedule()
+
+    def pause(self) -> None:
+        """Stop starting new jobs; running ones continue."""
+        self.paused = True
+
+    def resume(self) -> None:
+        self.paused = False
+        self._schedule()
+
+    def stop_all(self, timeout: float | None = None) -> None:
+        """Pause and ask every running job to stop, then wait for them."""
+        self.pause()
+        with self._lock:
+            for context in self._contexts.values():
+                context.stop()
+        self.wait(timeout)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """App exit: stop running jobs but keep them queued (with ``resume``)
+        so they continue on the next start."""
+        self._shutting_down = True
+        self.stop_all(timeout)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until nothing is running or startable; False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(self._is_idle, timeout)
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+    def _find(self, job_id: str) -> Job | None:
+        return next((job for job in self._jobs if job.id == job_id), None)
+
+    def _slots(self, stage: str) -> int:
+        return self.cpu_slots if stage == STAGE_CPU else self.io_slots
+
+    def _is_idle(self) -> bool:
+        if self._contexts:
+            return False
+        return self.paused or not any(job.state == JOB_QUEUED for job in self._jobs)
+
+    def _schedule(self) -> None:
+        started: list[Job] = []
+        with self._lock:
+            if not self.paused:
+                running = {STAGE_IO: 0, STAGE_CPU: 0}
+                for job in self._jobs:
+                    if job.state == JOB_RUNNING:
+                        running[job.stage] += 1
+                for job in self._jobs:
+                    if job.state == JOB_QUEUED and running[job.stage] < self._slots(job.stage):
+                        running[job.stage] += 1
+                        self._start(job)
+                        started.append(job)
+                if started:
+                    self._save()
+            self._idle.notify_all()
+        for job in started:
+            self.changed.emit(job)
+
+    def _start(self, job: Job) -> None:
+        log_path = task_log_path(job.operation, self.log_dir) if self.log_dir else None
+        context = LocalTaskContext(dict(job.task), log_path=log_path, throughput=self.throughput)
+        context.max_workers = max(2, context.max_workers // self._slots(job.stage))
+        context.progress.connect(lambda value, job=job: self._on_progress(job, value))
+        context.log.connect(lambda message, job=job: self.log.emit((job.id, message)))
+        job.state = JOB_RUNNING
+        job.progress = 0
+        self._contexts[job.id] = context
+        threading.Thread(
+            target=self._run, args=(job, context), name=f"apt-job-{job.id}", daemon=True
+        ).start()
+
+    def _on_progress(self, job: Job, value: int) -> None:
+        if value != job.progress:
+            job.progress = value
+            self.changed.emit(job)
+
+    def _run(self, job: Job, context: LocalTaskContext) -> None:
+        try:
+            context.run()
+        finally:
+            with self._lock:
+                job.message = context.finished_message or ""
+                job.state = finished_status(context.finished_message)
+                if job.state == STATUS_DONE:
+                    job.progress = 100
+                elif self._shutting_down:
+                    job.state = JOB_QUEUED
+                    job.task["resume"] = True
+                del self._contexts[job.id]
+                self._save()
+            self.changed.emit(job)
+            self._schedule()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _save(self) -> None:
+        if not self.path:
+            return
+        data = {
+            "version": QUEUE_VERSION,
+            "io_slots": self.io_slots,
+            "cpu_slots": self.cpu_slots,
+            "jobs": [asdict(job) for job in self._jobs],
+        }
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            logging.error("작업 큐 저장 실패: %s", self.path, exc_info=True)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data: dict[str, Any] = json.load(f)
+            self.io_slots = int(data.get("io_slots", DEFAULT_IO_SLOTS))
+            self.cpu_slots = int(data.get("cpu_slots", DEFAULT_CPU_SLOTS))
+            jobs = [Job(**entry) for entry in data.get("jobs", [])]
+        except (OSError, ValueError, TypeError):
+            logging.error("작업 큐 파일을 읽을 수 없습니다: %s", self.path, exc_info=True)
+            return
+        for job in jobs:
+            if job.state == JOB_RUNNING:
+                # Interrupted by an exit — run again, resuming journaled copies.
+                job.state = JOB_QUEUED
+                job.task["resume"] = True
+        self._jobs = jobs
+        self.paused = any(job.state == JOB_QUEUED for job in jobs)
+
+
+_shared_queue: JobQueue | None = None
+
+
+def shared_job_queue() -> JobQueue:
+    """The app-wide queue, persisted next to ``error.log``."""
+    global _shared_queue
+    if _shared_queue is None:
+        _shared_queue = JobQueue(
+            user_data_path(QUEUE_FILENAME),
+            log_dir=user_data_path(TASK_LOG_DIRNAME),
+            throughput=shared_throughput_history(),
+        )
+    return _shared_queue
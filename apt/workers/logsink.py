@@ -0,0 +1,98 @@
+"""Where task log lines go besides the UI.
+
+Handlers log one line per file. Delivering each line as its own queued Qt
+signal — and appending it to the console — costs the UI thread more than
+the copy itself once a task touches 100k files. ``LogBatcher`` coalesces
+lines and delivers them as one list every ``interval_ms``; ``TaskLogFile``
+keeps the complete per-file detail on disk so the console can be capped.
+Both are Qt-free and safe to call from pool threads.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from datetime import datetime
+from typing import Callable, TextIO
+
+from apt.utils.paths import user_data_path
+
+LOG_BATCH_INTERVAL_MS = 100
+TASK_LOG_DIRNAME = "logs"
+
+
+class LogBatcher:
+    """Buffers messages and hands them to ``deliver`` in batches.
+
+    The first message after a flush arms a one-shot timer; everything that
+    arrives before it fires goes out in the same batch. ``flush()`` delivers
+    immediately (call it before a terminal message so ordering holds) and
+    ``close()`` flushes and disarms the timer. Batches are delivered one at
+    a time: a ``flush()`` that races the timer waits until the timer's batch
+    is out, so no line can land after a later one (or the terminal message).
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[list[str]], None],
+        interval_ms: int = LOG_BATCH_INTERVAL_MS,
+    ) -> None:
+        self._deliver = deliver
+        self._interval = interval_ms / 1000
+        self._lock = threading.Lock()
+        self._deliver_lock = threading.Lock()  # held across swap + deliver
+        self._buffer: list[str] = []
+        self._timer: threading.Timer | None = None
+
+    def add(self, message: str) -> None:
+        with self._lock:
+            self._buffer.append(message)
+            if self._timer is None:
+                self._timer = threading.Timer(self._interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._deliver_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                timer, self._timer = self._timer, None
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            if batch:
+                self._deliver(batch)
+
+    def close(self) -> None:
+        self.flush()
+
+
+class TaskLogFile:
+    """Appends timestamped log lines to one file per task run."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: TextIO | None = open(path, "a", encoding="utf-8")
+
+    def write(self, message: str) -> None:
+        stamp = datetime.now().strftime("%H:%M:%S")
+        with self._lock:
+            if self._file is not None:
+                self._file.write(f"[{stamp}] {message}\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def task_log_path(operation: str, log_dir: str | None = None) -> str:
+    """``<log_dir>/<operation>_<YYYYmmdd_HHMMSS_ffffff>.log`` (dir is created).
+
+    ``log_dir`` defaults to ``logs/`` next to ``error.log``.
+    """
+    log_dir = log_dir or user_data_path(TASK_LOG_DIRNAME)
+    os.makedirs(log_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return os.path.join(log_dir, f"{operation or 'task'}_{stamp}.log")
@@ -9,6 +9,7 @@ import sys
 from typing import TYPE_CHECKING
 
 from apt.constants import OP_MIM_TO_BMP
+from apt.workers.plan import finish_plan, plan_for
 
 if TYPE_CHECKING:
     from apt.workers.base import WorkerThread
@@ -49,6 +50,12 @@ def mim_to_bmp(worker: "WorkerThread", task: dict) -> None:
 
         worker.log.emit(f"INI 사용: {ini_path}")
         worker.log.emit(f"실행 파일: {exe_path}")
+        plan = plan_for(task)
+        if plan is not None:
+            # The conversion runs inside mim2color.exe; only the launch is planned.
+            plan.add(ini_path, exe_path, kind="launch", size=0)
+            finish_plan(worker, plan, "MIM to BMP")
+            return
 
         creation_flags = 0
         if os.name == "nt":
@@ -68,6 +75,6 @@ def mim_to_bmp(worker: "WorkerThread", task: dict) -> None:
         worker.finished.emit("MIM to BMP 중 오류 발생.")
 
 
-from apt.workers.base import register  # noqa: E402
+from apt.workers.registry import register  # noqa: E402
 
 register(OP_MIM_TO_BMP, mim_to_bmp)
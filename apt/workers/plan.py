@@ -0,0 +1,293 @@
+"""Dry-run plans and the throughput history their ETA is based on.
+
+With ``dry_run: true`` in the task, every handler runs its usual source
+scan but, instead of copying / converting, records what it *would* do in a
+``Plan``: one ``PlanAction`` per ``src -> dst`` write with the source size,
+destinations that already exist or are written twice (conflicts), and files
+the real run would skip (existing targets, journal entries). Nothing under
+the target is created — not even the target folder, the journal or the
+dedup index.
+
+The ETA comes from ``ThroughputHistory``: after every successful real run
+the context records ``(files, bytes, seconds)`` for the operation, and the
+estimate fits ``seconds ≈ a·files + b·bytes`` over the recent samples (a
+per-file rate when there are too few samples or no byte counts).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from apt.constants import DEDUP_OFF
+from apt.utils.journal import CopyJournal
+from apt.utils.paths import user_data_path
+
+THROUGHPUT_FILENAME = "throughput_history.json"
+HISTORY_SAMPLES = 20
+
+ACTION_COPY = "copy"
+
+
+@dataclass
+class PlanAction:
+    """One write the real run would perform."""
+
+    kind: str
+    src: str
+    dst: str
+    bytes: int = 0
+
+
+@dataclass
+class Plan:
+    """Everything a dry run found, in the order the real run would go."""
+
+    operation: str = ""
+    target: str = ""
+    actions: list[PlanAction] = field(default_factory=list)
+    conflicts: list[dict[str, str]] = field(default_factory=list)
+    skips: list[dict[str, str]] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+    eta_seconds: float | None = None
+    _destinations: set[str] = field(default_factory=set, repr=False)
+
+    # ------------------------------------------------------------------
+    def add(self, src: str, dst: str, kind: str = ACTION_COPY, size: int | None = None) -> PlanAction:
+        """Plan ``src -> dst``; flags a conflict when ``dst`` exists or repeats."""
+        if size is None:
+            try:
+                size = os.path.getsize(src)
+            except OSError:
+                size = 0
+        key = os.path.normcase(os.path.abspath(dst))
+        if key in self._destinations:
+            self.conflicts.append({"path": dst, "reason": "같은 대상에 여러 번 기록"})
+        elif os.path.exists(dst):
+            self.conflicts.append({"path": dst, "reason": "대상 파일이 이미 있어 덮어씀"})
+        self._destinations.add(key)
+        action = PlanAction(kind, src, dst, size)
+        self.actions.append(action)
+        return action
+
+    def add_copy(self, src: str, dst: str, journal: CopyJournal | None = None) -> None:
+        """``add`` for a journaled copy — proven-done pairs become skips."""
+        if journal is not None and journal.resume and journal.is_done(src, dst):
+            self.skip(src, "저널에 완료 기록 있음", dst)
+        else:
+            self.add(src, dst)
+
+    def skip(self, path: str, reason: str, dst: str = "") -> None:
+        self.skips.append({"path": path, "dst": dst, "reason": reason})
+
+    def note(self, message: str) -> None:
+        self.notes.append(message)
+
+    def check_target(self, target: str) -> None:
+        """Note a target folder the real run would have to create."""
+        if target and not os.path.isdir(target):
+            self.note(f"Target 폴더가 없어 실행 시 생성됩니다: {target}")
+
+    # ------------------------------------------------------------------
+    @property
+    def total_files(self) -> int:
+        return len(self.actions)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(action.bytes for action in self.actions)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "target": self.target,
+            "total_files": self.total_files,
+            "total_bytes": self.total_bytes,
+            "eta_seconds": self.eta_seconds,
+            "actions": [asdict(action) for action in self.actions],
+            "conflicts": list(self.conflicts),
+            "skips": list(self.skips),
+            "notes": list(self.notes),
+        }
+
+    def summary_lines(self) -> list[str]:
+        lines = [
+            f"계획: 작업 {self.total_files}개, 총 {format_bytes(self.total_bytes)}",
+            f"충돌 {len(self.conflicts)}개, 건너뜀 {len(self.skips)}개",
+        ]
+        if self.eta_seconds is None:
+            lines.append("예상 소요 시간: 이전 실행 기록이 없어 계산할 수 없습니다.")
+        else:
+            lines.append(f"예상 소요 시간: 약 {format_duration(self.eta_seconds)}")
+        return lines
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {secs}초"
+    return f"{secs}초"
+
+
+# ---------------------------------------------------------------------------
+# Throughput history
+# ---------------------------------------------------------------------------
+
+class ThroughputHistory:
+    """Recent ``(files, bytes, seconds)`` samples per operation, kept as JSON."""
+
+    def __init__(self, path: str | None = None, max_samples: int = HISTORY_SAMPLES) -> None:
+        self.path = path
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[list[float]]] = {}
+        if path and os.path.exists(path):
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._samples = {
+                op: [[float(v) for v in sample[:3]] for sample in samples]
+                for op, samples in data.get("operations", {}).items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            logging.error("처리량 기록 파일을 읽을 수 없습니다: %s", self.path, exc_info=True)
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"operations": self._samples}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            logging.error("처리량 기록 저장 실패: %s", self.path, exc_info=True)
+
+    def samples(self, operation: str) -> list[tuple[int, int, float]]:
+        with self._lock:
+            return [(int(f), int(b), s) for f, b, s in self._samples.get(operation, [])]
+
+    def record(self, operation: str, files: int, bytes_: int, seconds: float) -> None:
+        """Add one finished run; ignored when nothing was processed."""
+        if files <= 0 or seconds <= 0:
+            return
+        with self._lock:
+            samples = self._samples.setdefault(operation, [])
+            samples.append([files, bytes_, round(seconds, 3)])
+            del samples[:-self.max_samples]
+            self._save()
+
+    def estimate(self, operation: str, files: int, bytes_: int = 0) -> float | None:
+        """Predicted seconds for ``files`` / ``bytes_``, or None without history."""
+        samples = self.samples(operation)
+        if not samples or files <= 0:
+            return None if not samples else 0.0
+        fit = _fit_file_byte_costs(samples) if bytes_ > 0 else None
+        if fit is not None:
+            per_file, per_byte = fit
+            return per_file * files + per_byte * bytes_
+        total_files = sum(f for f, _b, _s in samples)
+        total_seconds = sum(s for _f, _b, s in samples)
+        return total_seconds / total_files * files
+
+
+def _fit_file_byte_costs(samples: list[tuple[int, int, float]]) -> tuple[float, float] | None:
+    """Least-squares ``(seconds per file, seconds per byte)``, or None if ill-posed."""
+    if len(samples) < 2 or any(b <= 0 for _f, b, _s in samples):
+        return None
+    sff = sum(f * f for f, _b, _s in samples)
+    sbb = sum(b * b for _f, b, _s in samples)
+    sfb = sum(f * b for f, b, _s in samples)
+    sfs = sum(f * s for f, _b, s in samples)
+    sbs = sum(b * s for _f, b, s in samples)
+    det = sff * sbb - sfb * sfb
+    if det <= 1e-9 * sff * sbb:
+        return None  # every sample has the same bytes-per-file ratio
+    per_file = (sfs * sbb - sbs * sfb) / det
+    per_byte = (sbs * sff - sfs * sfb) / det
+    if per_file < 0 or per_byte < 0:
+        return None
+    return per_file, per_byte
+
+
+_shared_history: ThroughputHistory | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_throughput_history() -> ThroughputHistory:
+    """The app-wide history, kept next to ``error.log``."""
+    global _shared_history
+    with _shared_lock:
+        if _shared_history is None:
+            _shared_history = ThroughputHistory(user_data_path(THROUGHPUT_FILENAME))
+        return _shared_history
+
+
+# ---------------------------------------------------------------------------
+# Handler helpers
+# ---------------------------------------------------------------------------
+
+def plan_for(task: dict) -> Plan | None:
+    """A fresh ``Plan`` when the task is a dry run, else None."""
+    if not task.get("dry_run", False):
+        return None
+    plan = Plan(operation=task.get("operation", ""), target=task.get("target", ""))
+    if task.get("dedup", DEDUP_OFF) != DEDUP_OFF:
+        plan.note("중복 검사는 실행 시 내용 해시로 수행되므로 계획에는 반영되지 않습니다.")
+    return plan
+
+
+def prepare_target(worker: Any, target: str, plan: Plan | None) -> bool:
+    """``worker.ensure_target_folder`` for real runs; only a note in a dry run."""
+    if plan is not None:
+        plan.check_target(target)
+        return True
+    return worker.ensure_target_folder(target)
+
+
+def plan_journal(target: str, task: dict) -> CopyJournal | None:
+    """Read-only view of the target's journal for a resumed dry run."""
+    if not task.get("resume", False):
+        return None
+    return CopyJournal(target, resume=True, read_only=True)
+
+
+def finish_plan(worker: Any, plan: Plan, label: str) -> None:
+    """Log ``plan``, hand it to ``worker.plan_ready`` and emit ``finished``."""
+    history = getattr(worker, "throughput", None) or shared_throughput_history()
+    plan.eta_seconds = history.estimate(plan.operation, plan.total_files, plan.total_bytes)
+    for action in plan.actions:
+        worker.log.emit(f"[Dry Run] {action.kind}: {action.src} -> {action.dst}")
+    for conflict in plan.conflicts:
+        worker.log.emit(f"[Dry Run] 충돌: {conflict['path']} ({conflict['reason']})")
+    for skip in plan.skips:
+        worker.log.emit(f"[Dry Run] 건너뜀: {skip['path']} ({skip['reason']})")
+    for message in plan.notes + plan.summary_lines():
+        worker.log.emit(message)
+    plan_ready = getattr(worker, "plan_ready", None)
+    if plan_ready is not None:
+        plan_ready.emit(plan)
+    worker.progress.emit(100)
+    worker.finished.emit(
+        f"{label} Dry Run 완료. 작업 {plan.total_files}개, "
+        f"{format_bytes(plan.total_bytes)}, 충돌 {len(plan.conflicts)}, 건너뜀 {len(plan.skips)}"
+    )
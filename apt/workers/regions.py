@@ -0,0 +1,393 @@
+"""Region-of-interest decoding for the crop primitives.
+
+``RegionReader(path).crop(box)`` returns the pixels inside ``box`` — the same
+image ``ImageOps.exif_transpose(Image.open(path)).crop(box)`` would give —
+while touching as little of the file as its format allows:
+
+* Uncompressed BMPs (8-bit palette / grey, 24-bit, 32-bit incl. the common
+  bitfield layouts) are memory-mapped and only the rows and columns inside
+  the box are copied out; a 200x200 patch of a 16k x 4k line-scan frame reads
+  ~120 KB instead of 200 MB. RLE, 1/4/16-bit and OS/2 bitmaps fall back to
+  Pillow.
+* Baseline JPEGs are decoded only down to the last row of the box (in the
+  stored orientation), so a crop near the top of the frame stops the
+  entropy decoder early. Draft mode would only help for scaled output; the
+  crop is 1:1, so rows are the part that can be skipped. Pillow reports
+  that early stop as a broken stream unless ``ImageFile.LOAD_TRUNCATED_IMAGES``
+  is set, so the flag is switched on around the limited ``load()`` only
+  (``_truncated_loads``) — other loads running at that moment see it too.
+* Anything else is decoded in full by Pillow and cropped.
+
+EXIF orientation is applied to the patch, not to the frame: the display box
+is mapped back onto the stored image, cropped there and the patch alone is
+transposed.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+from PIL import BmpImagePlugin, ExifTags, Image, ImageFile
+
+from apt.workers.instrument import STAGE_DECODE, STAGE_READ, STAGE_TRANSFORM, current_timings
+
+Box = tuple[int, int, int, int]
+
+# EXIF orientation -> transpose that turns the stored image upright.
+_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+_SWAPS_AXES = (5, 6, 7, 8)
+
+_BMP_HEADER_SIZES = (40, 52, 56, 64, 108, 124)
+_BI_RGB, _BI_BITFIELDS = 0, 3
+
+
+def clamp_box(box: Box, size: tuple[int, int]) -> Box | None:
+    """``box`` with its corners ordered and clamped to ``size``; ``None`` if empty."""
+    x1, y1, x2, y2 = box
+    if x1 > x2:
+        x1, x2 = x2, x1
+    if y1 > y2:
+        y1, y2 = y2, y1
+    w, h = size
+    x1 = max(0, min(x1, w))
+    y1 = max(0, min(y1, h))
+    x2 = max(0, min(x2, w))
+    y2 = max(0, min(y2, h))
+    if x2 <= x1 or y2 <= y1:
+        return None
+    return x1, y1, x2, y2
+
+
+def _stored_box(box: Box, orientation: int, stored_size: tuple[int, int]) -> Box:
+    """Map a display-space ``box`` onto the image as stored in the file."""
+    x1, y1, x2, y2 = box
+    w, h = stored_size
+    return {
+        2: (w - x2, y1, w - x1, y2),
+        3: (w - x2, h - y2, w - x1, h - y1),
+        4: (x1, h - y2, x2, h - y1),
+        5: (y1, x1, y2, x2),
+        6: (y1, h - x2, y2, h - x1),
+        7: (w - y2, h - x2, w - y1, h - x1),
+        8: (w - y2, x1, w - y1, x2),
+    }.get(orientation, box)
+
+
+_truncated_lock = threading.Lock()
+_truncated_users = 0
+_truncated_saved = False
+
+
+@contextmanager
+def _truncated_loads() -> Iterator[None]:
+    """Set ``ImageFile.LOAD_TRUNCATED_IMAGES`` while any limited decode runs.
+
+    The flag is process-wide; the last reader out restores the old value.
+    """
+    global _truncated_users, _truncated_saved
+    with _truncated_lock:
+        if _truncated_users == 0:
+            _truncated_saved = ImageFile.LOAD_TRUNCATED_IMAGES
+            ImageFile.LOAD_TRUNCATED_IMAGES = True
+        _truncated_users += 1
+    try:
+        yield
+    finally:
+        with _truncated_lock:
+            _truncated_users -= 1
+            if _truncated_users == 0:
+                ImageFile.LOAD_TRUNCATED_IMAGES = _truncated_saved
+
+
+def _limit_rows(img: Image.Image, rows: int) -> bool:
+    """Make a baseline JPEG decode only its first ``rows`` rows on ``load()``."""
+    if img.format != "JPEG" or rows >= img.height or "progression" in img.info:
+        return False
+    if len(img.tile) != 1:
+        return False
+    tile = img.tile[0]
+    if tile[0] != "jpeg" or tuple(tile[1]) != (0, 0, img.width, img.height):
+        return False
+    if not hasattr(img, "_size"):
+        return False
+    # Tiles are ImageFile._Tile namedtuples on Pillow 11+, plain tuples on 10.
+    entry = (tile[0], (0, 0, img.width, rows), *tile[2:])
+    img.tile = [type(tile)(*entry) if hasattr(tile, "_fields") else entry]
+    # Private since Pillow 7; ``load_prepare`` sizes the decode target from it.
+    img._size = (img.width, rows)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# BMP
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class _BmpLayout:
+    """Where a plain BMP's pixels are and how to turn them into a Pillow image."""
+
+    width: int
+    height: int
+    top_down: bool
+    offset: int
+    stride: int
+    pixel_bytes: int
+    mode: str
+    order: tuple[int, ...]  # byte index of R, G, B(, A) inside a pixel
+    palette: bytes | None = None  # RGB triplets for mode "P"
+
+
+def _mask_order(masks: tuple[int, ...]) -> tuple[int, ...] | None:
+    """Byte index per channel for byte-aligned bitfield masks."""
+    order = []
+    for mask in masks:
+        if mask not in (0xFF, 0xFF00, 0xFF0000, 0xFF000000):
+            return None
+        order.append(mask.bit_length() // 8 - 1)
+    return tuple(order)
+
+
+def _probe_bmp(path: str) -> _BmpLayout | None:
+    """The pixel layout of ``path`` if it is a BMP this module can window into."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(14 + 124 + 16)
+            if len(head) < 54 or head[:2] != b"BM":
+                return None
+            offset, header_size = struct.unpack_from("<II", head, 10)
+            if header_size not in _BMP_HEADER_SIZES:
+                return None
+            width, height, _planes, bits, compression = struct.unpack_from("<iiHHI", head, 18)
+            colors = struct.unpack_from("<I", head, 46)[0] or (1 << bits if bits <= 8 else 0)
+            if width <= 0 or height == 0:
+                return None
+
+            palette = None
+            if bits == 8 and compression == _BI_RGB:
+                if not 0 < colors <= 256:
+                    return None
+                f.seek(14 + header_size)
+                bgrx = f.read(4 * colors)
+                if len(bgrx) < 4 * colors:
+                    return None
+                rgb = np.frombuffer(bgrx, np.uint8).reshape(-1, 4)[:, 2::-1]
+                if np.array_equal(rgb, np.repeat(np.arange(colors, dtype=np.uint8)[:, None], 3, axis=1)):
+                    mode = "L"
+                else:
+                    mode, palette = "P", rgb.tobytes()
+                order: tuple[int, ...] = (0,)
+                if offset == 14 + header_size:  # offset that forgot the palette, as Pillow reads it
+                    offset += 4 * colors
+            elif bits in (24, 32) and compression == _BI_RGB:
+                mode, order = "RGB", (2, 1, 0)
+                if bits == 32 and BmpImagePlugin.USE_RAW_ALPHA:
+                    mode, order = "RGBA", (2, 1, 0, 3)
+            elif bits in (24, 32) and compression == _BI_BITFIELDS:
+                r, g, b = struct.unpack_from("<III", head, 54)
+                a = struct.unpack_from("<I", head, 66)[0] if header_size >= 56 and bits == 32 else 0
+                if (r, g, b, a) == (0, 0, 0, 0) and bits == 32:
+                    mode, order = "RGBA", (2, 1, 0, 3)
+                else:
+                    found = _mask_order((r, g, b, a) if a else (r, g, b))
+                    if found is None or max(found) >= bits // 8:
+                        return None
+                    mode, order = ("RGBA" if a else "RGB"), found
+            else:
+                return None
+    except OSError:
+        return None
+
+    stride = (width * bits + 31) // 32 * 4
+    return _BmpLayout(width, abs(height), height < 0, offset, stride, bits // 8, mode, order, palette)
+
+
+def _window(rows: np.ndarray, layout: _BmpLayout, box: Box) -> np.ndarray:
+    """View of the pixels in ``box`` (top row first) of the mapped rows, HxWxbytes."""
+    x1, y1, x2, y2 = box
+    if layout.top_down:
+        band = rows[y1:y2]
+    else:
+        band = rows[layout.height - y2:layout.height - y1][::-1]
+    return band[:, x1 * layout.pixel_bytes:x2 * layout.pixel_bytes].reshape(y2 - y1, x2 - x1, layout.pixel_bytes)
+
+
+def _pick_channels(pixels: np.ndarray, order: tuple[int, ...]) -> np.ndarray:
+    """C-ordered copy of ``pixels``' channels in ``order`` (HxW for one channel).
+
+    Fancy indexing the last axis would return a channel-planar array, which
+    makes every later row copy strided; copying plane by plane doesn't.
+    """
+    if len(order) == 1:
+        return np.array(pixels[:, :, order[0]])
+    if order == tuple(range(pixels.shape[2])):
+        return np.array(pixels)
+    out = np.empty(pixels.shape[:2] + (len(order),), np.uint8)
+    for i, channel in enumerate(order):
+        out[:, :, i] = pixels[:, :, channel]
+    return out
+
+
+def _read_bmp_regions(path: str, layout: _BmpLayout, boxes: list[Box]) -> list[Image.Image]:
+    timings = current_timings()
+    patches = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Raises TypeError if the file is shorter than its header says.
+        rows = np.ndarray((layout.height, layout.stride), np.uint8, buffer=mm, offset=layout.offset)
+        try:
+            for box in boxes:
+                x1, y1, x2, y2 = box
+                # Only the pages under the box are faulted in.
+                with timings.stage(STAGE_READ, (y2 - y1) * (x2 - x1) * layout.pixel_bytes):
+                    pixels = _pick_channels(_window(rows, layout, box), layout.order)
+                with timings.stage(STAGE_DECODE):
+                    patch = Image.fromarray(pixels, "L" if layout.pixel_bytes == 1 else layout.mode)
+                    if layout.palette is not None:
+                        patch.putpalette(layout.palette)
+                patches.append(patch)
+        finally:
+            del rows  # the map can't close while a view of it is alive
+    return patches
+
+
+def _read_bmp_frame(path: str, layout: _BmpLayout, order: tuple[int, ...]) -> np.ndarray:
+    """The whole bitmap as an HxW or HxWxC array (``order`` picks the bytes), copied once."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        rows = np.ndarray((layout.height, layout.stride), np.uint8, buffer=mm, offset=layout.offset)
+        try:
+            with current_timings().stage(STAGE_READ, layout.height * layout.width * layout.pixel_bytes):
+                pixels = _pick_channels(_window(rows, layout, (0, 0, layout.width, layout.height)), order)
+        finally:
+            del rows
+    return pixels
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class RegionReader:
+    """Decodes rectangles of one image file.
+
+    ``size`` is the display size (EXIF orientation applied), which is the
+    space boxes are given in; clamp them with ``clamp_box`` first. Use it as
+    a context manager, or ``close()`` it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._bmp = _probe_bmp(path)
+        self._img: Image.Image | None = None
+        if self._bmp is not None:
+            self.size = (self._bmp.width, self._bmp.height)
+        else:
+            self._open_pillow()
+
+    def _open_pillow(self) -> None:
+        self._bmp = None
+        self._img = Image.open(self.path)
+        self._stored_size = self._img.size
+        try:
+            self._orientation = int(self._img.getexif().get(ExifTags.Base.Orientation, 1))
+        except (TypeError, ValueError):
+            self._orientation = 1
+        w, h = self._stored_size
+        self.size = (h, w) if self._orientation in _SWAPS_AXES else (w, h)
+        self._rows = 0  # stored rows decoded so far
+
+    @property
+    def mode(self) -> str:
+        """Pillow mode of the patches (``L``, ``P``, ``RGB``, ``RGBA``, …)."""
+        return self._bmp.mode if self._bmp is not None else self._img.mode
+
+    def crop(self, box: Box) -> Image.Image:
+        return self.crops([box])[0]
+
+    def crops(self, boxes: list[Box]) -> list[Image.Image]:
+        """One patch per (clamped) display-space box, decoding the file once."""
+        if self._bmp is not None:
+            try:
+                return _read_bmp_regions(self.path, self._bmp, boxes)
+            except (TypeError, ValueError):  # truncated or oddly padded: let Pillow cope
+                self._open_pillow()
+
+        stored = [_stored_box(box, self._orientation, self._stored_size) for box in boxes]
+        self._decode_rows(max(box[3] for box in stored))
+        patches = []
+        with current_timings().stage(STAGE_TRANSFORM):
+            for box in stored:
+                patch = self._img.crop(box)
+                method = _TRANSPOSE.get(self._orientation)
+                patches.append(patch.transpose(method) if method is not None else patch)
+        return patches
+
+    def frame(self, bgr: bool = False) -> tuple[np.ndarray, str, bytes | None]:
+        """``(pixels, mode, palette)`` of the whole display frame.
+
+        ``pixels`` is HxW for ``L`` / ``P`` (palette indices; ``palette`` holds
+        the RGB triplets) and HxWxC otherwise — a buffer to take numpy views
+        of. ``bgr`` swaps red and blue (BMP / OpenCV order); ``mode`` still
+        names the RGB mode.
+        """
+        if self._bmp is not None:
+            order = self._bmp.order
+            if bgr and len(order) >= 3:
+                order = (order[2], order[1], order[0], *order[3:])
+            try:
+                return _read_bmp_frame(self.path, self._bmp, order), self._bmp.mode, self._bmp.palette
+            except (TypeError, ValueError):
+                self._open_pillow()
+        img = self.crop((0, 0, *self.size))
+        palette = bytes(img.getpalette() or ()) if img.mode == "P" else None
+        with current_timings().stage(STAGE_DECODE):
+            pixels = np.asarray(img)
+            if bgr and img.mode in ("RGB", "RGBA"):
+                pixels = _pick_channels(pixels, (2, 1, 0, 3)[:pixels.shape[2]])
+        return pixels, img.mode, palette
+
+    def _decode_rows(self, rows: int) -> None:
+        if rows <= self._rows:
+            return
+        if self._rows:  # an earlier, shorter partial decode: start over
+            self._img.close()
+            self._img = Image.open(self.path)
+        with current_timings().stage(STAGE_DECODE):
+            partial = _limit_rows(self._img, rows)
+            try:
+                if partial:
+                    with _truncated_loads():
+                        self._img.load()
+                else:
+                    self._img.load()
+            except OSError:
+                if not partial:
+                    raise
+                # A stream the limited decode can't handle: decode it in full.
+                self._img.close()
+                self._img = Image.open(self.path)
+                self._img.load()
+        self._rows = self._img.height
+
+    def close(self) -> None:
+        if self._img is not None:
+            self._img.close()
+            self._img = None
+
+    def __enter__(self) -> "RegionReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,91 @@
+"""Operation registry — maps ``task["operation"]`` to its handler.
+
+Kept apart from ``apt.workers.base`` so the handlers can be looked up and
+run without importing PyQt (see ``apt.cli``). ``load_handlers()`` imports
+the task modules, which self-register at their bottom.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+from apt.constants import (
+    OP_ATTACH_FOV,
+    OP_BASIC_SORTING,
+    OP_BTJ,
+    OP_CROP,
+    OP_DATE_COPY,
+    OP_IMAGE_COPY,
+    OP_MIM_TO_BMP,
+    OP_NG_COUNT,
+    OP_NG_SORTING,
+    OP_RENDER_OVERLAYS,
+    OP_SIMULATION,
+)
+
+# Each handler signature: handler(worker, task: dict) -> None, where worker
+# is a WorkerThread or any object with the same log / progress / finished
+# interface.
+TaskHandler = Callable[[Any, dict], None]
+
+_HANDLERS: dict[str, TaskHandler] = {}
+
+# Every operation key declared in constants must have a handler.
+_EXPECTED = {
+    OP_NG_SORTING,
+    OP_DATE_COPY,
+    OP_IMAGE_COPY,
+    OP_SIMULATION,
+    OP_BASIC_SORTING,
+    OP_NG_COUNT,
+    OP_CROP,
+    OP_ATTACH_FOV,
+    OP_MIM_TO_BMP,
+    OP_BTJ,
+    OP_RENDER_OVERLAYS,
+}
+
+
+def register(operation: str, handler: TaskHandler) -> TaskHandler:
+    """Register a worker task. Returns the handler so it can decorate."""
+    _HANDLERS[operation] = handler
+    return handler
+
+
+def load_handlers() -> dict[str, TaskHandler]:
+    """Import the task modules (idempotent) and return the registry."""
+    from apt.workers import (  # noqa: F401  (registration side-effects)
+        btj,
+        copying,
+        counting,
+        cropping,
+        fov,
+        mim,
+        sorting,
+    )
+
+    missing = _EXPECTED - _HANDLERS.keys()
+    if missing:  # pragma: no cover — would break import
+        raise RuntimeError(f"Worker handlers missing for: {sorted(missing)}")
+    return _HANDLERS
+
+
+def dispatch(worker: Any, task: dict) -> None:
+    """Run the handler for ``task["operation"]`` on ``worker``.
+
+    Always ends with exactly one ``finished`` emit from the handler; unknown
+    operations and uncaught handler exceptions are reported the same way.
+    """
+    operation = task.get("operation", "")
+    handler = _HANDLERS.get(operation)
+    if handler is None:
+        worker.log.emit(f"알 수 없는 작업 유형입니다: {operation!r}")
+        worker.finished.emit("알 수 없는 작업 유형입니다.")
+        return
+    try:
+        handler(worker, task)
+    except Exception as exc:  # noqa: BLE001
+        logging.error("작업 중 오류 발생", exc_info=True)
+        worker.log.emit(f"오류 발생: {exc}")
+        worker.finished.emit("작업 중 오류 발생했습니다.")
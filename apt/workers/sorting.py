@@ -8,13 +8,22 @@ from __future__ import annotations
 
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from functools import partial
 from typing import TYPE_CHECKING
 
 from apt.constants import IGNORED_DIRS, OP_BASIC_SORTING, OP_NG_SORTING
-from apt.utils.formats import is_valid_file
+from apt.utils.dedup import ContentIndex, open_content_index
+from apt.utils.formats import FileMatcher
 from apt.utils.fov import extract_fov_from_filename, parse_fov_numbers
-from apt.utils.fs import copy_file_chunked
+from apt.utils.fs import transfer_function
+from apt.utils.listing_cache import ListingCache, list_dir, listing_cache_for
+from apt.utils.scan import StreamedScan, scan_files
+from apt.workers.executor import bounded_map
+from apt.workers.instrument import STAGE_SCAN, timed_copy, timings_for
+from apt.workers.plan import Plan, finish_plan, plan_for, plan_journal, prepare_target
+from apt.workers.tuning import STAGE_IO, tuner_for
+from apt.utils.journal import CopyJournal
 
 if TYPE_CHECKING:
     from apt.workers.base import WorkerThread
@@ -37,17 +46,19 @@ def _collect_inner_ids(worker: "WorkerThread", sources) -> set[str]:
     return inner_ids
 
 
-def _collect_inner_ids_from_source2(worker: "WorkerThread", source2: str) -> set[str]:
+def _collect_inner_ids_from_source2(
+    worker: "WorkerThread",
+    source2: str,
+    cache: ListingCache | None = None,
+) -> set[str]:
     if not os.path.exists(source2):
         worker.log.emit(f"Source2 경로 없음: {source2}")
         return set()
     try:
-        with os.scandir(source2) as it:
-            return {
-                entry.name
-                for entry in it
-                if entry.is_dir() and entry.name.lower() not in IGNORED_DIRS
-            }
+        return {
+            name for name in list_dir(source2, cache).dirs
+            if name.lower() not in IGNORED_DIRS
+        }
     except Exception as exc:
         worker.log.emit(f"Source2에서 Inner ID 수집 오류: {exc}")
         return set()
@@ -58,40 +69,45 @@ def _collect_images_to_copy(
     inner_ids: set[str],
     source: str,
     formats: list[str],
+    cache: ListingCache | None = None,
 ) -> tuple[dict[str, list[str]], int]:
-    images_to_copy: dict[str, list[str]] = {}
-    total_images = 0
+    folders: dict[str, str] = {}
     for inner_id in inner_ids:
         source_folder = os.path.join(source, inner_id)
         if not os.path.exists(source_folder):
             worker.log.emit(f"Source 내 폴더 없음: {source_folder}")
             continue
-        try:
-            with os.scandir(source_folder) as it:
-                images = [
-                    entry.name
-                    for entry in it
-                    if entry.is_file() and is_valid_file(entry.name, formats)
-                ]
-            if images:
-                images_to_copy[inner_id] = images
-                total_images += len(images)
-        except Exception as exc:
-            worker.log.emit(f"이미지 수집 오류: {source_folder} | 에러: {exc}")
+        folders[source_folder] = inner_id
+
+    images_to_copy: dict[str, list[str]] = {}
+    total_images = 0
+    for entry in scan_files(
+        folders,
+        formats=formats,
+        recursive=False,
+        ignored_dirs=(),
+        max_workers=worker.max_workers,
+        on_error=lambda path, exc: worker.log.emit(f"이미지 수집 오류: {path} | 에러: {exc}"),
+        cache=cache,
+    ):
+        images_to_copy.setdefault(folders[entry.root], []).append(entry.name)
+        total_images += 1
     return images_to_copy, total_images
 
 
-def _get_fovs_from_folder(worker: "WorkerThread", folder_path: str) -> set[str]:
+def _get_fovs_from_folder(
+    worker: "WorkerThread",
+    folder_path: str,
+    cache: ListingCache | None = None,
+) -> set[str]:
     if not os.path.isdir(folder_path):
         return set()
     fov_numbers: set[str] = set()
     try:
-        with os.scandir(folder_path) as it:
-            for entry in it:
-                if entry.is_file():
-                    digits = extract_fov_from_filename(entry.name)
-                    if digits:
-                        fov_numbers.add(digits)
+        for name in list_dir(folder_path, cache).files:
+            digits = extract_fov_from_filename(name)
+            if digits:
+                fov_numbers.add(digits)
     except Exception as exc:
         worker.log.emit(f"FOV 추출 오류: {folder_path} | 에러: {exc}")
     return fov_numbers
@@ -102,35 +118,42 @@ def _get_matching_files_for_folder(
     folder_path: str,
     formats: list[str],
     fov_numbers: set[str],
+    cache: ListingCache | None = None,
 ) -> list[str]:
     if not os.path.isdir(folder_path):
         return []
     try:
-        with os.scandir(folder_path) as it:
-            image_files = [
-                entry.name
-                for entry in it
-                if entry.is_file() and is_valid_file(entry.name, formats)
-            ]
-        matching = []
-        for fname in image_files:
-            digits = extract_fov_from_filename(fname)
-            if digits and digits in fov_numbers:
-                matching.append(fname)
-        return matching
+        return FileMatcher(formats, fov_numbers).filter(list_dir(folder_path, cache).files)
     except Exception as exc:
         worker.log.emit(f"이미지 목록 오류: {folder_path} | 에러: {exc}")
         return []
 
 
+def _copy_function(task: dict, journal: CopyJournal, index: ContentIndex | None = None):
+    """Journaled per-file copy honouring the ``transfer`` / ``dedup`` options."""
+    copy = timed_copy(transfer_function(task.get("transfer")))
+    if index is not None:
+        copy = partial(index.copy, copy=copy)
+    return partial(journal.copy, copy=copy)
+
+
+def _plan_copies(worker: "WorkerThread", plan: Plan, jobs, journal: CopyJournal | None) -> None:
+    """Dry-run counterpart of the Basic Sorting copy loops (``(src, dst, ...)`` jobs)."""
+    for src, dst, *_rest in jobs:
+        plan.add_copy(src, dst, journal)
+    finish_plan(worker, plan, "Basic Sorting")
+
+
 # ---------------------------------------------------------------------------
 # 1) NG Folder Sorting
 # ---------------------------------------------------------------------------
 
 def ng_folder_sorting(worker: "WorkerThread", task: dict) -> None:
-    from apt.workers.base import set_worker_priority
-
     worker.log.emit("------ NG Folder Sorting 작업 시작 ------")
+    journal: CopyJournal | None = None
+    index: ContentIndex | None = None
+    cache = listing_cache_for(task)
+    plan = plan_for(task)
     try:
         sources1 = task.get("inputs", [])
         source2 = task.get("source2", "")
@@ -141,12 +164,26 @@ def ng_folder_sorting(worker: "WorkerThread", task: dict) -> None:
         worker.log.emit(f"Target: {target}")
         worker.log.emit(f"Formats: {formats}")
 
-        if not worker.ensure_target_folder(target):
+        if not prepare_target(worker, target, plan):
             worker.finished.emit("NG Folder Sorting 중단.")
             return
-
+        if plan is not None:
+            journal = plan_journal(target, task)
+        else:
+            journal = CopyJournal(
+                target, resume=task.get("resume", False), metrics=getattr(worker, "metrics", None)
+            )
+            index = open_content_index(target, task.get("dedup"))
+        if journal is not None and journal.resume:
+            worker.log.emit(f"이어하기 모드: 저널 항목 {len(journal)}개")
+        if index is not None:
+            added = index.sync(worker.is_stopped)
+            worker.log.emit(f"중복 인덱스: {len(index)}개 파일 (신규 등록 {added}개)")
+
+        timings = timings_for(worker)
+        scan_started = time.perf_counter_ns()
         inner_ids_sources1 = _collect_inner_ids(worker, sources1)
-        inner_ids_source2 = _collect_inner_ids_from_source2(worker, source2)
+        inner_ids_source2 = _collect_inner_ids_from_source2(worker, source2, cache)
         matched = inner_ids_sources1 & inner_ids_source2
 
         if not matched:
@@ -157,55 +194,60 @@ def ng_folder_sorting(worker: "WorkerThread", task: dict) -> None:
         worker.log.emit(f"총 매칭된 Inner ID 수: {len(matched)}")
 
         images_to_copy, total_images = _collect_images_to_copy(
-            worker, matched, source2, formats
+            worker, matched, source2, formats, cache
         )
+        timings.add_since(STAGE_SCAN, scan_started)
         if total_images == 0:
             worker.log.emit("선택한 이미지 포맷에 해당하는 이미지가 없습니다.")
             worker.finished.emit("NG Folder Sorting 완료.")
             return
 
         worker.log.emit(f"총 복사할 이미지 수: {total_images}")
+        if plan is not None:
+            for inner_id, images in images_to_copy.items():
+                for image in images:
+                    src_file = os.path.join(source2, inner_id, image)
+                    dst_file = os.path.join(target, inner_id, image)
+                    if journal is None and os.path.exists(dst_file):
+                        plan.skip(src_file, "대상 파일이 이미 있음", dst_file)
+                    else:
+                        plan.add_copy(src_file, dst_file, journal)
+            finish_plan(worker, plan, "NG Folder Sorting")
+            return
         processed = 0
         is_stopped = worker.is_stopped
+        tuner = tuner_for(worker, task, STAGE_IO)
 
-        with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as executor:
-            futures: dict = {}
+        def copy_jobs():
             for inner_id, images in images_to_copy.items():
-                if is_stopped():
-                    worker.log.emit(f"작업 중지: 처리한 이미지 {processed}")
-                    worker.finished.emit(f"작업 중지됨. 처리한 이미지: {processed}")
-                    return
                 src_dir = os.path.join(source2, inner_id)
                 dst_dir = os.path.join(target, inner_id)
                 if not worker.ensure_target_folder(dst_dir):
                     continue
                 for image in images:
-                    if is_stopped():
-                        worker.log.emit(f"작업 중지: 처리한 이미지 {processed}")
-                        worker.finished.emit(f"작업 중지됨. 처리한 이미지: {processed}")
-                        return
                     src_file = os.path.join(src_dir, image)
                     dst_file = os.path.join(dst_dir, image)
-                    if os.path.exists(dst_file):
+                    if not journal.resume and os.path.exists(dst_file):
                         worker.log.emit(f"파일 건너뜀: {dst_file}")
                         continue
-                    futures[executor.submit(copy_file_chunked, src_file, dst_file, is_stopped)] = (
-                        src_file,
-                        dst_file,
-                    )
+                    yield src_file, dst_file, is_stopped
 
-            for future in as_completed(futures):
-                if is_stopped():
-                    worker.log.emit(f"작업 중지: 처리한 이미지 {processed}")
-                    worker.finished.emit(f"작업 중지됨. 처리한 이미지: {processed}")
-                    return
-                result = future.result()
-                if result.startswith("오류 발생"):
-                    worker.log.emit(result)
-                else:
-                    processed += 1
-                    worker.log.emit(result)
-                    worker.progress.emit(min(int(processed / total_images * 100), 100))
+        copy = _copy_function(task, journal, index)
+        for _job, result in bounded_map(worker, copy, copy_jobs(), tuner=tuner):
+            if is_stopped():
+                break
+            if result.startswith("오류 발생"):
+                worker.log.emit(result)
+            else:
+                processed += 1
+                worker.log.emit(result)
+                worker.progress.emit(min(int(processed / total_images * 100), 100))
+        if index is not None:
+            worker.log.emit(f"중복 처리: 건너뜀 {index.skipped}, 하드링크 {index.linked}")
+        if is_stopped():
+            worker.log.emit(f"작업 중지: 처리한 이미지 {processed}")
+            worker.finished.emit(f"작업 중지됨. 처리한 이미지: {processed}")
+            return
 
         worker.finished.emit(f"NG Folder Sorting 완료. 처리한 이미지: {processed}")
         worker.log.emit("------ NG Folder Sorting 작업 완료 ------")
@@ -213,6 +255,13 @@ def ng_folder_sorting(worker: "WorkerThread", task: dict) -> None:
         logging.error("NG Folder Sorting 중 오류 발생", exc_info=True)
         worker.log.emit(f"오류 발생: {exc}")
         worker.finished.emit("NG Folder Sorting 중 오류 발생.")
+    finally:
+        if journal is not None:
+            journal.close()
+        if index is not None:
+            index.close()
+        if cache is not None:
+            cache.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -220,9 +269,10 @@ def ng_folder_sorting(worker: "WorkerThread", task: dict) -> None:
 # ---------------------------------------------------------------------------
 
 def basic_sorting(worker: "WorkerThread", task: dict) -> None:
-    from apt.workers.base import set_worker_priority
-
     worker.log.emit("------ Basic Sorting 작업 시작 ------")
+    journal: CopyJournal | None = None
+    cache = listing_cache_for(task)
+    plan = plan_for(task)
     try:
         source = task["source"]
         target = task["target"]
@@ -235,6 +285,8 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
         only_defect_sorting = task.get("only_defect_sorting", False)
 
         # Inner ID info ----------------------------------------------------
+        timings = timings_for(worker)
+        scan_started = time.perf_counter_ns()
         inner_id_info: list[dict] = []
 
         if use_inner_id and inner_id:
@@ -245,21 +297,19 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
                 )
         elif inner_id_list_path and os.path.isdir(inner_id_list_path):
             try:
-                with os.scandir(inner_id_list_path) as it:
-                    for entry in it:
-                        if not entry.is_dir() or entry.name.lower() in IGNORED_DIRS:
-                            continue
-                        if is_double_path:
-                            code_folder = os.path.join(inner_id_list_path, entry.name)
-                            with os.scandir(code_folder) as sub_it:
-                                for sub_entry in sub_it:
-                                    if sub_entry.is_dir() and sub_entry.name.lower() not in IGNORED_DIRS:
-                                        rel_path = os.path.join(entry.name, sub_entry.name)
-                                        inner_id_info.append(
-                                            {"path": rel_path, "name": sub_entry.name, "code": entry.name}
-                                        )
-                        else:
-                            inner_id_info.append({"path": entry.name, "name": entry.name, "code": None})
+                for name in list_dir(inner_id_list_path, cache).dirs:
+                    if name.lower() in IGNORED_DIRS:
+                        continue
+                    if is_double_path:
+                        code_folder = os.path.join(inner_id_list_path, name)
+                        for sub_name in list_dir(code_folder, cache).dirs:
+                            if sub_name.lower() not in IGNORED_DIRS:
+                                rel_path = os.path.join(name, sub_name)
+                                inner_id_info.append(
+                                    {"path": rel_path, "name": sub_name, "code": name}
+                                )
+                    else:
+                        inner_id_info.append({"path": name, "name": name, "code": None})
             except Exception as exc:
                 worker.log.emit(f"Inner ID List Path 오류: {exc}")
                 worker.finished.emit("Basic Sorting 중지됨.")
@@ -278,11 +328,21 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
             worker.log.emit(f"Source 경로가 존재하지 않습니다: {source}")
             worker.finished.emit("Basic Sorting 중지됨.")
             return
-        if not worker.ensure_target_folder(target):
+        if not prepare_target(worker, target, plan):
             worker.finished.emit("Basic Sorting 중지됨.")
             return
+        if plan is not None:
+            journal = plan_journal(target, task)
+        else:
+            journal = CopyJournal(
+                target, resume=task.get("resume", False), metrics=getattr(worker, "metrics", None)
+            )
+        if journal is not None and journal.resume:
+            worker.log.emit(f"이어하기 모드: 저널 항목 {len(journal)}개")
 
         is_stopped = worker.is_stopped
+        tuner = tuner_for(worker, task, STAGE_IO)
+        copy = _copy_function(task, journal) if plan is None else None
 
         # --- Only Defect mode -------------------------------------------
         if only_defect_sorting:
@@ -292,7 +352,7 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
                 if is_stopped():
                     break
                 template_folder = os.path.join(inner_id_list_path, info["path"])
-                fovs_to_find = _get_fovs_from_folder(worker, template_folder)
+                fovs_to_find = _get_fovs_from_folder(worker, template_folder, cache)
                 if not fovs_to_find:
                     worker.log.emit(
                         f"[{info['name']}] 기준 폴더({template_folder})에 파일이 없어 건너뜁니다."
@@ -303,7 +363,7 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
                 )
                 source_folder = os.path.join(source, info["path"])
                 matching = _get_matching_files_for_folder(
-                    worker, source_folder, formats, fovs_to_find
+                    worker, source_folder, formats, fovs_to_find, cache
                 )
                 for filename in matching:
                     src_file = os.path.join(source_folder, filename)
@@ -322,21 +382,20 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
                 worker.finished.emit("Basic Sorting 완료.")
                 return
 
+            timings.add_since(STAGE_SCAN, scan_started)
             worker.log.emit(f"총 {total}개의 파일을 복사합니다.")
+            if plan is not None:
+                _plan_copies(worker, plan, copy_tasks, journal)
+                return
             processed = 0
-            with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as executor:
-                futures = [
-                    executor.submit(copy_file_chunked, src, dst, is_stopped)
-                    for src, dst in copy_tasks
-                ]
-                for future in as_completed(futures):
-                    if is_stopped():
-                        break
-                    result = future.result()
-                    if not result.startswith("오류 발생"):
-                        processed += 1
-                        worker.log.emit(result)
-                        worker.progress.emit(min(int(processed / total * 100), 100))
+            jobs = ((src, dst, is_stopped) for src, dst in copy_tasks)
+            for _job, result in bounded_map(worker, copy, jobs, tuner=tuner):
+                if is_stopped():
+                    break
+                if not result.startswith("오류 발생"):
+                    processed += 1
+                    worker.log.emit(result)
+                    worker.progress.emit(min(int(processed / total * 100), 100))
 
             if is_stopped():
                 worker.finished.emit(f"Basic Sorting 중지됨. ({processed}/{total})")
@@ -353,62 +412,62 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
                 worker.finished.emit("Basic Sorting 중지됨.")
                 return
 
-            folder_to_files: dict[str, dict] = {}
-            with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as scan_exec:
-                future_to_info = {}
-                for info in inner_id_info:
-                    src_folder = os.path.join(source, info["path"])
-                    if os.path.isdir(src_folder):
-                        fut = scan_exec.submit(
-                            _get_matching_files_for_folder,
-                            worker,
-                            src_folder,
-                            formats,
-                            fov_numbers,
-                        )
-                        future_to_info[fut] = info
-                for fut in as_completed(future_to_info):
-                    info = future_to_info[fut]
-                    matching = fut.result()
-                    if matching:
-                        folder_to_files[info["path"]] = {"files": matching, "info": info}
-
-            total = sum(len(d["files"]) for d in folder_to_files.values())
-            if total == 0:
-                worker.log.emit("선택한 FOV Number에 해당하는 이미지가 없습니다.")
-                worker.finished.emit("Basic Sorting 완료.")
+            folder_to_info = {}
+            for info in inner_id_info:
+                src_folder = os.path.join(source, info["path"])
+                if os.path.isdir(src_folder):
+                    folder_to_info[src_folder] = info
+            entries = scan_files(
+                folder_to_info,
+                formats=formats,
+                fov_numbers=fov_numbers,
+                recursive=False,
+                ignored_dirs=(),
+                max_workers=worker.max_workers,
+                is_stopped=is_stopped,
+                on_error=lambda path, exc: worker.log.emit(f"이미지 목록 오류: {path} | 에러: {exc}"),
+                cache=cache,
+            )
+
+            def fov_jobs(found):
+                for entry in found:
+                    info = folder_to_info[entry.root]
+                    prefix = f"{info['code']}_{info['name']}" if info.get("code") else info["name"]
+                    file_base, file_ext = os.path.splitext(entry.name)
+                    new_name = f"{prefix}_{file_base}{file_ext}"
+                    yield entry.path, os.path.join(target, new_name), is_stopped
+
+            if plan is not None:
+                entries = list(entries)
+                timings.add_since(STAGE_SCAN, scan_started)
+                if not entries:
+                    worker.log.emit("선택한 FOV Number에 해당하는 이미지가 없습니다.")
+                    worker.finished.emit("Basic Sorting 완료.")
+                    return
+                _plan_copies(worker, plan, fov_jobs(entries), journal)
                 return
 
+            # Copying starts with the first listed folder; see apt.utils.scan.
+            scan = StreamedScan(entries, on_done=lambda _found: timings.add_since(STAGE_SCAN, scan_started))
             processed = 0
-            with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as copy_exec:
-                futures = []
-                for rel_path, data in folder_to_files.items():
-                    src_folder = os.path.join(source, rel_path)
-                    info = data["info"]
-                    for image_file in data["files"]:
-                        if is_stopped():
-                            break
-                        src_file = os.path.join(src_folder, image_file)
-                        file_base, file_ext = os.path.splitext(image_file)
-                        prefix = f"{info['code']}_{info['name']}" if info.get("code") else info["name"]
-                        new_name = f"{prefix}_{file_base}{file_ext}"
-                        dst_file = os.path.join(target, new_name)
-                        futures.append(copy_exec.submit(copy_file_chunked, src_file, dst_file, is_stopped))
-                    if is_stopped():
-                        break
-
-                for future in as_completed(futures):
-                    if is_stopped():
-                        break
-                    result = future.result()
-                    if not result.startswith("오류 발생"):
-                        processed += 1
-                        worker.log.emit(result)
-                        worker.progress.emit(min(int(processed / total * 100), 100))
+            for _job, result in bounded_map(worker, copy, fov_jobs(scan), tuner=tuner):
+                if is_stopped():
+                    break
+                if not result.startswith("오류 발생"):
+                    processed += 1
+                    worker.log.emit(result)
+                    percent = scan.percent(processed)
+                    if percent is not None:
+                        worker.progress.emit(percent)
 
+            if scan.found == 0 and not is_stopped():
+                worker.log.emit("선택한 FOV Number에 해당하는 이미지가 없습니다.")
+                worker.finished.emit("Basic Sorting 완료.")
+                return
             if is_stopped():
-                worker.finished.emit(f"Basic Sorting 중지됨. ({processed}/{total})")
+                worker.finished.emit(f"Basic Sorting 중지됨. ({processed}/{scan.found})")
             else:
+                worker.progress.emit(scan.percent(processed))
                 worker.finished.emit(f"Basic Sorting 완료. 총 처리 파일: {processed}")
             worker.log.emit("------ Basic Sorting 작업 완료 ------")
             return
@@ -417,6 +476,7 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
         worker.log.emit("FOV 미입력: inner_id_list_path 폴더의 파일 복사 진행")
         folder_to_files = {}
         total = 0
+        matcher = FileMatcher(formats)
         for info in inner_id_info:
             if is_stopped():
                 break
@@ -425,48 +485,40 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
                 worker.log.emit(f"폴더 없음: {src_folder}")
                 continue
             try:
-                with os.scandir(src_folder) as it:
-                    image_files = [
-                        entry.name
-                        for entry in it
-                        if entry.is_file() and is_valid_file(entry.name, formats)
-                    ]
+                image_files = matcher.filter(list_dir(src_folder, cache).files)
                 if image_files:
                     folder_to_files[info["path"]] = {"files": image_files, "info": info}
                     total += len(image_files)
             except Exception as exc:
                 worker.log.emit(f"파일 목록 오류: {src_folder} | 에러: {exc}")
 
+        timings.add_since(STAGE_SCAN, scan_started)
         if total == 0:
             worker.log.emit("formats 조건에 맞는 파일 없음.")
             worker.finished.emit("Basic Sorting 완료.")
             return
 
-        processed = 0
-        with ThreadPoolExecutor(max_workers=worker.max_workers, initializer=set_worker_priority) as executor:
-            futures = []
+        def list_jobs():
             for rel_path, data in folder_to_files.items():
-                if is_stopped():
-                    break
                 src_folder = os.path.join(inner_id_list_path, rel_path)
                 info = data["info"]
+                prefix = f"{info['code']}_{info['name']}" if info.get("code") else info["name"]
                 for image_file in data["files"]:
-                    if is_stopped():
-                        break
                     src_file = os.path.join(src_folder, image_file)
-                    prefix = f"{info['code']}_{info['name']}" if info.get("code") else info["name"]
                     new_name = f"{prefix}_{image_file}"
-                    dst_file = os.path.join(target, new_name)
-                    futures.append(executor.submit(copy_file_chunked, src_file, dst_file, is_stopped))
+                    yield src_file, os.path.join(target, new_name), is_stopped
 
-            for future in as_completed(futures):
-                if is_stopped():
-                    break
-                result = future.result()
-                if not result.startswith("오류 발생"):
-                    processed += 1
-                    worker.log.emit(result)
-                    worker.progress.emit(min(int(processed / total * 100), 100))
+        if plan is not None:
+            _plan_copies(worker, plan, list_jobs(), journal)
+            return
+        processed = 0
+        for _job, result in bounded_map(worker, copy, list_jobs(), tuner=tuner):
+            if is_stopped():
+                break
+            if not result.startswith("오류 발생"):
+                processed += 1
+                worker.log.emit(result)
+                worker.progress.emit(min(int(processed / total * 100), 100))
 
         if is_stopped():
             worker.finished.emit(f"Basic Sorting 중지됨. ({processed}/{total})")
@@ -478,12 +530,17 @@ def basic_sorting(worker: "WorkerThread", task: dict) -> None:
         logging.error("Basic Sorting 중 오류", exc_info=True)
         worker.log.emit(f"오류 발생: {exc}")
         worker.finished.emit("작업 중 오류 발생.")
+    finally:
+        if journal is not None:
+            journal.close()
+        if cache is not None:
+            cache.flush()
 
 
 # ---------------------------------------------------------------------------
 # Register
 # ---------------------------------------------------------------------------
-from apt.workers.base import register  # noqa: E402
+from apt.workers.registry import register  # noqa: E402
 
 register(OP_NG_SORTING, ng_folder_sorting)
 register(OP_BASIC_SORTING, basic_sorting)
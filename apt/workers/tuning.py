@@ -0,0 +1,158 @@
+"""Adaptive concurrency for ``bounded_map``.
+
+The legacy ``max_workers = min(12, cpu*2)`` was the same for local NVMe
+copies, SMB shares and JPEG encoding — too many threads thrash a spinning
+disk, too few leave a network share idle. ``ConcurrencyTuner`` hill-climbs
+the number of jobs running at once on measured throughput instead:
+
+1. run a window of jobs at the current limit and measure jobs/s;
+2. if that beat the best window so far, keep moving the same way
+   (x1.5 up / /1.5 down);
+3. otherwise go back to the best limit and try the other direction once;
+   when that does not help either, settle.
+
+Tuning only happens during the first few hundred jobs (``probe_jobs``);
+after that the limit is frozen and logged, so long runs are not disturbed.
+I/O-bound and CPU-bound stages get separate bounds (``STAGE_IO`` /
+``STAGE_CPU``) so a copy stage can grow to dozens of threads while an
+encoding stage stays around the core count.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Callable
+
+from apt.constants import BACKEND_PROCESS, BACKEND_THREAD
+
+STAGE_IO = "io"
+STAGE_CPU = "cpu"
+
+# Upper bound for I/O stages — past this SMB / NAS targets stop scaling.
+IO_MAX_WORKERS = 64
+
+
+class ConcurrencyTuner:
+    """Throughput hill-climber over an integer concurrency ``limit``."""
+
+    GROWTH = 1.5
+    # A window has to beat the best one by this much to count as better.
+    TOLERANCE = 0.05
+
+    def __init__(
+        self,
+        stage: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        *,
+        window_jobs: int = 32,
+        min_window_s: float = 0.25,
+        probe_jobs: int = 512,
+        log: Callable[[str], None] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.stage = stage
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = self._clamp(initial)
+        self.window_jobs = window_jobs
+        self.min_window_s = min_window_s
+        self.probe_jobs = probe_jobs
+        self._log = log
+        self._clock = clock
+
+        self.settled = False
+        self.best_limit = self.limit
+        self.best_rate = 0.0
+        self._direction = 1
+        self._reversed = False
+        self._seen = 0
+        self._window_count = 0
+        self._window_start: float | None = None
+
+    # ------------------------------------------------------------------
+    def _clamp(self, value: int) -> int:
+        return max(self.minimum, min(self.maximum, int(value)))
+
+    def _step(self) -> bool:
+        """Move ``limit`` one step in the current direction; False at a bound."""
+        if self._direction > 0:
+            new = self._clamp(max(self.limit + 1, round(self.limit * self.GROWTH)))
+        else:
+            new = self._clamp(min(self.limit - 1, round(self.limit / self.GROWTH)))
+        if new == self.limit:
+            return False
+        self.limit = new
+        return True
+
+    def _settle(self) -> None:
+        self.limit = self.best_limit
+        self.settled = True
+        if self._log is not None:
+            self._log(
+                f"동시 작업 수 자동 조정 ({self.stage}): {self.limit} "
+                f"(≈{self.best_rate:.1f} jobs/s)"
+            )
+
+    def _reverse(self) -> None:
+        self.limit = self.best_limit
+        if self._reversed:
+            self._settle()
+            return
+        self._reversed = True
+        self._direction = -self._direction
+        if not self._step():
+            self._settle()
+
+    # ------------------------------------------------------------------
+    def record(self, jobs: int = 1) -> None:
+        """Report ``jobs`` completed jobs; may change ``limit``."""
+        if self.settled:
+            return
+        now = self._clock()
+        if self._window_start is None:
+            self._window_start = now
+        self._seen += jobs
+        self._window_count += jobs
+        elapsed = now - self._window_start
+        if self._window_count < self.window_jobs or elapsed < self.min_window_s:
+            return
+
+        rate = self._window_count / elapsed if elapsed > 0 else float("inf")
+        self._window_count = 0
+        self._window_start = now
+
+        if rate > self.best_rate * (1 + self.TOLERANCE):
+            self.best_rate = rate
+            self.best_limit = self.limit
+            if self._seen < self.probe_jobs and not self._step():
+                self._reverse()
+        else:
+            self._reverse()
+        if not self.settled and self._seen >= self.probe_jobs:
+            self._settle()
+
+
+def tuner_for(
+    worker: Any,
+    task: dict,
+    stage: str,
+    backend: str = BACKEND_THREAD,
+) -> ConcurrencyTuner | None:
+    """Build the tuner for one handler stage, or None if ``auto_tune`` is off.
+
+    The legacy ``worker.max_workers`` is the starting point for I/O stages;
+    CPU stages start at the core count. The process backend never goes past
+    one process per core.
+    """
+    if not task.get("auto_tune", True):
+        return None
+    cpus = os.cpu_count() or 1
+    log = worker.log.emit
+    if stage == STAGE_CPU:
+        maximum = cpus if backend == BACKEND_PROCESS else cpus * 2
+        return ConcurrencyTuner(stage, cpus, 1, maximum, log=log)
+    initial = worker.max_workers
+    return ConcurrencyTuner(stage, initial, 2, max(IO_MAX_WORKERS, initial), log=log)
@@ -0,0 +1,12 @@
+"""Throughput benchmarks for APT.
+
+Not part of the test suite — run them by hand::
+
+    python -m benchmarks.workers --sizes 1k 10k
+    python -m benchmarks.workers --sizes 10k --baseline benchmarks/results/old.json
+
+Every suite writes one JSON file (``benchmarks/results/`` by default) with
+the machine, the commit and one row per measurement; passing an earlier
+file as ``--baseline`` prints the change per row and exits non-zero when a
+row got slower than the tolerance (see ``benchmarks.common``).
+"""
@@ -0,0 +1,176 @@
+"""Result files, peak RSS and baseline comparison shared by the suites."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, Iterable, Sequence
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+SCHEMA_VERSION = 1
+DEFAULT_TOLERANCE = 0.10
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process so far, or None if unknown."""
+    if sys.platform == "win32":
+        return _windows_peak_working_set()
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _windows_peak_working_set() -> int | None:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    try:
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        ok = ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb)
+    except (AttributeError, OSError):
+        return None
+    return int(counters.PeakWorkingSetSize) if ok else None
+
+
+def git_commit() -> str | None:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=root, capture_output=True, text=True, timeout=10, check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def machine_info() -> dict[str, Any]:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": multiprocessing.cpu_count(),
+        "commit": git_commit(),
+    }
+
+
+def parse_count(text: str) -> int:
+    """``"1k"`` -> 1000, ``"2.5m"`` -> 2_500_000, ``"300"`` -> 300."""
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    if scale != 1:
+        text = text[:-1]
+    value = int(float(text) * scale)
+    if value <= 0:
+        raise ValueError(f"count must be positive: {text!r}")
+    return value
+
+
+def default_results_path(suite: str) -> str:
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(RESULTS_DIR, f"{suite}_{stamp}.json")
+
+
+def save_results(path: str, suite: str, params: dict[str, Any], rows: list[dict[str, Any]]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    report = {
+        "schema": SCHEMA_VERSION,
+        "suite": suite,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "params": params,
+        "results": rows,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_rows(
+    baseline: Iterable[dict[str, Any]],
+    current: Iterable[dict[str, Any]],
+    keys: Sequence[str],
+    metric: str,
+    higher_is_better: bool,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[dict[str, Any]]:
+    """Match rows on ``keys`` and report the relative change of ``metric``.
+
+    ``change`` is positive when the row got better; ``regressed`` is set
+    when it got worse by more than ``tolerance`` (a fraction). Rows
+    missing from either side, or without the metric, are left out.
+    """
+    old = {tuple(row.get(k) for k in keys): row for row in baseline}
+    out = []
+    for row in current:
+        key = tuple(row.get(k) for k in keys)
+        before = old.get(key, {}).get(metric)
+        after = row.get(metric)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        if not higher_is_better:
+            change = -change
+        out.append({
+            **{k: v for k, v in zip(keys, key)},
+            "baseline": before,
+            "current": after,
+            "change": change,
+            "regressed": change < -tolerance,
+        })
+    return out
+
+
+def format_table(rows: list[dict[str, Any]], columns: Sequence[tuple[str, str, str]]) -> list[str]:
+    """Fixed-width text table; ``columns`` are ``(key, header, format spec)``."""
+    cells = [
+        [_format_cell(row.get(key), spec) for key, _header, spec in columns]
+        for row in rows
+    ]
+    headers = [header for _key, header, _spec in columns]
+    widths = [
+        max([len(h)] + [len(r[i]) for r in cells]) for i, h in enumerate(headers)
+    ]
+    lines = ["  ".join(h.rjust(w) if i else h.ljust(w) for i, (h, w) in enumerate(zip(headers, widths)))]
+    for r in cells:
+        lines.append("  ".join(c.rjust(w) if i else c.ljust(w) for i, (c, w) in enumerate(zip(r, widths))))
+    return lines
+
+
+def _format_cell(value: Any, spec: str) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, bool):
+        return "yes" if value else ""
+    try:
+        return format(value, spec)
+    except (TypeError, ValueError):
+        return str(value)
@@ -0,0 +1,298 @@
+"""Preprocessing benchmarks: ``python -m benchmarks.preprocessing``.
+
+Times every registered ``Operation`` on synthetic images of each size and
+channel layout (``gray`` HxW, ``bgr`` HxWx3), a few representative
+``Pipeline`` graphs cold (empty cache), warm (every node cached) and after
+a parameter tweak on one node, and ``duplicate_with_origin`` — the clone
+that full-resolution export and batch runs make per image::
+
+    python -m benchmarks.preprocessing
+    python -m benchmarks.preprocessing --sizes 512 2048 --ops bilateral median_blur
+    python -m benchmarks.preprocessing --baseline benchmarks/results/preprocessing_old.json
+
+Each measurement runs once to warm up, then repeats until ``--min-time``
+seconds have passed (at most ``--max-repeat`` times, at least once) and
+keeps min / median latency. Operations that raise on a layout are recorded
+with ``status: error`` rather than aborting the run. Two 8192² BGR inputs
+take ~400 MB, so the largest size needs a few GB free.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from apt.preprocessing import OPERATIONS, Pipeline, apply_operation
+from benchmarks.common import (
+    DEFAULT_TOLERANCE,
+    compare_rows,
+    default_results_path,
+    format_table,
+    load_results,
+    save_results,
+)
+
+SUITE = "preprocessing"
+DEFAULT_SIZES = (512, 2048, 8192)
+LAYOUTS = ("gray", "bgr")
+DEFAULT_MIN_TIME = 0.3
+DEFAULT_MAX_REPEAT = 20
+CLONE_CHAIN_NODES = 50
+
+# Representative graphs: (name, [(node name, op key, [input names], params)]).
+# "origin" is the loaded image.
+DAGS: tuple[tuple[str, list[tuple[str, str, list[str], dict]]], ...] = (
+    ("edges", [
+        ("gray", "to_gray", ["origin"], {}),
+        ("blur", "gaussian_blur", ["gray"], {}),
+        ("canny", "canny", ["blur"], {}),
+    ]),
+    ("threshold_morph", [
+        ("median", "median_blur", ["origin"], {}),
+        ("otsu", "threshold_otsu", ["median"], {}),
+        ("open", "open", ["otsu"], {}),
+        ("close", "close", ["open"], {}),
+    ]),
+    ("enhance_blend", [
+        ("clahe", "clahe", ["origin"], {}),
+        ("sharpen", "sharpen", ["origin"], {}),
+        ("blend", "blend", ["clahe", "sharpen"], {}),
+        ("diff", "subtract", ["blend", "origin"], {}),
+    ]),
+)
+
+
+def make_image(size: int, layout: str, seed: int = 0) -> np.ndarray:
+    """Noise with a bright square and a gradient, so thresholds and edges have work."""
+    rng = np.random.default_rng(seed)
+    shape = (size, size) if layout == "gray" else (size, size, 3)
+    img = rng.integers(0, 64, size=shape, dtype=np.uint8)
+    ramp = (np.arange(size, dtype=np.uint32) * 128 // size).astype(np.uint8)
+    img += ramp[:, None] if layout == "gray" else ramp[:, None, None]
+    q = size // 4
+    img[q:2 * q, q:2 * q] = 240
+    return img
+
+
+def time_call(fn: Callable[[], Any], min_time: float, max_repeat: int) -> dict[str, Any]:
+    """Warm up once, then time ``fn`` until ``min_time`` is spent."""
+    fn()
+    samples: list[float] = []
+    budget_end = time.perf_counter() + min_time
+    while len(samples) < max(1, max_repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+        if time.perf_counter() >= budget_end:
+            break
+    return {
+        "repeat": len(samples),
+        "min_ms": round(min(samples) * 1e3, 3),
+        "median_ms": round(statistics.median(samples) * 1e3, 3),
+    }
+
+
+def build_pipeline(nodes: list[tuple[str, str, list[str], dict]], image: np.ndarray | None) -> tuple[Pipeline, dict[str, str]]:
+    """A ``Pipeline`` for a ``DAGS`` entry; returns it with ``name -> node id``."""
+    pipeline = Pipeline()
+    pipeline.set_origin(image)
+    ids = {"origin": Pipeline.ORIGIN_ID}
+    for name, op_key, inputs, params in nodes:
+        node = pipeline.add_node(op_key, [ids[i] for i in inputs])
+        for key, value in params.items():
+            pipeline.set_param(node.id, key, value)
+        ids[name] = node.id
+    return pipeline, ids
+
+
+def _compute_outputs(pipeline: Pipeline) -> None:
+    for node_id in pipeline.output_ids():
+        pipeline.compute(node_id)
+
+
+def _chain(length: int) -> list[tuple[str, str, list[str], dict]]:
+    keys = ("gaussian_blur", "invert", "gamma", "erode", "dilate")
+    previous = "origin"
+    nodes = []
+    for i in range(length):
+        name = f"n{i}"
+        nodes.append((name, keys[i % len(keys)], [previous], {}))
+        previous = name
+    return nodes
+
+
+# ---------------------------------------------------------------------------
+# Suites
+# ---------------------------------------------------------------------------
+
+def bench_operations(
+    size: int, layout: str, ops: Sequence[str] | None, min_time: float, max_repeat: int,
+) -> list[dict[str, Any]]:
+    a = make_image(size, layout, seed=1)
+    b = make_image(size, layout, seed=2)
+    rows = []
+    for op in OPERATIONS:
+        if ops and op.key not in ops:
+            continue
+        images = [a, b][: op.inputs]
+        params = op.defaults()
+        row = {"kind": "op", "name": op.key, "category": op.category, "size": size, "layout": layout,
+               "mode": "", "status": "ok"}
+        try:
+            row.update(time_call(lambda: apply_operation(op.key, images, **params), min_time, max_repeat))
+        except Exception as exc:  # noqa: BLE001 — recorded, the run goes on
+            row.update(status="error", error=f"{type(exc).__name__}: {exc}")
+        else:
+            row["mpix_per_s"] = round(size * size / 1e6 / (row["median_ms"] / 1e3), 1) if row["median_ms"] else None
+        rows.append(row)
+    return rows
+
+
+def bench_dags(size: int, layout: str, min_time: float, max_repeat: int) -> list[dict[str, Any]]:
+    image = make_image(size, layout, seed=1)
+    rows = []
+    for name, nodes in DAGS:
+        pipeline, ids = build_pipeline(nodes, image)
+        # The most downstream node with a parameter — the one a user tweaks.
+        tweaked = next(ids[n] for n, _op, _inputs, _params in reversed(nodes) if pipeline.get(ids[n]).params)
+
+        def cold() -> None:
+            pipeline.set_origin(image)  # clears the cache
+            _compute_outputs(pipeline)
+
+        def warm() -> None:
+            _compute_outputs(pipeline)
+
+        def tweak() -> None:
+            # set_param invalidates the node and everything downstream of it.
+            params = pipeline.get(tweaked).params
+            key = next(iter(params))
+            pipeline.set_param(tweaked, key, params[key])
+            _compute_outputs(pipeline)
+
+        base = {"kind": "dag", "name": name, "category": "", "size": size, "layout": layout, "status": "ok"}
+        for mode, fn in (("cold", cold), ("warm", warm), ("tweak", tweak)):
+            row = dict(base, mode=mode)
+            try:
+                row.update(time_call(fn, min_time, max_repeat))
+            except Exception as exc:  # noqa: BLE001
+                row.update(status="error", error=f"{type(exc).__name__}: {exc}")
+            rows.append(row)
+    return rows
+
+
+def bench_clone(min_time: float, max_repeat: int) -> list[dict[str, Any]]:
+    """``duplicate_with_origin`` per graph; ``size`` is the graph's node count."""
+    image = make_image(64, "bgr")
+    rows = []
+    graphs = [(name, nodes) for name, nodes in DAGS] + [(f"chain_{CLONE_CHAIN_NODES}", _chain(CLONE_CHAIN_NODES))]
+    for name, nodes in graphs:
+        pipeline, _ids = build_pipeline(nodes, image)
+        row = {"kind": "clone", "name": name, "category": "", "size": len(nodes), "layout": "",
+               "mode": "duplicate_with_origin", "status": "ok"}
+        row.update(time_call(lambda: pipeline.duplicate_with_origin(image), min_time, max_repeat))
+        rows.append(row)
+    return rows
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    layouts: Sequence[str] = LAYOUTS,
+    ops: Sequence[str] | None = None,
+    min_time: float = DEFAULT_MIN_TIME,
+    max_repeat: int = DEFAULT_MAX_REPEAT,
+    dags: bool = True,
+    log: Callable[[str], None] = print,
+) -> list[dict[str, Any]]:
+    rows = []
+    for size in sizes:
+        for layout in layouts:
+            log(f"{size}x{size} {layout}")
+            rows += bench_operations(size, layout, ops, min_time, max_repeat)
+            if dags:
+                rows += bench_dags(size, layout, min_time, max_repeat)
+    if dags:
+        rows += bench_clone(min_time, max_repeat)
+    return rows
+
+
+RESULT_COLUMNS = (
+    ("name", "name", ""),
+    ("kind", "kind", ""),
+    ("mode", "mode", ""),
+    ("size", "size", "d"),
+    ("layout", "layout", ""),
+    ("median_ms", "median ms", ".3f"),
+    ("min_ms", "min ms", ".3f"),
+    ("mpix_per_s", "MPix/s", ".1f"),
+    ("repeat", "n", "d"),
+    ("status", "status", ""),
+)
+
+COMPARE_KEYS = ("kind", "name", "mode", "size", "layout")
+
+COMPARE_COLUMNS = (
+    ("name", "name", ""),
+    ("kind", "kind", ""),
+    ("mode", "mode", ""),
+    ("size", "size", "d"),
+    ("layout", "layout", ""),
+    ("baseline", "base ms", ".3f"),
+    ("current", "ms", ".3f"),
+    ("change", "change", "+.1%"),
+    ("regressed", "regressed", ""),
+)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.preprocessing", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="square edge in pixels")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument("--ops", nargs="+", metavar="KEY", help="only these operation keys")
+    parser.add_argument("--no-dags", action="store_true", help="skip the pipeline / clone measurements")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="seconds per measurement")
+    parser.add_argument("--max-repeat", type=int, default=DEFAULT_MAX_REPEAT)
+    parser.add_argument("--out", help="result JSON (default benchmarks/results/preprocessing_<time>.json)")
+    parser.add_argument("--baseline", help="earlier result JSON to compare median latency against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed latency increase before a row counts as regressed")
+    args = parser.parse_args(argv)
+
+    known = {op.key for op in OPERATIONS}
+    unknown = sorted(set(args.ops or ()) - known)
+    if unknown:
+        parser.error(f"unknown operation(s): {', '.join(unknown)}")
+    rows = run_benchmarks(
+        args.sizes, args.layouts, args.ops, args.min_time, args.max_repeat, dags=not args.no_dags,
+    )
+    out = args.out or default_results_path(SUITE)
+    params = {"sizes": args.sizes, "layouts": args.layouts, "min_time": args.min_time, "max_repeat": args.max_repeat}
+    save_results(out, SUITE, params, rows)
+    print()
+    print("\n".join(format_table(rows, RESULT_COLUMNS)))
+    slowest = sorted((r for r in rows if r["kind"] == "op" and r["status"] == "ok"),
+                     key=lambda r: r["median_ms"], reverse=True)[:5]
+    if slowest:
+        print("\nslowest operations: " + ", ".join(
+            f"{r['name']} ({r['size']} {r['layout']}, {r['median_ms']:.1f} ms)" for r in slowest))
+    print(f"\nresults: {out}")
+
+    if args.baseline:
+        changes = compare_rows(
+            load_results(args.baseline)["results"], rows, COMPARE_KEYS,
+            "median_ms", higher_is_better=False, tolerance=args.tolerance,
+        )
+        print()
+        print("\n".join(format_table(changes, COMPARE_COLUMNS)))
+        if any(change["regressed"] for change in changes):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Synthetic inspection trees for the worker benchmarks.
+
+``make_tree(root, files)`` lays out what an inspection line produces, scaled
+to roughly ``files`` source files::
+
+    <root>/
+        source/<inner id>/              # one folder per inspected part
+            <fov>_Cam<c>.bmp            # FOVS x CAMS raw images
+            <fov>_Cam1.json             # LabelMe labels for the Cam1 images
+            FOV<fov>.jpg                # one preview JPG per FOV
+        rerun/<inner id>/FOV<fov>.jpg   # second inspection (Attach FOV)
+        inner/<inner id>/               # Inner ID list (Basic Sorting)
+        ng/Cam_<c>/Defect_<d>/<inner id>/   # NG folders (NG Count)
+        manifest.json
+
+Inner IDs are 15 characters, which is what Attach FOV keys folders on.
+Every BMP / JPG is the same encoded payload written many times, so building
+100k files is bounded by the disk rather than the encoder. A tree whose
+``manifest.json`` matches the requested parameters is reused as is.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+import os
+from dataclasses import asdict, dataclass
+
+import numpy as np
+from PIL import Image
+
+FOVS = 4
+CAMS = 2
+DEFECTS = ("Scratch", "Dent", "Stain")
+NG_EVERY = 5  # every 5th inner ID is NG
+FILES_PER_ID = FOVS * CAMS + FOVS + FOVS  # BMPs + Cam1 JSONs + FOV JPGs
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class TreeManifest:
+    """What ``make_tree`` wrote, with the byte counts the benchmarks need."""
+
+    version: int
+    files: int
+    image_size: int
+    inner_ids: int
+    bmp_files: int = 0
+    bmp_bytes: int = 0
+    json_files: int = 0
+    json_bytes: int = 0
+    jpg_files: int = 0
+    jpg_bytes: int = 0
+    rerun_jpg_files: int = 0
+    rerun_jpg_bytes: int = 0
+    ng_folders: int = 0
+
+    @property
+    def source_files(self) -> int:
+        return self.bmp_files + self.json_files + self.jpg_files
+
+
+class SyntheticTree:
+    """Paths of a generated tree."""
+
+    def __init__(self, root: str, manifest: TreeManifest) -> None:
+        self.root = root
+        self.manifest = manifest
+        self.source = os.path.join(root, "source")
+        self.rerun = os.path.join(root, "rerun")
+        self.inner = os.path.join(root, "inner")
+        self.ng = os.path.join(root, "ng")
+
+
+def inner_id(index: int) -> str:
+    return f"LOT01A{index:09d}"
+
+
+def _image_payloads(size: int) -> tuple[bytes, bytes]:
+    """Encoded ``(bmp, jpg)`` of a ``size`` x ``size`` gradient with some texture."""
+    y, x = np.mgrid[0:size, 0:size]
+    rng = np.random.default_rng(size)
+    base = (x * 255 // max(1, size - 1)).astype(np.uint8)
+    noise = rng.integers(0, 32, (size, size), dtype=np.uint8)
+    rgb = np.dstack([base, (y * 255 // max(1, size - 1)).astype(np.uint8), base ^ noise])
+    img = Image.fromarray(rgb, "RGB")
+    bmp, jpg = io.BytesIO(), io.BytesIO()
+    img.save(bmp, "BMP")
+    img.save(jpg, "JPEG", quality=90)
+    return bmp.getvalue(), jpg.getvalue()
+
+
+def _labelme(name: str, size: int, index: int) -> bytes:
+    """A LabelMe file with a polygon, a rectangle and a point inside the image."""
+    q = size // 4
+    off = index % max(1, q)
+    data = {
+        "version": "5.0.1",
+        "flags": {},
+        "shapes": [
+            {
+                "label": "scratch",
+                "points": [[q + off, q], [2 * q + off, q + 2], [2 * q, 2 * q + off], [q, 2 * q]],
+                "shape_type": "polygon",
+                "bbox": {"x": q, "y": q, "width": q + off, "height": q + off},
+                "flags": {},
+            },
+            {
+                "label": "dent",
+                "points": [[q // 2, q // 2], [q + q // 2, q]],
+                "shape_type": "rectangle",
+                "bbox": {"x": q // 2, "y": q // 2, "width": q, "height": q // 2},
+                "flags": {},
+            },
+            {
+                "label": "dot",
+                "points": [[3 * q, 3 * q - off]],
+                "shape_type": "point",
+                "bbox": {"x": 3 * q, "y": 3 * q - off, "width": 0, "height": 0},
+                "flags": {},
+            },
+        ],
+        "imagePath": name,
+        "imageData": None,
+        "imageHeight": size,
+        "imageWidth": size,
+    }
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _write(path: str, data: bytes) -> int:
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def load_tree(root: str) -> SyntheticTree | None:
+    """The tree under ``root`` if it has a readable manifest."""
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = TreeManifest(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+    return SyntheticTree(root, manifest)
+
+
+def make_tree(root: str, files: int, image_size: int = 128) -> SyntheticTree:
+    """Build (or reuse) a tree of about ``files`` source files under ``root``."""
+    existing = load_tree(root)
+    if existing is not None:
+        m = existing.manifest
+        if (m.version, m.files, m.image_size) == (MANIFEST_VERSION, files, image_size):
+            return existing
+        raise FileExistsError(f"{root} holds a different benchmark tree; remove it first")
+
+    ids = max(1, math.ceil(files / FILES_PER_ID))
+    manifest = TreeManifest(MANIFEST_VERSION, files, image_size, ids)
+    tree = SyntheticTree(root, manifest)
+    bmp, jpg = _image_payloads(image_size)
+
+    for i in range(ids):
+        ident = inner_id(i)
+        src = os.path.join(tree.source, ident)
+        rerun = os.path.join(tree.rerun, ident)
+        os.makedirs(src, exist_ok=True)
+        os.makedirs(rerun, exist_ok=True)
+        os.makedirs(os.path.join(tree.inner, ident), exist_ok=True)
+        for fov in range(1, FOVS + 1):
+            for cam in range(1, CAMS + 1):
+                name = f"{fov}_Cam{cam}.bmp"
+                manifest.bmp_bytes += _write(os.path.join(src, name), bmp)
+                manifest.bmp_files += 1
+                if cam == 1:
+                    label = _labelme(name, image_size, i + fov)
+                    manifest.json_bytes += _write(os.path.join(src, f"{fov}_Cam{cam}.json"), label)
+                    manifest.json_files += 1
+            manifest.jpg_bytes += _write(os.path.join(src, f"FOV{fov}.jpg"), jpg)
+            manifest.jpg_files += 1
+            manifest.rerun_jpg_bytes += _write(os.path.join(rerun, f"FOV{fov}.jpg"), jpg)
+            manifest.rerun_jpg_files += 1
+        if i % NG_EVERY == 0:
+            cam = i // NG_EVERY % CAMS + 1
+            defect = DEFECTS[i // NG_EVERY % len(DEFECTS)]
+            os.makedirs(os.path.join(tree.ng, f"Cam_{cam:02d}", defect, ident), exist_ok=True)
+            manifest.ng_folders += 1
+
+    with open(os.path.join(root, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(asdict(manifest), f, indent=2)
+    return tree
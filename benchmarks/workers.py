@@ -0,0 +1,339 @@
+"""File-operation worker benchmarks: ``python -m benchmarks.workers``.
+
+Builds a synthetic inspection tree per size (``benchmarks.trees``) and runs
+each handler on it through ``LocalTaskContext`` — the same Qt-free core the
+GUI and ``apt.cli`` use — recording files/s, MB/s and peak RSS::
+
+    python -m benchmarks.workers --sizes 1k 10k 100k
+    python -m benchmarks.workers --scenarios btj crop --backend process
+    python -m benchmarks.workers --baseline benchmarks/results/workers_old.json
+
+Each scenario runs in a freshly spawned process (``--no-isolate`` runs them
+in this one), so peak RSS is per scenario and no handler warms another's
+caches. files/s and MB/s are over the scenario's *input* (the files and
+bytes the handler has to read, from the tree manifest), which keeps rows
+comparable across commits even when the output layout changes. Trees are
+kept under ``--data-dir`` and reused; every target is deleted after its run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from apt.constants import (
+    BACKEND_CHOICES,
+    BACKEND_THREAD,
+    BTJ_ENCODER_OPENCV,
+    OP_ATTACH_FOV,
+    OP_BASIC_SORTING,
+    OP_BTJ,
+    OP_CROP,
+    OP_DATE_COPY,
+    OP_NG_COUNT,
+)
+from benchmarks.common import (
+    DEFAULT_TOLERANCE,
+    compare_rows,
+    default_results_path,
+    format_table,
+    load_results,
+    parse_count,
+    peak_rss_bytes,
+    save_results,
+)
+from benchmarks.trees import FOVS, SyntheticTree, make_tree
+
+SUITE = "workers"
+DEFAULT_SIZES = ("1k", "10k")
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One handler run: the task to give it and the input it consumes."""
+
+    name: str
+    operation: str
+    task: Callable[[SyntheticTree, str], dict]
+    inputs: Callable[[SyntheticTree], tuple[int, int]]  # (files, bytes)
+
+
+def _copy_task(tree: SyntheticTree, target: str) -> dict:
+    return {
+        "mode": "folder",
+        "source": tree.source,
+        "target": target,
+        "count": tree.manifest.inner_ids,
+        "formats": [".bmp", "fov_jpg"],
+        "year": 2000, "month": 1, "day": 1, "hour": 0, "minute": 0, "second": 0,
+    }
+
+
+def _sorting_task(tree: SyntheticTree, target: str) -> dict:
+    return {
+        "source": tree.source,
+        "target": target,
+        "inner_id_list": tree.inner,
+        "fov_number": f"1/{FOVS}",
+        "formats": [".bmp"],
+    }
+
+
+def _crop_task(tree: SyntheticTree, target: str) -> dict:
+    size = tree.manifest.image_size
+    return {
+        "source": tree.source,
+        "target": target,
+        "formats": [".bmp"],
+        "left_top_x": size // 8, "left_top_y": size // 8,
+        "right_bottom_x": size - size // 8, "right_bottom_y": size - size // 8,
+    }
+
+
+def _crop_regions_task(tree: SyntheticTree, target: str) -> dict:
+    """Six named quarter-size boxes from one decode per image."""
+    q = tree.manifest.image_size // 4
+    boxes = [(x, y) for y in (0, 2 * q) for x in (0, q, 2 * q)]
+    return {
+        "source": tree.source,
+        "target": target,
+        "formats": [".bmp"],
+        "regions": [{"name": f"roi_{i}", "box": [x, y, x + 2 * q, y + 2 * q]} for i, (x, y) in enumerate(boxes)],
+    }
+
+
+def _crop_tiles_task(tree: SyntheticTree, target: str) -> dict:
+    """Half-size tiles at quarter-size stride: a 3x3 grid per image."""
+    size = tree.manifest.image_size
+    return {
+        "source": tree.source,
+        "target": target,
+        "formats": [".bmp"],
+        "tile_size": size // 2,
+        "tile_stride": size // 4,
+    }
+
+
+def _btj_task(tree: SyntheticTree, target: str) -> dict:
+    return {"source": tree.source, "target": target}
+
+
+def _btj_opencv_task(tree: SyntheticTree, target: str) -> dict:
+    return dict(_btj_task(tree, target), encoder=BTJ_ENCODER_OPENCV)
+
+
+def _attach_task(tree: SyntheticTree, target: str) -> dict:
+    return {"search1": tree.source, "search2": tree.rerun, "target": target}
+
+
+def _ng_count_task(tree: SyntheticTree, _target: str) -> dict:
+    return {"ng_folder": tree.ng}
+
+
+SCENARIOS: dict[str, Scenario] = {
+    s.name: s for s in (
+        Scenario("copy", OP_DATE_COPY, _copy_task,
+                 lambda t: (t.manifest.bmp_files + t.manifest.jpg_files,
+                            t.manifest.bmp_bytes + t.manifest.jpg_bytes)),
+        Scenario("sorting", OP_BASIC_SORTING, _sorting_task,
+                 lambda t: (t.manifest.bmp_files, t.manifest.bmp_bytes)),
+        Scenario("crop", OP_CROP, _crop_task,
+                 lambda t: (t.manifest.bmp_files + t.manifest.json_files,
+                            t.manifest.bmp_bytes + t.manifest.json_bytes)),
+        Scenario("crop_regions", OP_CROP, _crop_regions_task,
+                 lambda t: (t.manifest.bmp_files + t.manifest.json_files,
+                            t.manifest.bmp_bytes + t.manifest.json_bytes)),
+        Scenario("crop_tiles", OP_CROP, _crop_tiles_task,
+                 lambda t: (t.manifest.bmp_files + t.manifest.json_files,
+                            t.manifest.bmp_bytes + t.manifest.json_bytes)),
+        Scenario("btj", OP_BTJ, _btj_task,
+                 lambda t: (t.manifest.bmp_files, t.manifest.bmp_bytes)),
+        Scenario("btj_opencv", OP_BTJ, _btj_opencv_task,
+                 lambda t: (t.manifest.bmp_files, t.manifest.bmp_bytes)),
+        Scenario("attach_fov", OP_ATTACH_FOV, _attach_task,
+                 lambda t: (t.manifest.jpg_files + t.manifest.rerun_jpg_files,
+                            t.manifest.jpg_bytes + t.manifest.rerun_jpg_bytes)),
+        Scenario("ng_count", OP_NG_COUNT, _ng_count_task,
+                 lambda t: (t.manifest.ng_folders, 0)),
+    )
+}
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+def run_scenario(scenario_name: str, tree_root: str, work_dir: str, backend: str = BACKEND_THREAD) -> dict[str, Any]:
+    """Run one scenario on the tree at ``tree_root``; returns the raw measurement."""
+    from apt.workers.context import LocalTaskContext, finished_status
+    from apt.workers.registry import load_handlers
+    from benchmarks.trees import load_tree
+
+    load_handlers()
+    scenario = SCENARIOS[scenario_name]
+    tree = load_tree(tree_root)
+    if tree is None:
+        raise FileNotFoundError(f"no benchmark tree at {tree_root}")
+    target = os.path.join(work_dir, f"out_{scenario.name}")
+    shutil.rmtree(target, ignore_errors=True)
+    task = dict(scenario.task(tree, target), operation=scenario.operation, backend=backend)
+    context = LocalTaskContext(task)
+    try:
+        start = time.perf_counter()
+        context.run()
+        seconds = time.perf_counter() - start
+    finally:
+        shutil.rmtree(target, ignore_errors=True)
+    return {
+        "seconds": seconds,
+        "status": finished_status(context.finished_message),
+        "finished": context.finished_message,
+        "jobs": context.metrics.get("jobs"),
+        "peak_rss": peak_rss_bytes(),
+    }
+
+
+def _child(conn, *args: Any) -> None:
+    try:
+        conn.send(("ok", run_scenario(*args)))
+    except BaseException as exc:  # noqa: BLE001 — reported to the parent
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
+
+def run_isolated(*args: Any) -> dict[str, Any]:
+    """``run_scenario`` in a freshly spawned process."""
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(child, *args))
+    proc.start()
+    child.close()
+    try:
+        status, value = parent.recv()
+    except EOFError:
+        status, value = "error", "benchmark process exited without a result"
+    proc.join()
+    if status != "ok":
+        raise RuntimeError(value)
+    return value
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    scenarios: Sequence[str],
+    data_dir: str,
+    image_size: int = 128,
+    backend: str = BACKEND_THREAD,
+    repeat: int = 1,
+    isolate: bool = True,
+    log: Callable[[str], None] = print,
+) -> list[dict[str, Any]]:
+    """One row per ``(scenario, size)``; seconds is the median of ``repeat`` runs."""
+    rows = []
+    runner = run_isolated if isolate else run_scenario
+    for files in sizes:
+        tree_root = os.path.join(data_dir, f"tree_{files}_{image_size}")
+        log(f"tree {files} files ({image_size}px) -> {tree_root}")
+        tree = make_tree(tree_root, files, image_size)
+        work_dir = os.path.join(data_dir, "work")
+        os.makedirs(work_dir, exist_ok=True)
+        for name in scenarios:
+            runs = [runner(name, tree.root, work_dir, backend) for _ in range(max(1, repeat))]
+            seconds = statistics.median(run["seconds"] for run in runs)
+            input_files, input_bytes = SCENARIOS[name].inputs(tree)
+            peaks = [run["peak_rss"] for run in runs if run["peak_rss"] is not None]
+            row = {
+                "scenario": name,
+                "operation": SCENARIOS[name].operation,
+                "size": files,
+                "backend": backend,
+                "input_files": input_files,
+                "input_bytes": input_bytes,
+                "seconds": round(seconds, 4),
+                "files_per_s": round(input_files / seconds, 1) if seconds else None,
+                "mb_per_s": round(input_bytes / 1e6 / seconds, 2) if seconds and input_bytes else None,
+                "peak_rss_mb": round(max(peaks) / 2**20, 1) if peaks else None,
+                "status": runs[-1]["status"],
+                "finished": runs[-1]["finished"],
+            }
+            rows.append(row)
+            log(f"  {name:<11} {row['seconds']:>9.3f}s  {row['files_per_s'] or 0:>10.1f} files/s  "
+                f"{row['status']}")
+    return rows
+
+
+RESULT_COLUMNS = (
+    ("scenario", "scenario", ""),
+    ("size", "files", "d"),
+    ("seconds", "seconds", ".3f"),
+    ("files_per_s", "files/s", ".1f"),
+    ("mb_per_s", "MB/s", ".2f"),
+    ("peak_rss_mb", "peak RSS MB", ".1f"),
+    ("status", "status", ""),
+)
+
+COMPARE_COLUMNS = (
+    ("scenario", "scenario", ""),
+    ("size", "files", "d"),
+    ("baseline", "base files/s", ".1f"),
+    ("current", "files/s", ".1f"),
+    ("change", "change", "+.1%"),
+    ("regressed", "regressed", ""),
+)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.workers", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES),
+                        help="source files per tree, e.g. 1k 10k 100k")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--image-size", type=int, default=128, help="BMP / JPG edge in pixels")
+    parser.add_argument("--backend", choices=[value for _label, value in BACKEND_CHOICES],
+                        default=BACKEND_THREAD)
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scenario (median is kept)")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="where trees are built and kept")
+    parser.add_argument("--out", help="result JSON (default benchmarks/results/workers_<time>.json)")
+    parser.add_argument("--baseline", help="earlier result JSON to compare files/s against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed files/s drop before a row counts as regressed")
+    parser.add_argument("--no-isolate", action="store_true", help="run scenarios in this process")
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = [parse_count(s) for s in args.sizes]
+    except ValueError as exc:
+        parser.error(str(exc))
+    rows = run_benchmarks(
+        sizes, args.scenarios, args.data_dir, args.image_size, args.backend,
+        args.repeat, isolate=not args.no_isolate,
+    )
+    out = args.out or default_results_path(SUITE)
+    params = {"sizes": sizes, "image_size": args.image_size, "backend": args.backend, "repeat": args.repeat}
+    save_results(out, SUITE, params, rows)
+    print()
+    print("\n".join(format_table(rows, RESULT_COLUMNS)))
+    print(f"\nresults: {out}")
+
+    if args.baseline:
+        changes = compare_rows(
+            load_results(args.baseline)["results"], rows, ("scenario", "size", "backend"),
+            "files_per_s", higher_is_better=True, tolerance=args.tolerance,
+        )
+        print()
+        print("\n".join(format_table(changes, COMPARE_COLUMNS)))
+        if any(change["regressed"] for change in changes):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,15 @@ boots it. PyInstaller builds also use this file as the entry script.
 
 from __future__ import annotations
 
+import multiprocessing
 import sys
 
 from apt.app import main
 
 
 if __name__ == "__main__":
+    # Required so the frozen EXE can spawn the process-pool backend workers.
+    multiprocessing.freeze_support()
     sys.exit(main())
 
 # ----------------------------------------------------------------------
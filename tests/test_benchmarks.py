@@ -0,0 +1,85 @@
+"""Benchmark harness — synthetic trees, result rows and baseline comparison."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from apt.preprocessing import OPERATIONS
+from benchmarks import preprocessing, workers
+from benchmarks.common import compare_rows, parse_count
+from benchmarks.trees import CAMS, FILES_PER_ID, FOVS, load_tree, make_tree
+
+
+def test_tree_matches_its_manifest(tmp_path):
+    tree = make_tree(str(tmp_path / "tree"), 40, image_size=32)
+    m = tree.manifest
+    assert m.inner_ids == 3 and m.source_files == 3 * FILES_PER_ID
+    bmps = list((tmp_path / "tree" / "source").rglob("*.bmp"))
+    assert len(bmps) == m.bmp_files
+    assert sum(p.stat().st_size for p in bmps) == m.bmp_bytes
+    assert len(list((tmp_path / "tree" / "rerun").rglob("FOV*.jpg"))) == m.rerun_jpg_files
+
+    assert make_tree(tree.root, 40, image_size=32).manifest == m  # reused
+    with pytest.raises(FileExistsError):
+        make_tree(tree.root, 80, image_size=32)
+    assert load_tree(str(tmp_path / "missing")) is None
+
+
+def test_every_scenario_runs_on_a_small_tree(tmp_path):
+    rows = workers.run_benchmarks(
+        [20], list(workers.SCENARIOS), str(tmp_path), image_size=32, isolate=False, log=lambda _m: None,
+    )
+    assert [row["scenario"] for row in rows] == list(workers.SCENARIOS)
+    assert {row["status"] for row in rows} == {"done"}
+    assert all(row["files_per_s"] > 0 for row in rows)
+    # Targets are cleaned up, the tree is kept for the next run.
+    assert list((tmp_path / "work").iterdir()) == []
+
+
+def test_main_writes_results_and_flags_regressions(tmp_path, monkeypatch, capsys):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": [
+        {"scenario": "btj", "size": 20, "backend": "thread", "files_per_s": 1e12},
+    ]}))
+    out = tmp_path / "current.json"
+    args = ["--sizes", "20", "--scenarios", "btj", "--image-size", "32", "--no-isolate",
+            "--data-dir", str(tmp_path / "data"), "--out", str(out), "--baseline", str(baseline)]
+    assert workers.main(args) == 1
+
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert report["suite"] == "workers" and report["params"]["sizes"] == [20]
+    row = report["results"][0]
+    assert row["input_files"] == 2 * FOVS * CAMS and row["peak_rss_mb"] > 0
+    assert "regressed" in capsys.readouterr().out
+
+
+def test_preprocessing_times_every_operation_and_graph():
+    rows = preprocessing.run_benchmarks([32], min_time=0, max_repeat=1, log=lambda _m: None)
+    ops = [r for r in rows if r["kind"] == "op"]
+    assert len(ops) == 2 * len(OPERATIONS)
+    assert {r["status"] for r in rows} == {"ok"}
+    modes = {(r["name"], r["mode"]) for r in rows if r["kind"] == "dag"}
+    assert modes == {(name, mode) for name, _nodes in preprocessing.DAGS for mode in ("cold", "warm", "tweak")}
+    assert len([r for r in rows if r["kind"] == "clone"]) == len(preprocessing.DAGS) + 1
+
+
+def test_preprocessing_main_rejects_unknown_ops(tmp_path):
+    with pytest.raises(SystemExit):
+        preprocessing.main(["--sizes", "32", "--ops", "no_such_op", "--out", str(tmp_path / "r.json")])
+
+
+def test_compare_rows_direction_and_tolerance():
+    base = [{"op": "a", "t": 100.0}, {"op": "b", "t": 100.0}, {"op": "gone", "t": 1.0}]
+    now = [{"op": "a", "t": 95.0}, {"op": "b", "t": 80.0}, {"op": "new", "t": 1.0}]
+    faster = compare_rows(base, now, ["op"], "t", higher_is_better=True)
+    assert [(r["op"], r["regressed"]) for r in faster] == [("a", False), ("b", True)]
+    lower = compare_rows(base, now, ["op"], "t", higher_is_better=False)
+    assert lower[1]["change"] == pytest.approx(0.2) and not lower[1]["regressed"]
+
+
+def test_parse_count():
+    assert [parse_count(s) for s in ("1k", "10K", "2.5m", "300")] == [1000, 10_000, 2_500_000, 300]
+    with pytest.raises(ValueError):
+        parse_count("0")
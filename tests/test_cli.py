@@ -0,0 +1,63 @@
+"""Headless CLI — runs handlers without Qt and reports through JSON lines."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from apt import cli
+from apt.constants import OP_BTJ
+from apt.workers import plan
+from apt.workers.plan import ThroughputHistory
+
+
+@pytest.fixture(autouse=True)
+def isolated_history(tmp_path, monkeypatch):
+    """Keep the ETA history of these runs out of the working directory."""
+    monkeypatch.setattr(plan, "_shared_history", ThroughputHistory(str(tmp_path / "history.json")))
+
+
+def _events(capsys) -> list[dict]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_cli_does_not_import_pyqt():
+    code = "import sys, apt.cli; apt.cli.load_handlers(); print('PyQt5' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_cli_runs_btj_and_streams_json(bmp_tree, tmp_path, capsys):
+    task_file = tmp_path / "task.json"
+    target = tmp_path / "out"
+    task_file.write_text(json.dumps({"source": str(bmp_tree), "target": str(target)}))
+
+    assert cli.main([OP_BTJ, "--task", str(task_file)]) == cli.EXIT_OK
+    events = _events(capsys)
+    assert events[-1]["event"] == "finished" and events[-1]["exit_code"] == 0
+    assert any(e["event"] == "progress" for e in events)
+    assert len(list(target.rglob("*.jpg"))) == 3
+
+
+def test_cli_reports_aborted_task(tmp_path, capsys):
+    task_file = tmp_path / "task.json"
+    task_file.write_text(json.dumps({"source": str(tmp_path / "missing"), "target": str(tmp_path / "o")}))
+    assert cli.main([OP_BTJ, "--task", str(task_file)]) == cli.EXIT_STOPPED
+    assert _events(capsys)[-1]["exit_code"] == cli.EXIT_STOPPED
+
+
+def test_cli_rejects_bad_task_file(tmp_path, capsys):
+    task_file = tmp_path / "task.json"
+    task_file.write_text("[1, 2]")
+    assert cli.main([OP_BTJ, "--task", str(task_file)]) == cli.EXIT_USAGE
+    assert _events(capsys)[-1]["event"] == "error"
+
+
+def test_exit_code_mapping():
+    assert cli.exit_code_for("Crop 완료.") == cli.EXIT_OK
+    assert cli.exit_code_for("작업 중 오류 발생했습니다.") == cli.EXIT_FAILED
+    assert cli.exit_code_for(None) == cli.EXIT_FAILED
+    assert cli.exit_code_for("작업 중지됨.", stopped=True) == cli.EXIT_INTERRUPTED
@@ -0,0 +1,164 @@
+"""Content index — duplicates are skipped or linked, never trusted blindly."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from apt.constants import DEDUP_LINK, DEDUP_OFF, DEDUP_SKIP, OP_DATE_COPY, OP_NG_SORTING
+from apt.utils.dedup import ContentIndex, open_content_index, quick_hash
+from apt.workers.context import LocalTaskContext
+from apt.workers.plan import ThroughputHistory
+from apt.workers.registry import load_handlers
+from apt.workers.sorting import ng_folder_sorting
+
+load_handlers()
+
+
+class FakeSignal:
+    def __init__(self) -> None:
+        self.records: list = []
+
+    def emit(self, value) -> None:
+        self.records.append(value)
+
+
+class FakeWorker:
+    def __init__(self) -> None:
+        self.progress = FakeSignal()
+        self.log = FakeSignal()
+        self.ng_count_result = FakeSignal()
+        self.finished = FakeSignal()
+        self.max_workers = 2
+        self._is_stopped = False
+
+    def is_stopped(self) -> bool:
+        return self._is_stopped
+
+    def ensure_target_folder(self, path: str) -> bool:
+        os.makedirs(path, exist_ok=True)
+        return True
+
+
+def _write(path, payload: bytes) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return str(path)
+
+
+def test_skip_mode_skips_identical_content(tmp_path):
+    a = _write(tmp_path / "src" / "a.bmp", b"same" * 1000)
+    b = _write(tmp_path / "src" / "b.bmp", b"same" * 1000)
+    target = tmp_path / "target"
+    with ContentIndex(str(target), DEDUP_SKIP) as index:
+        assert index.copy(a, str(target / "a.bmp")).startswith("Copied")
+        assert index.copy(b, str(target / "b.bmp")).startswith("Skipped (duplicate")
+        assert index.skipped == 1
+    assert not (target / "b.bmp").exists()
+
+
+def test_link_mode_hard_links_duplicates(tmp_path):
+    a = _write(tmp_path / "src" / "a.bmp", b"same" * 1000)
+    b = _write(tmp_path / "src" / "b.bmp", b"same" * 1000)
+    target = tmp_path / "target"
+    with ContentIndex(str(target), DEDUP_LINK) as index:
+        index.copy(a, str(target / "a.bmp"))
+        assert index.copy(b, str(target / "b.bmp")).startswith("Linked")
+    assert os.path.samefile(target / "a.bmp", target / "b.bmp")
+
+
+def test_quick_hash_collision_is_resolved_by_full_hash(tmp_path):
+    # Same size, head and tail — only the middle differs.
+    edge = b"h" * 70_000
+    a = _write(tmp_path / "src" / "a.bin", edge + b"A" * 1000 + edge)
+    b = _write(tmp_path / "src" / "b.bin", edge + b"B" * 1000 + edge)
+    assert quick_hash(a) == quick_hash(b)
+    target = tmp_path / "target"
+    with ContentIndex(str(target)) as index:
+        index.copy(a, str(target / "a.bin"))
+        assert index.copy(b, str(target / "b.bin")).startswith("Copied")
+    assert (target / "b.bin").read_bytes() == (tmp_path / "src" / "b.bin").read_bytes()
+
+
+def test_modified_target_is_not_trusted(tmp_path):
+    a = _write(tmp_path / "src" / "a.bmp", b"payload")
+    target = tmp_path / "target"
+    with ContentIndex(str(target)) as index:
+        index.copy(a, str(target / "a.bmp"))
+    (target / "a.bmp").write_bytes(b"edited!")
+
+    with ContentIndex(str(target)) as index:
+        assert index.copy(a, str(target / "copy.bmp")).startswith("Copied")
+        assert len(index) == 1  # the stale row was dropped
+
+
+def test_sync_indexes_existing_target_files(tmp_path):
+    target = tmp_path / "target"
+    _write(target / "old" / "a.bmp", b"already here")
+    src = _write(tmp_path / "src" / "a.bmp", b"already here")
+    with ContentIndex(str(target)) as index:
+        assert index.sync() == 1
+        assert index.sync() == 0
+        assert index.copy(src, str(target / "new.bmp")).startswith("Skipped")
+
+
+def test_open_content_index_modes(tmp_path):
+    assert open_content_index(str(tmp_path), DEDUP_OFF) is None
+    assert open_content_index(str(tmp_path), None) is None
+    with pytest.raises(ValueError):
+        open_content_index(str(tmp_path), "bogus")
+
+
+def test_ng_sorting_dedup_skips_repeated_images(tmp_path):
+    source1 = tmp_path / "ng"
+    source2 = tmp_path / "match"
+    for inner_id in ("ID1", "ID2"):
+        (source1 / inner_id).mkdir(parents=True)
+        _write(source2 / inner_id / "1_cam.bmp", b"identical frame")
+    target = tmp_path / "target"
+    worker = FakeWorker()
+    ng_folder_sorting(worker, {
+        "operation": OP_NG_SORTING,
+        "inputs": [str(source1 / "ID1"), str(source1 / "ID2")],
+        "source2": str(source2),
+        "target": str(target),
+        "formats": [".bmp"],
+        "dedup": DEDUP_SKIP,
+    })
+    copied = [p for p in target.rglob("*.bmp")]
+    assert len(copied) == 1
+    assert any("건너뜀 1" in line for line in worker.log.records)
+    assert worker.finished.records[-1].startswith("NG Folder Sorting 완료")
+
+
+@pytest.mark.parametrize("mode", ["folder", "image"])
+@pytest.mark.parametrize("dedup", [DEDUP_OFF, DEDUP_SKIP])
+def test_date_copy_conditional_random(tmp_path, mode, dedup):
+    source = tmp_path / "src"
+    for inner_id in ("ID1", "ID2", "ID3", "ID4"):
+        _write(source / inner_id / "1_cam.bmp", b"identical frame")
+    target = tmp_path / "target"
+    context = LocalTaskContext({
+        "operation": OP_DATE_COPY,
+        "mode": mode,
+        "source": str(source),
+        "target": str(target),
+        "count": 2,
+        "formats": [".bmp"],
+        "year": 2000, "month": 1, "day": 1, "hour": 0, "minute": 0, "second": 0,
+        "conditional_random": True,
+        "random_count": 1,
+        "fov_numbers": ["1"],
+        "dedup": dedup,
+    }, throughput=ThroughputHistory(str(tmp_path / "history.json")))
+    finished: list[str] = []
+    context.finished.connect(finished.append)
+    context.run()
+    assert len(finished) == 1 and finished[0].startswith(f"Date-Based Copy ({mode.capitalize()} Mode) 완료")
+    copied = list(target.rglob("*.bmp"))
+    assert len(copied) == (1 if dedup == DEDUP_SKIP else 2)
+    if dedup == DEDUP_SKIP:
+        # The index was closed (and committed): a fresh one already knows the copy.
+        with ContentIndex(str(target), DEDUP_SKIP) as index:
+            assert len(index) == 1 and index.sync() == 0
@@ -1,4 +1,6 @@
-from apt.utils.formats import is_valid_file
+import pytest
+
+from apt.utils.formats import FileMatcher, is_valid_file
 
 
 def test_empty_formats_rejects_everything():
@@ -31,3 +33,31 @@ def test_multiple_formats_or_match():
     assert is_valid_file("anything.bmp", formats)
     assert is_valid_file("fov_5.jpg", formats)
     assert not is_valid_file("normal.jpg", formats)
+
+
+_NAMES = [
+    "a.bmp", "A.BMP", "fov_1.jpg", "x.jpg", "FOV3_y.JPG", ".jpg", "a.jpgx",
+    "abc.png", "a.mim", "1_fov.jpg", "b.jpeg",
+]
+
+
+@pytest.mark.parametrize("formats", [
+    [], [".bmp"], ["org_jpg"], ["fov_jpg"], ["org_jpg", "fov_jpg"],
+    ["fov_jpg", ".bmp"], [".PNG", "org_jpg", ".mim"],
+])
+def test_file_matcher_agrees_with_is_valid_file(formats):
+    matcher = FileMatcher(formats)
+    for name in _NAMES:
+        assert matcher(name) == is_valid_file(name, formats), name
+    assert matcher.filter(_NAMES) == [n for n in _NAMES if is_valid_file(n, formats)]
+
+
+def test_file_matcher_fov_filter():
+    matcher = FileMatcher([".bmp"], {"1", "12"})
+    names = ["1_a.bmp", "12_b.bmp", "2_c.bmp", "fov12_d.bmp", "1_e.jpg", "noprefix.bmp"]
+    assert matcher.filter(names) == ["1_a.bmp", "12_b.bmp", "fov12_d.bmp"]
+
+
+def test_file_matcher_without_formats_only_filters_fov():
+    assert FileMatcher(None)("anything.xyz")
+    assert FileMatcher(None, {"3"}).filter(["3_a.txt", "4_b.txt"]) == ["3_a.txt"]
@@ -39,3 +39,8 @@ class TestExtractFOVFromFilename:
 
     def test_empty(self):
         assert extract_fov_from_filename("") is None
+
+    def test_non_ascii_digits_are_not_fov_numbers(self):
+        # "²" passes str.isdigit() but not the legacy [0-9] filter.
+        assert extract_fov_from_filename("1²_x.bmp") == "1"
+        assert extract_fov_from_filename("²_x.bmp") is None
@@ -1,6 +1,15 @@
 import os
 
-from apt.utils.fs import copy_file_chunked, copy_folder_filtered, ensure_target_folder
+import pytest
+
+from apt.utils.fs import (
+    available_copy_strategies,
+    copy_file_chunked,
+    copy_folder_filtered,
+    ensure_target_folder,
+    link_file,
+    transfer_function,
+)
 
 
 def test_ensure_target_folder_creates_when_missing(tmp_path):
@@ -26,6 +35,35 @@ def test_copy_file_chunked_copies_bytes(tmp_path):
     assert dst.read_bytes() == payload
 
 
+@pytest.mark.parametrize("strategy", available_copy_strategies())
+def test_copy_file_chunked_every_strategy(tmp_path, strategy):
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    payload = bytes(range(256)) * 9_000  # > 2 chunks, not chunk-aligned
+    src.write_bytes(payload)
+    result = copy_file_chunked(str(src), str(dst), strategy=strategy)
+    assert result.startswith("Copied")
+    assert dst.read_bytes() == payload
+
+
+def test_copy_file_chunked_stops_between_chunks(tmp_path):
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(b"x" * 4_000_000)
+    calls = iter(range(100))
+    # Not stopped on entry, stopped after the first chunk went through.
+    result = copy_file_chunked(str(src), str(dst), is_stopped=lambda: next(calls) >= 2)
+    assert result.startswith("오류 발생")
+    assert not dst.exists()
+
+
+def test_copy_file_chunked_rejects_unknown_strategy(tmp_path):
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"x")
+    result = copy_file_chunked(str(src), str(tmp_path / "dst.bin"), strategy="teleport")
+    assert result.startswith("오류 발생")
+
+
 def test_copy_file_chunked_respects_stop(tmp_path):
     src = tmp_path / "src.bin"
     dst = tmp_path / "dst.bin"
@@ -35,6 +73,50 @@ def test_copy_file_chunked_respects_stop(tmp_path):
     assert not dst.exists()
 
 
+def test_link_file_links_or_reflinks(tmp_path):
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(b"payload" * 1000)
+    result = link_file(str(src), str(dst))
+    assert result.split()[0] in {"Reflinked", "Linked"}
+    assert dst.read_bytes() == src.read_bytes()
+    # Running again over an existing link is a no-op, not an error.
+    assert not link_file(str(src), str(dst)).startswith("오류 발생")
+
+
+def test_link_file_falls_back_to_copy(tmp_path, monkeypatch):
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(b"payload")
+
+    def refuse(*_args):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr("apt.utils.fs._reflink", lambda *_args: False)
+    monkeypatch.setattr("apt.utils.fs.os.link", refuse)
+    assert link_file(str(src), str(dst)).startswith("Copied")
+    assert dst.read_bytes() == b"payload"
+
+
+def test_copy_over_hard_link_leaves_other_name_intact(tmp_path):
+    original = tmp_path / "original.bin"
+    original.write_bytes(b"original")
+    dst = tmp_path / "dst.bin"
+    os.link(original, dst)
+    new = tmp_path / "new.bin"
+    new.write_bytes(b"replacement")
+    assert copy_file_chunked(str(new), str(dst)).startswith("Copied")
+    assert dst.read_bytes() == b"replacement"
+    assert original.read_bytes() == b"original"
+
+
+def test_transfer_function_modes():
+    assert transfer_function(None) is copy_file_chunked
+    assert transfer_function("link") is link_file
+    with pytest.raises(ValueError):
+        transfer_function("teleport")
+
+
 def test_copy_folder_filtered_only_copies_matching(tmp_path, bmp_tree):
     target = tmp_path / "dst"
     result = copy_folder_filtered(str(bmp_tree), str(target), [".bmp"])
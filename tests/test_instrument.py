@@ -0,0 +1,143 @@
+"""Stage timings — cheap counters, merged across pools, reported at the end."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from apt import cli
+from apt.constants import BACKEND_PROCESS, OP_BASIC_SORTING, OP_BTJ
+from apt.workers import plan
+from apt.workers.context import LocalTaskContext
+from apt.workers.executor import _run_timed_chunk, bounded_map
+from apt.workers.instrument import (
+    NULL_TIMINGS,
+    STAGE_DECODE,
+    STAGE_QUEUE,
+    STAGE_READ,
+    STAGE_SCAN,
+    STAGE_WRITE,
+    StageTimings,
+    current_timings,
+)
+from apt.workers.plan import ThroughputHistory
+from apt.workers.registry import load_handlers
+
+load_handlers()
+
+
+def _stages(timings) -> dict[str, dict]:
+    return {row["stage"]: row for row in timings.summary()}
+
+
+def test_counters_merge_and_order():
+    a = StageTimings()
+    a.add(STAGE_WRITE, 2_000_000, nbytes=10)
+    a.add(STAGE_SCAN, 1_000_000)
+    b = StageTimings()
+    b.add(STAGE_WRITE, 4_000_000, nbytes=5)
+    a.merge(b.raw())
+    rows = a.summary()
+    assert [r["stage"] for r in rows] == [STAGE_SCAN, STAGE_WRITE]
+    write = rows[1]
+    assert (write["calls"], write["bytes"], write["max_ms"], write["mean_ms"]) == (2, 15, 4.0, 3.0)
+    assert len(a.table_lines()) == 3
+
+
+class _Worker:
+    max_workers = 2
+    timings = None
+
+    def is_stopped(self) -> bool:
+        return False
+
+
+def _current_is_enabled(_):
+    return current_timings().enabled
+
+
+def test_bounded_map_installs_task_timings_on_pool_threads():
+    worker = _Worker()
+    assert not any(r for _j, r in bounded_map(worker, _current_is_enabled, [(i,) for i in range(4)]))
+    assert current_timings() is NULL_TIMINGS
+
+    worker.timings = StageTimings()
+    assert all(r for _j, r in bounded_map(worker, _current_is_enabled, [(i,) for i in range(4)]))
+    assert _stages(worker.timings)[STAGE_QUEUE]["calls"] == 4
+
+
+def _slow_and_timed(_):
+    time.sleep(0.03)
+    return current_timings().enabled
+
+
+def test_process_chunks_record_one_queue_wait_each():
+    results, raw = _run_timed_chunk(_slow_and_timed, [(i,) for i in range(4)], time.time_ns())
+    assert results == [True] * 4
+    timings = StageTimings()
+    timings.merge(raw)
+    queue = _stages(timings)[STAGE_QUEUE]
+    # The later jobs' wait behind their chunk-mates is not queue time.
+    assert queue["calls"] == 1 and queue["max_ms"] < 30
+
+
+def _btj_context(source, target, tmp_path, **extra) -> LocalTaskContext:
+    task = {"operation": OP_BTJ, "source": str(source), "target": str(target), "instrument": True}
+    return LocalTaskContext(dict(task, **extra), timing_dir=str(tmp_path / "timings"))
+
+
+def test_btj_reports_every_stage(bmp_tree, tmp_path):
+    context = _btj_context(bmp_tree, tmp_path / "out", tmp_path)
+    lines: list[str] = []
+    context.log.connect(lines.append)
+    context.run()
+
+    stages = _stages(context.timings)
+    assert {STAGE_SCAN, STAGE_QUEUE, STAGE_READ, STAGE_DECODE, "transform", "encode", STAGE_WRITE} <= set(stages)
+    assert stages[STAGE_READ]["bytes"] == sum(p.stat().st_size for p in bmp_tree.rglob("*.bmp"))
+    assert stages[STAGE_DECODE]["calls"] == 3
+
+    with open(context.timing_report, encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["operation"] == OP_BTJ and report["metrics"]["jobs"] == 3
+    assert {row["stage"] for row in report["stages"]} == set(stages)
+    assert any(line.startswith("write ") for line in lines)
+
+
+def test_process_pool_timings_are_merged(bmp_tree, tmp_path):
+    context = _btj_context(bmp_tree, tmp_path / "out", tmp_path, backend=BACKEND_PROCESS)
+    context.run()
+    assert _stages(context.timings)[STAGE_DECODE]["calls"] == 3
+
+
+def test_copies_count_written_bytes(basic_sorting_tree, tmp_path):
+    context = LocalTaskContext({
+        "operation": OP_BASIC_SORTING,
+        "source": basic_sorting_tree["source"],
+        "target": basic_sorting_tree["target"],
+        "inner_id_list": basic_sorting_tree["inner_id_list"],
+        "fov_number": "1",
+        "formats": [".bmp"],
+        "instrument": True,
+    }, timing_dir=str(tmp_path / "timings"))
+    context.run()
+    write = _stages(context.timings)[STAGE_WRITE]
+    assert write["calls"] == 2
+    assert write["bytes"] == context.metrics.get("bytes") > 0
+
+
+def test_timings_are_off_by_default(bmp_tree, tmp_path):
+    context = LocalTaskContext({"operation": OP_BTJ, "source": str(bmp_tree), "target": str(tmp_path / "out")})
+    context.run()
+    assert context.timings is NULL_TIMINGS and context.timing_report is None
+
+
+def test_cli_timings_flag(bmp_tree, tmp_path, capsys, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(plan, "_shared_history", ThroughputHistory(str(tmp_path / "history.json")))
+    task_file = tmp_path / "task.json"
+    task_file.write_text(json.dumps({"source": str(bmp_tree), "target": str(tmp_path / "out")}))
+    assert cli.main([OP_BTJ, "--task", str(task_file), "--timings"]) == cli.EXIT_OK
+    finished = [json.loads(line) for line in capsys.readouterr().out.splitlines()][-1]
+    assert finished["timing_report"].startswith("timings")
+    assert any(row["stage"] == STAGE_WRITE for row in finished["timings"])
@@ -0,0 +1,131 @@
+"""Copy journal — resume skips proven work and re-copies anything suspect."""
+
+from __future__ import annotations
+
+import os
+
+from apt.utils.journal import JOURNAL_FILENAME, CopyJournal
+from apt.workers.sorting import basic_sorting
+
+
+class FakeSignal:
+    def __init__(self) -> None:
+        self.records: list = []
+
+    def emit(self, value) -> None:
+        self.records.append(value)
+
+
+class FakeWorker:
+    def __init__(self) -> None:
+        self.progress = FakeSignal()
+        self.log = FakeSignal()
+        self.ng_count_result = FakeSignal()
+        self.finished = FakeSignal()
+        self.max_workers = 2
+        self._is_stopped = False
+
+    def is_stopped(self) -> bool:
+        return self._is_stopped
+
+    def ensure_target_folder(self, path: str) -> bool:
+        os.makedirs(path, exist_ok=True)
+        return True
+
+
+def _pair(tmp_path, payload: bytes = b"abc"):
+    src = tmp_path / "src.bin"
+    src.write_bytes(payload)
+    target = tmp_path / "target"
+    return str(src), str(target / "dst.bin"), str(target)
+
+
+def test_journal_records_and_resumes(tmp_path):
+    src, dst, target = _pair(tmp_path)
+    with CopyJournal(target) as journal:
+        assert journal.copy(src, dst).startswith("Copied")
+
+    with CopyJournal(target, resume=True) as journal:
+        assert len(journal) == 1
+        assert journal.copy(src, dst).startswith("Skipped")
+
+
+def test_journal_recopies_truncated_destination(tmp_path):
+    src, dst, target = _pair(tmp_path, b"x" * 1000)
+    with CopyJournal(target) as journal:
+        journal.copy(src, dst)
+    with open(dst, "wb") as f:
+        f.write(b"x" * 10)  # simulate a half-written file
+
+    with CopyJournal(target, resume=True) as journal:
+        assert journal.copy(src, dst).startswith("Copied")
+    assert os.path.getsize(dst) == 1000
+
+
+def test_journal_recopies_modified_source(tmp_path):
+    src, dst, target = _pair(tmp_path)
+    with CopyJournal(target) as journal:
+        journal.copy(src, dst)
+    with open(src, "wb") as f:
+        f.write(b"changed!")
+
+    with CopyJournal(target, resume=True) as journal:
+        assert not journal.is_done(src, dst)
+
+
+def test_journal_ignores_torn_last_line(tmp_path):
+    src, dst, target = _pair(tmp_path)
+    with CopyJournal(target) as journal:
+        journal.copy(src, dst)
+    with open(os.path.join(target, JOURNAL_FILENAME), "a", encoding="utf-8") as f:
+        f.write('{"src": "broken')
+
+    with CopyJournal(target, resume=True) as journal:
+        assert journal.is_done(src, dst)
+
+
+def test_non_resume_run_starts_a_fresh_journal(tmp_path):
+    src, dst, target = _pair(tmp_path)
+    with CopyJournal(target) as journal:
+        journal.copy(src, dst)
+    with CopyJournal(target) as journal:
+        assert len(journal) == 0
+        assert journal.copy(src, dst).startswith("Copied")
+
+
+def test_basic_sorting_resume_skips_journaled_files(basic_sorting_tree):
+    task = {
+        "source": basic_sorting_tree["source"],
+        "target": basic_sorting_tree["target"],
+        "inner_id_list": basic_sorting_tree["inner_id_list"],
+        "fov_number": "1,2",
+        "formats": [".bmp"],
+    }
+    basic_sorting(FakeWorker(), dict(task))
+    assert os.path.isfile(os.path.join(task["target"], JOURNAL_FILENAME))
+
+    worker = FakeWorker()
+    basic_sorting(worker, dict(task, resume=True))
+    skipped = [m for m in worker.log.records if m.startswith("Skipped (journal)")]
+    assert len(skipped) == 4
+    assert "총 처리 파일: 4" in worker.finished.records[-1]
+
+
+def test_basic_sorting_link_mode_places_every_file(basic_sorting_tree):
+    task = {
+        "source": basic_sorting_tree["source"],
+        "target": basic_sorting_tree["target"],
+        "inner_id_list": basic_sorting_tree["inner_id_list"],
+        "fov_number": "1,2",
+        "formats": [".bmp"],
+        "transfer": "link",
+    }
+    worker = FakeWorker()
+    basic_sorting(worker, task)
+    assert "총 처리 파일: 4" in worker.finished.records[-1]
+    linked = [m for m in worker.log.records if m.startswith(("Reflinked", "Linked"))]
+    assert len(linked) == 4
+    with open(os.path.join(task["source"], "ID001", "1_ID001.bmp"), "rb") as f:
+        payload = f.read()
+    with open(os.path.join(task["target"], "ID001_1_ID001.bmp"), "rb") as f:
+        assert f.read() == payload
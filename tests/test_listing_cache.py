@@ -0,0 +1,125 @@
+"""Listing cache — reuse unchanged folders, re-list anything that changed."""
+
+from __future__ import annotations
+
+import os
+import time
+
+from apt.utils import listing_cache
+from apt.utils.listing_cache import ListingCache, scan_listing
+from apt.utils.scan import scan_files
+from apt.workers.sorting import basic_sorting
+
+
+class FakeSignal:
+    def __init__(self) -> None:
+        self.records: list = []
+
+    def emit(self, value) -> None:
+        self.records.append(value)
+
+
+class FakeWorker:
+    def __init__(self) -> None:
+        self.progress = FakeSignal()
+        self.log = FakeSignal()
+        self.ng_count_result = FakeSignal()
+        self.finished = FakeSignal()
+        self.max_workers = 2
+        self._is_stopped = False
+
+    def is_stopped(self) -> bool:
+        return self._is_stopped
+
+    def ensure_target_folder(self, path: str) -> bool:
+        os.makedirs(path, exist_ok=True)
+        return True
+
+
+def _age(path, seconds: float = 60) -> None:
+    """Backdate ``path``'s mtime so the cache considers it settled."""
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def _tree(tmp_path):
+    root = tmp_path / "tree"
+    (root / "sub").mkdir(parents=True)
+    (root / "1_a.bmp").write_bytes(b"")
+    (root / "sub" / "2_b.bmp").write_bytes(b"")
+    _age(root / "sub")
+    _age(root)
+    return root
+
+
+def test_unchanged_folder_is_served_from_cache(tmp_path):
+    root = _tree(tmp_path)
+    with ListingCache(str(tmp_path / "cache.sqlite")) as cache:
+        first = cache.listdir(str(root))
+        assert cache.listdir(str(root)) == first
+        assert (cache.hits, cache.misses) == (1, 1)
+    assert first.files == ("1_a.bmp",) and first.dirs == ("sub",)
+
+    # Persisted across instances.
+    with ListingCache(str(tmp_path / "cache.sqlite")) as cache:
+        assert cache.listdir(str(root)) == first
+        assert cache.hits == 1
+
+
+def test_changed_folder_is_listed_again(tmp_path):
+    root = _tree(tmp_path)
+    with ListingCache(str(tmp_path / "cache.sqlite")) as cache:
+        cache.listdir(str(root))
+        (root / "3_c.bmp").write_bytes(b"")
+        _age(root, 30)
+        assert "3_c.bmp" in cache.listdir(str(root)).files
+        assert cache.misses == 2
+
+
+def test_recently_changed_folder_is_not_stored(tmp_path):
+    root = tmp_path / "fresh"
+    root.mkdir()
+    (root / "1_a.bmp").write_bytes(b"")
+    with ListingCache(str(tmp_path / "cache.sqlite")) as cache:
+        cache.listdir(str(root))
+        assert len(cache) == 0
+
+
+def test_scan_files_with_cache_matches_plain_scan(tmp_path):
+    root = _tree(tmp_path)
+    (root / "ok").mkdir()
+    (root / "ok" / "1_x.bmp").write_bytes(b"")
+    _age(root / "ok")
+    _age(root)
+    plain = sorted(e.path for e in scan_files(str(root), formats=[".bmp"]))
+    with ListingCache(str(tmp_path / "cache.sqlite")) as cache:
+        for _ in range(2):
+            cached = sorted(e.path for e in scan_files(str(root), formats=[".bmp"], cache=cache))
+            assert cached == plain
+        assert cache.hits == 2
+    assert scan_listing(str(root)).dirs
+
+
+def test_basic_sorting_reuses_listings(basic_sorting_tree, tmp_path, monkeypatch):
+    for folder in ("inner", "src"):
+        for path in (tmp_path / folder).iterdir():
+            _age(path)
+        _age(tmp_path / folder)
+    cache = ListingCache(str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(listing_cache, "_shared_cache", cache)
+    task = {
+        "source": basic_sorting_tree["source"],
+        "target": basic_sorting_tree["target"],
+        "inner_id_list": basic_sorting_tree["inner_id_list"],
+        "fov_number": "1",
+        "formats": [".bmp"],
+        "listing_cache": True,
+    }
+    basic_sorting(FakeWorker(), dict(task))
+    misses = cache.misses
+    worker = FakeWorker()
+    basic_sorting(worker, dict(task, fov_number="2"))
+    assert cache.misses == misses
+    assert cache.hits >= 3  # inner-ID list + both source folders
+    assert "총 처리 파일: 2" in worker.finished.records[-1]
+    cache.close()
@@ -0,0 +1,91 @@
+"""Log batching, per-task log files and de-duplicated progress."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from apt.constants import OP_BTJ
+from apt.workers.context import LocalTaskContext, ProgressChannel
+from apt.workers.logsink import LogBatcher, TaskLogFile, task_log_path
+
+
+def test_batcher_coalesces_and_keeps_order():
+    batches: list[list[str]] = []
+    batcher = LogBatcher(batches.append, interval_ms=50)
+    for i in range(1000):
+        batcher.add(str(i))
+    time.sleep(0.2)
+    batcher.close()
+    assert 1 <= len(batches) <= 3
+    assert [m for batch in batches for m in batch] == [str(i) for i in range(1000)]
+
+
+def test_batcher_flush_delivers_immediately():
+    batches: list[list[str]] = []
+    batcher = LogBatcher(batches.append, interval_ms=10_000)
+    batcher.add("a")
+    batcher.flush()
+    assert batches == [["a"]]
+    batcher.close()
+    assert batches == [["a"]]
+
+
+def test_flush_waits_for_a_batch_the_timer_is_delivering():
+    received: list = []
+    delivering = threading.Event()
+    release = threading.Event()
+
+    def deliver(batch):
+        if batch == ["a"]:  # the timer's batch: swapped out, but slow to emit
+            delivering.set()
+            release.wait(5)
+        received.append(batch)
+
+    batcher = LogBatcher(deliver, interval_ms=10)
+    batcher.add("a")
+    assert delivering.wait(5)
+    batcher.add("b")
+
+    def finish():  # what WorkerThread._forward_finished does
+        batcher.flush()
+        received.append("finished")
+
+    finisher = threading.Thread(target=finish)
+    finisher.start()
+    time.sleep(0.05)
+    release.set()
+    finisher.join(5)
+    batcher.close()
+    assert received == [["a"], ["b"], "finished"]
+
+
+def test_task_log_file_appends_lines(tmp_path):
+    path = task_log_path(OP_BTJ, str(tmp_path / "logs"))
+    log_file = TaskLogFile(path)
+    log_file.write("first")
+    log_file.write("second")
+    log_file.close()
+    lines = open(path, encoding="utf-8").read().splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["first", "second"]
+
+
+def test_context_writes_full_log_to_file(bmp_tree, tmp_path):
+    path = task_log_path(OP_BTJ, str(tmp_path / "logs"))
+    context = LocalTaskContext(
+        {"operation": OP_BTJ, "source": str(bmp_tree), "target": str(tmp_path / "out")},
+        log_path=path,
+    )
+    seen: list[str] = []
+    context.log.connect(seen.append)
+    context.run()
+    assert len(open(path, encoding="utf-8").read().splitlines()) == len(seen)
+
+
+def test_progress_channel_drops_repeats():
+    channel = ProgressChannel()
+    seen: list[int] = []
+    channel.connect(seen.append)
+    for value in (0, 0, 1, 1, 1, 2, 2, 100, 100):
+        channel.emit(value)
+    assert seen == [0, 1, 2, 100]
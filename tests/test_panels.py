@@ -16,6 +16,7 @@ from apt.constants import (
     OP_MIM_TO_BMP,
     OP_NG_COUNT,
     OP_NG_SORTING,
+    OP_RENDER_OVERLAYS,
     OP_SIMULATION,
 )
 
@@ -30,6 +31,7 @@ from apt.constants import (
         ("apt.dialogs.image_copy.ImageFormatCopyPanel",        OP_IMAGE_COPY),
         ("apt.dialogs.simulation.SimulationFolderingPanel",    OP_SIMULATION),
         ("apt.dialogs.crop.CropPanel",                         OP_CROP),
+        ("apt.dialogs.render_overlays.RenderOverlaysPanel",    OP_RENDER_OVERLAYS),
         ("apt.dialogs.mim_to_bmp.MIMtoBMPPanel",               OP_MIM_TO_BMP),
         ("apt.dialogs.attach_fov.AttachFOVPanel",              OP_ATTACH_FOV),
         ("apt.dialogs.btj.BMPtoJPGPanel",                      OP_BTJ),
@@ -49,10 +51,12 @@ def test_main_window_lists_all_pages(qt_app):
 
     win = MainWindow()
     titles = [win.stack.widget(i).TITLE for i in range(win.stack.count())]
-    assert len(titles) == 11
+    assert len(titles) == 13
     assert "Basic Sorting" in titles
     assert "MIM to BMP" in titles
     assert "Preprocessing" in titles
+    assert "Render Overlays" in titles
+    assert "Job Queue" in titles
 
 
 def test_preprocessing_delete_clears_multiselection_in_one_call(qt_app):
@@ -368,3 +372,69 @@ def test_preprocessing_remove_active_image_picks_safe_index(qt_app):
     panel._on_image_removed(0)  # remove a non-active before active
     assert len(panel._images) == 1
     assert panel._active_index == 0   # shifted down
+
+
+def test_job_queue_panel_tracks_queued_task(qt_app, bmp_tree, tmp_path, monkeypatch):
+    from apt.dialogs import base as base_module
+    from apt.dialogs.btj import BMPtoJPGPanel
+    from apt.dialogs.job_queue import JobQueuePanel
+    from apt.workers.jobs import JobQueue
+
+    queue = JobQueue()
+    monkeypatch.setattr(base_module, "shared_job_queue", lambda: queue)
+    page = JobQueuePanel(queue)
+    panel = BMPtoJPGPanel()
+    panel.source_picker.set_text(str(bmp_tree))
+    panel.target_picker.set_text(str(tmp_path / "out"))
+    panel.queue_task()
+
+    assert queue.wait(30)
+    qt_app.processEvents()
+    assert page.table.rowCount() == 1
+    assert page.table.item(0, 3).text() == "done"
+    assert page.table.cellWidget(0, 4).value() == 100
+
+
+def test_log_console_keeps_only_the_last_records(qt_app):
+    from apt.widgets.log_console import LogConsole
+
+    console = LogConsole(max_records=10)
+    console.append_many([f"line {i}" for i in range(25)])
+    model = console.model
+    assert model.rowCount() <= 10
+    assert model.data(model.index(model.rowCount() - 1)).endswith("line 24")
+
+
+def test_log_console_filters_and_exports(qt_app, tmp_path):
+    from apt.widgets.log_console import LogConsole
+    from apt.widgets.log_model import LEVEL_ERROR
+
+    console = LogConsole()
+    console.append_many(["Copied a -> b", "오류 발생: disk full", "Copied c -> d"])
+    console.append("오류 발생: timeout")
+    console.model.set_filter(LEVEL_ERROR)
+    assert console.model.rowCount() == 2
+    console.model.set_filter(text="copied C")
+    assert console.model.rowCount() == 1
+    console.append("Copied c -> e")  # new records respect the active filter
+    assert console.model.rowCount() == 2
+
+    path = tmp_path / "export.txt"
+    assert console.export(str(path)) == 2
+    assert path.read_text(encoding="utf-8").splitlines()[1].endswith("Copied c -> e")
+
+
+def test_log_model_handles_a_million_records(qt_app):
+    import time
+
+    from apt.widgets.log_model import LogModel
+
+    model = LogModel(max_records=1_000_000)
+    start = time.perf_counter()
+    for batch in range(100):
+        model.append_many([f"Copied {batch}_{i}.bmp" for i in range(10_000)])
+    model.set_filter(text="99_9999")
+    elapsed = time.perf_counter() - start
+    assert model.total_records == 1_000_000
+    assert model.rowCount() == 1
+    assert elapsed < 30
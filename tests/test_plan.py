@@ -0,0 +1,163 @@
+"""Dry-run plans — same scan as the real run, nothing written, ETA from history."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from apt import cli
+from apt.constants import OP_BASIC_SORTING, OP_BTJ, OP_CROP, OP_NG_SORTING
+from apt.utils.journal import JOURNAL_FILENAME, CopyJournal
+from apt.workers import plan as plan_module
+from apt.workers.context import LocalTaskContext
+from apt.workers.plan import ThroughputHistory
+from apt.workers.registry import load_handlers
+
+load_handlers()
+
+
+@pytest.fixture(autouse=True)
+def isolated_history(tmp_path, monkeypatch):
+    history = ThroughputHistory(str(tmp_path / "history.json"))
+    monkeypatch.setattr(plan_module, "_shared_history", history)
+    return history
+
+
+def _tree_files(root) -> list[str]:
+    return sorted(str(p.relative_to(root)) for p in root.rglob("*"))
+
+
+def _basic_task(tree, **extra) -> dict:
+    return {
+        "operation": OP_BASIC_SORTING,
+        "source": tree["source"],
+        "target": tree["target"],
+        "inner_id_list": tree["inner_id_list"],
+        "fov_number": "1",
+        "formats": [".bmp"],
+        "dry_run": True,
+        **extra,
+    }
+
+
+def test_basic_sorting_dry_run_plans_without_writing(basic_sorting_tree, tmp_path):
+    target = tmp_path / "target"
+    (target / "ID001_1_ID001.bmp").write_bytes(b"old")
+    before = _tree_files(target)
+
+    context = LocalTaskContext(_basic_task(basic_sorting_tree))
+    context.run()
+
+    assert _tree_files(target) == before
+    plan = context.plan
+    assert plan.total_files == 2
+    assert plan.total_bytes == sum(os.path.getsize(a.src) for a in plan.actions)
+    assert [c["path"] for c in plan.conflicts] == [str(target / "ID001_1_ID001.bmp")]
+    assert "Dry Run 완료" in context.finished_message
+
+
+def test_resumed_dry_run_skips_journaled_copies(basic_sorting_tree, tmp_path):
+    target = tmp_path / "target"
+    src = tmp_path / "src" / "ID001" / "1_ID001.bmp"
+    dst = target / "ID001_1_ID001.bmp"
+    with CopyJournal(str(target)) as journal:
+        journal.copy(str(src), str(dst))
+    journal_before = (target / JOURNAL_FILENAME).read_text(encoding="utf-8")
+
+    context = LocalTaskContext(_basic_task(basic_sorting_tree, resume=True))
+    context.run()
+
+    assert [s["path"] for s in context.plan.skips] == [str(src)]
+    assert context.plan.total_files == 1
+    assert (target / JOURNAL_FILENAME).read_text(encoding="utf-8") == journal_before
+
+
+def test_ng_sorting_dry_run_does_not_create_target(tmp_path):
+    source1 = tmp_path / "ng"
+    source2 = tmp_path / "match"
+    for inner_id in ("ID1", "ID2"):
+        (source1 / inner_id).mkdir(parents=True)
+        (source2 / inner_id).mkdir(parents=True)
+        (source2 / inner_id / "1_cam.bmp").write_bytes(b"x" * 10)
+    target = tmp_path / "target"
+    context = LocalTaskContext({
+        "operation": OP_NG_SORTING,
+        "inputs": [str(source1 / "ID1"), str(source1 / "ID2")],
+        "source2": str(source2),
+        "target": str(target),
+        "formats": [".bmp"],
+        "dry_run": True,
+    })
+    context.run()
+
+    assert not target.exists()
+    assert context.plan.total_files == 2 and context.plan.total_bytes == 20
+    assert any("Target 폴더가 없어" in note for note in context.plan.notes)
+
+
+def test_crop_dry_run_lists_crops(bmp_tree, tmp_path):
+    target = tmp_path / "crops"
+    context = LocalTaskContext({
+        "operation": OP_CROP,
+        "source": str(bmp_tree),
+        "target": str(target),
+        "formats": [".bmp"],
+        "left_top_x": 0, "left_top_y": 0, "right_bottom_x": 8, "right_bottom_y": 8,
+        "dry_run": True,
+    })
+    context.run()
+    assert not target.exists()
+    assert {a.kind for a in context.plan.actions} == {"crop"}
+    assert context.plan.total_files == 3
+
+
+def test_real_runs_feed_the_eta(bmp_tree, tmp_path):
+    history = ThroughputHistory(str(tmp_path / "history.json"))
+    task = {"operation": OP_BTJ, "source": str(bmp_tree), "target": str(tmp_path / "out")}
+    LocalTaskContext(dict(task), throughput=history).run()
+    assert [s[0] for s in history.samples(OP_BTJ)] == [3]
+
+    context = LocalTaskContext(dict(task, target=str(tmp_path / "planned"), dry_run=True),
+                               throughput=history)
+    context.run()
+    assert context.plan.eta_seconds is not None
+    assert len(history.samples(OP_BTJ)) == 1  # dry runs are not measured
+
+
+def test_estimate_fits_per_file_and_per_byte_costs(tmp_path):
+    history = ThroughputHistory(str(tmp_path / "history.json"))
+    assert history.estimate("op", 10, 100) is None
+    # seconds = 0.01 per file + 1e-6 per byte
+    for files, size in ((100, 1_000_000), (1000, 2_000_000), (50, 8_000_000)):
+        history.record("op", files, size, 0.01 * files + 1e-6 * size)
+    assert history.estimate("op", 200, 4_000_000) == pytest.approx(6.0, rel=1e-3)
+
+    reloaded = ThroughputHistory(history.path)
+    assert len(reloaded.samples("op")) == 3
+    # Without byte counts only the per-file rate is used.
+    assert reloaded.estimate("op", 10) == pytest.approx(
+        sum(s for _f, _b, s in reloaded.samples("op")) / 1150 * 10
+    )
+
+
+def test_history_keeps_recent_samples(tmp_path):
+    history = ThroughputHistory(None, max_samples=3)
+    for i in range(1, 6):
+        history.record("op", i, 0, 1.0)
+    assert [s[0] for s in history.samples("op")] == [3, 4, 5]
+    history.record("op", 0, 0, 1.0)
+    assert len(history.samples("op")) == 3
+
+
+def test_cli_dry_run_prints_plan(bmp_tree, tmp_path, capsys):
+    task_file = tmp_path / "task.json"
+    target = tmp_path / "out"
+    task_file.write_text(json.dumps({"source": str(bmp_tree), "target": str(target)}))
+
+    assert cli.main([OP_BTJ, "--task", str(task_file), "--dry-run"]) == cli.EXIT_OK
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    plan = next(e["value"] for e in events if e["event"] == "plan")
+    assert plan["total_files"] == 3 and len(plan["actions"]) == 3
+    assert not target.exists()
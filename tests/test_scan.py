@@ -0,0 +1,67 @@
+from apt.utils.scan import StreamedScan, scan_files
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+
+
+def _names(entries):
+    return sorted(e.name for e in entries)
+
+
+def test_recursive_scan_filters_formats(bmp_tree):
+    entries = list(scan_files(str(bmp_tree), formats=[".bmp"]))
+    assert _names(entries) == ["1_a.bmp", "2_b.bmp", "top.bmp"]
+    by_name = {e.name: e for e in entries}
+    assert by_name["top.bmp"].rel_dir == "."
+    assert by_name["1_a.bmp"].top_folder == "sub"
+
+
+def test_ignored_dirs_are_not_entered(tmp_path):
+    _touch(tmp_path / "ID1" / "1_a.bmp")
+    _touch(tmp_path / "ID1" / "OK" / "1_b.bmp")
+    _touch(tmp_path / "crop" / "1_c.bmp")
+    assert _names(scan_files(str(tmp_path), formats=[".bmp"])) == ["1_a.bmp"]
+    assert len(list(scan_files(str(tmp_path), formats=[".bmp"], ignored_dirs=()))) == 3
+
+
+def test_fov_filter_uses_leading_digits(tmp_path):
+    for name in ("1_a.bmp", "2_b.bmp", "fov3_c.bmp", "noprefix.bmp"):
+        _touch(tmp_path / name)
+    entries = scan_files(str(tmp_path), formats=[".bmp"], fov_numbers={"1", "3"})
+    assert _names(entries) == ["1_a.bmp", "fov3_c.bmp"]
+
+
+def test_non_recursive_scan_over_many_roots(tmp_path):
+    roots = []
+    for ident in ("A", "B"):
+        _touch(tmp_path / ident / f"{ident}.png")
+        _touch(tmp_path / ident / "deep" / "skip.png")
+        roots.append(str(tmp_path / ident))
+    entries = list(scan_files(roots, formats=[".png"], recursive=False))
+    assert _names(entries) == ["A.png", "B.png"]
+    assert {e.root for e in entries} == set(roots)
+
+
+def test_unreadable_root_is_reported(tmp_path):
+    errors = []
+    missing = str(tmp_path / "missing")
+    entries = list(scan_files(missing, on_error=lambda p, exc: errors.append(p)))
+    assert entries == []
+    assert errors == [missing]
+
+
+def test_scan_stops_when_requested(bmp_tree):
+    assert list(scan_files(str(bmp_tree), is_stopped=lambda: True)) == []
+
+
+def test_streamed_scan_counts_and_reports_once_done():
+    done: list[int] = []
+    scan = StreamedScan(iter("abc"), on_done=done.append)
+    items = iter(scan)
+    assert next(items) == "a" and scan.found == 1
+    assert scan.percent(1) is None  # total not known yet
+    assert list(items) == ["b", "c"]
+    assert scan.done and done == [3]
+    assert scan.percent(2) == 66
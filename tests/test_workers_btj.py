@@ -7,6 +7,7 @@ through a fake WorkerThread that records its signals into lists.
 from __future__ import annotations
 
 import os
+import time
 
 from apt.workers.btj import btj_operation
 
@@ -61,3 +62,163 @@ def test_btj_rejects_invalid_source(tmp_path):
     worker = FakeWorker()
     btj_operation(worker, {"source": str(tmp_path / "does-not-exist"), "target": ""})
     assert worker.finished.records[-1].endswith("중지됨.")
+
+
+def test_btj_process_backend_matches_thread_backend(bmp_tree, tmp_path):
+    worker = FakeWorker()
+    target = tmp_path / "out_proc"
+    btj_operation(worker, {"source": str(bmp_tree), "target": str(target), "backend": "process"})
+    assert "총 3개" in worker.finished.records[-1]
+    assert len(list(target.rglob("*.jpg"))) == 3
+
+
+def _write_bmp(path, mode="RGB", size=(40, 30), **save_args):
+    import numpy as np
+    from PIL import Image
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    shape = (size[1], size[0]) if mode == "L" else (size[1], size[0], 3)
+    noise = np.random.default_rng(0).integers(0, 256, shape, dtype=np.uint8)
+    Image.fromarray(noise, mode).save(path, "BMP", **save_args)
+    return path
+
+
+def _write_alpha_bmp(path, bgra=(10, 40, 200, 128)):
+    import cv2
+    import numpy as np
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cv2.imwrite(str(path), np.full((30, 40, 4), bgra, dtype=np.uint8))  # 32-bit BMP with alpha
+    return path
+
+
+def test_btj_opencv_encoder_matches_pillow_output(bmp_tree, tmp_path):
+    from PIL import Image
+
+    for encoder in ("pillow", "opencv"):
+        worker = FakeWorker()
+        target = tmp_path / encoder
+        btj_operation(worker, {"source": str(bmp_tree), "target": str(target), "encoder": encoder})
+        assert "총 3개" in worker.finished.records[-1]
+    for rel in ("top.jpg", "sub/1_a.jpg", "sub/2_b.jpg"):
+        with Image.open(tmp_path / "pillow" / rel) as a, Image.open(tmp_path / "opencv" / rel) as b:
+            assert a.size == b.size and b.mode == "RGB"
+            assert max(abs(x - y) for x, y in zip(a.getpixel((5, 5)), b.getpixel((5, 5)))) <= 3
+
+
+def test_btj_opencv_keeps_grayscale_and_flattens_alpha(tmp_path):
+    from PIL import Image
+
+    src = tmp_path / "src"
+    _write_bmp(src / "gray.bmp", "L")
+    _write_alpha_bmp(src / "alpha.bmp")
+    btj_operation(FakeWorker(), {"source": str(src), "target": str(tmp_path / "out"), "encoder": "opencv"})
+    with Image.open(tmp_path / "out" / "gray.jpg") as gray:
+        assert gray.mode == "L"
+    with Image.open(tmp_path / "out" / "alpha.jpg") as flat:
+        # (200, 40, 10) at alpha 128 over white
+        assert all(abs(a - b) <= 4 for a, b in zip(flat.getpixel((5, 5)), (227, 147, 132)))
+
+
+def test_btj_jpeg_options_reach_both_encoders(tmp_path):
+    from PIL import Image
+    from PIL.JpegImagePlugin import get_sampling
+
+    src = tmp_path / "src"
+    _write_bmp(src / "a.bmp", size=(64, 64), dpi=(300, 300))
+    os.utime(src / "a.bmp", (1_600_000_000, 1_600_000_000))
+    task = {"source": str(src), "quality": 95, "subsampling": "4:4:4", "progressive": True,
+            "keep_metadata": True}
+    for encoder in ("pillow", "opencv"):
+        out = tmp_path / encoder
+        btj_operation(FakeWorker(), dict(task, target=str(out), encoder=encoder))
+        with Image.open(out / "a.jpg") as jpg:
+            assert get_sampling(jpg) == 0  # 4:4:4
+            assert jpg.info.get("progressive")
+            assert tuple(round(d) for d in jpg.info["dpi"]) == (300, 300)
+        assert os.path.getmtime(out / "a.jpg") == 1_600_000_000
+
+    low = tmp_path / "low"
+    btj_operation(FakeWorker(), {"source": str(src), "target": str(low), "encoder": "opencv", "quality": 10})
+    assert os.path.getsize(low / "a.jpg") < os.path.getsize(tmp_path / "opencv" / "a.jpg")
+
+
+def _write_v5_bmp(path, profile: bytes, size=(16, 8)):
+    """24-bit BMP with a BITMAPV5HEADER and ``profile`` embedded after the pixels."""
+    import struct
+
+    import numpy as np
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    width, height = size
+    stride = (width * 3 + 3) & ~3
+    pixels = np.random.default_rng(0).integers(0, 256, (height, stride), dtype=np.uint8).tobytes()
+    offset = 14 + 124
+    header = struct.pack(
+        "<IiiHHIIiiII16s4s36s12sIIII", 124, width, height, 1, 24, 0, len(pixels), 2835, 2835, 0, 0,
+        b"", b"MBED"[::-1], b"", b"", 4, 124 + len(pixels), len(profile), 0,
+    )
+    total = offset + len(pixels) + len(profile)
+    path.write_bytes(b"BM" + struct.pack("<IHHI", total, 0, 0, offset) + header + pixels + profile)
+    return path
+
+
+def test_btj_keeps_an_embedded_icc_profile(tmp_path):
+    from PIL import Image
+
+    profile = bytes(range(256)) * 300  # spans two APP2 segments
+    src = tmp_path / "src"
+    _write_v5_bmp(src / "a.bmp", profile)
+    for encoder in ("pillow", "opencv"):
+        out = tmp_path / encoder
+        btj_operation(FakeWorker(), {"source": str(src), "target": str(out), "encoder": encoder,
+                                     "keep_metadata": True})
+        with Image.open(out / "a.jpg") as jpg:
+            assert jpg.info.get("icc_profile") == profile
+            assert tuple(round(d) for d in jpg.info["dpi"]) == (72, 72)
+            jpg.load()
+
+        plain = tmp_path / f"{encoder}_plain"
+        btj_operation(FakeWorker(), {"source": str(src), "target": str(plain), "encoder": encoder})
+        with Image.open(plain / "a.jpg") as jpg:
+            assert "icc_profile" not in jpg.info
+
+
+def test_btj_rejects_invalid_jpeg_options(bmp_tree, tmp_path):
+    worker = FakeWorker()
+    btj_operation(worker, {"source": str(bmp_tree), "target": str(tmp_path / "out"), "quality": 0})
+    assert worker.finished.records[-1].endswith("중지됨.")
+    assert any("JPEG 옵션 오류" in line for line in worker.log.records)
+
+
+def test_btj_opencv_on_process_backend(bmp_tree, tmp_path):
+    worker = FakeWorker()
+    target = tmp_path / "out_proc"
+    btj_operation(worker, {"source": str(bmp_tree), "target": str(target), "backend": "process",
+                           "encoder": "opencv"})
+    assert "총 3개" in worker.finished.records[-1]
+    assert len(list(target.rglob("*.jpg"))) == 3
+
+
+def test_btj_starts_converting_before_the_scan_ends(bmp_tree, tmp_path, monkeypatch):
+    from apt.workers import btj
+
+    target = tmp_path / "out"
+    converted_while_scanning: list[bool] = []
+    real_scan = btj.scan_files
+
+    def slow_scan(*args, **kwargs):
+        for i, entry in enumerate(real_scan(*args, **kwargs)):
+            if i == 1:  # the scan is still running: wait for the first JPG
+                deadline = time.monotonic() + 5
+                while not list(target.rglob("*.jpg")) and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                converted_while_scanning.append(bool(list(target.rglob("*.jpg"))))
+            yield entry
+
+    monkeypatch.setattr(btj, "scan_files", slow_scan)
+    worker = FakeWorker()
+    btj_operation(worker, {"source": str(bmp_tree), "target": str(target)})
+    assert converted_while_scanning == [True]
+    assert worker.finished.records[-1] == "BMP->JPG 변환 완료 (총 3개)."
+    assert worker.progress.records[-1] == 100
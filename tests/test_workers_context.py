@@ -0,0 +1,62 @@
+"""Qt-free task context — handlers run and report without a QApplication."""
+
+from __future__ import annotations
+
+import threading
+
+from apt.constants import OP_BTJ
+from apt.workers.context import Channel, LocalTaskContext, TaskMetrics
+
+
+def _btj_context(source, target) -> LocalTaskContext:
+    return LocalTaskContext({"operation": OP_BTJ, "source": str(source), "target": str(target)})
+
+
+def test_channel_calls_every_slot():
+    channel = Channel()
+    seen: list = []
+    channel.connect(seen.append)
+    channel.connect(lambda v: seen.append(v * 2))
+    channel.emit(3)
+    assert seen == [3, 6]
+
+
+def test_local_context_runs_handler_and_collects_metrics(bmp_tree, tmp_path):
+    context = _btj_context(bmp_tree, tmp_path / "out")
+    progress: list[int] = []
+    context.progress.connect(progress.append)
+    context.run()
+
+    assert "변환 완료" in context.finished_message
+    assert progress and progress[-1] == 100
+    snapshot = context.metrics.snapshot()
+    assert snapshot["jobs"] == 3
+    assert snapshot["elapsed_s"] >= 0
+
+
+def test_contexts_run_side_by_side(bmp_tree, tmp_path):
+    contexts = [_btj_context(bmp_tree, tmp_path / f"out{i}") for i in range(3)]
+    threads = [threading.Thread(target=c.run) for c in contexts]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(c.metrics.get("jobs") == 3 for c in contexts)
+
+
+def test_unknown_operation_finishes_once():
+    context = LocalTaskContext({"operation": "nope"})
+    finished: list[str] = []
+    context.finished.connect(finished.append)
+    context.run()
+    assert len(finished) == 1
+
+
+def test_metrics_counters_are_thread_safe():
+    metrics = TaskMetrics()
+    threads = [threading.Thread(target=lambda: [metrics.add("files") for _ in range(1000)]) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert metrics.get("files") == 4000
@@ -0,0 +1,450 @@
+"""Crop worker — region decoding must match a full decode followed by a crop."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import struct
+import time
+
+import numpy as np
+import pytest
+from PIL import Image, ImageFile, ImageOps
+
+from apt.workers.cropping import crop_images
+from apt.workers.instrument import STAGE_READ, StageTimings, run_with_timings
+from apt.workers.regions import (
+    RegionReader,
+    _limit_rows,
+    _probe_bmp,
+    _truncated_loads,
+    clamp_box,
+)
+
+
+class FakeSignal:
+    def __init__(self) -> None:
+        self.records: list = []
+
+    def emit(self, value) -> None:
+        self.records.append(value)
+
+
+class FakeWorker:
+    def __init__(self) -> None:
+        self.progress = FakeSignal()
+        self.log = FakeSignal()
+        self.ng_count_result = FakeSignal()
+        self.finished = FakeSignal()
+        self.max_workers = 2
+        self._is_stopped = False
+
+    def is_stopped(self) -> bool:
+        return self._is_stopped
+
+    def ensure_target_folder(self, path: str) -> bool:
+        os.makedirs(path, exist_ok=True)
+        return True
+
+
+BOXES = [(3, 5, 27, 19), (0, 0, 40, 30), (39, 29, 40, 30), (10, 0, 11, 30)]
+
+
+def _noise(mode: str, size=(40, 30)) -> Image.Image:
+    channels = {"L": 1, "P": 1, "RGB": 3, "RGBA": 4}[mode]
+    shape = (size[1], size[0]) if channels == 1 else (size[1], size[0], channels)
+    pixels = np.random.default_rng(1).integers(0, 256, shape, dtype=np.uint8)
+    if mode == "P":
+        img = Image.fromarray(pixels % 16, "L").convert("P")
+        img.putpalette([c for i in range(16) for c in (i * 16, 255 - i * 16, i * 7)])
+        return img
+    return Image.fromarray(pixels, mode)
+
+
+def _reference(path, box) -> Image.Image:
+    with Image.open(path) as img:
+        return ImageOps.exif_transpose(img).crop(box)
+
+
+def _assert_same(actual: Image.Image, expected: Image.Image) -> None:
+    assert actual.mode == expected.mode and actual.size == expected.size
+    assert np.array_equal(np.asarray(actual.convert("RGBA")), np.asarray(expected.convert("RGBA")))
+
+
+def _top_down_bmp(path, img: Image.Image) -> None:
+    """``img`` as a 24-bit BMP with a negative height (first row stored first)."""
+    buffer = io.BytesIO()
+    img.save(buffer, "BMP")
+    data = bytearray(buffer.getvalue())
+    offset = struct.unpack_from("<I", data, 10)[0]
+    stride = (img.width * 3 + 3) // 4 * 4
+    rows = [bytes(data[offset + r * stride:offset + (r + 1) * stride]) for r in range(img.height)]
+    data[offset:] = b"".join(reversed(rows))
+    struct.pack_into("<i", data, 22, -img.height)
+    path.write_bytes(bytes(data))
+
+
+@pytest.mark.parametrize("mode", ["L", "P", "RGB"])
+def test_bmp_regions_match_full_decode(tmp_path, mode):
+    path = tmp_path / f"{mode}.bmp"
+    _noise(mode).save(path)
+    assert _probe_bmp(str(path)) is not None
+    with RegionReader(str(path)) as reader:
+        assert reader.size == (40, 30)
+        for box, patch in zip(BOXES, reader.crops(BOXES)):
+            _assert_same(patch, _reference(path, box))
+
+
+def test_top_down_and_alpha_bmps(tmp_path):
+    cv2 = pytest.importorskip("cv2")
+    top_down = tmp_path / "top_down.bmp"
+    _top_down_bmp(top_down, _noise("RGB"))
+    alpha = tmp_path / "alpha.bmp"
+    cv2.imwrite(str(alpha), np.asarray(_noise("RGBA")))
+    for path in (top_down, alpha):
+        assert _probe_bmp(str(path)) is not None
+        with RegionReader(str(path)) as reader:
+            for box in BOXES:
+                _assert_same(reader.crop(box), _reference(path, box))
+
+
+def test_bmp_region_reads_only_the_box(tmp_path):
+    path = tmp_path / "wide.bmp"
+    _noise("RGB", size=(2000, 500)).save(path)
+    timings = StageTimings()
+
+    def crop():
+        with RegionReader(str(path)) as reader:
+            return reader.crop((100, 400, 120, 410))
+
+    patch = run_with_timings(timings, crop, time.time_ns())
+    assert patch.size == (20, 10)
+    read = {row["stage"]: row for row in timings.summary()}[STAGE_READ]
+    assert read["bytes"] == 20 * 10 * 3 < path.stat().st_size // 1000
+
+
+@pytest.mark.parametrize("orientation", range(1, 9))
+@pytest.mark.parametrize("progressive", [False, True])
+def test_jpeg_regions_follow_exif_orientation(tmp_path, orientation, progressive):
+    path = tmp_path / "oriented.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    _noise("RGB", size=(64, 48)).save(path, exif=exif, quality=95, progressive=progressive)
+    with RegionReader(str(path)) as reader:
+        assert reader.size == ((48, 64) if orientation >= 5 else (64, 48))
+        for box in [(3, 5, 20, 17), (0, 0, 8, 8), (30, 20, 48, 48)]:
+            _assert_same(reader.crop(box), _reference(path, box))
+
+
+def test_jpeg_rows_stop_early_without_the_global_truncated_flag(tmp_path, monkeypatch):
+    monkeypatch.setattr(ImageFile, "LOAD_TRUNCATED_IMAGES", False)
+    path = tmp_path / "tall.jpg"
+    _noise("RGB", size=(64, 256)).save(path, quality=95)
+    box = (4, 2, 40, 20)
+    with RegionReader(str(path)) as reader:
+        _assert_same(reader.crop(box), _reference(path, box))
+        assert reader._rows < 256  # no second, full decode
+    assert ImageFile.LOAD_TRUNCATED_IMAGES is False
+
+
+def test_jpeg_row_limit_accepts_plain_tuple_tiles(tmp_path):
+    path = tmp_path / "tall.jpg"
+    _noise("RGB", size=(64, 256)).save(path, quality=95)
+    with Image.open(path) as img:
+        img.tile = [tuple(tile) for tile in img.tile]  # what Pillow 10 hands out
+        assert _limit_rows(img, 32)
+        with _truncated_loads():
+            img.load()
+        top = img.copy()
+    _assert_same(top, _reference(path, (0, 0, 64, 32)))
+
+
+def test_png_falls_back_to_full_decode(tmp_path):
+    path = tmp_path / "a.png"
+    _noise("RGBA").save(path)
+    with RegionReader(str(path)) as reader:
+        _assert_same(reader.crop(BOXES[0]), _reference(path, BOXES[0]))
+
+
+def test_clamp_box():
+    assert clamp_box((30, 20, -5, 50), (40, 30)) == (0, 20, 30, 30)
+    assert clamp_box((50, 0, 60, 10), (40, 30)) is None
+
+
+def test_crop_handler_crops_bmp_and_json(tmp_path):
+    source = tmp_path / "src" / "ID1"
+    source.mkdir(parents=True)
+    _noise("RGB").save(source / "1_Cam1.bmp")
+    (source / "1_Cam1.json").write_text(json.dumps({
+        "shapes": [{"label": "a", "points": [[12, 10], [20, 16]], "shape_type": "rectangle",
+                    "bbox": {"x": 12, "y": 10, "width": 8, "height": 6}}],
+        "imagePath": "1_Cam1.bmp", "imageWidth": 40, "imageHeight": 30,
+    }), encoding="utf-8")
+    target = tmp_path / "out"
+    worker = FakeWorker()
+    crop_images(worker, {
+        "source": str(tmp_path / "src"), "target": str(target), "formats": [".bmp"],
+        "left_top_x": 10, "left_top_y": 8, "right_bottom_x": 30, "right_bottom_y": 28,
+    })
+    assert worker.finished.records[-1] == "Crop 완료. 처리 이미지: 1"
+    with Image.open(target / "ID1_1_Cam1.bmp") as out:
+        _assert_same(out, _reference(source / "1_Cam1.bmp", (10, 8, 30, 28)))
+    label = json.loads((target / "ID1_1_Cam1.json").read_text(encoding="utf-8"))
+    assert label["shapes"][0]["points"] == [[2.0, 2.0], [10.0, 8.0]]
+    assert (label["imageWidth"], label["imageHeight"]) == (20, 20)
+
+
+def _labelled_tree(root):
+    source = root / "src" / "ID1"
+    source.mkdir(parents=True)
+    _noise("RGB").save(source / "1_Cam1.bmp")
+    _noise("L").save(source / "2_Cam1.bmp")
+    (source / "1_Cam1.json").write_text(json.dumps({
+        "shapes": [{"label": "a", "points": [[12, 10], [20, 16]], "shape_type": "rectangle",
+                    "bbox": {"x": 12, "y": 10, "width": 8, "height": 6}}],
+        "imagePath": "1_Cam1.bmp", "imageWidth": 40, "imageHeight": 30,
+    }), encoding="utf-8")
+    return root / "src"
+
+
+def test_multi_region_crop_decodes_each_image_once(tmp_path, monkeypatch):
+    from apt.workers import cropping
+
+    opened = []
+
+    class CountingReader(RegionReader):
+        def __init__(self, path):
+            opened.append(path)
+            super().__init__(path)
+
+    monkeypatch.setattr(cropping, "RegionReader", CountingReader)
+    source = _labelled_tree(tmp_path)
+    roi_file = tmp_path / "rois.json"
+    roi_file.write_text(json.dumps({"shapes": [
+        {"label": "pad", "points": [[10, 8], [30, 28]], "shape_type": "rectangle"},
+        {"label": "pad", "points": [[40, 30], [0, 20]], "shape_type": "rectangle"},
+        {"label": "ignored", "points": [[1, 1], [5, 5], [1, 5]], "shape_type": "polygon"},
+    ]}), encoding="utf-8")
+    target = tmp_path / "out"
+    worker = FakeWorker()
+    crop_images(worker, {
+        "source": str(source), "target": str(target), "formats": [".bmp"], "roi_file": str(roi_file),
+        "regions": [{"name": "edge", "box": [35, 0, 10, 10]}, {"name": "outside", "box": [50, 50, 60, 60]}],
+        "coords_mode": "xywh",
+    })
+
+    assert worker.finished.records[-1] == "Crop 완료. 처리 이미지: 2"
+    assert len(opened) == 2
+    assert sorted(p.name for p in target.iterdir()) == ["edge", "outside", "pad", "pad_2"]
+    for name, box in (("pad", (10, 8, 30, 28)), ("pad_2", (0, 20, 40, 30)), ("edge", (35, 0, 40, 10))):
+        for image in ("1_Cam1", "2_Cam1"):
+            with Image.open(target / name / f"ID1_{image}.bmp") as out:
+                _assert_same(out, _reference(source / "ID1" / f"{image}.bmp", box))
+    assert list((target / "outside").iterdir()) == []
+    label = json.loads((target / "pad" / "ID1_1_Cam1.json").read_text(encoding="utf-8"))
+    assert label["shapes"][0]["points"] == [[2.0, 2.0], [10.0, 8.0]]
+    assert not (target / "pad" / "ID1_2_Cam1.json").exists()
+    assert any("SKIP: 이미지 밖의 영역 outside" in line for line in worker.log.records)
+
+
+def test_region_list_validation(tmp_path):
+    from apt.utils.roi import load_roi_file, parse_regions
+
+    assert parse_regions([{"name": "a", "box": [1, 2, -3, 4]}], "xywh")[0].box == (1, 2, 4, 6)
+    for bad in ([], [{"name": "a/b", "box": [0, 0, 1, 1]}], [{"name": "a", "box": [0, 0, 1]}],
+                [{"name": "A", "box": [0, 0, 1, 1]}, {"name": "a", "box": [0, 0, 2, 2]}]):
+        with pytest.raises(ValueError):
+            parse_regions(bad)
+    roi_file = tmp_path / "rois.json"
+    roi_file.write_text(json.dumps({"regions": [{"name": "a", "box": [0, 0, 5, 5]}]}), encoding="utf-8")
+    assert [r.name for r in load_roi_file(str(roi_file))] == ["a"]
+
+    worker = FakeWorker()
+    crop_images(worker, {"source": str(tmp_path), "target": str(tmp_path / "out"), "formats": [".bmp"],
+                         "regions": [{"name": "", "box": [0, 0, 1, 1]}]})
+    assert worker.finished.records[-1] == "Crop 중지됨."
+    assert worker.log.records[-1].startswith("Crop 영역 오류")
+
+
+def test_tile_origins_end_flush_with_the_edge():
+    from apt.workers.cropping import _tile_origins
+
+    assert _tile_origins(40, 16, 16) == [0, 16, 24]
+    assert _tile_origins(32, 16, 8) == [0, 8, 16]
+    assert _tile_origins(10, 16, 8) == []
+
+
+@pytest.mark.parametrize("mode,ext", [("RGB", ".bmp"), ("L", ".bmp"), ("P", ".bmp"), ("RGBA", ".png")])
+def test_tiles_match_crops_of_the_full_frame(tmp_path, mode, ext):
+    from apt.workers.cropping import _crop_tiles
+
+    src = tmp_path / f"img{ext}"
+    _noise(mode).save(src)
+    result = _crop_tiles(str(src), None, str(tmp_path / "t"), ext, (16, 12), (12, 9), False, lambda: False)
+    assert result.startswith("Tiled") and "-> 9개 타일" in result
+    for x in (0, 12, 24):
+        for y in (0, 9, 18):
+            with Image.open(tmp_path / f"t_x{x}_y{y}{ext}") as tile:
+                _assert_same(tile, _reference(src, (x, y, x + 16, y + 12)))
+
+
+def test_tiles_carry_only_their_labels(tmp_path):
+    from apt.workers.cropping import _crop_tiles
+
+    src = tmp_path / "img.bmp"
+    _noise("RGB").save(src)
+    (tmp_path / "img.json").write_text(json.dumps({
+        "shapes": [
+            {"label": "box", "points": [[2, 2], [6, 6]], "shape_type": "rectangle",
+             "bbox": {"x": 2, "y": 2, "width": 4, "height": 4}},
+            {"label": "dot", "points": [[20, 10]], "shape_type": "point"},
+        ],
+        "rois": [[22, 12, 30, 14]],
+        "imagePath": "img.bmp", "imageData": "AAAA", "imageWidth": 40, "imageHeight": 30,
+    }), encoding="utf-8")
+    result = _crop_tiles(str(src), str(tmp_path / "img.json"), str(tmp_path / "t"), ".bmp",
+                         (20, 15), (20, 15), True, lambda: False)
+    assert "-> 2개 타일" in result and "라벨 없는 타일 2개 제외" in result
+    assert sorted(p.name for p in tmp_path.glob("t_*.json")) == ["t_x0_y0.json", "t_x20_y0.json"]
+
+    first = json.loads((tmp_path / "t_x0_y0.json").read_text(encoding="utf-8"))
+    assert [s["label"] for s in first["shapes"]] == ["box"] and first["rois"] == []
+    assert first["imageData"] is None and first["imagePath"] == "t_x0_y0.bmp"
+    # The point sits on the x=20 seam, so it belongs to the right-hand tile only.
+    second = json.loads((tmp_path / "t_x20_y0.json").read_text(encoding="utf-8"))
+    assert [s["label"] for s in second["shapes"]] == ["dot"]
+    assert second["shapes"][0]["points"] == [[0.0, 10.0]]
+    assert second["rois"] == [[2, 12, 10, 14]]
+
+
+def test_failed_or_stopped_tiling_leaves_no_tiles(tmp_path, monkeypatch):
+    from apt.workers import cropping
+
+    src = tmp_path / "img.bmp"
+    _noise("RGB").save(src)
+    real_write = cropping.write_file
+    calls = []
+
+    def flaky_write(path, data):
+        calls.append(path)
+        if len(calls) == 3:
+            raise OSError("disk full")
+        real_write(path, data)
+
+    monkeypatch.setattr(cropping, "write_file", flaky_write)
+    result = cropping._crop_tiles(str(src), None, str(tmp_path / "t"), ".bmp", (10, 10), (10, 10),
+                                  False, lambda: False)
+    assert result == "오류 발생: disk full"
+    assert not list(tmp_path.glob("t_*"))
+
+    monkeypatch.setattr(cropping, "write_file", real_write)
+    checks = iter([False, False, True])  # stop after the first row of tiles
+    result = cropping._crop_tiles(str(src), None, str(tmp_path / "t"), ".bmp", (10, 10), (10, 10),
+                                  False, lambda: next(checks))
+    assert result == "오류 발생: 사용자 중지 요청"
+    assert not list(tmp_path.glob("t_*"))
+
+
+def test_tiling_task(tmp_path):
+    source = _labelled_tree(tmp_path)
+    target = tmp_path / "tiles"
+    task = {"source": str(source), "target": str(target), "formats": [".bmp"],
+            "tile_size": 20, "tile_stride": [10, 10], "labelled_tiles_only": True}
+    worker = FakeWorker()
+    crop_images(worker, task)
+    assert worker.finished.records[-1] == "Crop 완료. 처리 이미지: 2"
+    # Only 1_Cam1 has labels: the shape (12..20, 10..16) touches 4 of its 9 tiles.
+    assert sorted(p.name for p in target.glob("*.bmp")) == [
+        f"ID1_1_Cam1_x{x}_y{y}.bmp" for x in (0, 10) for y in (0, 10)
+    ]
+    assert any("SKIP: 라벨 없는 이미지" in line for line in worker.log.records)
+
+    worker = FakeWorker()
+    crop_images(worker, dict(task, regions=[{"name": "a", "box": [0, 0, 1, 1]}]))
+    assert worker.finished.records[-1] == "Crop 중지됨."
+    worker = FakeWorker()
+    crop_images(worker, dict(task, tile_size=[20, 0]))
+    assert worker.log.records[-1].startswith("Crop 타일 설정 오류")
+
+
+def test_label_transform(tmp_path):
+    from apt.workers.cropping import _adjust_and_save_json
+
+    source = {
+        "shapes": [
+            {"label": "poly", "shape_type": "polygon", "points": [[5, 5], [50, 12.5], "bad", [20, 40, 1]],
+             "bbox": {"x": 0, "y": 0, "width": 1, "height": 1}},
+            {"label": "dot", "shape_type": "point", "points": [[12, 14]],
+             "bbox": {"x": 12, "y": 14, "width": 30, "height": 2}},
+            {"label": "pin", "shape_type": "linestrip", "points": [[15, 15]],
+             "bbox": {"x": 15, "y": 15, "width": 0, "height": 0}},
+            {"label": "empty", "shape_type": "polygon", "points": []},
+        ],
+        "rois": [[40, 30, 12, 11], "note", [1, 2]],
+        "imagePath": "img.bmp", "imageWidth": 60, "imageHeight": 50,
+    }
+    before = json.dumps(source)
+    _adjust_and_save_json("", str(tmp_path / "a.json"), (10, 10, 30, 30), (20, 20), "a.bmp", src_data=source)
+    assert json.dumps(source) == before
+    data = json.loads((tmp_path / "a.json").read_text(encoding="utf-8"))
+    poly, dot, pin, empty = data["shapes"]
+    assert poly["points"] == [[0.0, 0.0], [20.0, 2.5], [10.0, 20.0]]
+    assert poly["bbox"] == {"x": 0.0, "y": 0.0, "width": 20.0, "height": 20.0}
+    assert dot["points"] == [[2.0, 4.0]] and dot["bbox"] == {"x": 2.0, "y": 4.0, "width": 18.0, "height": 2.0}
+    assert pin["bbox"] == {"x": 5.0, "y": 5.0, "width": 0.0, "height": 0.0}
+    assert empty["points"] == []
+    assert data["rois"] == [[2, 1, 20, 20], "note", [1, 2]]
+    assert (data["imagePath"], data["imageWidth"], data["imageHeight"]) == ("a.bmp", 20, 20)
+
+    _adjust_and_save_json("", str(tmp_path / "c.json"), (10, 10, 30, 30), (20, 20), "a.bmp",
+                          src_data=source, compact=True)
+    assert json.loads((tmp_path / "c.json").read_text(encoding="utf-8")) == data
+    assert (tmp_path / "c.json").stat().st_size < (tmp_path / "a.json").stat().st_size
+
+
+def test_overlays_are_optional_and_can_be_rendered_later(tmp_path):
+    from apt.workers.cropping import render_overlays
+
+    source = _labelled_tree(tmp_path)
+    task = {"source": str(source), "formats": [".bmp"],
+            "left_top_x": 10, "left_top_y": 8, "right_bottom_x": 30, "right_bottom_y": 28}
+    worker = FakeWorker()
+    crop_images(worker, dict(task, target=str(tmp_path / "png"), debug_overlay="png"))
+    assert worker.finished.records[-1] == "Crop 완료. 처리 이미지: 2"
+    assert sorted(p.name for p in (tmp_path / "png").glob("*_draw.*")) == ["ID1_1_Cam1_draw.png"]
+
+    later = tmp_path / "off"
+    crop_images(FakeWorker(), dict(task, target=str(later), debug_overlay="off"))
+    assert not list(later.glob("*_draw.*"))
+
+    worker = FakeWorker()
+    render_overlays(worker, {"source": str(later), "files": ["ID1_1_Cam1.bmp", "missing.bmp"]})
+    assert worker.finished.records[-1] == "Render Overlays 완료. 처리 이미지: 1"
+    assert any("SKIP" in line and "missing.bmp" in line for line in worker.log.records)
+    with Image.open(later / "ID1_1_Cam1_draw.png") as rendered, \
+            Image.open(tmp_path / "png" / "ID1_1_Cam1_draw.png") as at_crop_time:
+        _assert_same(rendered, at_crop_time)
+
+    # Without files the whole folder is rendered; overlays are not drawn over again.
+    worker = FakeWorker()
+    render_overlays(worker, {"source": str(later), "overlay_format": "jpg"})
+    assert worker.finished.records[-1] == "Render Overlays 완료. 처리 이미지: 1"
+    assert (later / "ID1_1_Cam1_draw.jpg").is_file()
+
+    worker = FakeWorker()
+    crop_images(worker, dict(task, target=str(tmp_path / "bad"), debug_overlay="gif"))
+    assert worker.finished.records[-1] == "Crop 중지됨."
+
+
+def test_crop_into_a_target_inside_the_source(tmp_path):
+    source = _labelled_tree(tmp_path)
+    target = source / "patches"  # scanned while crops are written into it
+    worker = FakeWorker()
+    crop_images(worker, {"source": str(source), "target": str(target), "formats": [".bmp"],
+                         "left_top_x": 0, "left_top_y": 0, "right_bottom_x": 10, "right_bottom_y": 10})
+    assert worker.finished.records[-1] == "Crop 완료. 처리 이미지: 2"
+    assert sorted(p.name for p in target.glob("*.bmp")) == [
+        "ID1_1_Cam1.bmp", "ID1_1_Cam1_draw.bmp", "ID1_2_Cam1.bmp",
+    ]
+    assert worker.progress.records[-1] == 100
@@ -8,6 +8,7 @@ from apt.constants import (
     OP_MIM_TO_BMP,
     OP_NG_COUNT,
     OP_NG_SORTING,
+    OP_RENDER_OVERLAYS,
     OP_SIMULATION,
 )
 from apt.workers.base import _HANDLERS
@@ -24,6 +25,7 @@ def test_every_canonical_op_has_a_handler():
         OP_MIM_TO_BMP,
         OP_NG_COUNT,
         OP_NG_SORTING,
+        OP_RENDER_OVERLAYS,
         OP_SIMULATION,
     }
     assert expected.issubset(_HANDLERS.keys())
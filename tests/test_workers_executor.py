@@ -0,0 +1,98 @@
+"""bounded_map — lazy submission, bounded in-flight jobs, cooperative stop."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+from apt.workers.executor import bounded_map
+
+
+class FakeWorker:
+    def __init__(self, max_workers: int = 2) -> None:
+        self.max_workers = max_workers
+        self._is_stopped = False
+
+    def stop(self) -> None:
+        self._is_stopped = True
+
+    def is_stopped(self) -> bool:
+        return self._is_stopped
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+def test_yields_every_job_with_its_result():
+    results = dict(bounded_map(FakeWorker(), _square, ((i,) for i in range(50))))
+    assert results == {(i,): i * i for i in range(50)}
+
+
+def test_never_exceeds_max_in_flight():
+    lock = threading.Lock()
+    live = peak = 0
+
+    def slow(_i):
+        nonlocal live, peak
+        with lock:
+            live += 1
+            peak = max(peak, live)
+        time.sleep(0.005)
+        with lock:
+            live -= 1
+
+    pulled = []
+
+    def jobs():
+        for i in range(40):
+            pulled.append(i)
+            yield (i,)
+
+    first = True
+    for _job, _result in bounded_map(FakeWorker(4), slow, jobs(), max_in_flight=3):
+        if first:
+            # Streaming: the first result arrives long before all jobs are pulled.
+            assert len(pulled) < 40
+            first = False
+    assert peak <= 3
+    assert len(pulled) == 40
+
+
+def test_stop_halts_submission():
+    worker = FakeWorker()
+    seen = []
+    for job, _result in bounded_map(worker, _square, ((i,) for i in range(1000)), max_in_flight=2):
+        seen.append(job)
+        worker.stop()
+    assert len(seen) <= 2
+
+
+def test_exceptions_propagate():
+    def boom(_x):
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError, match="bad"):
+        list(bounded_map(FakeWorker(), boom, [(1,)]))
+
+
+def test_process_backend_runs_chunks_in_child_processes():
+    jobs = [(i,) for i in range(40)]
+    results = dict(
+        bounded_map(FakeWorker(), _square, jobs, backend="process", max_workers=2, chunk_size=8)
+    )
+    assert results == {(i,): i * i for i in range(40)}
+    pids = {pid for _job, pid in bounded_map(FakeWorker(), _pid, [(0,)] * 4, backend="process", max_workers=1)}
+    assert os.getpid() not in pids
+
+
+def _pid(_x: int) -> int:
+    return os.getpid()
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="gpu"):
+        list(bounded_map(FakeWorker(), _square, [(1,)], backend="gpu"))
@@ -0,0 +1,77 @@
+"""Job queue — budgets, persistence and cancellation."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from apt.constants import OP_BTJ, OP_IMAGE_COPY
+from apt.workers.context import STATUS_DONE
+from apt.workers.jobs import JOB_CANCELLED, JOB_QUEUED, JOB_RUNNING, JobQueue
+
+
+def _btj(source, target) -> dict:
+    return {"operation": OP_BTJ, "source": str(source), "target": str(target)}
+
+
+def test_queue_runs_every_job(bmp_tree, tmp_path):
+    queue = JobQueue(io_slots=2, cpu_slots=2)
+    jobs = [queue.add(_btj(bmp_tree, tmp_path / f"out{i}")) for i in range(3)]
+    assert queue.wait(30)
+    assert [job.state for job in jobs] == [STATUS_DONE] * 3
+    assert all(job.progress == 100 for job in jobs)
+    assert len(list((tmp_path / "out2").rglob("*.jpg"))) == 3
+
+
+def test_cpu_budget_limits_concurrent_jobs(bmp_tree, tmp_path):
+    queue = JobQueue(cpu_slots=1)
+    lock = threading.Lock()
+    peak = [0]
+
+    def on_change(_job):
+        with lock:
+            running = sum(job.state == JOB_RUNNING for job in queue.jobs())
+            peak[0] = max(peak[0], running)
+
+    queue.changed.connect(on_change)
+    for i in range(3):
+        queue.add(_btj(bmp_tree, tmp_path / f"out{i}"))
+    assert queue.wait(30)
+    assert peak[0] == 1
+
+
+def test_cancel_queued_job(bmp_tree, tmp_path):
+    queue = JobQueue()
+    queue.pause()
+    job = queue.add(_btj(bmp_tree, tmp_path / "out"))
+    queue.cancel(job.id)
+    queue.resume()
+    assert queue.wait(10)
+    assert job.state == JOB_CANCELLED
+    assert not (tmp_path / "out").exists()
+
+
+def test_queue_persists_and_resumes_interrupted_jobs(tmp_path):
+    path = str(tmp_path / "queue.json")
+    queue = JobQueue(path)
+    queue.pause()
+    queue.add({"operation": OP_IMAGE_COPY, "pairs": []})
+    queue.set_budget(3, 2)
+
+    # Simulate an exit while the job was running.
+    data = json.loads((tmp_path / "queue.json").read_text(encoding="utf-8"))
+    data["jobs"][0]["state"] = JOB_RUNNING
+    (tmp_path / "queue.json").write_text(json.dumps(data), encoding="utf-8")
+
+    restored = JobQueue(path)
+    [job] = restored.jobs()
+    assert job.state == JOB_QUEUED and job.task["resume"] is True
+    assert (restored.io_slots, restored.cpu_slots) == (3, 2)
+    assert restored.paused
+
+
+def test_unknown_operation_is_rejected():
+    with pytest.raises(ValueError):
+        JobQueue().add({"operation": "nope"})
@@ -0,0 +1,130 @@
+"""Adaptive concurrency — the tuner climbs towards the throughput peak."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from apt.workers.executor import IN_FLIGHT_PER_WORKER, bounded_map
+from apt.workers.tuning import STAGE_CPU, STAGE_IO, ConcurrencyTuner, tuner_for
+
+
+class FakeSignal:
+    def __init__(self) -> None:
+        self.records: list = []
+
+    def emit(self, value) -> None:
+        self.records.append(value)
+
+
+class FakeWorker:
+    def __init__(self) -> None:
+        self.log = FakeSignal()
+        self.max_workers = 4
+
+    def is_stopped(self) -> bool:
+        return False
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _simulate(tuner: ConcurrencyTuner, clock: FakeClock, rate_at, jobs: int) -> None:
+    """Feed ``jobs`` completions one by one at the rate ``rate_at(limit)``."""
+    for _ in range(jobs):
+        clock.now += 1.0 / rate_at(tuner.limit)
+        tuner.record()
+
+
+def _peaked_at(peak: int):
+    # Throughput rises linearly up to ``peak`` workers, then thrashing sets in.
+    return lambda n: n * 10.0 if n <= peak else peak * 10.0 * peak / n
+
+
+def test_tuner_grows_towards_the_peak():
+    clock = FakeClock()
+    logs: list[str] = []
+    tuner = ConcurrencyTuner(
+        STAGE_IO, 2, 1, 64, window_jobs=16, min_window_s=0, log=logs.append, clock=clock
+    )
+    _simulate(tuner, clock, _peaked_at(10), 400)
+    assert tuner.settled
+    assert 6 <= tuner.limit <= 14
+    assert logs and "(io)" in logs[0]
+
+
+def test_tuner_shrinks_when_starting_too_high():
+    clock = FakeClock()
+    tuner = ConcurrencyTuner(STAGE_IO, 40, 1, 64, window_jobs=16, min_window_s=0, clock=clock)
+    _simulate(tuner, clock, _peaked_at(4), 400)
+    assert tuner.settled
+    assert tuner.limit <= 12
+
+
+def test_tuner_respects_bounds_and_probe_budget():
+    clock = FakeClock()
+    tuner = ConcurrencyTuner(
+        STAGE_CPU, 2, 1, 3, window_jobs=8, min_window_s=0, probe_jobs=64, clock=clock
+    )
+    _simulate(tuner, clock, lambda n: n * 10.0, 64)
+    assert tuner.settled
+    assert tuner.limit == 3
+
+
+def test_tuner_for_honours_auto_tune_flag():
+    worker = FakeWorker()
+    assert tuner_for(worker, {"auto_tune": False}, STAGE_IO) is None
+    io = tuner_for(worker, {}, STAGE_IO)
+    cpu = tuner_for(worker, {}, STAGE_CPU, "process")
+    assert io.limit == worker.max_workers and io.maximum > worker.max_workers
+    assert cpu.maximum == cpu.limit  # never more processes than cores
+
+
+def test_bounded_map_with_tuner_completes_every_job():
+    worker = FakeWorker()
+    tuner = ConcurrencyTuner(STAGE_IO, 2, 1, 8, window_jobs=4, min_window_s=0)
+    jobs = ((i,) for i in range(100))
+    results = sorted(r for _job, r in bounded_map(worker, lambda x: x * 2, jobs, tuner=tuner))
+    assert results == [i * 2 for i in range(100)]
+
+
+def test_tuned_bounded_map_queues_slack_behind_the_limit():
+    tuner = ConcurrencyTuner(STAGE_IO, 2, 1, 16, window_jobs=10**6)
+    lock = threading.Lock()
+    running = peak_running = finished = peak_queued = 0
+
+    def slow(_i):
+        nonlocal running, peak_running, finished
+        with lock:
+            running += 1
+            peak_running = max(peak_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+            finished += 1
+
+    def jobs():
+        nonlocal peak_queued
+        for i in range(60):
+            peak_queued = max(peak_queued, i - finished)
+            yield (i,)
+
+    assert len(list(bounded_map(FakeWorker(), slow, jobs(), tuner=tuner))) == 60
+    assert peak_running == tuner.limit == 2
+    assert peak_queued >= 2 * IN_FLIGHT_PER_WORKER - 1
+
+
+def _double(x: int) -> int:
+    return x * 2
+
+
+def test_tuned_process_backend_completes_every_job():
+    tuner = ConcurrencyTuner(STAGE_CPU, 1, 1, 2, window_jobs=4, min_window_s=0)
+    jobs = [(i,) for i in range(40)]
+    results = dict(bounded_map(FakeWorker(), _double, jobs, backend="process", chunk_size=4, tuner=tuner))
+    assert results == {(i,): i * 2 for i in range(40)}